@@ -4,8 +4,7 @@
 #
 # Part of IOA Core (Open Source Edition). See LICENSE at repo root.
 
-
-
+"""
 Canonical JSON processing and hashing utilities.
 
 Ensures deterministic JSON serialization and SHA-256 hashing for
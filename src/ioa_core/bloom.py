@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import hashlib
+import math
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+"""Bloom filter primitives shared by the memory fabric and the audit chain."""
+
+# Serialized filters (little endian): per filter its name, sizing and
+# stages, each stage followed by its bit array
+_FILTER_HEADER = struct.Struct("<IIId")  # name length, stages, capacity, fp rate
+_STAGE_HEADER = struct.Struct("<IQQ")    # hashes, bits, count
+
+
+def _hash_pair(key: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    h1, h2 = struct.unpack("<QQ", digest)
+    return h1, h2 | 1
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+
+    Bit positions come from double hashing one 128-bit BLAKE2b digest, so a
+    lookup costs one hash regardless of the number of hash functions.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float, bits: Optional[int] = None, hashes: Optional[int] = None):
+        """
+        Size a filter for `capacity` keys at a target false-positive rate.
+
+        Args:
+            capacity: Keys the filter is sized for
+            fp_rate: Target false-positive rate at capacity
+            bits: Explicit size in bits (when loading)
+            hashes: Explicit number of hash functions (when loading)
+        """
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.bits = bits or max(64, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        self.hashes = hashes or max(1, int(round(self.bits / capacity * math.log(2))))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        h1, h2 = _hash_pair(key)
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        """Add a key."""
+        array = self._array
+        for position in self._positions(key):
+            array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        array = self._array
+        return all(array[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._array)
+
+    def estimated_fp_rate(self) -> float:
+        """False-positive rate implied by the current fill."""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def to_bytes(self) -> bytes:
+        """Sizing header followed by the bit array."""
+        return _STAGE_HEADER.pack(self.hashes, self.bits, self.count) + bytes(self._array)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """Filter serialized by to_bytes()."""
+        hashes, bits, count = _STAGE_HEADER.unpack_from(data, 0)
+        bloom = cls(max(1, count), 0.5, bits=bits, hashes=hashes)
+        bloom._array[:] = data[_STAGE_HEADER.size:_STAGE_HEADER.size + len(bloom._array)]
+        bloom.count = count
+        return bloom
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows in stages instead of degrading past capacity.
+
+    When a stage is full a new one with twice the capacity and half the
+    false-positive rate is added (Almeida et al.), so the compound rate
+    stays below about twice the target however many keys are added.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float):
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Keys the first stage is sized for
+            fp_rate: Target compound false-positive rate
+        """
+        self.capacity = max(1, capacity)
+        self.fp_rate = fp_rate
+        self.stages: List[BloomFilter] = [BloomFilter(self.capacity, fp_rate / 2)]
+
+    def add(self, key: str) -> None:
+        """Add a key, opening a new stage when the current one is full."""
+        stage = self.stages[-1]
+        if stage.full:
+            stage = BloomFilter(stage.capacity * 2, stage.fp_rate / 2)
+            self.stages.append(stage)
+        stage.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in stage for stage in self.stages)
+
+    def __len__(self) -> int:
+        return sum(stage.count for stage in self.stages)
+
+    def stats(self) -> Dict[str, Any]:
+        """Keys, size and estimated false-positive rate."""
+        miss = 1.0
+        for stage in self.stages:
+            miss *= 1 - stage.estimated_fp_rate()
+        return {
+            "keys": len(self),
+            "stages": len(self.stages),
+            "hashes": self.stages[-1].hashes,
+            "memory_bytes": sum(stage.memory_bytes for stage in self.stages),
+            "estimated_fp_rate": 1 - miss
+        }
+
+    def to_bytes(self, name: str) -> bytes:
+        encoded = name.encode("utf-8")
+        parts = [_FILTER_HEADER.pack(len(encoded), len(self.stages), self.capacity, self.fp_rate), encoded]
+        for stage in self.stages:
+            parts.append(_STAGE_HEADER.pack(stage.hashes, stage.bits, stage.count))
+            parts.append(bytes(stage._array))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: memoryview, offset: int) -> Tuple[str, "ScalableBloomFilter", int]:
+        name_length, stage_count, capacity, fp_rate = _FILTER_HEADER.unpack_from(data, offset)
+        offset += _FILTER_HEADER.size
+        name = bytes(data[offset:offset + name_length]).decode("utf-8")
+        offset += name_length
+        bloom = cls(capacity, fp_rate)
+        bloom.stages = []
+        stage_capacity, stage_fp = capacity, fp_rate / 2
+        for _ in range(stage_count):
+            hashes, bits, count = _STAGE_HEADER.unpack_from(data, offset)
+            offset += _STAGE_HEADER.size
+            stage = BloomFilter(stage_capacity, stage_fp, bits=bits, hashes=hashes)
+            size = len(stage._array)
+            stage._array[:] = data[offset:offset + size]
+            stage.count = count
+            offset += size
+            bloom.stages.append(stage)
+            stage_capacity, stage_fp = stage_capacity * 2, stage_fp / 2
+        return name, bloom, offset
@@ -2130,6 +2130,398 @@ def stats(index: str):
         sys.exit(1)
 
 
+@app.group()
+def fabric():
+    """Memory Fabric operations."""
+    pass
+
+
+def _open_fabric(backend: Optional[str], data_dir: Optional[str], db_name: Optional[str], **config: Any):
+    """Open a MemoryFabric for CLI operations."""
+    from .memory_fabric import MemoryFabric
+
+    if data_dir:
+        config["data_dir"] = data_dir
+    if db_name:
+        config["db_name"] = db_name
+    return MemoryFabric(backend=backend, config=config, enable_metrics=True)
+
+
+def _fabric_options(command):
+    """Backend and location options shared by the fabric commands."""
+    command = click.option("--db-name", default=None, help="SQLite database file name")(command)
+    command = click.option("--data-dir", default=None, help="Fabric data directory (default: IOA_FABRIC_ROOT)")(command)
+    return click.option("--backend", default=None, help="Fabric backend (default: IOA_FABRIC_BACKEND)")(command)
+
+
+def _progress_options(command):
+    """Progress file and quiet options of the bulk fabric commands."""
+    command = click.option("--quiet", is_flag=True, help="No live progress line")(command)
+    return click.option(
+        "--progress-file", default=None,
+        help="Append JSON progress lines to this file (default: IOA_FABRIC_PROGRESS_PATH)"
+    )(command)
+
+
+def _progress_reporter(phase: str, total: Optional[int], progress_file: Optional[str], quiet: bool):
+    """Progress reporter that redraws a records/sec and ETA line on stderr."""
+    from .memory_fabric.bulk import ProgressReporter, progress_path
+
+    def show(report: Dict[str, Any]) -> None:
+        done = f"{report['done']:,}" + (f"/{report['total']:,}" if report["total"] else "")
+        eta = f"  ETA {report['eta_sec']:.0f}s" if report["eta_sec"] is not None else ""
+        click.echo(
+            f"\r⏳ {phase}: {done} records  {report['rate_per_sec']:,.0f} rec/s{eta}",
+            nl=report["final"], err=True
+        )
+
+    return ProgressReporter(
+        phase,
+        total,
+        path=progress_file or progress_path(),
+        interval=0.5,
+        on_update=None if quiet else show
+    )
+
+
+def _echo_summary(summary: Dict[str, Any], as_json: bool, message: str) -> None:
+    if as_json:
+        click.echo(json_lib.dumps(summary, default=str))
+    else:
+        click.echo(message)
+
+
+@fabric.command()
+@_fabric_options
+@click.option("--ttl", "ttls", multiple=True, help="memory_type=seconds (repeatable; default: IOA_FABRIC_TTL)")
+@click.option("--batch-size", default=1000, help="Records deleted per transaction")
+@click.option("--max-batches", default=None, type=int, help="Stop after N batches per memory type")
+@click.option("--json", "as_json", is_flag=True, help="Output results as JSON")
+def sweep(
+    backend: Optional[str],
+    data_dir: Optional[str],
+    db_name: Optional[str],
+    ttls: tuple,
+    batch_size: int,
+    max_batches: Optional[int],
+    as_json: bool,
+):
+    """Delete records older than their memory type's TTL."""
+    try:
+        from .memory_fabric import RetentionPolicy
+
+        if ttls:
+            ttl_seconds = {}
+            for item in ttls:
+                memory_type, _, seconds = item.partition("=")
+                ttl_seconds[memory_type.strip()] = int(seconds)
+            policy = RetentionPolicy(ttl_seconds=ttl_seconds, batch_size=batch_size)
+        else:
+            policy = RetentionPolicy.from_env()
+            policy.batch_size = batch_size
+
+        if not policy.ttl_seconds:
+            click.echo("❌ No TTLs configured (use --ttl or IOA_FABRIC_TTL)")
+            sys.exit(1)
+
+        mf = _open_fabric(backend, data_dir, db_name)
+        started = time.time()
+        try:
+            results = mf.sweep_expired(policy=policy, max_batches=max_batches)
+        finally:
+            mf.close()
+        elapsed = time.time() - started
+
+        if as_json:
+            click.echo(json_lib.dumps({"deleted": results, "elapsed_sec": round(elapsed, 3)}))
+            return
+
+        for memory_type, deleted in results.items():
+            click.echo(f"🧹 {memory_type}: deleted {deleted} expired records")
+        click.echo(f"✅ Sweep completed in {elapsed:.2f}s")
+
+    except Exception as e:
+        click.echo(f"❌ Sweep failed: {e}")
+        sys.exit(1)
+
+
+@fabric.command("import")
+@_fabric_options
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", default=10000, help="Records per bulk write")
+@click.option("--workers", default=1, help="Threads decoding and encrypting batches ahead of the writes")
+@_progress_options
+@click.option("--json", "as_json", is_flag=True, help="Output the summary as JSON")
+def fabric_import(
+    backend: Optional[str],
+    data_dir: Optional[str],
+    db_name: Optional[str],
+    path: str,
+    batch_size: int,
+    workers: int,
+    progress_file: Optional[str],
+    quiet: bool,
+    as_json: bool,
+):
+    """Load records from a columnar export (Parquet, Arrow or NDJSON)."""
+    try:
+        from .memory_fabric.columnar import count_records
+
+        mf = _open_fabric(backend, data_dir, db_name)
+        reporter = _progress_reporter("import", count_records(path), progress_file, quiet)
+        try:
+            summary = mf.import_columnar(path, batch_size=batch_size, workers=workers, progress=reporter.update)
+        finally:
+            summary_progress = reporter.finish()
+            mf.close()
+        summary["rate_per_sec"] = summary_progress["rate_per_sec"]
+        _echo_summary(summary, as_json, f"✅ Imported {summary['records']:,} records in {summary['duration_ms'] / 1000:.2f}s")
+    except Exception as e:
+        click.echo(f"❌ Import failed: {e}")
+        sys.exit(1)
+
+
+@fabric.command("export")
+@_fabric_options
+@click.argument("path", type=click.Path(dir_okay=False))
+@click.option("--format", "fmt", default="auto", type=click.Choice(["auto", "parquet", "arrow", "ndjson"]))
+@click.option("--row-group-size", default=10000, help="Records per row group")
+@click.option("--decrypt", is_flag=True, help="Export plaintext content")
+@click.option("--workers", default=1, help="Threads decrypting row groups ahead of the writer")
+@_progress_options
+@click.option("--json", "as_json", is_flag=True, help="Output the summary as JSON")
+def fabric_export(
+    backend: Optional[str],
+    data_dir: Optional[str],
+    db_name: Optional[str],
+    path: str,
+    fmt: str,
+    row_group_size: int,
+    decrypt: bool,
+    workers: int,
+    progress_file: Optional[str],
+    quiet: bool,
+    as_json: bool,
+):
+    """Stream every record to a columnar file."""
+    try:
+        mf = _open_fabric(backend, data_dir, db_name)
+        reporter = _progress_reporter("export", mf.count(), progress_file, quiet)
+        try:
+            summary = mf.export_columnar(
+                path, fmt=fmt, row_group_size=row_group_size, decrypt=decrypt,
+                workers=workers, progress=reporter.update
+            )
+        finally:
+            summary_progress = reporter.finish()
+            mf.close()
+        summary["rate_per_sec"] = summary_progress["rate_per_sec"]
+        _echo_summary(
+            summary, as_json,
+            f"✅ Exported {summary['records']:,} records to {summary['path']} ({summary['format']}, {summary['bytes']:,} bytes)"
+        )
+    except Exception as e:
+        click.echo(f"❌ Export failed: {e}")
+        sys.exit(1)
+
+
+@fabric.command()
+@_fabric_options
+@click.option("--json", "as_json", is_flag=True, help="Output the summary as JSON")
+def compact(backend: Optional[str], data_dir: Optional[str], db_name: Optional[str], as_json: bool):
+    """Reclaim space in the backend's files."""
+    try:
+        mf = _open_fabric(backend, data_dir, db_name)
+        try:
+            summary = mf.compact()
+        finally:
+            mf.close()
+        if not summary["compacted"]:
+            message = f"ℹ️  The {summary['backend']} backend has nothing to compact"
+        else:
+            message = f"✅ Compacted {summary['bytes_before']:,} -> {summary['bytes_after']:,} bytes"
+        _echo_summary(summary, as_json, message)
+    except Exception as e:
+        click.echo(f"❌ Compaction failed: {e}")
+        sys.exit(1)
+
+
+@fabric.command("stats")
+@_fabric_options
+def fabric_stats(backend: Optional[str], data_dir: Optional[str], db_name: Optional[str]):
+    """Print fabric statistics as JSON."""
+    try:
+        mf = _open_fabric(backend, data_dir, db_name)
+        try:
+            stats_data = mf.get_stats()
+            stats_data["records"] = mf.count()
+        finally:
+            mf.close()
+        click.echo(json_lib.dumps(stats_data, indent=2, default=str))
+    except Exception as e:
+        click.echo(f"❌ Failed to get stats: {e}")
+        sys.exit(1)
+
+
+@fabric.command("verify")
+@_fabric_options
+@click.option("--durability", is_flag=True, help="Also verify content checksums against the durability ledger")
+@click.option("--workers", default=None, type=int, help="Parallel workers for the durability verification")
+@click.option("--batch-size", default=1000, help="Records read per batch")
+@_progress_options
+@click.option("--json", "as_json", is_flag=True, help="Output the summary as JSON")
+def fabric_verify(
+    backend: Optional[str],
+    data_dir: Optional[str],
+    db_name: Optional[str],
+    durability: bool,
+    workers: Optional[int],
+    batch_size: int,
+    progress_file: Optional[str],
+    quiet: bool,
+    as_json: bool,
+):
+    """Read back every record and check the backend's integrity."""
+    try:
+        extra = {"durability": True} if durability else {}
+        mf = _open_fabric(backend, data_dir, db_name, **extra)
+        reporter = _progress_reporter("verify", mf.count(), progress_file, quiet)
+        try:
+            summary = mf.verify(workers=workers, batch_size=batch_size, progress=reporter.update)
+        finally:
+            reporter.finish()
+            mf.close()
+        problems = len(summary["unreadable"]) + len(summary["store_errors"])
+        if summary["durability"] is not None:
+            problems += len(summary["durability"]["mismatches"]) + len(summary["durability"]["missing"])
+        _echo_summary(
+            summary, as_json,
+            f"✅ Verified {summary['records']:,} records" if summary["ok"]
+            else f"❌ Verification found {problems} problems in {summary['records']:,} records"
+        )
+        if not summary["ok"]:
+            sys.exit(2)
+    except SystemExit:
+        raise
+    except Exception as e:
+        click.echo(f"❌ Verification failed: {e}")
+        sys.exit(1)
+
+
+@fabric.command()
+@_fabric_options
+@click.option("--batch-size", default=1000, help="Hot records scored per batch")
+@_progress_options
+@click.option("--json", "as_json", is_flag=True, help="Output the summary as JSON")
+def retier(
+    backend: Optional[str],
+    data_dir: Optional[str],
+    db_name: Optional[str],
+    batch_size: int,
+    progress_file: Optional[str],
+    quiet: bool,
+    as_json: bool,
+):
+    """Demote hot records that now score COLD (tiered backend)."""
+    try:
+        mf = _open_fabric(backend, data_dir, db_name)
+        reporter = _progress_reporter("retier", None, progress_file, quiet)
+        started = time.time()
+        try:
+            demoted = mf.retier(batch_size=batch_size, progress=reporter.update)
+        finally:
+            scanned = reporter.finish()["done"]
+            mf.close()
+        summary = {"scanned": scanned, "demoted": demoted, "elapsed_sec": round(time.time() - started, 3)}
+        _echo_summary(summary, as_json, f"✅ Demoted {demoted:,} of {scanned:,} hot records to the cold tier")
+    except Exception as e:
+        click.echo(f"❌ Retier failed: {e}")
+        sys.exit(1)
+
+
+@app.group()
+def bench():
+    """Reproducible benchmarks."""
+    pass
+
+
+@bench.command("fabric")
+@click.option("--workload", "workloads", multiple=True, help="Workload to run (repeatable; default: all)")
+@click.option("--list-workloads", is_flag=True, help="List the workloads and exit")
+@click.option("--records", default=2000, help="Records loaded before the timed operations")
+@click.option("--operations", default=None, type=int, help="Timed operations per iteration (default: --records)")
+@click.option("--iterations", default=3, help="Measured iterations per workload")
+@click.option("--warmup", default=1, help="Unreported warmup iterations per workload")
+@click.option("--seed", default=42, help="Seed of the generated data and operation sequence")
+@click.option("--backend", default="sqlite", help="Fabric backend of the non-sharded workloads")
+@click.option("--output", default=None, type=click.Path(dir_okay=False), help="Write the JSON report to this file")
+@click.option("--baseline", default=None, type=click.Path(exists=True, dir_okay=False), help="Baseline report to compare against")
+@click.option("--threshold", default=0.10, help="Allowed throughput drop / p99 growth against the baseline (0.10 = 10%)")
+@click.option("--json", "as_json", is_flag=True, help="Output the report (and comparison) as JSON")
+def bench_fabric(
+    workloads: tuple,
+    list_workloads: bool,
+    records: int,
+    operations: Optional[int],
+    iterations: int,
+    warmup: int,
+    seed: int,
+    backend: str,
+    output: Optional[str],
+    baseline: Optional[str],
+    threshold: float,
+    as_json: bool,
+):
+    """Benchmark Memory Fabric workloads; exits 2 on a regression against --baseline."""
+    try:
+        from .memory_fabric.bench import WORKLOADS, BenchmarkRunner, compare, load_report, save_report
+
+        if list_workloads:
+            for name, workload in WORKLOADS.items():
+                click.echo(f"{name:16} {workload.description}")
+            return
+
+        def show(name: str, iteration: int, result: Dict[str, Any]) -> None:
+            click.echo(f"⏱️  {name} #{iteration + 1}: {result['ops_per_sec']:,.0f} ops/s", err=True)
+
+        runner = BenchmarkRunner(
+            records=records, operations=operations, iterations=iterations, warmup=warmup,
+            seed=seed, backend=backend, on_iteration=None if as_json else show
+        )
+        report = runner.run(workloads or None)
+        if output:
+            save_report(report, output)
+        comparison = compare(report, load_report(baseline), threshold) if baseline else None
+
+        if as_json:
+            click.echo(json_lib.dumps({"report": report, "comparison": comparison}))
+        else:
+            click.echo(f"{'workload':16} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak RSS MiB':>13}")
+            for name, result in report["workloads"].items():
+                rss = result["peak_rss_mb"]
+                click.echo(
+                    f"{name:16} {result['ops_per_sec']:>10,.0f} {result['p50_ms']:>9.3f} {result['p99_ms']:>9.3f} "
+                    f"{rss if rss is not None else '-':>13}"
+                )
+            if output:
+                click.echo(f"📄 Report written to {output}")
+            if comparison is not None:
+                for regression in comparison["regressions"]:
+                    click.echo(
+                        f"❌ {regression['workload']}: {regression['metric']} {regression['baseline']} -> "
+                        f"{regression['current']} ({regression['change_pct']:+.1f}%)"
+                    )
+                if comparison["ok"]:
+                    click.echo(f"✅ No regressions beyond {comparison['threshold_pct']}% against {baseline}")
+        if comparison is not None and not comparison["ok"]:
+            sys.exit(2)
+    except SystemExit:
+        raise
+    except Exception as e:
+        click.echo(f"❌ Benchmark failed: {e}")
+        sys.exit(1)
+
+
 @app.group()
 def policies():
     """Policy and governance management."""
@@ -4,34 +4,40 @@
 #
 # Part of IOA Core (Open Source Edition). See LICENSE at repo root.
 
-
-
+"""
 IOA Governance: Immutable Audit Chain
 
 Provides append-only, hash-chained JSONL audit logging with schema validation.
 Each entry includes prev_hash and content hash to create an immutable chain.
 Entries are validated against AUDIT_SCHEMA before persistence.
 """
-"""Audit Chain module."""
-
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
 import os
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from concurrent.futures import Future
 from dataclasses import asdict, dataclass
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple
 
 try:
-    from jsonschema import validate
+    from jsonschema import validators
 except Exception as e:
     raise ImportError("jsonschema is required for audit_chain.py") from e
 
+from .nonce_store import AUDIT_NONCE_RETENTION, NonceStore
+
 logger = logging.getLogger(__name__)
 
 # PATCH: Cursor-2025-08-19 Added environment variable configuration for audit log path
@@ -44,6 +50,18 @@
 AUDIT_BATCH_SIZE = int(os.environ.get("IOA_AUDIT_BATCH_SIZE", "10"))
 AUDIT_BACKPRESSURE_ENABLED = os.environ.get("IOA_AUDIT_BACKPRESSURE", "1") in ("1", "true", "TRUE")
 AUDIT_BACKPRESSURE_THRESHOLD = int(os.environ.get("IOA_AUDIT_BACKPRESSURE_THRESHOLD", "100"))
+# Seconds a producer blocks on a full queue before backpressure raises
+AUDIT_BACKPRESSURE_TIMEOUT = float(os.environ.get("IOA_AUDIT_BACKPRESSURE_TIMEOUT", "5.0"))
+# Seconds a partial batch waits for more entries before the writer flushes it; 0 waits for a full batch
+AUDIT_FLUSH_INTERVAL = float(os.environ.get("IOA_AUDIT_FLUSH_INTERVAL", "0.05"))
+# fsync policy of the persistent writer: "batch" syncs every flush, "interval" at most
+# once per IOA_AUDIT_FSYNC_INTERVAL seconds, "none" leaves write-back to the OS
+AUDIT_FSYNC_POLICIES = ("batch", "interval", "none")
+AUDIT_FSYNC_POLICY = os.environ.get("IOA_AUDIT_FSYNC", "interval")
+AUDIT_FSYNC_INTERVAL = float(os.environ.get("IOA_AUDIT_FSYNC_INTERVAL", "1.0"))
+# Fixed-size checkpoint record, rewritten in place after every flush
+AUDIT_CHECKPOINT_VERSION = 1
+AUDIT_CHECKPOINT_SIZE = 512
 
 AUDIT_SCHEMA: Dict[str, Any] = {
     "type": "object",
@@ -61,6 +79,8 @@
     },
     "required": ["timestamp", "event", "data", "prev_hash", "hash"],
 }
+# Checked once here; jsonschema.validate() would re-check the schema for every entry
+_AUDIT_VALIDATOR = validators.validator_for(AUDIT_SCHEMA)(AUDIT_SCHEMA)
 
 
 @dataclass
@@ -74,15 +94,304 @@ class AuditEntry:
     seq: Optional[int] = None
 
     def materialize(self) -> Dict[str, Any]:
+        return self.serialize()[0]
+
+    def serialize(self) -> Tuple[Dict[str, Any], str]:
+        """
+        Materialize the entry together with its JSONL line.
+
+        The line is the canonical JSON that was hashed with the hash appended,
+        so an entry is serialized exactly once.
+
+        Returns:
+            Tuple of (entry dict including its hash, JSONL line without newline)
+        """
         payload = asdict(self)
         # Compute hash deterministically ignoring None hash in input
-        payload_no_hash = {k: v for k, v in payload.items() if k != "hash"}
+        payload.pop("hash")
         # PATCH: Cursor-2025-09-10 Use canonical JSON hashing for audit verification compatibility
-        from ioa_core.audit.canonical import compute_hash
+        from ioa_core.audit.canonical import canonicalize_json
 
-        digest = compute_hash(payload_no_hash)
+        canonical = canonicalize_json(payload)
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
         payload["hash"] = digest
-        return payload
+        return payload, f'{canonical[:-1]},"hash":"{digest}"}}'
+
+
+def _checkpoint_checksum(record: Dict[str, Any]) -> str:
+    body = {k: v for k, v in record.items() if k != "checksum"}
+    return hashlib.sha256(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def read_checkpoint(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read an audit checkpoint sidecar.
+
+    Args:
+        path: Checkpoint file path
+
+    Returns:
+        The checkpoint record, or None when it is missing, torn or from another version
+    """
+    try:
+        record = json.loads(Path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(record, dict)
+        or record.get("version") != AUDIT_CHECKPOINT_VERSION
+        or record.get("checksum") != _checkpoint_checksum(record)
+    ):
+        return None
+    return record
+
+
+def _tail_line(f: BinaryIO, end: int, chunk: int = 8192) -> Optional[Tuple[int, bytes]]:
+    """
+    Find the last complete non-blank line ending at or before `end`, reading backwards.
+
+    Args:
+        f: Log file opened in binary mode
+        end: Byte offset to search back from
+        chunk: Read size
+
+    Returns:
+        Tuple of (offset just past the line's newline, line without newline), or None
+    """
+    buf = b""
+    pos = end
+    stop: Optional[int] = None  # file offset of the line's terminating newline
+    while pos > 0:
+        step = min(chunk, pos)
+        pos -= step
+        f.seek(pos)
+        buf = f.read(step) + buf
+        while True:
+            if stop is None:
+                i = buf.rfind(b"\n")
+                if i < 0:
+                    break
+                stop = pos + i
+            start = buf.rfind(b"\n", 0, stop - pos)
+            if start < 0:
+                break
+            line = buf[start + 1:stop - pos]
+            if line.strip():
+                return stop + 1, line
+            stop = pos + start
+    if stop is not None and buf[:stop - pos].strip():
+        return stop + 1, buf[:stop - pos]
+    return None
+
+
+def _scan_lines(f: BinaryIO, offset: int) -> Tuple[int, Optional[bytes], int]:
+    """
+    Scan forward from `offset` over complete non-blank lines.
+
+    Args:
+        f: Log file opened in binary mode
+        offset: Byte offset of a line start
+
+    Returns:
+        Tuple of (line count, last line, offset just past the last line)
+    """
+    f.seek(offset)
+    count, last, end = 0, None, offset
+    for line in f:
+        if not line.endswith(b"\n"):
+            break  # torn trailing write
+        offset += len(line)
+        if line.strip():
+            count, last, end = count + 1, line, offset
+    return count, last, end
+
+
+class AuditLogWriter:
+    """
+    Appends audit batches to the log and its nonce index through open handles.
+
+    - Both files stay open between flushes; rotation closes and reopens them.
+    - A batch's nonce lines are written before its entry lines, so a crash never
+      leaves a persisted entry whose nonce is missing from the index.
+    - fsync follows the configured policy; `sync()` and `close()` always sync.
+    - With a checkpoint path, each batch can rewrite a fixed-size checkpoint
+      record (tail hash, next seq, byte offsets, nonce-index generation) in place.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        nonce_path: Path,
+        fsync: str = AUDIT_FSYNC_POLICY,
+        fsync_interval: float = AUDIT_FSYNC_INTERVAL,
+        checkpoint_path: Optional[Path] = None,
+    ) -> None:
+        if fsync not in AUDIT_FSYNC_POLICIES:
+            raise ValueError(
+                f"Unknown audit fsync policy '{fsync}' (expected one of: {', '.join(AUDIT_FSYNC_POLICIES)})"
+            )
+        self.log_path = Path(log_path)
+        self.nonce_path = Path(nonce_path)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.nonce_generation = 0
+        self._log: Optional[BinaryIO] = None
+        self._nonces: Optional[BinaryIO] = None
+        self._checkpoint_fd: Optional[int] = None
+        self._size = 0
+        self._nonce_size = 0
+        self._dirty = False
+        self._last_sync = time.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        return self._log is None
+
+    @property
+    def nonce_offset(self) -> int:
+        """Current size of the nonce journal in bytes."""
+        if self._nonces is not None:
+            return self._nonce_size
+        return self.nonce_path.stat().st_size if self.nonce_path.exists() else 0
+
+    def open(self) -> None:
+        """Open both files for appending if they are not open yet."""
+        if self._log is not None:
+            return
+        self._nonces = self.nonce_path.open("ab")
+        self._log = self.log_path.open("ab")
+        self._size = self._log.tell()
+        self._nonce_size = self._nonces.tell()
+        if self.checkpoint_path is not None:
+            self._checkpoint_fd = os.open(self.checkpoint_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def size(self) -> int:
+        """Current size of the log file in bytes."""
+        if self._log is not None:
+            return self._size
+        return self.log_path.stat().st_size if self.log_path.exists() else 0
+
+    def write(
+        self,
+        lines: Sequence[str],
+        nonces: Sequence[str] = (),
+        tail_hash: Optional[str] = None,
+        next_seq: Optional[int] = None,
+    ) -> None:
+        """
+        Append one batch of entry lines and their nonces.
+
+        Args:
+            lines: Serialized entries, without trailing newlines
+            nonces: Nonces to add to the index alongside the entries
+            tail_hash: Hash of the last entry in the log, recorded in the checkpoint
+            next_seq: Sequence number of the next entry, recorded in the checkpoint
+        """
+        self.open()
+        if nonces:
+            data = "".join(f"{nonce}\n" for nonce in nonces).encode("utf-8")
+            self._nonces.write(data)
+            self._nonces.flush()
+            self._nonce_size += len(data)
+        data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        self._log.write(data)
+        self._log.flush()
+        self._size += len(data)
+        if tail_hash is not None and self._checkpoint_fd is not None:
+            self._write_checkpoint(tail_hash, next_seq)
+        self._dirty = True
+
+        if self.fsync == "batch" or (
+            self.fsync == "interval" and time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+
+    def _write_checkpoint(self, tail_hash: str, next_seq: Optional[int]) -> None:
+        record = {
+            "version": AUDIT_CHECKPOINT_VERSION,
+            "tail_hash": tail_hash,
+            "next_seq": next_seq,
+            "offset": self._size,
+            "nonce_offset": self._nonce_size,
+            "nonce_generation": self.nonce_generation,
+        }
+        record["checksum"] = _checkpoint_checksum(record)
+        data = json.dumps(record, sort_keys=True).encode("utf-8")
+        # A torn record fails its checksum and startup falls back to a scan
+        os.pwrite(self._checkpoint_fd, data.ljust(AUDIT_CHECKPOINT_SIZE - 1) + b"\n", 0)
+
+    def sync(self) -> None:
+        """fsync all files if anything was written since the last sync."""
+        if self._log is None or not self._dirty:
+            return
+        os.fsync(self._nonces.fileno())
+        os.fsync(self._log.fileno())
+        if self._checkpoint_fd is not None:
+            os.fsync(self._checkpoint_fd)
+        self._dirty = False
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close both files; the next write reopens them."""
+        if self._log is None:
+            return
+        try:
+            self.sync()
+        finally:
+            self._nonces.close()
+            self._log.close()
+            self._nonces = self._log = None
+            if self._checkpoint_fd is not None:
+                os.close(self._checkpoint_fd)
+                self._checkpoint_fd = None
+
+
+@dataclass
+class _AuditRequest:
+    kind: str  # "log", "flush" or "sync"
+    future: Future
+    event: str = ""
+    data: Optional[Dict[str, Any]] = None
+    durable: bool = False
+
+
+_STOP = object()
+
+
+def _resolve(future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _run_writer(chain_ref: "weakref.ReferenceType[AuditChain]", requests: "queue.Queue[Any]") -> None:
+    """
+    Body of an AuditChain's writer thread.
+
+    The chain is only referenced while a request is handled, so a chain that
+    is dropped without close() can still be collected (and closed).
+    """
+    timeout: Optional[float] = None
+    while True:
+        try:
+            request = requests.get(timeout=timeout)
+        except queue.Empty:
+            request = None
+        if request is _STOP:
+            return
+        chain = chain_ref()
+        if chain is None:
+            return
+        try:
+            timeout = chain._handle(request)
+        except Exception:
+            logger.exception("audit_chain: writer thread failed to handle a request")
+            timeout = chain._flush_interval or None
+        del chain
 
 
 class AuditChain:
@@ -91,14 +400,23 @@ class AuditChain:
     - Each entry includes prev_hash and content hash to create an immutable chain.
     - Entries are validated against AUDIT_SCHEMA before persistence.
     - Supports batching and backpressure for high-throughput scenarios.
+    - Writes through a persistent AuditLogWriter; call `close()` when done.
+    - Safe for concurrent producers: events go through a bounded queue to one
+      writer thread, which assigns seq, chains hashes and writes in order.
     """
 
     def __init__(
-        self, log_path: str = AUDIT_LOG_PATH, rotate_bytes: int = AUDIT_ROTATE_BYTES
+        self,
+        log_path: str = AUDIT_LOG_PATH,
+        rotate_bytes: int = AUDIT_ROTATE_BYTES,
+        fsync: str = AUDIT_FSYNC_POLICY,
+        fsync_interval: float = AUDIT_FSYNC_INTERVAL,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL,
     ) -> None:
+        self._submit_lock = threading.Lock()
+        self._closed = False
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        self.prev_hash = self._recover_tail_hash() or ("0" * 64)
         self.rotate_bytes = rotate_bytes
 
         # PATCH: Cursor-2025-10-08 Add batching and backpressure support
@@ -106,57 +424,198 @@ def __init__(
         self._backpressure_enabled = AUDIT_BACKPRESSURE_ENABLED
         self._backpressure_threshold = AUDIT_BACKPRESSURE_THRESHOLD
         self._pending_batch: List[Dict[str, Any]] = []
-        self._batch_lock = False  # Simple mutex for batch operations
+        self._pending_lines: List[str] = []
+        self._flush_interval = flush_interval
 
         # Replay protection controls
         self._require_nonce = os.environ.get("IOA_AUDIT_REQUIRE_NONCE", "1") in ("1", "true", "TRUE")
         self._strict_replay_check = os.environ.get("IOA_AUDIT_REPLAY_STRICT", "0") in ("1", "true", "TRUE")
         self._nonce_index_path = self.log_path.with_suffix(".nonce")
-        self._seen_nonces: set[str] = set()
-        self._seq_counter = self._recover_next_sequence()
-        self._load_nonce_index()
-
-    # PATCH: Cursor-2025-10-08 Backpressure check for high-throughput scenarios
-    def _should_apply_backpressure(self) -> bool:
-        """Check if backpressure should be applied based on pending batch size."""
-        if not self._backpressure_enabled:
-            return False
-        return len(self._pending_batch) >= self._backpressure_threshold
+        self._checkpoint_path = self.log_path.with_suffix(".ckpt")
+        # Strict mode also checks nonces older than the retention window, on disk.
+        self._nonces = NonceStore(
+            self.log_path.with_suffix(".nonces.db"),
+            retention_seconds=AUDIT_NONCE_RETENTION,
+            keep_expired=self._strict_replay_check,
+        )
+        self._writer = AuditLogWriter(
+            self.log_path, self._nonce_index_path, fsync, fsync_interval, checkpoint_path=self._checkpoint_path
+        )
+        self._writer.nonce_generation = self._nonces.generation
+        self._recover_position()
+        # The .nonce file is the journal; index whatever it holds beyond the store
+        self._nonces.index_journal(self._nonce_index_path)
+
+        # PATCH: Cursor-2025-10-08 Backpressure: producers block on a full queue, then raise
+        self._backpressure_timeout = AUDIT_BACKPRESSURE_TIMEOUT
+        self._requests: "queue.Queue[Any]" = queue.Queue(
+            maxsize=self._backpressure_threshold if self._backpressure_enabled else 0
+        )
+        # Futures of durable submissions, resolved once their batch is fsynced
+        self._durable_waiters: List[Tuple[Future, Dict[str, Any]]] = []
+        self._thread = threading.Thread(
+            target=_run_writer,
+            args=(weakref.ref(self), self._requests),
+            name=f"ioa-audit-writer:{self.log_path.name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Writer thread: the only code that touches chain state after __init__
+    # ------------------------------------------------------------------
+
+    def _handle(self, request: Optional[_AuditRequest]) -> Optional[float]:
+        """
+        Handle one request (None after an idle timeout) on the writer thread.
 
-    def _flush_batch_if_needed(self) -> None:
-        """Flush batch if it reaches the configured size."""
-        if len(self._pending_batch) >= self._batch_size:
+        Returns:
+            Seconds to wait for the next request before flushing, or None
+        """
+        if request is None:
+            self._flush_and_settle()
+        elif request.kind == "log":
+            try:
+                entry = self._sequence(request.event, request.data)
+            except Exception as e:
+                logger.warning(f"audit_chain: rejected {request.event}: {e}")
+                _resolve(request.future, error=e)
+            else:
+                if request.durable:
+                    self._durable_waiters.append((request.future, entry))
+                else:
+                    # Resolved after a batch it completes is written, as log() always did
+                    try:
+                        self._flush_if_due()
+                    finally:
+                        _resolve(request.future, entry)
+        else:
+            try:
+                self._flush_and_settle(sync=request.kind == "sync")
+            except Exception as e:
+                _resolve(request.future, error=e)
+            else:
+                _resolve(request.future)
+        self._flush_if_due()
+        if self._pending_batch and self._flush_interval > 0:
+            return self._flush_interval
+        return None
+
+    def _flush_if_due(self) -> None:
+        # Durable waiters are flushed as soon as no more requests are queued,
+        # so concurrent durable producers share one write and fsync
+        if len(self._pending_batch) >= self._batch_size or (self._durable_waiters and self._requests.empty()):
+            self._flush_and_settle()
+
+    def _flush_and_settle(self, sync: bool = False) -> None:
+        waiters, self._durable_waiters = self._durable_waiters, []
+        try:
             self._flush_pending_batch()
+            if sync or waiters:
+                self._writer.sync()
+        except Exception as e:
+            for future, _ in waiters:
+                _resolve(future, error=e)
+            raise
+        for future, entry in waiters:
+            _resolve(future, entry)
 
     def _flush_pending_batch(self) -> None:
         """Flush all pending batch entries to disk."""
-        if self._batch_lock or not self._pending_batch:
+        if not self._pending_batch:
             return
 
-        self._batch_lock = True
+        # Rotate if needed
+        self._maybe_rotate()
+
+        last = self._pending_batch[-1]
+        self._writer.write(
+            self._pending_lines,
+            [entry["nonce"] for entry in self._pending_batch],
+            tail_hash=last["hash"],
+            next_seq=last["seq"] + 1,
+        )
+        self.prev_hash = last["hash"]
         try:
-            # Rotate if needed
-            self._maybe_rotate()
-
-            with self.log_path.open("a", encoding="utf-8") as f:
-                for entry in self._pending_batch:
-                    f.write(json.dumps(entry, sort_keys=True) + "\n")
-                    self.prev_hash = entry["hash"]
-
-            batch_count = len(self._pending_batch)
-            self._pending_batch.clear()
-            logger.info("audit_chain: flushed batch of %d entries", batch_count)
-        finally:
-            self._batch_lock = False
+            self._nonces.commit_if_due(journal_offset=self._writer.nonce_offset)
+        except sqlite3.Error as e:
+            # The journal already holds these nonces; the next startup indexes them
+            logger.warning(f"audit_chain: failed to index nonces: {e}")
+
+        batch_count = len(self._pending_batch)
+        self._pending_batch.clear()
+        self._pending_lines.clear()
+        logger.info("audit_chain: flushed batch of %d entries", batch_count)
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def _put(self, request: _AuditRequest) -> Future:
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("Audit chain is closed")
+            try:
+                self._requests.put(request, timeout=self._backpressure_timeout)
+            except queue.Full:
+                raise RuntimeError(
+                    f"Audit backpressure triggered (queued={self._requests.qsize()}, "
+                    f"threshold={self._backpressure_threshold})"
+                ) from None
+        return request.future
 
     def flush(self) -> None:
         """Force flush any pending batched entries to disk."""
-        self._flush_pending_batch()
+        if not self._closed:
+            self._put(_AuditRequest("flush", Future())).result()
+
+    def sync(self) -> None:
+        """Flush pending entries and fsync the log and nonce index."""
+        if not self._closed:
+            self._put(_AuditRequest("sync", Future())).result()
+
+    def close(self) -> None:
+        """Write queued and pending entries, then sync and close the underlying files."""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+        thread = getattr(self, "_thread", None)
+        if thread is not None:
+            if thread is threading.current_thread():
+                # Collected on its own writer thread: finish inline, then let the thread exit
+                self._drain_requests()
+                self._requests.put_nowait(_STOP)
+            else:
+                self._requests.put(_STOP)
+                thread.join()
+                self._drain_requests()
+        try:
+            self._flush_and_settle()
+            self._nonces.commit(journal_offset=self._writer.nonce_offset)
+        finally:
+            self._writer.close()
+            self._nonces.close()
+
+    def _drain_requests(self) -> None:
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            if request is not _STOP:
+                self._handle(request)
+
+    def __enter__(self) -> "AuditChain":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def __del__(self):
         """Ensure pending batches are flushed on destruction."""
         try:
-            self.flush()
+            self.close()
         except Exception:
             pass  # Ignore errors during cleanup
 
@@ -219,11 +678,10 @@ def _redact(self, data: Any) -> Any:
     # PATCH: Cursor-2025-08-19 Implement size-based rotation with SHA-256 suffix
     def _maybe_rotate(self) -> None:
         try:
-            if not self.log_path.exists():
-                return
-            size = self.log_path.stat().st_size
+            size = self._writer.size()
             if size < self.rotate_bytes:
                 return
+            self._writer.close()
             # Compute checksum
             sha256 = hashlib.sha256()
             with self.log_path.open("rb") as f:
@@ -236,83 +694,114 @@ def _maybe_rotate(self) -> None:
             )
             rotated_path = self.log_path.with_name(rotated_name)
             os.replace(self.log_path, rotated_path)
-            # Reset current log file
+            # Reset current log file and start a new nonce generation and journal
             self.log_path.touch()
             self.prev_hash = "0" * 64
+            self._writer.nonce_generation = self._nonces.rotate()
+            self._nonce_index_path.write_bytes(b"")
             logger.info("audit_chain: rotated log to %s (size=%d)", rotated_path, size)
         except Exception as e:
             logger.error("audit_chain: rotation failed: %s", e)
 
-    def _recover_tail_hash(self) -> Optional[str]:
+    # Startup recovery: trust the checkpoint when the log line it points at
+    # carries its tail hash; a full scan is only the fallback.
+    def _recover_position(self) -> None:
+        """Recover prev_hash and the next sequence number from the checkpoint or the log."""
+        self.prev_hash, self._seq_counter = "0" * 64, 1
         if not self.log_path.exists():
-            return None
-        last = None
-        with self.log_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    last = line
-        if not last:
-            return None
+            return
         try:
-            payload = json.loads(last)
-            return payload.get("hash")
+            with self.log_path.open("rb") as f:
+                if self._recover_from_checkpoint(f):
+                    return
+                count, last, end = _scan_lines(f, 0)
+        except OSError as e:
+            logger.warning(f"Failed to recover audit chain position: {e}")
+            return
+        self._seq_counter = count + 1
+        if last is not None:
+            tail_hash = self._line_hash(last)
+            if tail_hash is None:
+                logger.warning("Failed to recover tail hash; starting fresh.")
+                return
+            self.prev_hash = tail_hash
+            try:
+                self._writer.write([], tail_hash=tail_hash, next_seq=self._seq_counter)
+            except OSError as e:
+                logger.warning(f"Failed to write audit checkpoint: {e}")
+        logger.info("audit_chain: recovered position by scanning %d entries", count)
+
+    def _recover_from_checkpoint(self, f: BinaryIO) -> bool:
+        checkpoint = read_checkpoint(self._checkpoint_path)
+        if checkpoint is None:
+            return False
+        offset = checkpoint["offset"]
+        size = os.fstat(f.fileno()).st_size
+        if offset > size:
+            return False
+        if offset:
+            tail = _tail_line(f, offset)
+            if tail is None or tail[0] != offset or self._line_hash(tail[1]) != checkpoint["tail_hash"]:
+                return False
+            prev_hash, next_seq = checkpoint["tail_hash"], checkpoint["next_seq"]
+        else:
+            prev_hash, next_seq = "0" * 64, checkpoint["next_seq"] or 1
+
+        # Entries flushed after the checkpoint (e.g. a crash in between) are replayed from its offset
+        count, last, _ = _scan_lines(f, offset) if offset < size else (0, None, offset)
+        if last is not None:
+            prev_hash = self._line_hash(last)
+            if prev_hash is None:
+                return False
+        self.prev_hash, self._seq_counter = prev_hash, next_seq + count
+        nonce_size = self._writer.nonce_offset
+        if checkpoint.get("nonce_generation") == self._writer.nonce_generation and nonce_size < checkpoint.get("nonce_offset", 0):
+            logger.warning("audit_chain: nonce index is shorter than its checkpoint; replay protection is incomplete")
+        logger.info("audit_chain: recovered position from checkpoint (+%d entries)", count)
+        return True
+
+    @staticmethod
+    def _line_hash(line: bytes) -> Optional[str]:
+        try:
+            return json.loads(line).get("hash")
         except Exception:
-            logger.warning("Failed to recover tail hash; starting fresh.")
             return None
 
-    def _recover_next_sequence(self) -> int:
-        """Recover the next sequence number based on existing log entries."""
-        try:
-            if not self.log_path.exists():
-                return 1
-            count = 0
-            with self.log_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        count += 1
-            return count + 1
-        except Exception as e:
-            logger.warning(f"Failed to recover sequence counter: {e}")
-            return 1
+    def _nonce_already_used(self, nonce: str) -> bool:
+        return nonce in self._nonces
 
-    def _load_nonce_index(self) -> None:
-        """Load previously seen nonces from index file if present."""
-        try:
-            if self._nonce_index_path.exists():
-                with self._nonce_index_path.open("r", encoding="utf-8") as f:
-                    for line in f:
-                        val = line.strip()
-                        if val:
-                            self._seen_nonces.add(val)
-        except Exception as e:
-            logger.warning(f"Failed to load nonce index: {e}")
+    def log(self, event: str, data: Dict[str, Any], durable: bool = False) -> Dict[str, Any]:
+        """
+        Append an event and wait for its entry.
 
-    def _persist_nonce(self, nonce: str) -> None:
-        try:
-            with self._nonce_index_path.open("a", encoding="utf-8") as f:
-                f.write(nonce + "\n")
-        except Exception as e:
-            logger.warning(f"Failed to persist nonce index: {e}")
+        Args:
+            event: Event type
+            data: Event data (redacted before it is logged)
+            durable: Wait until the entry is written and fsynced, not just sequenced
 
-    def _nonce_already_used(self, nonce: str) -> bool:
-        if nonce in self._seen_nonces:
-            return True
-        if self._strict_replay_check and self.log_path.exists():
-            try:
-                with self.log_path.open("r", encoding="utf-8") as f:
-                    for line in f:
-                        if nonce in line:
-                            return True
-            except Exception:
-                # Fall through to best-effort detection
-                pass
-        return False
-
-    def log(self, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        # PATCH: Cursor-2025-10-08 Check backpressure before logging
-        if self._should_apply_backpressure():
-            raise RuntimeError(f"Audit backpressure triggered (pending={len(self._pending_batch)}, threshold={self._backpressure_threshold})")
+        Returns:
+            The audit entry, including its seq and hash
+
+        Raises:
+            RuntimeError: On replay, backpressure, or a closed chain
+        """
+        return self.submit(event, data, durable=durable).result()
 
+    def submit(self, event: str, data: Dict[str, Any], durable: bool = False) -> Future:
+        """
+        Queue an event without waiting for it (fire and forget).
+
+        Args:
+            event: Event type
+            data: Event data; redacted and copied before this returns
+            durable: Resolve the future once the entry is fsynced instead of once it is sequenced
+
+        Returns:
+            Future resolving to the audit entry, or to the error that rejected it
+
+        Raises:
+            RuntimeError: If the chain is closed or the queue stayed full past the backpressure timeout
+        """
         # Redact sensitive values before logging
         safe_data = self._redact(data)
 
@@ -324,7 +813,10 @@ def log(self, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
                 "id": operator_id,
                 "role": operator_role or "unknown",
             }
+        return self._put(_AuditRequest("log", Future(), event, safe_data, durable))
 
+    def _sequence(self, event: str, safe_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Assign seq and the chained hash to an event and add it to the batch (writer thread)."""
         # Replay protection fields
         nonce = safe_data.get("nonce") or uuid.uuid4().hex
         if self._require_nonce and self._nonce_already_used(nonce):
@@ -332,15 +824,15 @@ def log(self, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
 
         seq = safe_data.get("seq") or self._seq_counter
 
-        entry = AuditEntry(
+        entry, line = AuditEntry(
             timestamp=datetime.now(timezone.utc).isoformat(),
             event=event,
             data=safe_data,
             prev_hash=self.prev_hash,
             nonce=nonce,
             seq=seq,
-        ).materialize()
-        validate(entry, AUDIT_SCHEMA)
+        ).serialize()
+        _AUDIT_VALIDATOR.validate(entry)
 
         # Optional TSA integration: timestamp the entry hash
         try:
@@ -363,18 +855,20 @@ def log(self, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
                     "tsr_sha256": ts_evd.tsr_sha256,
                     "created_at": ts_evd.created_at,
                 }
+                line = json.dumps(entry, sort_keys=True)
         except Exception as e:
             logger.warning(f"audit_chain: TSA timestamping failed: {e}")
 
         # PATCH: Cursor-2025-10-08 Add to batch instead of immediate write
+        # Reserved before the flush that journals it, so the index never
+        # records a journal offset past a nonce it does not hold
+        self._nonces.add(nonce)
+        # Nonces reach the journal in the same flush as their entries
         self._pending_batch.append(entry)
-        self._flush_batch_if_needed()
+        self._pending_lines.append(line)
 
         # Update prev_hash for next entry
         self.prev_hash = entry["hash"]
-        # Update replay protection state
-        self._seen_nonces.add(nonce)
-        self._persist_nonce(nonce)
         self._seq_counter = seq + 1
         logger.info("audit_chain: batched %s (pending=%d)", self.prev_hash, len(self._pending_batch))
         return entry
@@ -422,11 +916,14 @@ def log_sustainability_event(
 
 # PATCH: Cursor-2025-08-19 Added module-level singleton for integration wiring
 _audit_chain_instance: Optional[AuditChain] = None
+_audit_chain_lock = threading.Lock()
 
 
 def get_audit_chain() -> AuditChain:
     """Get the singleton AuditChain instance for this process."""
     global _audit_chain_instance
-    if _audit_chain_instance is None:
-        _audit_chain_instance = AuditChain()
+    with _audit_chain_lock:
+        if _audit_chain_instance is None:
+            _audit_chain_instance = AuditChain()
+            atexit.register(_audit_chain_instance.close)
     return _audit_chain_instance
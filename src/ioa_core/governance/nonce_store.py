@@ -0,0 +1,366 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+IOA Governance: Audit Nonce Store
+
+Replay protection for the audit chain without holding every nonce in memory.
+Nonces are indexed in SQLite and grouped into generations that follow audit
+log rotation. Each retained generation keeps a Bloom filter in memory, so a
+fresh nonce is usually rejected as unseen without touching disk, and a filter
+hit is confirmed by a primary-key lookup.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ioa_core.bloom import ScalableBloomFilter
+
+logger = logging.getLogger(__name__)
+
+# Generations closed longer ago than this are dropped; 0 keeps every generation
+AUDIT_NONCE_RETENTION = float(os.environ.get("IOA_AUDIT_NONCE_RETENTION", str(30 * 24 * 3600)))
+AUDIT_NONCE_BLOOM_CAPACITY = int(os.environ.get("IOA_AUDIT_NONCE_BLOOM_CAPACITY", "100000"))
+AUDIT_NONCE_BLOOM_FP_RATE = float(os.environ.get("IOA_AUDIT_NONCE_BLOOM_FP_RATE", "0.001"))
+# Reserved nonces indexed per SQLite transaction
+AUDIT_NONCE_INDEX_BATCH = int(os.environ.get("IOA_AUDIT_NONCE_INDEX_BATCH", "1000"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nonces (
+    nonce TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_nonces_generation ON nonces(generation);
+CREATE TABLE IF NOT EXISTS generations (
+    generation INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    closed_at REAL,
+    count INTEGER NOT NULL DEFAULT 0,
+    bloom BLOB,
+    bloom_count INTEGER
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class NonceStore:
+    """
+    Generational nonce index: a rotating set of Bloom filters over SQLite.
+
+    - `add()` reserves a nonce in memory; `commit()` indexes reserved nonces
+      in one transaction, and `commit_if_due()` does so once `index_batch`
+      have accumulated. The caller's journal covers reserved nonces that a
+      crash keeps from being indexed (see `index_journal()`).
+    - `rotate()` closes the current generation and drops generations that
+      were closed more than `retention_seconds` ago, rows included, unless
+      `keep_expired` is set. Expired rows that are kept have no filter, so
+      they are checked with an indexed lookup instead.
+    - Filters are saved with their generation on rotation and close; a
+      filter that missed commits (e.g. after a crash) is rebuilt from the
+      rows of its own generation only.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        retention_seconds: float = AUDIT_NONCE_RETENTION,
+        keep_expired: bool = False,
+        capacity: int = AUDIT_NONCE_BLOOM_CAPACITY,
+        fp_rate: float = AUDIT_NONCE_BLOOM_FP_RATE,
+        index_batch: int = AUDIT_NONCE_INDEX_BATCH,
+    ) -> None:
+        """
+        Open (or create) the nonce index.
+
+        Args:
+            path: SQLite database file
+            retention_seconds: How long closed generations stay checked; 0 keeps all
+            keep_expired: Keep rows of expired generations and check them on disk
+            capacity: Nonces per filter stage
+            fp_rate: Target false-positive rate of each filter
+            index_batch: Reserved nonces that make `commit_if_due()` commit
+        """
+        self.path = Path(path)
+        self.retention_seconds = retention_seconds
+        self.keep_expired = keep_expired
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.index_batch = max(1, index_batch)
+        # Guards the in-memory state and serializes use of the connection
+        self._lock = threading.RLock()
+        self._pending: Set[str] = set()
+        self._filters: Dict[int, ScalableBloomFilter] = {}
+        self._stats = {"lookups": 0, "filter_negatives": 0, "confirmed": 0, "false_positives": 0}
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT MAX(generation) FROM generations").fetchone()
+        if row[0] is None:
+            self._conn.execute("INSERT INTO generations (generation, started_at) VALUES (0, ?)", (time.time(),))
+            self.generation = 0
+        else:
+            self.generation = row[0]
+        self._load_filters()
+
+    # ------------------------------------------------------------------
+    # Filters
+    # ------------------------------------------------------------------
+
+    def _new_filter(self) -> ScalableBloomFilter:
+        return ScalableBloomFilter(self.capacity, self.fp_rate)
+
+    def _retained(self) -> List[int]:
+        """Generations within the retention window, newest first."""
+        if self.retention_seconds <= 0:
+            rows = self._conn.execute("SELECT generation FROM generations ORDER BY generation DESC")
+        else:
+            rows = self._conn.execute(
+                "SELECT generation FROM generations WHERE closed_at IS NULL OR closed_at >= ? "
+                "ORDER BY generation DESC",
+                (time.time() - self.retention_seconds,),
+            )
+        return [generation for (generation,) in rows]
+
+    def _load_filters(self) -> None:
+        for generation in self._retained():
+            count, blob, bloom_count = self._conn.execute(
+                "SELECT count, bloom, bloom_count FROM generations WHERE generation = ?", (generation,)
+            ).fetchone()
+            bloom = None
+            if blob is not None and bloom_count == count:
+                try:
+                    _, bloom, _ = ScalableBloomFilter.from_bytes(memoryview(blob), 0)
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable nonce filter of generation {generation}: {e}")
+            if bloom is None:
+                bloom = self._new_filter()
+                for (nonce,) in self._conn.execute("SELECT nonce FROM nonces WHERE generation = ?", (generation,)):
+                    bloom.add(nonce)
+                logger.info("nonce_store: rebuilt filter of generation %d (%d nonces)", generation, count)
+            self._filters[generation] = bloom
+
+    def _save_filter(self, generation: int) -> None:
+        bloom = self._filters.get(generation)
+        if bloom is None:
+            return
+        self._conn.execute(
+            "UPDATE generations SET bloom = ?, bloom_count = count WHERE generation = ?",
+            (bloom.to_bytes(str(generation)), generation),
+        )
+
+    # ------------------------------------------------------------------
+    # Nonces
+    # ------------------------------------------------------------------
+
+    def __contains__(self, nonce: str) -> bool:
+        with self._lock:
+            self._stats["lookups"] += 1
+            if nonce in self._pending:
+                self._stats["confirmed"] += 1
+                return True
+            candidates = [generation for generation, bloom in self._filters.items() if nonce in bloom]
+            found = False
+            if candidates:
+                placeholders = ",".join("?" * len(candidates))
+                found = self._conn.execute(
+                    f"SELECT 1 FROM nonces WHERE nonce = ? AND generation IN ({placeholders})", (nonce, *candidates)
+                ).fetchone() is not None
+            if not found and self.keep_expired:
+                # Expired generations have no filter; their rows are checked on disk
+                oldest = min(self._filters, default=self.generation + 1)
+                found = self._conn.execute(
+                    "SELECT 1 FROM nonces WHERE nonce = ? AND generation < ?", (nonce, oldest)
+                ).fetchone() is not None
+            if found:
+                self._stats["confirmed"] += 1
+            elif candidates:
+                self._stats["false_positives"] += 1
+            else:
+                self._stats["filter_negatives"] += 1
+        return found
+
+    def add(self, nonce: str) -> None:
+        """Reserve a nonce; it is seen immediately and indexed on the next commit."""
+        with self._lock:
+            self._pending.add(nonce)
+
+    def commit(self, journal_offset: Optional[int] = None) -> int:
+        """
+        Index all reserved nonces in the current generation.
+
+        Args:
+            journal_offset: Journal size covering every nonce indexed so far; nonces
+                must be reserved before they are journaled for this to hold
+
+        Returns:
+            Number of nonces indexed
+        """
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        if not pending and journal_offset is None:
+            return 0
+        return self._index(pending, journal_offset)
+
+    def commit_if_due(self, journal_offset: Optional[int] = None) -> int:
+        """
+        Commit once at least `index_batch` nonces are reserved.
+
+        Args:
+            journal_offset: Journal size covering every reserved nonce
+
+        Returns:
+            Number of nonces indexed
+        """
+        if len(self._pending) < self.index_batch:
+            return 0
+        return self.commit(journal_offset)
+
+    def _index(self, nonces: Iterable[str], journal_offset: Optional[int]) -> int:
+        nonces = list(nonces)
+        with self._lock:
+            return self._index_locked(nonces, journal_offset)
+
+    def _index_locked(self, nonces: List[str], journal_offset: Optional[int]) -> int:
+        generation = self.generation
+        try:
+            self._conn.execute("BEGIN")
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO nonces (nonce, generation) VALUES (?, ?)",
+                ((nonce, generation) for nonce in nonces),
+            )
+            added = self._conn.total_changes - before
+            self._conn.execute("UPDATE generations SET count = count + ? WHERE generation = ?", (added, generation))
+            if journal_offset is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('journal_offset', ?)", (journal_offset,)
+                )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            self._pending.update(nonces)
+            raise
+        bloom = self._filters.setdefault(generation, self._new_filter())
+        for nonce in nonces:
+            bloom.add(nonce)
+        return added
+
+    def journal_offset(self) -> int:
+        """Bytes of the nonce journal already indexed."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'journal_offset'").fetchone()
+        return row[0] if row else 0
+
+    def index_journal(self, journal_path: Path) -> int:
+        """
+        Index the part of a newline-delimited nonce journal not indexed yet.
+
+        Covers nonces journaled by a process that stopped before committing,
+        and imports journals written before the index existed.
+
+        Returns:
+            Number of nonces indexed
+        """
+        journal_path = Path(journal_path)
+        offset = self.journal_offset()
+        try:
+            size = journal_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+        if size <= offset:
+            return 0
+        nonces = []
+        with journal_path.open("rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn trailing write
+                offset += len(line)
+                nonce = line.strip().decode("utf-8")
+                if nonce:
+                    nonces.append(nonce)
+        added = self._index(nonces, offset)
+        logger.info("nonce_store: indexed %d journaled nonces", added)
+        return added
+
+    def rotate(self) -> int:
+        """
+        Close the current generation, start the next one and expire old ones.
+
+        The journal offset is reset, as the caller starts a new journal.
+
+        Returns:
+            The new generation number
+        """
+        self.commit()
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._save_filter(self.generation)
+                self._conn.execute("UPDATE generations SET closed_at = ? WHERE generation = ?", (now, self.generation))
+                self._conn.execute("INSERT INTO generations (generation, started_at) VALUES (?, ?)", (self.generation + 1, now))
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('journal_offset', 0)")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.generation += 1
+            self._filters[self.generation] = self._new_filter()
+            self._expire(now)
+        return self.generation
+
+    def _expire(self, now: float) -> None:
+        if self.retention_seconds <= 0:
+            return
+        expired = [
+            generation for (generation,) in self._conn.execute(
+                "SELECT generation FROM generations WHERE closed_at < ?", (now - self.retention_seconds,)
+            )
+        ]
+        for generation in expired:
+            self._filters.pop(generation, None)
+        if expired and not self.keep_expired:
+            placeholders = ",".join("?" * len(expired))
+            self._conn.execute("BEGIN")
+            self._conn.execute(f"DELETE FROM nonces WHERE generation IN ({placeholders})", expired)
+            self._conn.execute(f"DELETE FROM generations WHERE generation IN ({placeholders})", expired)
+            self._conn.execute("COMMIT")
+            logger.info("nonce_store: expired generations %s", expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup counters, retained generations and filter memory."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["generation"] = self.generation
+            stats["filters"] = {generation: bloom.stats() for generation, bloom in sorted(self._filters.items())}
+            stats["nonces"] = self._conn.execute("SELECT COUNT(*) FROM nonces").fetchone()[0]
+        stats["memory_bytes"] = sum(filter_stats["memory_bytes"] for filter_stats in stats["filters"].values())
+        return stats
+
+    def close(self) -> None:
+        """Index reserved nonces, save the current filter and close the database."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self.commit()
+                self._save_filter(self.generation)
+            finally:
+                self._conn.close()
+                self._conn = None
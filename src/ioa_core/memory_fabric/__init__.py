@@ -7,6 +7,7 @@
 
 
 from .fabric import MemoryFabric
+from .async_fabric import AsyncMemoryFabric
 from .schema import MemoryRecordV1, EmbeddingV1, StorageTier, MemoryType
 from .stores.base import MemoryStore
 from .stores.local_jsonl import LocalJSONLStore
@@ -16,9 +17,16 @@
 from .stores.s3 import S3Store
 from .metrics import MemoryFabricMetrics
 from .crypto import MemoryCrypto
+from .ann_index import IVFFlatIndex
+from .retention import RetentionPolicy, TTLSweeper
+from .durability import DurabilityLedger, DurabilityReport
+from .cache import CacheConfig, RecordCache
+from .query import FabricQuery
+from .changelog import ChangeEvent, ChangeLog, ChangeLogTruncatedError
 
 __all__ = [
     "MemoryFabric",
+    "AsyncMemoryFabric",
     "MemoryRecordV1", 
     "EmbeddingV1",
     "StorageTier",
@@ -28,7 +36,18 @@
     "SQLiteStore", 
     "S3Store",
     "MemoryFabricMetrics",
-    "MemoryCrypto"
+    "MemoryCrypto",
+    "IVFFlatIndex",
+    "RetentionPolicy",
+    "TTLSweeper",
+    "DurabilityLedger",
+    "DurabilityReport",
+    "CacheConfig",
+    "RecordCache",
+    "FabricQuery",
+    "ChangeEvent",
+    "ChangeLog",
+    "ChangeLogTruncatedError"
 ]
 
 __version__ = "1.0.0"
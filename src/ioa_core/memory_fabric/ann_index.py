@@ -0,0 +1,369 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import base64
+import json
+import math
+import os
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+"""Ann Index module."""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+INDEX_FORMAT_VERSION = 1
+SUPPORTED_METRICS = ("cosine", "dot")
+
+
+def _encode_floats(values: Iterable[float]) -> str:
+    """Pack floats as base64 float32 for compact JSON persistence."""
+    return base64.b64encode(array("f", values).tobytes()).decode("ascii")
+
+
+def _decode_floats(data: str) -> List[float]:
+    """Unpack base64 float32 data produced by _encode_floats."""
+    values = array("f")
+    values.frombytes(base64.b64decode(data.encode("ascii")))
+    return values.tolist()
+
+
+class IVFFlatIndex:
+    """
+    Approximate nearest-neighbour index over record embeddings (IVF-flat).
+
+    Vectors are partitioned into ``nlist`` inverted lists around k-means
+    centroids; a query scans only the ``nprobe`` closest lists. Until enough
+    vectors have been added to train the centroids the index answers with an
+    exact flat scan, so small fabrics always get exact results.
+
+    NumPy is used when installed; otherwise the index stays in exact mode
+    with a pure-Python scan.
+    """
+
+    def __init__(
+        self,
+        dimension: Optional[int] = None,
+        metric: str = "cosine",
+        nlist: int = 64,
+        nprobe: int = 8,
+        train_threshold: Optional[int] = None,
+        seed: int = 42,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            dimension: Vector dimension (inferred from the first vector if None)
+            metric: Similarity metric ('cosine' or 'dot')
+            nlist: Number of inverted lists (coarse clusters)
+            nprobe: Default number of lists probed per query (recall knob)
+            train_threshold: Vectors required before centroids are trained
+                (defaults to 39 * nlist, the usual k-means sample floor)
+            seed: Seed for centroid training
+        """
+        if metric not in SUPPORTED_METRICS:
+            raise ValueError(f"Unsupported metric: {metric}")
+        self.dimension = dimension
+        self.metric = metric
+        self.nlist = max(1, int(nlist))
+        self.nprobe = max(1, int(nprobe))
+        self.train_threshold = train_threshold if train_threshold is not None else 39 * self.nlist
+        self.seed = seed
+
+        # Row storage; deleted rows are tombstoned until the next rebuild
+        self._ids: List[Optional[str]] = []
+        self._memory_types: List[Optional[str]] = []
+        self._tiers: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors: List[List[float]] = []
+        self._matrix = None  # numpy mirror of _vectors, grown lazily
+        self._matrix_rows = 0
+
+        # IVF state
+        self._centroids = None
+        self._lists: List[List[int]] = []
+        self.dirty = False
+
+    # ------------------------------------------------------------------
+    # Basic properties
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        """True once centroids exist and queries use inverted lists."""
+        return self._centroids is not None
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+    def _prepare(self, vector: List[float]) -> List[float]:
+        """Validate dimension and normalize for the cosine metric."""
+        values = [float(v) for v in vector]
+        if self.dimension is None:
+            self.dimension = len(values)
+        elif len(values) != self.dimension:
+            raise ValueError(f"Vector dimension {len(values)} does not match index dimension {self.dimension}")
+        if self.metric == "cosine":
+            norm = math.sqrt(sum(v * v for v in values))
+            if norm > 0:
+                values = [v / norm for v in values]
+        return values
+
+    def add(
+        self,
+        record_id: str,
+        vector: List[float],
+        memory_type: Optional[str] = None,
+        storage_tier: Optional[str] = None,
+    ) -> None:
+        """Add or replace the vector for a record."""
+        if record_id in self._rows:
+            self.remove(record_id)
+
+        values = self._prepare(vector)
+        row = len(self._ids)
+        self._ids.append(record_id)
+        self._memory_types.append(memory_type)
+        self._tiers.append(storage_tier)
+        self._vectors.append(values)
+        self._rows[record_id] = row
+        self.dirty = True
+
+        if self.is_trained:
+            self._lists[self._nearest_list(values)].append(row)
+        elif np is not None and len(self._rows) >= self.train_threshold:
+            self.train()
+
+    def remove(self, record_id: str) -> bool:
+        """Tombstone a record's vector. Returns True if it was indexed."""
+        row = self._rows.pop(record_id, None)
+        if row is None:
+            return False
+        self._ids[row] = None
+        self.dirty = True
+        return True
+
+    def update_tier(self, record_id: str, storage_tier: str) -> None:
+        """Update the storage tier used for filtering."""
+        row = self._rows.get(record_id)
+        if row is not None:
+            self._tiers[row] = storage_tier
+            self.dirty = True
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+    def _get_matrix(self):
+        """Return the numpy matrix of all rows (including tombstones)."""
+        if self._matrix is None or self._matrix_rows != len(self._vectors):
+            if self._matrix is not None and self._matrix_rows < len(self._vectors):
+                tail = np.asarray(self._vectors[self._matrix_rows:], dtype=np.float32)
+                self._matrix = np.vstack([self._matrix, tail])
+            else:
+                self._matrix = np.asarray(self._vectors, dtype=np.float32).reshape(-1, self.dimension or 0)
+            self._matrix_rows = len(self._vectors)
+        return self._matrix
+
+    def train(self, iterations: int = 10) -> bool:
+        """Train IVF centroids with k-means over the live vectors."""
+        if np is None or len(self._rows) < self.nlist:
+            return False
+
+        live_rows = np.fromiter(self._rows.values(), dtype=np.int64)
+        matrix = self._get_matrix()
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(len(live_rows), 256 * self.nlist)
+        sample = matrix[rng.choice(live_rows, size=sample_size, replace=False)]
+
+        centroids = sample[rng.choice(sample_size, size=self.nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(self.nlist):
+                members = sample[assignments == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            if self.metric == "cosine":
+                norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+                centroids /= np.where(norms > 0, norms, 1.0)
+
+        self._centroids = centroids
+        self._lists = [[] for _ in range(self.nlist)]
+        assignments = np.argmax(matrix[live_rows] @ centroids.T, axis=1)
+        for row, c in zip(live_rows.tolist(), assignments.tolist()):
+            self._lists[c].append(row)
+        self.dirty = True
+        return True
+
+    def _nearest_list(self, values: List[float]) -> int:
+        query = np.asarray(values, dtype=np.float32)
+        return int(np.argmax(self._centroids @ query))
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _accepts(value: Optional[str], wanted: Optional[Union[str, List[str]]]) -> bool:
+        if wanted is None:
+            return True
+        if isinstance(wanted, (list, tuple, set)):
+            return value in wanted
+        return value == wanted
+
+    def search(
+        self,
+        vector: List[float],
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+        exact: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the k most similar records.
+
+        Args:
+            vector: Query vector
+            k: Number of results
+            filters: Optional 'memory_type' / 'storage_tier' filters (value or list)
+            nprobe: Lists to probe (overrides the index default)
+            exact: Scan every vector instead of probing lists
+
+        Returns:
+            List of (record_id, score) sorted by descending score
+        """
+        if not self._rows or k <= 0:
+            return []
+
+        query = self._prepare(vector)
+        filters = filters or {}
+        memory_type = filters.get("memory_type")
+        storage_tier = filters.get("storage_tier")
+
+        if self.is_trained and not exact:
+            probe = min(self.nlist, nprobe or self.nprobe)
+            q = np.asarray(query, dtype=np.float32)
+            nearest = np.argsort(-(self._centroids @ q))[:probe]
+            rows = [row for c in nearest.tolist() for row in self._lists[c]]
+        else:
+            rows = list(self._rows.values())
+
+        rows = [
+            row for row in rows
+            if self._ids[row] is not None
+            and self._accepts(self._memory_types[row], memory_type)
+            and self._accepts(self._tiers[row], storage_tier)
+        ]
+        if not rows:
+            return []
+
+        if np is not None:
+            matrix = self._get_matrix()
+            row_idx = np.asarray(rows, dtype=np.int64)
+            scores = matrix[row_idx] @ np.asarray(query, dtype=np.float32)
+            top = min(k, len(rows))
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best])]
+            return [(self._ids[rows[i]], float(scores[i])) for i in best.tolist()]
+
+        scored = [
+            (self._ids[row], sum(a * b for a, b in zip(self._vectors[row], query)))
+            for row in rows
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:k]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "vectors": len(self._rows),
+            "tombstones": len(self._ids) - len(self._rows),
+            "dimension": self.dimension,
+            "metric": self.metric,
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "trained": self.is_trained,
+            "backend": "numpy" if np is not None else "python",
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize live rows (tombstones are compacted away)."""
+        live = sorted(self._rows.values())
+        remap = {row: i for i, row in enumerate(live)}
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "dimension": self.dimension,
+            "metric": self.metric,
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "train_threshold": self.train_threshold,
+            "seed": self.seed,
+            "ids": [self._ids[row] for row in live],
+            "memory_types": [self._memory_types[row] for row in live],
+            "storage_tiers": [self._tiers[row] for row in live],
+            "vectors": _encode_floats(v for row in live for v in self._vectors[row]),
+            "centroids": None,
+            "lists": None,
+        }
+        if self.is_trained:
+            data["centroids"] = _encode_floats(self._centroids.ravel().tolist())
+            data["lists"] = [[remap[row] for row in lst if row in remap] for lst in self._lists]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IVFFlatIndex":
+        """Restore an index serialized with to_dict."""
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format: {data.get('version')}")
+        index = cls(
+            dimension=data["dimension"],
+            metric=data["metric"],
+            nlist=data["nlist"],
+            nprobe=data["nprobe"],
+            train_threshold=data.get("train_threshold"),
+            seed=data.get("seed", 42),
+        )
+        flat = _decode_floats(data["vectors"])
+        dim = index.dimension or 0
+        index._ids = list(data["ids"])
+        index._memory_types = list(data["memory_types"])
+        index._tiers = list(data["storage_tiers"])
+        index._vectors = [flat[i * dim:(i + 1) * dim] for i in range(len(index._ids))]
+        index._rows = {record_id: row for row, record_id in enumerate(index._ids)}
+        if data.get("centroids") and np is not None:
+            index._centroids = np.asarray(_decode_floats(data["centroids"]), dtype=np.float32).reshape(index.nlist, dim)
+            index._lists = [list(lst) for lst in data["lists"]]
+        return index
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Atomically persist the index as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IVFFlatIndex":
+        """Load an index persisted with save."""
+        with open(path, "r", encoding="utf-8") as f:
+            index = cls.from_dict(json.load(f))
+        index.dirty = False
+        return index
@@ -0,0 +1,303 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, List, Optional, Union
+"""Async Fabric module."""
+
+from .fabric import MemoryFabric
+from .metrics import MetricsCollector
+from .schema import MemoryRecordV1, MemoryType, StorageTier, EmbeddingV1
+from .stores.async_stores import create_async_store
+
+
+class AsyncMemoryFabric:
+    """
+    Async facade over MemoryFabric.
+
+    Record preparation (metadata, 4D tiering, encryption), the ANN index and
+    metrics are shared with a regular MemoryFabric, so both facades have the
+    same semantics; only store I/O differs, running on the async store's
+    executor (or async S3 client) instead of the calling thread.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+        encryption_key: Optional[str] = None,
+        enable_metrics: bool = True,
+        max_concurrency: Optional[int] = None,
+        fabric: Optional[MemoryFabric] = None
+    ):
+        """
+        Initialize the async memory fabric.
+
+        Args:
+            backend: Storage backend ('local_jsonl', 'sqlite', 's3')
+            config: Backend-specific configuration
+            encryption_key: Optional encryption key for at-rest encryption
+            enable_metrics: Whether to enable metrics collection
+            max_concurrency: Maximum store calls in flight
+            fabric: Existing MemoryFabric to wrap (other arguments are ignored)
+        """
+        self.fabric = fabric or MemoryFabric(
+            backend=backend,
+            config=config,
+            encryption_key=encryption_key,
+            enable_metrics=enable_metrics
+        )
+        self.logger = logging.getLogger(__name__)
+        self.metrics = self.fabric.metrics
+        self.backend_name = self.fabric.backend_name
+        self._store = create_async_store(self.fabric._store, max_concurrency=max_concurrency)
+
+    def _collect(self, operation: str):
+        return MetricsCollector(self.metrics, operation) if self.metrics else nullcontext()
+
+    async def store(
+        self,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+        memory_type: Union[str, MemoryType] = MemoryType.CONVERSATION,
+        storage_tier: Union[str, StorageTier] = StorageTier.HOT,
+        record_id: Optional[str] = None,
+        embedding: Optional[EmbeddingV1] = None
+    ) -> str:
+        """
+        Store content in memory fabric.
+
+        Args:
+            content: Content to store
+            metadata: Optional metadata
+            tags: Optional tags
+            memory_type: Type of memory
+            storage_tier: Storage tier preference
+            record_id: Optional custom record ID
+            embedding: Optional embedding, indexed for search_similar()
+
+        Returns:
+            Record ID
+        """
+        with self._collect("writes"):
+            try:
+                record = self.fabric._prepare_record(
+                    content, metadata, tags, memory_type, storage_tier, record_id, embedding
+                )
+                self.fabric._before_store_many([record])
+                if not await self._store.store(record):
+                    raise Exception("Failed to store record")
+                self.fabric._after_store(record, content)
+
+                self.logger.debug(f"Stored record {record.id}")
+                return record.id
+
+            except Exception as e:
+                self.logger.error(f"Failed to store record: {e}")
+                raise
+
+    async def store_batch(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store multiple records concurrently (bounded by the store's concurrency).
+
+        Args:
+            records: List of record dictionaries with 'content', 'metadata', etc.
+
+        Returns:
+            List of record IDs, in input order
+        """
+        record_ids = await asyncio.gather(*(
+            self.store(
+                content=record.get("content", ""),
+                metadata=record.get("metadata", {}),
+                tags=record.get("tags"),
+                memory_type=record.get("memory_type", MemoryType.CONVERSATION),
+                storage_tier=record.get("storage_tier", StorageTier.AUTO),
+                record_id=record.get("id"),
+                embedding=record.get("embedding")
+            )
+            for record in records
+        ))
+        self.logger.info(f"Batch stored {len(records)} records")
+        return list(record_ids)
+
+    async def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """
+        Retrieve a memory record by ID.
+
+        Args:
+            record_id: Record ID to retrieve
+
+        Returns:
+            Memory record or None if not found
+        """
+        with self._collect("reads"):
+            try:
+                id_filters = self.fabric._id_filters
+                if id_filters is not None and not id_filters.might_contain(record_id, prefix="tier:"):
+                    return None
+                if self.fabric._record_cache is not None:
+                    # Misses and write-behind flushes block, so run off the loop
+                    return await self._store._run(self.fabric._retrieve_cached, record_id)
+                record = await self._store.retrieve(record_id)
+                if record is None:
+                    if id_filters is not None:
+                        id_filters.record_false_positive()
+                    return None
+                self.fabric._note_access(record)
+                return self.fabric._decrypted_copy(record)
+            except Exception as e:
+                self.logger.error(f"Failed to retrieve record {record_id}: {e}")
+                return None
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[str] = None,
+        storage_tier: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """
+        Search for memory records.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            memory_type: Filter by memory type
+            storage_tier: Filter by storage tier
+            fields: Record fields to read (id is always included; None for all)
+
+        Returns:
+            List of matching records; encrypted content is decrypted on first access
+        """
+        store_fields = self.fabric._store_projection(fields)
+        with self._collect("queries"):
+            try:
+                if storage_tier:
+                    # Push the tier filter down so it applies before the limit
+                    results = await self._store.query(
+                        self.fabric._tier_search_query(query, limit, memory_type, storage_tier, store_fields)
+                    )
+                else:
+                    results = await self._store.search(query, limit, memory_type, store_fields)
+                return self.fabric._decrypt_lazily(results)
+            except Exception as e:
+                self.logger.error(f"Failed to search: {e}")
+                return []
+
+    async def search_similar(
+        self,
+        vector: List[float],
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+        exact: bool = False
+    ) -> List[tuple]:
+        """
+        Find records whose embeddings are most similar to a query vector.
+
+        See MemoryFabric.search_similar(); the index lookup runs in memory and
+        only the record fetch is awaited.
+        """
+        index = self.fabric._vector_index
+        with self._collect("queries"):
+            try:
+                if index is None or len(index) == 0:
+                    return []
+                hits = index.search(vector, k=k, filters=filters, nprobe=nprobe, exact=exact)
+                scores = dict(hits)
+                records = self.fabric._decrypt_lazily(await self._store.get_many([record_id for record_id, _ in hits]))
+                return [(record, scores[record.id]) for record in records]
+            except Exception as e:
+                self.logger.error(f"Failed similarity search: {e}")
+                return []
+
+    async def query(
+        self,
+        text: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = 10
+    ) -> List[MemoryRecordV1]:
+        """
+        Query records with filters pushed into the backend; see MemoryFabric.query().
+
+        Args:
+            text: Optional full-text match
+            filters: Field filters, all of which must match
+            order_by: Field or list of fields, "-" prefix for descending
+            limit: Maximum number of results (None for all)
+
+        Returns:
+            Matching records, decrypted
+        """
+        return await self._store._run(self.fabric.query, text, filters, order_by, limit)
+
+    async def delete(self, record_id: str) -> bool:
+        """
+        Delete a memory record.
+
+        Args:
+            record_id: Record ID to delete
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        with self._collect("writes"):
+            try:
+                success = await self._store.delete(record_id)
+                if success:
+                    self.fabric._after_delete([record_id])
+                if success and self.metrics:
+                    self.metrics.update_record_count((await self._store.get_stats()).get("total_records", 0))
+                return success
+            except Exception as e:
+                self.logger.error(f"Failed to delete record {record_id}: {e}")
+                return False
+
+    async def list_all(self, limit: Optional[int] = None, fields: Optional[Iterable[str]] = None) -> List[MemoryRecordV1]:
+        """
+        List all memory records.
+
+        Args:
+            limit: Maximum number of records to return
+            fields: Record fields to read (id is always included; None for all)
+
+        Returns:
+            List of all records; encrypted content is decrypted on first access
+        """
+        store_fields = self.fabric._store_projection(fields)
+        with self._collect("reads"):
+            try:
+                return self.fabric._decrypt_lazily(await self._store.list_all(limit, store_fields))
+            except Exception as e:
+                self.logger.error(f"Failed to list records: {e}")
+                return []
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get memory fabric statistics."""
+        return self.fabric.get_stats()
+
+    async def flush(self):
+        """Flush pending commits and the vector index off the event loop."""
+        await self._store._run(self.fabric.flush)
+
+    async def close(self):
+        """Close the fabric, draining in-flight store calls first."""
+        await self._store._run(self.fabric.close)
+        await self._store.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,400 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from .fabric import MemoryFabric
+"""Bench module."""
+
+REPORT_VERSION = 1
+
+_WORDS = (
+    "agent", "audit", "policy", "memory", "fabric", "consensus", "ledger", "vector",
+    "latency", "tier", "shard", "record", "query", "cache", "replica", "governance",
+    "evidence", "workflow", "provider", "token", "budget", "region", "schema", "index"
+)
+_MEMORY_TYPES = ("conversation", "knowledge", "context", "metadata")
+
+
+@dataclass
+class Workload:
+    """A named benchmark workload: an operation mix and the fabric it runs against."""
+    name: str
+    description: str
+    mix: Dict[str, float]  # Share of "write", "read" and "search" operations
+    env: Dict[str, str] = field(default_factory=dict)  # Environment while the fabric is open
+    config: Dict[str, Any] = field(default_factory=dict)  # Extra fabric config
+    encryption_key: Optional[str] = None
+    sharded: bool = False  # Writes go through store_batch() to the shard databases
+
+
+WORKLOADS: Dict[str, Workload] = {
+    workload.name: workload for workload in (
+        Workload("write-heavy", "90% single-record writes, 10% reads by id", {"write": 0.9, "read": 0.1}),
+        Workload("read-heavy", "10% writes, 90% reads by id", {"write": 0.1, "read": 0.9}),
+        Workload(
+            "search-mixed", "20% writes, 40% reads, 40% full-text searches",
+            {"write": 0.2, "read": 0.4, "search": 0.4}
+        ),
+        Workload(
+            "encrypted", "Half writes, half reads with AES-GCM content encryption",
+            {"write": 0.5, "read": 0.5}, encryption_key="ioa-bench-key"
+        ),
+        Workload(
+            "sharded", "One store_batch() across 4 shard databases, then reads by primary key",
+            {"write": 1.0}, env={"IOA_SHARDS": "4"}, sharded=True
+        ),
+        Workload(
+            "tiering-4d-on", "Half writes, half reads with 4D tiering classification",
+            {"write": 0.5, "read": 0.5}, env={"USE_4D_TIERING": "true"}
+        ),
+        Workload(
+            "tiering-4d-off", "Half writes, half reads without 4D tiering",
+            {"write": 0.5, "read": 0.5}, env={"USE_4D_TIERING": "false"}
+        ),
+    )
+}
+
+# Pinned for every workload unless it overrides them, so runs on different hosts compare
+_BASE_ENV = {"USE_4D_TIERING": "false", "IOA_SHARDS": "1"}
+
+
+def generate_records(count: int, seed: int, prefix: str = "bench") -> List[Dict[str, Any]]:
+    """
+    Deterministic record dictionaries for store_many()/store_batch().
+
+    Args:
+        count: Number of records
+        seed: Random seed; the same seed always yields the same records
+        prefix: Record id prefix
+
+    Returns:
+        Records with content, metadata, tags, memory_type and id
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        words = rng.choices(_WORDS, k=rng.randint(12, 40))
+        records.append({
+            "id": f"{prefix}-{i:08d}",
+            "content": " ".join(words),
+            "metadata": {"source": "bench", "sequence": i, "score": round(rng.random(), 4)},
+            "tags": sorted(set(rng.sample(_WORDS, 3))),
+            "memory_type": rng.choice(_MEMORY_TYPES)
+        })
+    return records
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of `values` (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB (None where unavailable)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+@contextmanager
+def _environ(overrides: Dict[str, str]) -> Iterator[None]:
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _latency_summary(latencies: Sequence[float]) -> Dict[str, Any]:
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "count": len(ms),
+        "p50_ms": round(percentile(ms, 50), 4) if ms else None,
+        "p99_ms": round(percentile(ms, 99), 4) if ms else None,
+        "mean_ms": round(statistics.fmean(ms), 4) if ms else None
+    }
+
+
+class BenchmarkRunner:
+    """
+    Runs workloads against fresh fabrics in temporary directories.
+
+    Every iteration replays the same seeded records and operation sequence;
+    warmup iterations run first and are not reported. Throughput is the
+    median over the measured iterations, latency percentiles are taken over
+    every measured operation. Peak RSS is the process high-water mark after
+    the workload, so it only isolates a workload run on its own.
+    """
+
+    def __init__(
+        self,
+        records: int = 2000,
+        operations: Optional[int] = None,
+        iterations: int = 3,
+        warmup: int = 1,
+        seed: int = 42,
+        backend: str = "sqlite",
+        work_dir: Optional[str] = None,
+        on_iteration: Optional[Callable[[str, int, Dict[str, Any]], None]] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            records: Records loaded before the timed operations
+            operations: Timed operations per iteration (default: `records`)
+            iterations: Measured iterations per workload
+            warmup: Unreported iterations run first
+            seed: Seed of the data and the operation sequence
+            backend: Fabric backend of the non-sharded workloads
+            work_dir: Parent of the temporary fabric directories
+            on_iteration: Called with (workload, iteration, result) after each measured iteration
+        """
+        self.records = records
+        self.operations = operations or records
+        self.iterations = max(1, iterations)
+        self.warmup = max(0, warmup)
+        self.seed = seed
+        self.backend = backend
+        self.work_dir = work_dir
+        self.on_iteration = on_iteration
+
+    def run(self, names: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Run workloads and build the report.
+
+        Args:
+            names: Workload names (default: all of WORKLOADS)
+
+        Returns:
+            JSON-serializable report
+        """
+        names = list(names or WORKLOADS)
+        unknown = [name for name in names if name not in WORKLOADS]
+        if unknown:
+            raise ValueError(f"Unknown workloads: {', '.join(unknown)} (choose from {', '.join(WORKLOADS)})")
+        return {
+            "version": REPORT_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "settings": {
+                "records": self.records,
+                "operations": self.operations,
+                "iterations": self.iterations,
+                "warmup": self.warmup,
+                "seed": self.seed,
+                "backend": self.backend
+            },
+            "environment": environment(),
+            "workloads": {name: self.run_workload(WORKLOADS[name]) for name in names}
+        }
+
+    def run_workload(self, workload: Workload) -> Dict[str, Any]:
+        """Warm up, then run the measured iterations of one workload."""
+        for _ in range(self.warmup):
+            self._iteration(workload)
+        results = []
+        for iteration in range(self.iterations):
+            result = self._iteration(workload)
+            results.append(result)
+            if self.on_iteration is not None:
+                self.on_iteration(workload.name, iteration, result)
+
+        latencies: Dict[str, List[float]] = {}
+        for result in results:
+            for op, values in result.pop("latencies").items():
+                latencies.setdefault(op, []).extend(values)
+        every = [value for values in latencies.values() for value in values]
+        overall = _latency_summary(every)
+        return {
+            "description": workload.description,
+            "ops_per_sec": round(statistics.median(result["ops_per_sec"] for result in results), 2),
+            "p50_ms": overall["p50_ms"],
+            "p99_ms": overall["p99_ms"],
+            "peak_rss_mb": peak_rss_mb(),
+            "operations": {op: _latency_summary(values) for op, values in sorted(latencies.items())},
+            "iterations": results
+        }
+
+    def _plan(self, workload: Workload) -> List[str]:
+        rng = random.Random(self.seed + 1)
+        ops = list(workload.mix)
+        return rng.choices(ops, weights=[workload.mix[op] for op in ops], k=self.operations)
+
+    def _iteration(self, workload: Workload) -> Dict[str, Any]:
+        data_dir = tempfile.mkdtemp(prefix=f"ioa-bench-{workload.name}-", dir=self.work_dir)
+        try:
+            with _environ({**_BASE_ENV, **workload.env}):
+                if workload.sharded:
+                    return asyncio.run(self._sharded_iteration(workload, data_dir))
+                return self._standard_iteration(workload, data_dir)
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    def _open(self, workload: Workload, data_dir: str, backend: str) -> MemoryFabric:
+        return MemoryFabric(
+            backend=backend,
+            config={"data_dir": data_dir, "db_name": "bench.db", **workload.config},
+            encryption_key=workload.encryption_key,
+            enable_metrics=False
+        )
+
+    def _standard_iteration(self, workload: Workload, data_dir: str) -> Dict[str, Any]:
+        preload = generate_records(self.records, self.seed)
+        fresh = iter(generate_records(self.operations, self.seed + 2, prefix="bench-new"))
+        rng = random.Random(self.seed + 3)
+        latencies: Dict[str, List[float]] = {}
+        mf = self._open(workload, data_dir, self.backend)
+        try:
+            for start in range(0, len(preload), 1000):
+                mf.store_many(preload[start:start + 1000])
+            ids = [record["id"] for record in preload]
+            started = time.perf_counter()
+            for op in self._plan(workload):
+                op_started = time.perf_counter()
+                if op == "write":
+                    record = next(fresh)
+                    mf.store(
+                        record["content"], metadata=record["metadata"], tags=record["tags"],
+                        memory_type=record["memory_type"], record_id=record["id"]
+                    )
+                    ids.append(record["id"])
+                elif op == "read":
+                    mf.retrieve(rng.choice(ids))
+                else:
+                    mf.search(" ".join(rng.sample(_WORDS, 2)), limit=10)
+                latencies.setdefault(op, []).append(time.perf_counter() - op_started)
+            elapsed = time.perf_counter() - started
+        finally:
+            mf.close()
+        return {"ops": self.operations, "elapsed_sec": round(elapsed, 4),
+                "ops_per_sec": round(self.operations / elapsed, 2) if elapsed > 0 else 0.0,
+                "latencies": latencies}
+
+    async def _sharded_iteration(self, workload: Workload, data_dir: str) -> Dict[str, Any]:
+        # Shard writers are asyncio tasks, so the fabric is opened inside the loop
+        records = generate_records(self.operations, self.seed)
+        rng = random.Random(self.seed + 3)
+        mf = self._open(workload, data_dir, "sqlite")
+        try:
+            started = time.perf_counter()
+            await mf.store_batch(records)
+            written = time.perf_counter()
+            read_latencies = []
+            for record in rng.sample(records, min(len(records), max(1, self.operations // 10))):
+                op_started = time.perf_counter()
+                mf.get_sharded_record(mf._generate_record_pk(record))
+                read_latencies.append(time.perf_counter() - op_started)
+            elapsed = time.perf_counter() - started
+        finally:
+            mf.close()
+        ops = len(records) + len(read_latencies)
+        return {"ops": ops, "elapsed_sec": round(elapsed, 4),
+                "ops_per_sec": round(ops / elapsed, 2) if elapsed > 0 else 0.0,
+                "latencies": {"write_batch": [written - started], "read": read_latencies}}
+
+
+def environment() -> Dict[str, Any]:
+    """Host details stored with a report, to tell apart results from different machines."""
+    from .. import __version__
+
+    return {
+        "ioa_core": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """Read a report (or baseline) written by save_report()."""
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    if report.get("version") != REPORT_VERSION:
+        raise ValueError(f"{path}: unsupported benchmark report version {report.get('version')}")
+    return report
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    """Write a report as JSON (atomically, so a baseline is never half-written)."""
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    os.replace(f"{path}.tmp", path)
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10) -> Dict[str, Any]:
+    """
+    Diff a report against a baseline.
+
+    A workload regresses when its throughput drops, or its p99 latency
+    grows, by more than `threshold` (a fraction of the baseline value).
+    Workloads missing from either side are listed but never regress.
+
+    Args:
+        report: Current report
+        baseline: Stored baseline report
+        threshold: Allowed relative change, e.g. 0.10 for 10%
+
+    Returns:
+        Per-workload changes, the regressions and an overall `ok`
+    """
+    workloads = {}
+    regressions = []
+    for name, current in report["workloads"].items():
+        base = baseline["workloads"].get(name)
+        if base is None:
+            continue
+        entry = {}
+        for metric, higher_is_better in (("ops_per_sec", True), ("p99_ms", False), ("p50_ms", False)):
+            before, after = base.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            entry[metric] = {"baseline": before, "current": after, "change_pct": round(100 * change, 2)}
+            if metric != "p50_ms" and (-change if higher_is_better else change) > threshold:
+                regressions.append({"workload": name, "metric": metric, **entry[metric]})
+        workloads[name] = entry
+    return {
+        "threshold_pct": round(100 * threshold, 2),
+        "workloads": workloads,
+        "regressions": regressions,
+        "missing_from_baseline": sorted(set(report["workloads"]) - set(baseline["workloads"])),
+        "missing_from_report": sorted(set(baseline["workloads"]) - set(report["workloads"])),
+        "ok": not regressions
+    }
@@ -0,0 +1,244 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import logging
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..bloom import BloomFilter, ScalableBloomFilter
+"""Bloom module."""
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"IOABLM1\0"
+
+# Filter set file (little endian): magic and filter count, then the
+# filters as serialized by ScalableBloomFilter.to_bytes()
+_FILE_HEADER = struct.Struct("<8sI")     # magic, filter count
+
+
+@dataclass
+class BloomConfig:
+    """Settings of the fabric's record id filters."""
+    enabled: bool = False
+    capacity: int = 100_000  # Keys per filter before it adds a stage
+    fp_rate: float = 0.01
+    rebuild_fraction: float = 0.2  # Deleted share of keys that triggers a rebuild after a TTL sweep
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> "BloomConfig":
+        """
+        Build settings from a fabric `bloom` config (True or a dict) or the environment.
+
+        A config dict enables the filters unless it sets `enabled: False`;
+        otherwise IOA_FABRIC_BLOOM=1 does. IOA_FABRIC_BLOOM_CAPACITY and
+        IOA_FABRIC_BLOOM_FP_RATE size them, and IOA_FABRIC_BLOOM_REBUILD_FRACTION
+        sets the deleted share of keys at which a TTL sweep rebuilds them.
+        """
+        if isinstance(config, bool):
+            config = {"enabled": config}
+        config = config or {}
+        enabled = config.get("enabled", True if config else os.getenv("IOA_FABRIC_BLOOM", "0"))
+        return cls(
+            enabled=str(enabled).lower() in ("1", "true", "yes"),
+            capacity=int(config.get("capacity", os.getenv("IOA_FABRIC_BLOOM_CAPACITY", "100000"))),
+            fp_rate=float(config.get("fp_rate", os.getenv("IOA_FABRIC_BLOOM_FP_RATE", "0.01"))),
+            rebuild_fraction=float(
+                config.get("rebuild_fraction", os.getenv("IOA_FABRIC_BLOOM_REBUILD_FRACTION", "0.2"))
+            )
+        )
+
+
+class IdFilterSet:
+    """
+    Named Bloom filters over record ids (one per storage tier or shard).
+
+    A key missing from every filter that could hold it was never written, so
+    the caller can answer a lookup without touching storage. Deleted keys
+    stay in the filters (harmless false positives) until rebuild().
+
+    The persisted file is only trusted when it was saved after the last add:
+    the first add after a save removes it, so a process that dies before its
+    next save leaves no file and the filters are rebuilt from storage.
+    """
+
+    def __init__(self, config: BloomConfig, path: Optional[str] = None):
+        """
+        Initialize the filter set.
+
+        Args:
+            config: Filter sizing
+            path: File the filters are persisted to
+        """
+        self.config = config
+        self.path = path
+        self._filters: Dict[str, ScalableBloomFilter] = {}
+        # Keys added while filters with a name prefix are being rebuilt
+        self._rebuilding: Dict[str, List[Tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+        self._persisted = False
+        # Deleted keys still set in the filters, by filter name prefix
+        self._removed: Dict[str, int] = {}
+        self._stats = {"lookups": 0, "negatives": 0, "false_positives": 0, "rebuilds": 0}
+
+    def _new_filter(self) -> ScalableBloomFilter:
+        return ScalableBloomFilter(self.config.capacity, self.config.fp_rate)
+
+    def _invalidate_file(self) -> None:
+        if self._persisted:
+            self._persisted = False
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    def add_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Add (filter name, key) pairs."""
+        with self._lock:
+            self._invalidate_file()
+            for name, key in items:
+                bloom = self._filters.get(name)
+                if bloom is None:
+                    bloom = self._filters[name] = self._new_filter()
+                bloom.add(key)
+                for prefix, pending in self._rebuilding.items():
+                    if name.startswith(prefix):
+                        pending.append((name, key))
+
+    def add(self, name: str, key: str) -> None:
+        """Add a key to the named filter."""
+        self.add_many([(name, key)])
+
+    def might_contain(self, key: str, names: Optional[Iterable[str]] = None, prefix: str = "") -> bool:
+        """
+        False only if the key was never added to any of the selected filters.
+
+        Args:
+            key: Record id (or shard primary key)
+            names: Filters to consult by name
+            prefix: Otherwise, consult every filter whose name starts with it
+        """
+        filters = self._filters
+        if names is not None:
+            candidates = [filters[name] for name in names if name in filters]
+        else:
+            candidates = [bloom for name, bloom in list(filters.items()) if name.startswith(prefix)]
+        found = any(key in bloom for bloom in candidates)
+        self._stats["lookups"] += 1
+        if not found:
+            self._stats["negatives"] += 1
+        return found
+
+    def record_false_positive(self) -> None:
+        """Count a lookup the filters passed that storage then missed."""
+        self._stats["false_positives"] += 1
+
+    def note_removed(self, count: int = 1, prefix: str = "") -> None:
+        """Count keys deleted from storage but still set in the filters under `prefix`."""
+        self._removed[prefix] = self._removed.get(prefix, 0) + count
+
+    def stale_fraction(self, prefix: str = "") -> float:
+        """Share of the keys in filters under `prefix` that have since been deleted."""
+        keys = sum(len(bloom) for name, bloom in list(self._filters.items()) if name.startswith(prefix))
+        return self._removed.get(prefix, 0) / keys if keys else 0.0
+
+    def rebuild(self, items: Iterable[Tuple[str, str]], prefix: str = "") -> int:
+        """
+        Replace the filters whose name starts with `prefix` with fresh ones
+        built from (name, key) pairs.
+
+        Keys added concurrently while `items` is being read are carried over,
+        so a rebuild never drops a write.
+
+        Returns:
+            Number of keys added
+        """
+        with self._lock:
+            self._rebuilding[prefix] = []
+        fresh: Dict[str, ScalableBloomFilter] = {}
+        added = 0
+        try:
+            for name, key in items:
+                bloom = fresh.get(name)
+                if bloom is None:
+                    bloom = fresh[name] = self._new_filter()
+                bloom.add(key)
+                added += 1
+        except BaseException:
+            with self._lock:
+                self._rebuilding.pop(prefix, None)
+            raise
+        with self._lock:
+            for name, key in self._rebuilding.pop(prefix):
+                fresh.setdefault(name, self._new_filter()).add(key)
+            self._invalidate_file()
+            filters = {name: bloom for name, bloom in self._filters.items() if not name.startswith(prefix)}
+            filters.update(fresh)
+            self._filters = filters
+            self._removed.pop(prefix, None)
+        self._stats["rebuilds"] += 1
+        return added
+
+    def save(self) -> None:
+        """Persist all filters atomically."""
+        if self.path is None:
+            return
+        with self._lock:
+            if self._persisted:
+                return
+            parts = [_FILE_HEADER.pack(MAGIC, len(self._filters))]
+            parts.extend(bloom.to_bytes(name) for name, bloom in self._filters.items())
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(b"".join(parts))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._persisted = True
+
+    def load(self) -> bool:
+        """
+        Load persisted filters.
+
+        Returns:
+            False if there is no trustworthy file (the caller rebuilds)
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                data = memoryview(f.read())
+            magic, count = _FILE_HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise ValueError("not a fabric id filter file")
+            offset = _FILE_HEADER.size
+            filters = {}
+            for _ in range(count):
+                name, bloom, offset = ScalableBloomFilter.from_bytes(data, offset)
+                filters[name] = bloom
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Ignoring unreadable id filter file {self.path}: {e}")
+            return False
+        with self._lock:
+            self._filters = filters
+            self._persisted = True
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-filter size and false-positive estimates, and lookup counters."""
+        stats = dict(self._stats)
+        # Share of lookups for absent keys that the filters failed to reject
+        absent = stats["negatives"] + stats["false_positives"]
+        stats["observed_fp_rate"] = stats["false_positives"] / absent if absent else 0.0
+        stats["filters"] = {name: bloom.stats() for name, bloom in sorted(self._filters.items())}
+        stats["memory_bytes"] = sum(filter_stats["memory_bytes"] for filter_stats in stats["filters"].values())
+        stats["stale_keys"] = dict(self._removed)
+        return stats
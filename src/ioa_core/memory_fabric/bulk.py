@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, TypeVar
+"""Bulk module."""
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def progress_path(config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Progress file from a `progress_path` config key or IOA_FABRIC_PROGRESS_PATH (None disables it)."""
+    return (config or {}).get("progress_path") or os.getenv("IOA_FABRIC_PROGRESS_PATH") or None
+
+
+class ProgressReporter:
+    """
+    Throughput and ETA of a bulk operation.
+
+    update() is called with the records finished since the last call; at
+    most every `interval` seconds the current state is appended as one JSON
+    line to `path` and passed to `on_update` (e.g. a terminal status line).
+    """
+
+    def __init__(
+        self,
+        phase: str,
+        total: Optional[int] = None,
+        path: Optional[str] = None,
+        interval: float = 1.0,
+        on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the reporter.
+
+        Args:
+            phase: Operation name written with every update
+            total: Expected number of records (None when unknown; no ETA)
+            path: JSON lines progress file
+            interval: Minimum seconds between reports
+            on_update: Called with each report
+            extra: Fields added to every report
+        """
+        self.phase = phase
+        self.total = total
+        self.path = path
+        self.interval = interval
+        self.on_update = on_update
+        self.extra = extra or {}
+        self.done = 0
+        self.started = time.monotonic()
+        self._reported = self.started
+        self._lock = threading.Lock()
+        if path:
+            parent = os.path.dirname(os.path.abspath(path))
+            os.makedirs(parent, exist_ok=True)
+
+    def snapshot(self, final: bool = False) -> Dict[str, Any]:
+        """Current progress, rate and ETA."""
+        elapsed = time.monotonic() - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        report = {
+            "phase": self.phase,
+            "done": self.done,
+            "total": self.total,
+            "progress_pct": round(100 * self.done / self.total, 2) if self.total else None,
+            "elapsed_sec": round(elapsed, 2),
+            "rate_per_sec": round(rate, 2),
+            "eta_sec": round((self.total - self.done) / rate, 1) if self.total and rate > 0 else None,
+            "final": final,
+            "timestamp": time.time()
+        }
+        report.update(self.extra)
+        return report
+
+    def update(self, count: int) -> None:
+        """Add finished records; report if the interval has passed."""
+        with self._lock:
+            self.done += count
+            now = time.monotonic()
+            if now - self._reported < self.interval:
+                return
+            self._reported = now
+            report = self.snapshot()
+        self._emit(report)
+
+    def finish(self) -> Dict[str, Any]:
+        """Write the final report and return it."""
+        with self._lock:
+            report = self.snapshot(final=True)
+        self._emit(report)
+        return report
+
+    def _emit(self, report: Dict[str, Any]) -> None:
+        if self.path:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(report) + "\n")
+        if self.on_update is not None:
+            self.on_update(report)
+
+
+def bounded_map(fn: Callable[[T], R], items: Iterable[T], workers: int = 1) -> Iterator[R]:
+    """
+    Apply fn over items on `workers` threads, yielding results in input order.
+
+    At most twice `workers` items are in flight, so a streamed input is
+    never read far ahead of the results.
+    """
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Deque = deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
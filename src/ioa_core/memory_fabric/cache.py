@@ -0,0 +1,321 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from .schema import MemoryRecordV1, StorageTier
+"""Cache module."""
+
+logger = logging.getLogger(__name__)
+
+
+def copy_record(record: MemoryRecordV1) -> MemoryRecordV1:
+    """Copy a record so callers cannot mutate cached state."""
+    return replace(record, metadata=dict(record.metadata), tags=list(record.tags))
+
+
+class FrequencySketch:
+    """
+    Count-min sketch of recent access frequencies (TinyLFU admission).
+
+    Counters saturate at 15 and are halved every `sample_size` increments,
+    so the sketch favours keys that are popular now over keys that were
+    popular once.
+    """
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the sketch.
+
+        Args:
+            capacity: Number of entries in the cache it serves
+        """
+        self.width = max(64, 1 << max(capacity * 4 - 1, 1).bit_length())
+        self.sample_size = max(capacity, 1) * 10
+        self._rows = [[0] * self.width for _ in self._SEEDS]
+        self._additions = 0
+
+    def _indexes(self, key: str):
+        h = zlib.crc32(key.encode("utf-8"))
+        for seed in self._SEEDS:
+            yield ((h ^ seed) * 0x01000193) % self.width
+
+    def increment(self, key: str) -> None:
+        """Count one access to key."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._rows = [[count >> 1 for count in row] for row in self._rows]
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        """Estimated recent access count of key."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+
+@dataclass
+class CacheConfig:
+    """Settings of the fabric's decrypted record cache."""
+    max_entries: int = 0  # 0 disables the cache
+    ttl_seconds: float = 300.0  # 0 keeps entries until evicted or invalidated
+    policy: str = "lru"  # "lru" or "tinylfu"
+    tiers: Tuple[str, ...] = (StorageTier.HOT.value,)
+    access_flush_records: int = 1000  # Pending access updates before a write-behind flush
+    access_flush_seconds: float = 5.0  # Longest delay of an access update
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "CacheConfig":
+        """
+        Build settings from a fabric `cache` config dict or the environment.
+
+        IOA_FABRIC_CACHE_SIZE (entries), IOA_FABRIC_CACHE_TTL (seconds),
+        IOA_FABRIC_CACHE_POLICY (lru|tinylfu), IOA_FABRIC_CACHE_TIERS
+        (comma-separated storage tiers admitted, default "hot") and
+        IOA_FABRIC_CACHE_FLUSH_RECORDS / IOA_FABRIC_CACHE_FLUSH_S (write-behind
+        of access counts).
+        """
+        config = config or {}
+        tiers = config.get("tiers") or os.getenv("IOA_FABRIC_CACHE_TIERS", StorageTier.HOT.value)
+        if isinstance(tiers, str):
+            tiers = [tier.strip() for tier in tiers.split(",") if tier.strip()]
+        return cls(
+            max_entries=int(config.get("max_entries", os.getenv("IOA_FABRIC_CACHE_SIZE", "0"))),
+            ttl_seconds=float(config.get("ttl_seconds", os.getenv("IOA_FABRIC_CACHE_TTL", "300"))),
+            policy=str(config.get("policy", os.getenv("IOA_FABRIC_CACHE_POLICY", "lru"))).lower(),
+            tiers=tuple(getattr(tier, "value", tier) for tier in tiers),
+            access_flush_records=int(
+                config.get("access_flush_records", os.getenv("IOA_FABRIC_CACHE_FLUSH_RECORDS", "1000"))
+            ),
+            access_flush_seconds=float(
+                config.get("access_flush_seconds", os.getenv("IOA_FABRIC_CACHE_FLUSH_S", "5"))
+            )
+        )
+
+
+class RecordCache:
+    """
+    Size-bounded cache of decrypted records with LRU or TinyLFU eviction.
+
+    Only records whose storage tier is admitted are cached, and entries
+    expire after `ttl_seconds`. With the TinyLFU policy a new record only
+    displaces the LRU victim when it has been requested more often
+    recently. Lookups return copies.
+
+    Writers invalidate keys; a reader that fetched a record before an
+    invalidation must pass the `generation()` it saw to put(), which then
+    drops the possibly stale record.
+    """
+
+    def __init__(self, config: CacheConfig, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache settings
+            clock: Monotonic clock in seconds
+        """
+        if config.policy not in ("lru", "tinylfu"):
+            raise ValueError(f"Unknown cache policy: {config.policy}")
+        self.config = config
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[MemoryRecordV1, float]]" = OrderedDict()
+        self._tiers: Set[str] = set(config.tiers)
+        self._sketch = FrequencySketch(config.max_entries) if config.policy == "tinylfu" else None
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "rejections": 0, "invalidations": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self) -> int:
+        """Invalidation counter to pass to put() for a record fetched afterwards."""
+        return self._generation
+
+    def get(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """
+        Look up a record, counting a hit or miss.
+
+        The cached entry's access count and time are advanced, so repeated
+        hits report the same values the backend will hold after write-behind.
+        """
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(record_id)
+            entry = self._entries.get(record_id)
+            if entry is not None and self.config.ttl_seconds and entry[1] <= self._clock():
+                del self._entries[record_id]
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(record_id)
+            self._stats["hits"] += 1
+            record = entry[0]
+            record.update_access()
+            return copy_record(record)
+
+    def admits(self, record: MemoryRecordV1) -> bool:
+        """True if the record's storage tier is cached."""
+        return record.storage_tier.value in self._tiers
+
+    def put(self, record: MemoryRecordV1, generation: Optional[int] = None) -> bool:
+        """
+        Cache a decrypted record.
+
+        Args:
+            record: Record as returned to the caller
+            generation: Value of generation() before the record was read
+
+        Returns:
+            True if the record was cached
+        """
+        if self.config.max_entries <= 0 or not self.admits(record):
+            return False
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            if record.id not in self._entries and len(self._entries) >= self.config.max_entries:
+                victim = next(iter(self._entries))
+                if self._sketch is not None and self._sketch.frequency(record.id) <= self._sketch.frequency(victim):
+                    self._stats["rejections"] += 1
+                    return False
+                del self._entries[victim]
+                self._stats["evictions"] += 1
+            expires = self._clock() + self.config.ttl_seconds if self.config.ttl_seconds else float("inf")
+            self._entries[record.id] = (copy_record(record), expires)
+            self._entries.move_to_end(record.id)
+            return True
+
+    def invalidate(self, record_ids: Iterable[str]) -> None:
+        """Drop records that were written or deleted."""
+        with self._lock:
+            self._generation += 1
+            for record_id in record_ids:
+                if self._entries.pop(record_id, None) is not None:
+                    self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, hit rate and size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["max_entries"] = self.config.max_entries
+        stats["policy"] = self.config.policy
+        return stats
+
+
+class AccessTracker:
+    """
+    Write-behind buffer of record access counts.
+
+    Accesses are summed per record and handed to the store's
+    record_accesses() once `flush_records` are pending or the oldest is
+    `flush_seconds` old, instead of one UPDATE (or S3 PUT) per read.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Dict[str, Tuple[int, datetime]]], Any],
+        flush_records: int = 1000,
+        flush_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            write: Persists {record_id: (access increment, last accessed)}
+            flush_records: Pending records that trigger a flush
+            flush_seconds: Age of the oldest pending access that triggers a flush
+            clock: Monotonic clock in seconds
+        """
+        self._write = write
+        self.flush_records = max(1, flush_records)
+        self.flush_seconds = flush_seconds
+        self._clock = clock
+        self._pending: Dict[str, Tuple[int, datetime]] = {}
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stats = {"accesses": 0, "flushes": 0, "written": 0, "failed_flushes": 0}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, record_id: str, accessed_at: datetime) -> None:
+        """Count one access; flushes when the buffer is full or old enough."""
+        with self._lock:
+            count, _ = self._pending.get(record_id, (0, accessed_at))
+            self._pending[record_id] = (count + 1, accessed_at)
+            self._stats["accesses"] += 1
+            if self._oldest is None:
+                self._oldest = self._clock()
+            due = (
+                len(self._pending) >= self.flush_records
+                or self._clock() - self._oldest >= self.flush_seconds
+            )
+        if due:
+            self.flush()
+
+    def discard(self, record_ids: Iterable[str]) -> None:
+        """Forget pending accesses of deleted records."""
+        with self._lock:
+            for record_id in record_ids:
+                self._pending.pop(record_id, None)
+
+    def flush(self) -> int:
+        """Write pending accesses; on failure they are kept for the next flush."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._oldest = None
+            if not pending:
+                return 0
+            try:
+                self._write(pending)
+            except Exception as e:
+                logger.error(f"Access count write-behind failed: {e}")
+                self._stats["failed_flushes"] += 1
+                with self._lock:
+                    for record_id, (count, accessed_at) in pending.items():
+                        newer_count, newer_at = self._pending.get(record_id, (0, accessed_at))
+                        self._pending[record_id] = (count + newer_count, max(accessed_at, newer_at))
+                    if self._oldest is None:
+                        self._oldest = self._clock()
+                return 0
+            self._stats["flushes"] += 1
+            self._stats["written"] += len(pending)
+            return len(pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Access and flush counters."""
+        stats = dict(self._stats)
+        stats["pending"] = len(self._pending)
+        return stats
@@ -0,0 +1,357 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import bisect
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+"""Changelog module."""
+
+_SEGMENT_NAME = re.compile(r"^changes-(\d{12})\.jsonl$")
+CHECKPOINT_FILE = "checkpoints.json"
+
+OP_STORE = "store"
+OP_ACCESS = "access"
+OP_DELETE = "delete"
+
+
+class ChangeLogTruncatedError(LookupError):
+    """Events after the requested sequence were already removed by retention."""
+
+
+@dataclass
+class ChangeEvent:
+    """One change to the fabric; `seq` increases by one per event."""
+    seq: int
+    op: str
+    record_id: str
+    at: float
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps({"seq": self.seq, "op": self.op, "id": self.record_id, "at": self.at, "data": self.data})
+
+    @classmethod
+    def from_json(cls, line: str) -> "ChangeEvent":
+        data = json.loads(line)
+        return cls(data["seq"], data["op"], data["id"], data["at"], data.get("data") or {})
+
+
+@dataclass
+class ChangeLogConfig:
+    """Settings of the fabric's change log."""
+    enabled: bool = False
+    segment_events: int = 10_000  # Events per log file
+    max_segments: int = 64  # Files kept when no consumer has a checkpoint (0 keeps all)
+    access_flush_events: int = 256  # Buffered access events before they are appended
+    fsync: bool = False
+    directory: Optional[str] = None  # Default: beside the store's database, or <data_dir>/changes
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> "ChangeLogConfig":
+        """
+        Build settings from a fabric `changelog` config (True or a dict) or the environment.
+
+        A config dict enables the log unless it sets `enabled: False`;
+        otherwise IOA_FABRIC_CHANGELOG=1 does. IOA_FABRIC_CHANGELOG_SEGMENT_EVENTS,
+        IOA_FABRIC_CHANGELOG_MAX_SEGMENTS, IOA_FABRIC_CHANGELOG_FSYNC and
+        IOA_FABRIC_CHANGELOG_DIR set the file size, the retention without
+        consumers, per-append fsync and the log directory.
+        """
+        if isinstance(config, bool):
+            config = {"enabled": config}
+        config = config or {}
+        enabled = config.get("enabled", True if config else os.getenv("IOA_FABRIC_CHANGELOG", "0"))
+        fsync = config.get("fsync", os.getenv("IOA_FABRIC_CHANGELOG_FSYNC", "0"))
+        return cls(
+            enabled=str(enabled).lower() in ("1", "true", "yes"),
+            segment_events=max(1, int(
+                config.get("segment_events", os.getenv("IOA_FABRIC_CHANGELOG_SEGMENT_EVENTS", "10000"))
+            )),
+            max_segments=int(config.get("max_segments", os.getenv("IOA_FABRIC_CHANGELOG_MAX_SEGMENTS", "64"))),
+            access_flush_events=int(config.get("access_flush_events", 256)),
+            fsync=str(fsync).lower() in ("1", "true", "yes"),
+            directory=config.get("directory") or os.getenv("IOA_FABRIC_CHANGELOG_DIR")
+        )
+
+
+class ChangeLog:
+    """
+    Append-only log of store, access and delete events.
+
+    Events live in JSONL files named by their first sequence number; a new
+    file starts every `segment_events` events. Consumers read the events
+    after a sequence number and save checkpoints; a file is removed once
+    every consumer has checkpointed past it (or, with no consumers, once more
+    than `max_segments` files exist).
+
+    Access events are coalesced per record and appended in batches, so reads
+    do not pay for a log write each; they are flushed before any other event
+    and before a read of the log, so event order follows operation order.
+    """
+
+    def __init__(self, directory: str, config: Optional[ChangeLogConfig] = None):
+        """
+        Open (or create) a change log.
+
+        Args:
+            directory: Directory holding the log files and checkpoints
+            config: Log settings
+        """
+        self.directory = directory
+        self.config = config or ChangeLogConfig(enabled=True)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._appended = threading.Condition(self._lock)
+        self._closed = False
+        self._segments: List[int] = sorted(
+            int(match.group(1)) for match in map(_SEGMENT_NAME.match, os.listdir(directory)) if match
+        )
+        self._seq = 0
+        self._segment_count = 0
+        if self._segments:
+            for event in self._read_segment(self._segments[-1], 0):
+                self._seq = event.seq
+                self._segment_count += 1
+            self._seq = max(self._seq, self._segments[-1] - 1)
+        self._file = None
+        self._pending_access: Dict[str, Tuple[int, str]] = {}
+        self._checkpoints: Dict[str, int] = self._load_checkpoints()
+        self._stats = {"appended": 0, "segments_removed": 0}
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest appended event (0 if none)."""
+        return self._seq
+
+    def _path(self, first_seq: int) -> str:
+        return os.path.join(self.directory, f"changes-{first_seq:012d}.jsonl")
+
+    def _append_locked(self, op: str, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        now = time.time()
+        lines = []
+        for record_id, data in entries:
+            if self._file is None or self._segment_count >= self.config.segment_events:
+                self._write_lines(lines)
+                lines = []
+                self._roll()
+            self._seq += 1
+            self._segment_count += 1
+            lines.append(ChangeEvent(self._seq, op, record_id, now, data).to_json() + "\n")
+            self._stats["appended"] += 1
+        self._write_lines(lines)
+        self._appended.notify_all()
+        return self._seq
+
+    def _write_lines(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        self._file.write("".join(lines))
+        self._file.flush()
+        if self.config.fsync:
+            os.fsync(self._file.fileno())
+
+    def _roll(self) -> None:
+        """Continue the newest file, or start a new one once it is full."""
+        if self._file is not None:
+            self._file.close()
+        if not self._segments or self._segment_count >= self.config.segment_events:
+            self._segments.append(self._seq + 1)
+            self._segment_count = 0
+            self._truncate_locked()
+        self._file = open(self._path(self._segments[-1]), "a", encoding="utf-8")
+
+    def _flush_access_locked(self) -> None:
+        if self._pending_access:
+            pending, self._pending_access = self._pending_access, {}
+            self._append_locked(OP_ACCESS, (
+                (record_id, {"count": count, "last_accessed": accessed_at})
+                for record_id, (count, accessed_at) in pending.items()
+            ))
+
+    def append(self, op: str, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Append events of one operation.
+
+        Args:
+            op: "store", "access" or "delete"
+            entries: (record id, event data) pairs
+
+        Returns:
+            Sequence number of the last event
+        """
+        with self._lock:
+            self._flush_access_locked()
+            return self._append_locked(op, entries)
+
+    def record_access(self, record_id: str, accessed_at: Optional[datetime] = None) -> None:
+        """Buffer an access event (coalesced per record until the next flush)."""
+        with self._lock:
+            count, _ = self._pending_access.get(record_id, (0, None))
+            self._pending_access[record_id] = (count + 1, (accessed_at or datetime.now()).isoformat())
+            if len(self._pending_access) >= self.config.access_flush_events:
+                self._flush_access_locked()
+
+    def flush(self) -> None:
+        """Append buffered access events."""
+        with self._lock:
+            self._flush_access_locked()
+
+    def _read_segment(self, first_seq: int, since_seq: int) -> Iterator[ChangeEvent]:
+        with open(self._path(first_seq), encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    return  # An append in progress
+                event = ChangeEvent.from_json(line)
+                if event.seq > since_seq:
+                    yield event
+
+    def read(self, since_seq: int = 0, limit: Optional[int] = None) -> Iterator[ChangeEvent]:
+        """
+        Events after `since_seq`, oldest first.
+
+        Raises:
+            ChangeLogTruncatedError: If retention already removed some of them
+        """
+        self.flush()
+        with self._lock:
+            segments = list(self._segments)
+        if not segments or since_seq >= self._seq:
+            return
+        if since_seq + 1 < segments[0]:
+            raise ChangeLogTruncatedError(
+                f"Change log starts at sequence {segments[0]}; events after {since_seq} were removed"
+            )
+        start = max(0, bisect.bisect_right(segments, since_seq + 1) - 1)
+        emitted = 0
+        for first_seq in segments[start:]:
+            try:
+                for event in self._read_segment(first_seq, since_seq):
+                    yield event
+                    emitted += 1
+                    if limit is not None and emitted >= limit:
+                        return
+            except FileNotFoundError:
+                raise ChangeLogTruncatedError(f"Change log file {first_seq} was removed while reading")
+
+    def follow(
+        self,
+        since_seq: int = 0,
+        timeout: Optional[float] = None,
+        poll_seconds: float = 1.0
+    ) -> Iterator[ChangeEvent]:
+        """
+        Events after `since_seq`, then new events as they are appended.
+
+        Args:
+            since_seq: Last sequence number already consumed
+            timeout: Stop after this many seconds without a new event (None waits until close())
+            poll_seconds: Longest wait before buffered access events are flushed
+
+        Yields:
+            Change events in sequence order
+        """
+        idle_since = time.monotonic()
+        while not self._closed:
+            for event in self.read(since_seq):
+                since_seq = event.seq
+                idle_since = time.monotonic()
+                yield event
+            wait = poll_seconds
+            if timeout is not None:
+                wait = min(wait, timeout - (time.monotonic() - idle_since))
+                if wait <= 0:
+                    return
+            with self._appended:
+                if self._seq <= since_seq and not self._closed:
+                    self._appended.wait(wait)
+
+    def _load_checkpoints(self) -> Dict[str, int]:
+        try:
+            with open(os.path.join(self.directory, CHECKPOINT_FILE), encoding="utf-8") as f:
+                return {consumer: int(seq) for consumer, seq in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+
+    def _save_checkpoints_locked(self) -> None:
+        path = os.path.join(self.directory, CHECKPOINT_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(self._checkpoints, f)
+        os.replace(f"{path}.tmp", path)
+
+    def checkpoint(self, consumer: str, seq: int) -> int:
+        """
+        Record that a consumer has processed every event up to `seq`.
+
+        Returns:
+            Number of log files removed by retention
+        """
+        with self._lock:
+            self._checkpoints[consumer] = min(seq, self._seq)
+            self._save_checkpoints_locked()
+            return self._truncate_locked()
+
+    def checkpoints(self) -> Dict[str, int]:
+        """Saved checkpoint of each consumer."""
+        with self._lock:
+            return dict(self._checkpoints)
+
+    def remove_consumer(self, consumer: str) -> int:
+        """Forget a consumer so it no longer holds back retention."""
+        with self._lock:
+            self._checkpoints.pop(consumer, None)
+            self._save_checkpoints_locked()
+            return self._truncate_locked()
+
+    def _truncate_locked(self) -> int:
+        """Remove files every consumer is past (the newest file always stays)."""
+        if self._checkpoints:
+            keep_after = min(self._checkpoints.values())
+            removable = [
+                first_seq for first_seq, next_seq in zip(self._segments, self._segments[1:])
+                if next_seq - 1 <= keep_after
+            ]
+        elif self.config.max_segments > 0:
+            removable = self._segments[:max(0, len(self._segments) - self.config.max_segments)]
+        else:
+            removable = []
+        for first_seq in removable:
+            try:
+                os.unlink(self._path(first_seq))
+            except FileNotFoundError:
+                pass
+        self._segments = self._segments[len(removable):]
+        self._stats["segments_removed"] += len(removable)
+        return len(removable)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Sequence range, file count and consumer checkpoints."""
+        with self._lock:
+            return {
+                "last_seq": self._seq,
+                "first_seq": self._segments[0] if self._segments else None,
+                "segments": len(self._segments),
+                "pending_access": len(self._pending_access),
+                "consumers": dict(self._checkpoints),
+                **self._stats
+            }
+
+    def close(self) -> None:
+        """Append buffered events, close the log and release followers."""
+        with self._lock:
+            self._flush_access_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._closed = True
+            self._appended.notify_all()
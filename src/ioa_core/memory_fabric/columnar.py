@@ -0,0 +1,348 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import gzip
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+"""Columnar module."""
+
+from .schema import EmbeddingV1, MemoryRecordV1
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pa_ipc = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+FORMAT_VERSION = 1
+NDJSON_FORMAT = "ioa-fabric-ndjson"
+LAYOUT_KEY = b"ioa.layout"
+SUPPORTED_FORMATS = ("parquet", "arrow", "ndjson")
+
+# Metadata values promoted to typed columns, keyed by their Python type
+_KINDS = {str: "string", int: "int64", float: "float64", bool: "bool"}
+_HOT_KEY_MIN_SHARE = 0.5
+
+
+def resolve_format(path: str, fmt: str = "auto") -> str:
+    """
+    Pick the export format for a path.
+
+    'auto' follows the file suffix (.parquet, .arrow/.feather/.ipc, .gz/.ndjson)
+    and otherwise prefers Parquet when pyarrow is installed, NDJSON if not.
+    """
+    if fmt == "auto":
+        name = Path(path).name.lower()
+        if name.endswith(".parquet"):
+            fmt = "parquet"
+        elif name.endswith((".arrow", ".feather", ".ipc")):
+            fmt = "arrow"
+        elif name.endswith((".gz", ".ndjson", ".jsonl")):
+            fmt = "ndjson"
+        else:
+            fmt = "parquet" if PYARROW_AVAILABLE else "ndjson"
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unknown columnar format: {fmt}")
+    if fmt != "ndjson" and not PYARROW_AVAILABLE:
+        raise ImportError(f"{fmt} export requires pyarrow (pip install 'ioa-core[columnar]')")
+    return fmt
+
+
+def sniff_format(path: str) -> str:
+    """Detect the format of an existing export from its magic bytes."""
+    with open(path, "rb") as f:
+        head = f.read(6)
+    if head.startswith(b"PAR1"):
+        return "parquet"
+    if head.startswith(b"ARROW1"):
+        return "arrow"
+    if head.startswith(b"\x1f\x8b"):
+        return "ndjson"
+    raise ValueError(f"Unrecognized columnar export: {path}")
+
+
+class ColumnarLayout:
+    """
+    Column layout of an export: promoted metadata keys and embedding width.
+
+    Decided from the first row group and stored with the file, so every row
+    group shares one schema. Values that do not fit a promoted column (other
+    type, None) stay in the residual `metadata` JSON column, and embeddings
+    of another width go to `embedding_json`. Round trips are lossless apart
+    from Parquet/Arrow embeddings, which are stored as float32.
+    """
+
+    def __init__(self, hot_keys: Optional[Dict[str, str]] = None, dimension: Optional[int] = None):
+        """
+        Args:
+            hot_keys: Promoted metadata key -> column kind
+            dimension: Width of the fixed-size embedding column
+        """
+        self.hot_keys = dict(hot_keys or {})
+        self.dimension = dimension
+
+    @classmethod
+    def from_sample(cls, records: List[MemoryRecordV1], hot_keys: Optional[List[str]] = None) -> "ColumnarLayout":
+        """
+        Infer a layout from sample records.
+
+        Args:
+            records: Sample (usually the first row group)
+            hot_keys: Keys to promote; by default scalar keys present in at
+                least half of the sample with a single consistent type
+        """
+        types: Dict[str, set] = {}
+        counts: Dict[str, int] = {}
+        for record in records:
+            for key, value in record.metadata.items():
+                if value is None:
+                    continue
+                types.setdefault(key, set()).add(type(value))
+                counts[key] = counts.get(key, 0) + 1
+
+        def kind(key):
+            seen = types.get(key, set())
+            return _KINDS.get(next(iter(seen))) if len(seen) == 1 else None
+
+        if hot_keys is None:
+            threshold = max(1, int(len(records) * _HOT_KEY_MIN_SHARE))
+            selected = {key: kind(key) for key in sorted(counts) if counts[key] >= threshold and kind(key)}
+        else:
+            selected = {key: kind(key) or "string" for key in hot_keys}
+
+        dimension = next((len(r.embedding.vector) for r in records if r.embedding is not None), None)
+        return cls(selected, dimension)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": FORMAT_VERSION, "hot_keys": self.hot_keys, "dimension": self.dimension}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnarLayout":
+        return cls(data.get("hot_keys"), data.get("dimension"))
+
+    def _fits(self, value: Any, kind: str) -> bool:
+        return _KINDS.get(type(value)) == kind
+
+    def to_row(self, record: MemoryRecordV1, iso_timestamps: bool = False) -> Dict[str, Any]:
+        """Flatten a record into one row of this layout."""
+        residual = {}
+        row: Dict[str, Any] = {}
+        for key, value in record.metadata.items():
+            kind = self.hot_keys.get(key)
+            if kind is not None and self._fits(value, kind):
+                row[f"meta.{key}"] = value
+            else:
+                residual[key] = value
+
+        embedding = record.embedding
+        fixed = embedding is not None and len(embedding.vector) == self.dimension
+        row.update({
+            "id": record.id,
+            "content": record.content,
+            "memory_type": record.memory_type.value,
+            "storage_tier": record.storage_tier.value,
+            "timestamp": record.timestamp.isoformat() if iso_timestamps else record.timestamp,
+            "tags": list(record.tags),
+            "access_count": record.access_count,
+            "last_accessed": (
+                record.last_accessed.isoformat() if iso_timestamps and record.last_accessed else record.last_accessed
+            ),
+            "schema_version": record.__schema_version__,
+            "metadata": json.dumps(residual) if residual else None,
+            "embedding": list(embedding.vector) if fixed else None,
+            "embedding_model": embedding.model if embedding is not None else None,
+            "embedding_json": json.dumps(embedding.to_dict()) if embedding is not None and not fixed else None,
+        })
+        return row
+
+    def from_row(self, row: Dict[str, Any]) -> MemoryRecordV1:
+        """Rebuild a record from a row of this layout."""
+        metadata = json.loads(row["metadata"]) if row.get("metadata") else {}
+        for key in self.hot_keys:
+            value = row.get(f"meta.{key}")
+            if value is not None:
+                metadata[key] = value
+
+        embedding = None
+        if row.get("embedding") is not None:
+            vector = [float(v) for v in row["embedding"]]
+            embedding = EmbeddingV1(vector=vector, model=row.get("embedding_model") or "", dimension=len(vector))
+        elif row.get("embedding_json"):
+            embedding = EmbeddingV1.from_dict(json.loads(row["embedding_json"]))
+
+        return MemoryRecordV1.from_dict({
+            "id": row["id"],
+            "content": row["content"],
+            "metadata": metadata,
+            "timestamp": row["timestamp"],
+            "tags": list(row.get("tags") or []),
+            "storage_tier": row["storage_tier"],
+            "memory_type": row["memory_type"],
+            "access_count": row.get("access_count") or 0,
+            "last_accessed": row.get("last_accessed"),
+            "embedding": embedding.to_dict() if embedding else None,
+            "__schema_version__": row.get("schema_version") or "1.0"
+        })
+
+    def arrow_schema(self):
+        """Arrow schema for this layout (requires pyarrow)."""
+        types = {"string": pa.string(), "int64": pa.int64(), "float64": pa.float64(), "bool": pa.bool_()}
+        embedding_type = pa.list_(pa.float32(), self.dimension) if self.dimension else pa.list_(pa.float32())
+        fields = [
+            pa.field("id", pa.string(), nullable=False),
+            pa.field("content", pa.string(), nullable=False),
+            pa.field("memory_type", pa.string()),
+            pa.field("storage_tier", pa.string()),
+            pa.field("timestamp", pa.timestamp("us", tz="UTC")),
+            pa.field("tags", pa.list_(pa.string())),
+            pa.field("access_count", pa.int64()),
+            pa.field("last_accessed", pa.timestamp("us", tz="UTC")),
+            pa.field("schema_version", pa.string()),
+            pa.field("metadata", pa.string()),
+            pa.field("embedding", embedding_type),
+            pa.field("embedding_model", pa.string()),
+            pa.field("embedding_json", pa.string()),
+        ]
+        fields += [pa.field(f"meta.{key}", types[kind]) for key, kind in self.hot_keys.items()]
+        return pa.schema(fields, metadata={LAYOUT_KEY: json.dumps(self.to_dict()).encode()})
+
+
+def write_columnar(
+    batches: Iterable[List[MemoryRecordV1]],
+    path: str,
+    fmt: str = "auto",
+    hot_keys: Optional[List[str]] = None,
+    compression: str = "zstd"
+) -> Dict[str, Any]:
+    """
+    Stream record batches to a columnar file, one row group per batch.
+
+    Args:
+        batches: Iterable of record lists (e.g. store.iter_batches())
+        path: Output file
+        fmt: 'parquet', 'arrow', 'ndjson' or 'auto'
+        hot_keys: Metadata keys to promote (default: inferred)
+        compression: Parquet/Arrow codec
+
+    Returns:
+        Export summary (format, records, row_groups, bytes, layout)
+    """
+    fmt = resolve_format(path, fmt)
+    batches = iter(batches)
+    first = next(batches, [])
+    layout = ColumnarLayout.from_sample(first, hot_keys)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    records = 0
+    row_groups = 0
+
+    if fmt == "ndjson":
+        with open(path, "wb") as f:
+            # Each row group is its own gzip member; gzip readers stream across them
+            header = {"format": NDJSON_FORMAT, "layout": layout.to_dict()}
+            f.write(gzip.compress((json.dumps(header) + "\n").encode()))
+            for batch in itertools.chain([first], batches):
+                if not batch:
+                    continue
+                lines = "".join(json.dumps(layout.to_row(r, iso_timestamps=True)) + "\n" for r in batch)
+                f.write(gzip.compress(lines.encode(), compresslevel=6))
+                records += len(batch)
+                row_groups += 1
+    else:
+        schema = layout.arrow_schema()
+        if fmt == "parquet":
+            writer = pq.ParquetWriter(path, schema, compression=compression)
+        else:
+            writer = pa_ipc.new_file(path, schema, options=pa_ipc.IpcWriteOptions(compression=compression))
+        try:
+            for batch in itertools.chain([first], batches):
+                if not batch:
+                    continue
+                table = pa.Table.from_pylist([layout.to_row(r) for r in batch], schema=schema)
+                if fmt == "parquet":
+                    writer.write_table(table, row_group_size=len(batch))
+                else:
+                    writer.write_table(table)
+                records += len(batch)
+                row_groups += 1
+        finally:
+            writer.close()
+
+    return {
+        "path": str(path),
+        "format": fmt,
+        "records": records,
+        "row_groups": row_groups,
+        "bytes": Path(path).stat().st_size,
+        "layout": layout.to_dict()
+    }
+
+
+def count_records(path: str) -> Optional[int]:
+    """
+    Records in a columnar export from its metadata, or None when that needs
+    a full read (NDJSON exports, or Parquet/Arrow without pyarrow).
+    """
+    fmt = sniff_format(path)
+    if fmt == "ndjson" or not PYARROW_AVAILABLE:
+        return None
+    if fmt == "parquet":
+        return pq.ParquetFile(path).metadata.num_rows
+    # Memory-mapped, so batch headers are read without loading the columns
+    with pa.memory_map(str(path)) as source:
+        reader = pa_ipc.open_file(source)
+        return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+
+def read_columnar(path: str, batch_size: int = 10000) -> Iterator[List[MemoryRecordV1]]:
+    """
+    Stream records back from a columnar export in batches.
+
+    Args:
+        path: File written by write_columnar()
+        batch_size: Records per yielded batch
+    """
+    fmt = sniff_format(path)
+    if fmt == "ndjson":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("format") != NDJSON_FORMAT:
+                raise ValueError(f"Not a fabric export: {path}")
+            layout = ColumnarLayout.from_dict(header["layout"])
+            batch = []
+            for line in f:
+                if not line.strip():
+                    continue
+                batch.append(layout.from_row(json.loads(line)))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        return
+
+    if not PYARROW_AVAILABLE:
+        raise ImportError(f"Reading {fmt} exports requires pyarrow")
+    if fmt == "parquet":
+        parquet_file = pq.ParquetFile(path)
+        layout = ColumnarLayout.from_dict(json.loads(parquet_file.schema_arrow.metadata[LAYOUT_KEY]))
+        record_batches = parquet_file.iter_batches(batch_size=batch_size)
+    else:
+        reader = pa_ipc.open_file(path)
+        layout = ColumnarLayout.from_dict(json.loads(reader.schema.metadata[LAYOUT_KEY]))
+        record_batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    for record_batch in record_batches:
+        rows = record_batch.to_pylist()
+        for start in range(0, len(rows), batch_size):
+            yield [layout.from_row(row) for row in rows[start:start + batch_size]]
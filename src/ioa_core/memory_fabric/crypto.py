@@ -73,23 +73,29 @@ def decrypt_content(self, encrypted_content: str, encryption_mode: str) -> str:
             return encrypted_content
         
         try:
-            # Decode base64
-            encrypted_data = base64.b64decode(encrypted_content.encode('utf-8'))
-            
-            # Split nonce and ciphertext
-            nonce = encrypted_data[:12]
-            ciphertext = encrypted_data[12:]
-            
-            # Decrypt content
-            aesgcm = AESGCM(self._encryption_key)
-            plaintext = aesgcm.decrypt(nonce, ciphertext, None)
-            
-            return plaintext.decode('utf-8')
-            
+            return self.decrypt_content_strict(encrypted_content)
         except Exception as e:
             # Return original content if decryption fails
             return encrypted_content
     
+    def decrypt_content_strict(self, encrypted_content: str) -> str:
+        """Decrypt AES-GCM content, raising if there is no key, the key is wrong or the ciphertext is corrupt."""
+        if not self._is_encryption_enabled:
+            raise ValueError("No encryption key configured")
+        
+        # Decode base64
+        encrypted_data = base64.b64decode(encrypted_content.encode('utf-8'))
+        
+        # Split nonce and ciphertext
+        nonce = encrypted_data[:12]
+        ciphertext = encrypted_data[12:]
+        
+        # Decrypt content (InvalidTag on authentication failure)
+        aesgcm = AESGCM(self._encryption_key)
+        plaintext = aesgcm.decrypt(nonce, ciphertext, None)
+        
+        return plaintext.decode('utf-8')
+    
     def redact_pii(self, content: str, redaction_rules: Optional[Dict[str, str]] = None) -> str:
         """Redact PII from content using configurable rules."""
         import re
@@ -115,6 +121,10 @@ def hash_content(self, content: str) -> str:
         """Generate SHA-256 hash of content."""
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
+    def fingerprint_content(self, content: str) -> str:
+        """Keyed BLAKE2b-256 digest of plaintext (unkeyed without encryption)."""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=32, key=self._encryption_key or b'').hexdigest()
+    
     def is_encryption_enabled(self) -> bool:
         """Check if encryption is enabled."""
         return self._is_encryption_enabled
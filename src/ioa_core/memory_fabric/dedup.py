@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from .schema import MemoryRecordV1
+"""Dedup module."""
+
+# Reserved metadata key carrying a plaintext fingerprint set by the fabric
+# when content is encrypted (ciphertexts of equal plaintexts differ); values
+# supplied by callers are dropped on write
+DEDUP_HASH_KEY = "_ioa_dedup_fingerprint"
+
+
+def dedup_enabled(config: Optional[Dict[str, Any]] = None) -> bool:
+    """True if content deduplication is on (config `dedup` or IOA_FABRIC_DEDUP=1)."""
+    return bool((config or {}).get("dedup")) or os.getenv("IOA_FABRIC_DEDUP", "0") == "1"
+
+
+def content_hash(content: str) -> str:
+    """BLAKE2b-256 digest of stored content."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def dedup_fingerprint(record: MemoryRecordV1) -> Optional[str]:
+    """The fabric's plaintext fingerprint of an encrypted record, if any."""
+    if record.metadata.get("encryption_mode") != "aes-gcm":
+        return None
+    return record.metadata.get(DEDUP_HASH_KEY)
+
+
+def dedup_key(record: MemoryRecordV1) -> str:
+    """
+    Key a record's content is stored under.
+
+    Plaintext content is keyed by its own hash; only encrypted records are
+    keyed by the fingerprint the fabric stored with them.
+    """
+    return dedup_fingerprint(record) or content_hash(record.content)
+
+
+def dedup_summary(unique: int, references: int, stored_bytes: int, logical_bytes: int) -> Dict[str, Any]:
+    """
+    Dedup statistics for a content table.
+
+    `dedup_ratio` is logical over stored bytes (1.0 = no savings);
+    `saved_fraction` is the share of logical bytes not stored.
+    """
+    return {
+        "unique_contents": unique,
+        "references": references,
+        "stored_bytes": stored_bytes,
+        "logical_bytes": logical_bytes,
+        "saved_bytes": logical_bytes - stored_bytes,
+        "dedup_ratio": logical_bytes / stored_bytes if stored_bytes else 1.0,
+        "saved_fraction": 1 - stored_bytes / logical_bytes if logical_bytes else 0.0
+    }
@@ -0,0 +1,366 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+"""Durability module."""
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENTS = 256
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+_FETCH_CHUNK = 500
+
+
+def content_checksum(content: str) -> str:
+    """SHA-256 of record content exactly as stored (ciphertext when encrypted)."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def merkle_root(leaves: Iterable[Tuple[str, str]]) -> str:
+    """
+    Merkle root over (record_id, checksum) leaves, ordered by record id.
+
+    Odd nodes are paired with themselves, so the root only depends on the
+    set of leaves, not on insertion order.
+    """
+    level = [
+        hashlib.sha256(f"{record_id}\0{checksum}".encode()).digest()
+        for record_id, checksum in sorted(leaves)
+    ]
+    if not level:
+        return EMPTY_ROOT
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+
+def compare_segment(segment: int, expected: Dict[str, str], actual: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Compare ledger checksums with checksums of the stored data for one segment.
+
+    Args:
+        segment: Segment number
+        expected: record_id -> checksum from the ledger
+        actual: record_id -> checksum of the stored content (ids absent from
+            the store are simply missing from this dict)
+
+    Returns:
+        Segment result with the recomputed root, mismatches and missing ids
+    """
+    root = merkle_root(actual.items())
+    expected_root = merkle_root(expected.items())
+    result = {"segment": segment, "records": len(expected), "root": root, "mismatches": [], "missing": []}
+    if root == expected_root:
+        return result
+    for record_id, checksum in expected.items():
+        if record_id not in actual:
+            result["missing"].append(record_id)
+        elif actual[record_id] != checksum:
+            result["mismatches"].append(record_id)
+    return result
+
+
+def _connect_ro(path: str) -> sqlite3.Connection:
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def verify_sqlite_segment(ledger_path: str, db_path: str, segment: int) -> Dict[str, Any]:
+    """
+    Verify one segment of a SQLite store; runs in a worker process.
+
+    Each worker opens its own read-only connections, so segments are hashed
+    in parallel without sharing the fabric's connection.
+    """
+    ledger = _connect_ro(ledger_path)
+    store = _connect_ro(db_path)
+    try:
+        expected = dict(ledger.execute("SELECT id, checksum FROM checksums WHERE segment = ?", (segment,)))
+        ids = list(expected)
+        actual: Dict[str, str] = {}
+        # Deduplicated content lives in memory_content (absent in older databases)
+        content_sql = "content"
+        if store.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_content'").fetchone():
+            content_sql = "COALESCE((SELECT c.content FROM memory_content c WHERE c.hash = content_hash), content)"
+        for i in range(0, len(ids), _FETCH_CHUNK):
+            chunk = ids[i:i + _FETCH_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for record_id, content in store.execute(
+                f"SELECT id, {content_sql} FROM memory_records WHERE id IN ({placeholders})", chunk
+            ):
+                actual[record_id] = content_checksum(content)
+        return compare_segment(segment, expected, actual)
+    finally:
+        ledger.close()
+        store.close()
+
+
+@dataclass
+class DurabilityReport:
+    """Outcome of a durability verification run."""
+    run_id: str
+    checked: int = 0
+    segments_verified: int = 0
+    segments_resumed: int = 0
+    mismatches: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    untracked: List[str] = field(default_factory=list)  # Stored records with no checksum
+    roots: Dict[int, str] = field(default_factory=dict)
+    duration_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True when no tracked record is corrupted or missing."""
+        return not self.mismatches and not self.missing
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["ok"] = self.ok
+        data["roots"] = {str(segment): root for segment, root in self.roots.items()}
+        return data
+
+
+class DurabilityLedger:
+    """
+    Checksums of stored records, persisted in a SQLite sidecar.
+
+    Records are assigned to a fixed number of segments by CRC32 of their id;
+    each verified segment's Merkle root is kept in the ledger, and a JSON
+    checkpoint beside it lets an interrupted verification resume where it
+    stopped.
+    """
+
+    def __init__(self, path: str, segments: Optional[int] = None, commit_every: int = 256):
+        """
+        Open or create a ledger.
+
+        Args:
+            path: Ledger database path
+            segments: Segment count for a new ledger (IOA_DURABILITY_SEGMENTS);
+                an existing ledger keeps the count it was created with
+            commit_every: Writes buffered before a commit
+        """
+        self.path = str(path)
+        self.checkpoint_path = self.path + ".verify.json"
+        self.commit_every = max(1, commit_every)
+        self._pending = 0
+        self._lock = threading.Lock()
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS checksums (
+                id TEXT PRIMARY KEY,
+                segment INTEGER NOT NULL,
+                checksum TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_checksums_segment ON checksums(segment);
+            CREATE TABLE IF NOT EXISTS segment_roots (
+                segment INTEGER PRIMARY KEY,
+                root TEXT NOT NULL,
+                records INTEGER NOT NULL,
+                verified_at TEXT NOT NULL
+            );
+        """)
+        row = self._connection.execute("SELECT value FROM meta WHERE key = 'segments'").fetchone()
+        if row:
+            self.segments = int(row[0])
+        else:
+            self.segments = segments or int(os.getenv("IOA_DURABILITY_SEGMENTS", str(DEFAULT_SEGMENTS)))
+            self._connection.execute("INSERT INTO meta (key, value) VALUES ('segments', ?)", (str(self.segments),))
+        self._connection.commit()
+
+    def segment_for(self, record_id: str) -> int:
+        """Segment a record id belongs to."""
+        return zlib.crc32(record_id.encode()) % self.segments
+
+    def _maybe_commit(self):
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self._connection.commit()
+            self._pending = 0
+
+    def record(self, record_id: str, checksum: str) -> None:
+        """Record (or replace) the checksum of a stored record."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checksums (id, segment, checksum) VALUES (?, ?, ?)",
+                (record_id, self.segment_for(record_id), checksum)
+            )
+            self._maybe_commit()
+
+    def remove(self, record_id: str) -> None:
+        """Forget a deleted record."""
+        with self._lock:
+            self._connection.execute("DELETE FROM checksums WHERE id = ?", (record_id,))
+            self._maybe_commit()
+
+    def get(self, record_id: str) -> Optional[str]:
+        """Checksum recorded for a record id."""
+        with self._lock:
+            row = self._connection.execute("SELECT checksum FROM checksums WHERE id = ?", (record_id,)).fetchone()
+        return row[0] if row else None
+
+    def expected(self, segment: int) -> Dict[str, str]:
+        """All recorded checksums of one segment."""
+        with self._lock:
+            return dict(self._connection.execute("SELECT id, checksum FROM checksums WHERE segment = ?", (segment,)))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM checksums").fetchone()[0]
+
+    def __contains__(self, record_id: str) -> bool:
+        return self.get(record_id) is not None
+
+    def save_roots(self, results: Iterable[Dict[str, Any]]) -> None:
+        """Persist Merkle roots of segments that verified cleanly."""
+        verified_at = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO segment_roots (segment, root, records, verified_at) VALUES (?, ?, ?, ?)",
+                [
+                    (result["segment"], result["root"], result["records"], verified_at)
+                    for result in results
+                    if not result["mismatches"] and not result["missing"]
+                ]
+            )
+            self._connection.commit()
+
+    def roots(self) -> Dict[int, str]:
+        """Merkle roots recorded by the last clean verification of each segment."""
+        with self._lock:
+            return dict(self._connection.execute("SELECT segment, root FROM segment_roots"))
+
+    def untracked(self, db_path: str, limit: int = 10000) -> List[str]:
+        """Ids in a SQLite store with no recorded checksum (index anti-join)."""
+        with self._lock:
+            self._connection.commit()
+            self._connection.execute("ATTACH DATABASE ? AS store", (f"file:{db_path}?mode=ro",))
+            try:
+                return [row[0] for row in self._connection.execute(
+                    "SELECT id FROM store.memory_records WHERE id NOT IN (SELECT id FROM checksums) LIMIT ?",
+                    (limit,)
+                )]
+            finally:
+                self._connection.execute("DETACH DATABASE store")
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return an unfinished verification checkpoint, if any."""
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get("complete") or checkpoint.get("segments_total") != self.segments:
+            return None
+        return checkpoint
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Atomically persist verification progress."""
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def new_checkpoint(self) -> Dict[str, Any]:
+        """Start a fresh verification checkpoint."""
+        return {
+            "run_id": uuid.uuid4().hex,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "segments_total": self.segments,
+            "results": {},
+            "complete": False
+        }
+
+    def commit(self) -> None:
+        """Commit buffered checksum writes."""
+        with self._lock:
+            self._connection.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit and close the ledger."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+
+
+def run_verification(
+    ledger: DurabilityLedger,
+    verify_segment: Callable[[int], Dict[str, Any]],
+    executor=None,
+    resume: bool = False,
+    segments: Optional[Iterable[int]] = None
+) -> DurabilityReport:
+    """
+    Verify segments, checkpointing each result as it completes.
+
+    Args:
+        ledger: Durability ledger
+        verify_segment: Callable (or picklable function for process pools)
+            taking a segment number and returning a compare_segment() result
+        executor: Optional concurrent.futures executor; None runs inline
+        resume: Continue an unfinished run from its checkpoint
+        segments: Optional subset of segments to verify
+
+    Returns:
+        Aggregated report (untracked ids are filled in by the caller)
+    """
+    from concurrent.futures import as_completed
+
+    started = time.perf_counter()
+    checkpoint = (ledger.load_checkpoint() if resume else None) or ledger.new_checkpoint()
+    done = {int(segment): result for segment, result in checkpoint["results"].items()}
+    report = DurabilityReport(run_id=checkpoint["run_id"], segments_resumed=len(done))
+    todo = [s for s in (segments if segments is not None else range(ledger.segments)) if s not in done]
+
+    def finish(result):
+        done[result["segment"]] = result
+        checkpoint["results"][str(result["segment"])] = result
+        ledger.save_checkpoint(checkpoint)
+
+    if executor is None:
+        for segment in todo:
+            finish(verify_segment(segment))
+    else:
+        futures = [executor.submit(verify_segment, segment) for segment in todo]
+        for future in as_completed(futures):
+            finish(future.result())
+
+    checkpoint["complete"] = True
+    ledger.save_checkpoint(checkpoint)
+    ledger.save_roots(done.values())
+
+    for segment in sorted(done):
+        result = done[segment]
+        report.checked += result["records"]
+        report.mismatches.extend(result["mismatches"])
+        report.missing.extend(result["missing"])
+        report.roots[segment] = result["root"]
+    report.segments_verified = len(done) - report.segments_resumed
+    report.duration_ms = (time.perf_counter() - started) * 1000
+    return report
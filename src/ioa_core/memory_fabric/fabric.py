@@ -9,24 +9,44 @@
 import os
 import logging
 import asyncio
-import zlib
-import sqlite3
 """Fabric module."""
 
 import json
 import hashlib
-from typing import List, Optional, Dict, Any, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Optional, Dict, Any, Union
 from datetime import datetime, timezone
 from contextlib import nullcontext
+from functools import partial
 
 from .schema import MemoryRecordV1, MemoryType, StorageTier, EmbeddingV1
 from .stores.base import MemoryStore
 from .stores.local_jsonl import LocalJSONLStore
 from .stores.sqlite import SQLiteStore
 from .stores.s3 import S3Store
+from .stores.snapshot import SnapshotStore
+from .stores.tiered import TieredStore
+from .stores.segments import SegmentStore
 from .crypto import MemoryCrypto
 from .metrics import MemoryFabricMetrics, MetricsCollector
 from .tiering_4d import Tier4D, Tier4DConfig
+from .ann_index import IVFFlatIndex
+from .hybrid import fuse, DEFAULT_RRF_K
+from .retention import RetentionPolicy, TTLSweeper
+from .columnar import read_columnar, write_columnar
+from .query import FabricQuery, projection
+from .cache import AccessTracker, CacheConfig, RecordCache, copy_record
+from .dedup import DEDUP_HASH_KEY, dedup_enabled
+from .bloom import BloomConfig, IdFilterSet
+from .bulk import ProgressReporter, bounded_map, progress_path
+from .changelog import OP_DELETE, OP_STORE, ChangeEvent, ChangeLog, ChangeLogConfig
+from .snapshot import publish_snapshot, snapshot_dir
+from .sharding import SHARD_MAP_FILE, Resharder, ShardMap, default_hash, existing_shards, open_shard, shard_path
+from .durability import (
+    DurabilityLedger, DurabilityReport, content_checksum, compare_segment,
+    run_verification, verify_sqlite_segment
+)
 
 # PATCH: Cursor-2025-09-10 DISPATCH-OSS-20250910-MEMORY-FABRIC-REFACTOR <main fabric>
 
@@ -42,7 +62,7 @@ def __init__(
     ):
         # Durability settings
         self.durability_enabled = False
-        self.durability_checksums = {}
+        self._durability_ledger: Optional[DurabilityLedger] = None
 
         # Performance optimization flags (default to current behavior)
         self.perf_tune_enabled = os.getenv("IOA_PERF_TUNE", "0") == "1"
@@ -56,7 +76,6 @@ def __init__(
         self.progress_telemetry = int(os.getenv("IOA_PROGRESS_T", "10"))  # Progress every N seconds
 
         # Performance optimization state
-        self._pending_commits = []
         self._schema_validators = {}
         self._fourd_cache = {}
         
@@ -65,6 +84,8 @@ def __init__(
         self._shard_connections = []
         self._shard_writers = []
         self._shard_queues = []
+        self._shard_map: Optional[ShardMap] = None
+        self._resharder: Optional[Resharder] = None
 
         """
         Initialize Memory Fabric.
@@ -93,6 +114,10 @@ def __init__(
             "commit_every": self.commit_every
         })
         
+        # Content-addressed deduplication in the store (opt-in)
+        self.dedup = dedup_enabled(self.config)
+        self.config["dedup"] = self.dedup
+        
         # Initialize encryption
         self.crypto = MemoryCrypto(encryption_key or os.getenv("IOA_FABRIC_KEY"))
         
@@ -154,10 +179,59 @@ def __init__(
         # Initialize store
         self._store = self._create_store()
         
+        # TTL retention (per memory type); the sweeper thread is opt-in
+        ttl_config = self.config.get("retention_ttl_seconds")
+        self.retention_policy = RetentionPolicy(ttl_seconds=dict(ttl_config)) if ttl_config else RetentionPolicy.from_env()
+        self._ttl_sweeper: Optional[TTLSweeper] = None
+        
+        # Decrypted record cache in front of retrieve(); access counts of
+        # cached reads reach the store through a write-behind buffer
+        cache_config = CacheConfig.from_config(self.config.get("cache"))
+        self._record_cache: Optional[RecordCache] = None
+        self._access_tracker: Optional[AccessTracker] = None
+        if cache_config.max_entries > 0:
+            self._record_cache = RecordCache(cache_config)
+            self._access_tracker = AccessTracker(
+                self._store.record_accesses,
+                flush_records=cache_config.access_flush_records,
+                flush_seconds=cache_config.access_flush_seconds
+            )
+        
+        # Lazily created pools for concurrent search and off-loop batch writes
+        self._search_executor: Optional[ThreadPoolExecutor] = None
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Embedding ANN index (persisted beside the store data)
+        self._vector_index_path = self._sidecar_path(".ann.json")
+        self._vector_index = self._load_vector_index()
+        
+        # Persisted durability checksums (opt-in)
+        if self.config.get("durability") or os.getenv("IOA_DURABILITY", "0") == "1":
+            self.enable_durability(True)
+        
         # Initialize sharding if enabled
         if self.shards > 1:
             self._initialize_sharding()
-            self._start_shard_writers()
+        
+        # Bloom filters over record ids (per storage tier and shard) answer
+        # lookups of missing ids without a store round trip (opt-in)
+        bloom_config = BloomConfig.from_config(self.config.get("bloom"))
+        self._id_filters: Optional[IdFilterSet] = None
+        if bloom_config.enabled:
+            self._id_filters = IdFilterSet(bloom_config, self._sidecar_path(".bloom"))
+            if not self._id_filters.load():
+                self.rebuild_id_filters()
+        
+        # Change log of store, access and delete events for incremental consumers (opt-in)
+        changelog_config = ChangeLogConfig.from_config(self.config.get("changelog"))
+        self._changes: Optional[ChangeLog] = None
+        if changelog_config.enabled:
+            # Beside the database, or per data directory for backends that write per-run files
+            directory = changelog_config.directory or (
+                self._sidecar_path(".changes") if hasattr(self._store, "get_db_path")
+                else os.path.join(str(self.config.get("data_dir", "./artifacts/memory/")), "changes")
+            )
+            self._changes = ChangeLog(directory, changelog_config)
         
         self.logger.info(f"Memory Fabric initialized with {self.backend_name} backend")
         if self.shards > 1:
@@ -165,60 +239,174 @@ def __init__(
         if self.crypto.is_encryption_enabled():
             self.logger.info("Encryption enabled with AES-GCM")
     
-    def _create_store(self) -> MemoryStore:
+    def _create_store(self, backend: Optional[str] = None, config: Optional[Dict[str, Any]] = None) -> MemoryStore:
         """Create the appropriate store based on backend."""
-        if self.backend_name == "local_jsonl":
-            return LocalJSONLStore(self.config)
-        elif self.backend_name == "sqlite":
-            return SQLiteStore(self.config)
-        elif self.backend_name == "s3":
-            return S3Store(self.config)
+        backend = backend or self.backend_name
+        config = self.config if config is None else config
+        if backend == "local_jsonl":
+            return LocalJSONLStore(config)
+        elif backend == "sqlite":
+            return SQLiteStore(config)
+        elif backend == "s3":
+            return S3Store(config)
+        elif backend == "snapshot":
+            # Reads from the shared snapshot; writes to a worker-local primary
+            primary = config.get("snapshot_primary", "local_jsonl")
+            if primary == "snapshot":
+                raise ValueError("snapshot_primary cannot be 'snapshot'")
+            return SnapshotStore(config, primary=self._create_store(primary, config))
+        elif backend == "segments":
+            return SegmentStore(config)
+        elif backend == "tiered":
+            return self._create_tiered_store(config)
         else:
-            raise ValueError(f"Unknown backend: {self.backend_name}")
+            raise ValueError(f"Unknown backend: {backend}")
+    
+    def _create_tiered_store(self, config: Dict[str, Any]) -> TieredStore:
+        """
+        Hot and cold stores of the tiered backend.
+        
+        `tiering.hot` is "sqlite" (default) or "memory" and `tiering.cold` any
+        single-store backend (default "sqlite"; "segments" keeps demoted
+        records in compressed segment files); IOA_FABRIC_HOT_BACKEND and
+        IOA_FABRIC_COLD_BACKEND set them too. Each tier keeps its files under
+        <data_dir>/<tier>, and `tiering.hot_config` / `tiering.cold_config`
+        override settings per tier.
+        """
+        tiering = config.get("tiering") or {}
+        stores = {}
+        for tier in ("hot", "cold"):
+            backend = tiering.get(tier) or os.getenv(f"IOA_FABRIC_{tier.upper()}_BACKEND", "sqlite")
+            tier_config = {key: value for key, value in config.items() if key != "tiering"}
+            tier_config["data_dir"] = os.path.join(str(config.get("data_dir", self.root_dir)), tier)
+            if backend == "memory":
+                backend = "sqlite"
+                tier_config["db_name"] = ":memory:"
+            elif backend in ("tiered", "snapshot"):
+                raise ValueError(f"The {tier} tier cannot use the {backend} backend")
+            tier_config.update(tiering.get(f"{tier}_config") or {})
+            stores[tier] = self._create_store(backend, tier_config)
+        
+        # Promotion and demotion re-score with the fabric's 4D engine (or the default policy)
+        scorer = self.tiering_engine or Tier4D(
+            policy_ref={"jurisdiction": os.getenv("IOA_POLICY_JURISDICTION", "global")}
+        )
+        return TieredStore(
+            config, hot=stores["hot"], cold=stores["cold"], scorer=scorer, on_tier_change=self._note_tier_change
+        )
+    
+    def _sidecar_path(self, suffix: str) -> str:
+        """Path for auxiliary files (indexes, ledgers) kept beside the store data."""
+        if hasattr(self._store, "get_db_path"):
+            return self._store.get_db_path() + suffix
+        if hasattr(self._store, "get_file_path"):
+            return self._store.get_file_path() + suffix
+        return os.path.join(self.config.get("data_dir", "./artifacts/memory/"), f"{self.backend_name}{suffix}")
+    
+    def _decrypt_record(self, record: MemoryRecordV1) -> MemoryRecordV1:
+        """Decrypt record content in place if it was stored encrypted."""
+        if self.crypto.is_encryption_enabled() and record.metadata.get("encryption_mode") == "aes-gcm":
+            record.content = self.crypto.decrypt_content(record.content, "aes-gcm")
+        return record
+    
+    def _decrypted_copy(self, record: MemoryRecordV1) -> MemoryRecordV1:
+        """
+        Record with plaintext content; encrypted records are decrypted on a copy.
+        
+        Some backends (JSONL) return their own in-memory records, which must
+        stay encrypted or a later file rewrite would store the plaintext.
+        """
+        if self.crypto.is_encryption_enabled() and record.metadata.get("encryption_mode") == "aes-gcm":
+            return self._decrypt_record(copy_record(record))
+        return record
+    
+    def _decrypt_lazily(self, records: List[MemoryRecordV1]) -> List[MemoryRecordV1]:
+        """
+        Records with encrypted content replaced by copies that decrypt on first access.
+        
+        Copies keep the store's own records (cached in memory by some
+        backends) encrypted; plaintext records are returned as they are.
+        """
+        if not self.crypto.is_encryption_enabled():
+            return records
+        decrypt = partial(self.crypto.decrypt_content, encryption_mode="aes-gcm")
+        results = []
+        for record in records:
+            if record.metadata.get("encryption_mode") == "aes-gcm":
+                record = copy_record(record)
+                record.defer_content(decrypt)
+            results.append(record)
+        return results
+    
+    def _store_projection(self, fields: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+        """Normalize a read projection; encrypted content also needs the metadata marking it."""
+        selected = projection(fields)
+        if selected is not None and "content" in selected and self.crypto.is_encryption_enabled():
+            selected = selected | {"metadata"}
+        return selected
+    
+    def _new_vector_index(self) -> IVFFlatIndex:
+        """Create an empty ANN index from config (or environment) knobs."""
+        index_config = self.config.get("vector_index", {})
+        return IVFFlatIndex(
+            metric=index_config.get("metric", os.getenv("IOA_ANN_METRIC", "cosine")),
+            nlist=int(index_config.get("nlist", os.getenv("IOA_ANN_NLIST", "64"))),
+            nprobe=int(index_config.get("nprobe", os.getenv("IOA_ANN_NPROBE", "8"))),
+            train_threshold=index_config.get("train_threshold"),
+        )
+    
+    def _load_vector_index(self) -> Optional[IVFFlatIndex]:
+        """Load the persisted ANN index if one exists."""
+        if not os.path.exists(self._vector_index_path):
+            return None
+        try:
+            return IVFFlatIndex.load(self._vector_index_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to load vector index, run rebuild_vector_index(): {e}")
+            return None
+    
+    def _index_embedding(self, record: MemoryRecordV1) -> None:
+        """Add a stored record's embedding to the ANN index."""
+        if self._vector_index is None:
+            self._vector_index = self._new_vector_index()
+        self._vector_index.add(
+            record.id,
+            record.embedding.vector,
+            memory_type=record.memory_type.value,
+            storage_tier=record.storage_tier.value
+        )
+    
+    def _note_tier_change(self, record_ids: List[str], storage_tier: str) -> None:
+        """Keep the ANN index's tier labels in step with promotions and demotions."""
+        if self._vector_index is not None:
+            for record_id in record_ids:
+                self._vector_index.update_tier(record_id, storage_tier)
     
     def _initialize_sharding(self):
         """Initialize sharded SQLite connections for high-scale operations."""
         try:
-            # Create shard databases
-            for i in range(self.shards):
-                db_path = os.path.join(self.config.get("data_dir", "./artifacts/memory/"), f"mf_shard_{i}.db")
-                
-                # Create connection with performance tuning
-                conn = sqlite3.connect(db_path, timeout=30.0)
-                
-                # Apply performance PRAGMAs
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-                conn.execute("PRAGMA cache_size=-8192")
-                conn.execute("PRAGMA temp_store=MEMORY")
-                conn.execute("PRAGMA mmap_size=268435456")
-                conn.execute("PRAGMA busy_timeout=5000")
-                
-                # Create table if not exists with blake3 primary key for uniqueness
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS memory_records (
-                        pk TEXT PRIMARY KEY,
-                        id TEXT NOT NULL,
-                        content TEXT NOT NULL,
-                        metadata TEXT NOT NULL,
-                        tags TEXT,
-                        memory_type TEXT,
-                        storage_tier TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Create unique index on primary key for deduplication
-                conn.execute("""
-                    CREATE UNIQUE INDEX IF NOT EXISTS uq_records_pk ON memory_records(pk)
-                """)
-                
-                # Create indexes for performance
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_memory_type ON memory_records(memory_type)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_storage_tier ON memory_records(storage_tier)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON memory_records(created_at)")
-                
-                self._shard_connections.append(conn)
+            data_dir = self.config.get("data_dir", "./artifacts/memory/")
+            map_path = os.path.join(data_dir, SHARD_MAP_FILE)
+            self._shard_map = ShardMap.load(map_path)
+            if self._shard_map is None:
+                # Shard databases without a map were written with hash % shards
+                legacy = existing_shards(data_dir) > 0
+                self._shard_map = ShardMap(
+                    shards=self.shards,
+                    scheme="modulo" if legacy else "jump",
+                    hash=("xxh64" if default_hash() == "xxh64" else "crc32") if legacy else default_hash()
+                )
+                self._shard_map.save(map_path)
+            elif self._shard_map.shards != self.shards:
+                self.logger.warning(
+                    f"IOA_SHARDS={self.shards} ignored: placement follows the persisted shard map "
+                    f"({self._shard_map.shards} shards); use reshard() to change it"
+                )
+                self.shards = self._shard_map.shards
+            
+            # Create shard databases (both layouts while a reshard is in progress)
+            for i in range(self._shard_map.open_shards):
+                self._shard_connections.append(open_shard(shard_path(data_dir, i)))
                 
             self.logger.info(f"Initialized {self.shards} shard databases")
             
@@ -228,6 +416,84 @@ def _initialize_sharding(self):
             self.shards = 1
             self._shard_connections = []
     
+    def reshard(self, shards: int, background: bool = True, batch_size: int = 1000) -> Resharder:
+        """
+        Move a sharded fabric to a new shard count while it keeps serving.
+        
+        New writes follow the new layout as soon as this returns; records
+        whose placement changed are copied in the background, reads fall back
+        to the old placement until the map flips, and moved rows are then
+        removed from their old shards. Calling it again with the same count
+        resumes an interrupted reshard.
+        
+        Args:
+            shards: Target shard count
+            background: Copy in a background thread instead of blocking
+            batch_size: Rows read per batch
+            
+        Returns:
+            The resharder (status(), wait())
+        """
+        if self._shard_map is None:
+            raise RuntimeError("Resharding requires a sharded fabric (IOA_SHARDS > 1)")
+        if self._resharder is not None and not self._resharder.wait(0):
+            raise RuntimeError("A reshard is already running")
+        
+        data_dir = self.config.get("data_dir", "./artifacts/memory/")
+        self._resharder = Resharder(data_dir, self._shard_map, shards, batch_size=batch_size, on_map=self._set_shard_map)
+        shard_map = self._resharder.begin()
+        
+        # Connections for shards added by the new layout; their writers start
+        # with the next sharded batch
+        for i in range(len(self._shard_connections), shard_map.open_shards):
+            self._shard_connections.append(open_shard(shard_path(data_dir, i)))
+        
+        if background:
+            self._resharder.start()
+        else:
+            self._resharder.run()
+        return self._resharder
+    
+    def _set_shard_map(self, shard_map: ShardMap) -> None:
+        """Swap in a persisted shard map (placement changes atomically)."""
+        if self._id_filters is not None and not shard_map.migrating:
+            # Reads bypass the shard filters until the map flips; cover the copied rows first
+            self._id_filters.rebuild(self._shard_pks(shard_map.open_shards), prefix="shard:")
+        self._shard_map = shard_map
+        self.shards = shard_map.shards
+    
+    def get_sharded_record(self, pk: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a record of the sharded store by primary key.
+        
+        While a reshard is copying, the new placement is tried first and then
+        the old one.
+        """
+        if self._shard_map is None:
+            return None
+        # Shard filters only cover copied rows once a reshard has flipped
+        use_filters = self._id_filters is not None and not self._shard_map.migrating
+        for index in self._shard_map.read_order(pk):
+            if use_filters and not self._id_filters.might_contain(pk, names=[f"shard:{index}"]):
+                continue
+            row = self._shard_connections[index].execute(
+                "SELECT pk, id, content, metadata, tags, memory_type, storage_tier, created_at "
+                "FROM memory_records WHERE pk = ?", (pk,)
+            ).fetchone()
+            if row:
+                return {
+                    "pk": row[0],
+                    "id": row[1],
+                    "content": row[2],
+                    "metadata": json.loads(row[3]) if row[3] else {},
+                    "tags": json.loads(row[4]) if row[4] else [],
+                    "memory_type": row[5],
+                    "storage_tier": row[6],
+                    "created_at": row[7],
+                    "shard": index
+                }
+        return None
+    
     def _generate_record_pk(self, record_data: Dict[str, Any]) -> str:
         """Generate blake3 primary key for record uniqueness."""
         # Create canonical JSON representation
@@ -247,9 +513,19 @@ def _generate_record_pk(self, record_data: Dict[str, Any]) -> str:
         return blake3_hash
     
     def _start_shard_writers(self):
-        """Start dedicated asyncio writers for each shard."""
+        """
+        Start dedicated asyncio writers on the running loop for shards that
+        have none yet.
+        
+        Writers are bound to the loop of the sharded batch that starts them,
+        so they are created from the async path rather than the constructor.
+        """
         try:
-            for i in range(self.shards):
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        try:
+            for i in range(len(self._shard_writers), len(self._shard_connections)):
                 # Create queue for this shard
                 queue = asyncio.Queue()
                 self._shard_queues.append(queue)
@@ -326,6 +602,137 @@ async def _commit_shard_batch(self, conn, batch):
             conn.rollback()
             raise
     
+    def _prepare_record(
+        self,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None,
+        memory_type: Union[str, MemoryType] = MemoryType.CONVERSATION,
+        storage_tier: Union[str, StorageTier] = StorageTier.HOT,
+        record_id: Optional[str] = None,
+        embedding: Optional[EmbeddingV1] = None
+    ) -> MemoryRecordV1:
+        """Build the record to persist: metadata, 4D tiering and encryption."""
+
+        # Prepare metadata
+        record_metadata = metadata or {}
+        # The dedup fingerprint is reserved for the fabric
+        record_metadata.pop(DEDUP_HASH_KEY, None)
+        record_metadata.update({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "memory_type": memory_type if isinstance(memory_type, str) else memory_type.value,
+        })
+
+        # Apply 4D-Tiering if enabled (experimental)
+        if self.use_4d_tiering and self.tiering_engine:
+            # Create cache key from metadata for performance optimization
+            cache_key = None
+            if self.fourd_cache_size > 0:
+                # Create deterministic cache key from relevant metadata
+                cache_parts = [
+                    record_metadata.get("jurisdiction", ""),
+                    record_metadata.get("risk_level", ""),
+                    record_metadata.get("memory_type", ""),
+                    str(record_metadata.get("content_length", 0))
+                ]
+                cache_key = "|".join(cache_parts)
+
+                # Check cache first
+                if cache_key in self._fourd_cache:
+                    suggested_tier = self._fourd_cache[cache_key]
+                    tiering_metrics = {"total_score": 0.5, "dimensions": {"cached": True}}  # Default for cached
+                    self.logger.debug(f"4D-Tiering cache hit: {suggested_tier}")
+                else:
+                    # Calculate tiering
+                    temp_record = type('TempRecord', (), {'metadata': record_metadata})()
+                    suggested_tier = self.tiering_engine.classify(temp_record)
+                    tiering_metrics = self.tiering_engine.get_tiering_metrics(temp_record)
+
+                    # Cache result (LRU-style by limiting cache size)
+                    if len(self._fourd_cache) >= self.fourd_cache_size:
+                        # Remove oldest entry (simple FIFO)
+                        oldest_key = next(iter(self._fourd_cache))
+                        del self._fourd_cache[oldest_key]
+                    self._fourd_cache[cache_key] = suggested_tier
+            else:
+                # No caching - calculate directly
+                temp_record = type('TempRecord', (), {'metadata': record_metadata})()
+                suggested_tier = self.tiering_engine.classify(temp_record)
+                tiering_metrics = self.tiering_engine.get_tiering_metrics(temp_record)
+
+            # Override storage tier with 4D suggestion if different
+            if suggested_tier != storage_tier:
+                # Map 4D tiers to StorageTier enum values
+                tier_mapping = {
+                    "HOT": StorageTier.HOT,
+                    "WARM": StorageTier.HOT,  # Map WARM to HOT for storage
+                    "COLD": StorageTier.COLD
+                }
+                storage_tier = tier_mapping.get(suggested_tier, StorageTier.AUTO)
+                self.logger.debug(f"4D-Tiering adjusted tier to {suggested_tier} (was {storage_tier})")
+
+            # Add tiering metadata
+            record_metadata.update({
+                "tiering_4d": {
+                    "enabled": True,
+                    "suggested_tier": suggested_tier,
+                    "score": tiering_metrics.get("total_score", 0.5),
+                    "dimensions": tiering_metrics.get("dimensions", {})
+                }
+            })
+
+        # Create memory record
+        record = MemoryRecordV1(
+            id=record_id or "",
+            content=content,
+            metadata=record_metadata,
+            tags=tags or [],
+            memory_type=MemoryType(memory_type) if isinstance(memory_type, str) else memory_type,
+            storage_tier=StorageTier(storage_tier) if isinstance(storage_tier, str) else storage_tier,
+            embedding=embedding
+        )
+
+        # Encrypt content if encryption is enabled
+        if self.crypto.is_encryption_enabled():
+            encrypted_content, encryption_mode = self.crypto.encrypt_content(content)
+            record.content = encrypted_content
+            record.metadata["encryption_mode"] = encryption_mode
+            if self.dedup:
+                # Ciphertexts of equal contents differ; dedup on a keyed plaintext digest
+                record.metadata[DEDUP_HASH_KEY] = self.crypto.fingerprint_content(content)
+        return record
+
+    def _before_store_many(self, records: List[MemoryRecordV1]) -> None:
+        """Add ids to the Bloom filters before the write, so a stored record is never filtered out."""
+        if self._id_filters is not None:
+            self._id_filters.add_many((f"tier:{record.storage_tier.value}", record.id) for record in records)
+    
+    def _after_store(self, record: MemoryRecordV1, content: str) -> None:
+        """Update indexes, durability checksums and metrics after a successful write."""
+        self._after_store_many([record])
+
+    def _after_store_many(self, records: List[MemoryRecordV1]) -> None:
+        """Update indexes, durability checksums and metrics after a bulk write."""
+        if self._record_cache is not None:
+            self._record_cache.invalidate(record.id for record in records)
+        for record in records:
+            if record.embedding is not None:
+                self._index_embedding(record)
+
+            # Track checksum of the stored content for durability if enabled
+            if self._durability_ledger is not None:
+                self._durability_ledger.record(record.id, content_checksum(record.content))
+
+        if self._changes is not None:
+            self._changes.append(OP_STORE, (
+                (record.id, {"memory_type": record.memory_type.value, "storage_tier": record.storage_tier.value})
+                for record in records
+            ))
+
+        # Update metrics
+        if self.metrics:
+            self.metrics.update_record_count(self._store.get_stats().get("total_records", 0))
+
     def store(
         self,
         content: str,
@@ -346,121 +753,24 @@ def store(
             memory_type: Type of memory
             storage_tier: Storage tier preference
             record_id: Optional custom record ID
+            embedding: Optional embedding, indexed for search_similar()
             
         Returns:
             Record ID
         """
         with MetricsCollector(self.metrics, "writes") if self.metrics else nullcontext():
             try:
-                # Prepare metadata
-                record_metadata = metadata or {}
-                record_metadata.update({
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "memory_type": memory_type if isinstance(memory_type, str) else memory_type.value,
-                })
-
-                # Apply 4D-Tiering if enabled (experimental)
-                if self.use_4d_tiering and self.tiering_engine:
-                    # Create cache key from metadata for performance optimization
-                    cache_key = None
-                    if self.fourd_cache_size > 0:
-                        # Create deterministic cache key from relevant metadata
-                        cache_parts = [
-                            record_metadata.get("jurisdiction", ""),
-                            record_metadata.get("risk_level", ""),
-                            record_metadata.get("memory_type", ""),
-                            str(record_metadata.get("content_length", 0))
-                        ]
-                        cache_key = "|".join(cache_parts)
-
-                        # Check cache first
-                        if cache_key in self._fourd_cache:
-                            suggested_tier = self._fourd_cache[cache_key]
-                            tiering_metrics = {"total_score": 0.5, "dimensions": {"cached": True}}  # Default for cached
-                            self.logger.debug(f"4D-Tiering cache hit: {suggested_tier}")
-                        else:
-                            # Calculate tiering
-                            temp_record = type('TempRecord', (), {'metadata': record_metadata})()
-                            suggested_tier = self.tiering_engine.classify(temp_record)
-                            tiering_metrics = self.tiering_engine.get_tiering_metrics(temp_record)
-
-                            # Cache result (LRU-style by limiting cache size)
-                            if len(self._fourd_cache) >= self.fourd_cache_size:
-                                # Remove oldest entry (simple FIFO)
-                                oldest_key = next(iter(self._fourd_cache))
-                                del self._fourd_cache[oldest_key]
-                            self._fourd_cache[cache_key] = suggested_tier
-                    else:
-                        # No caching - calculate directly
-                        temp_record = type('TempRecord', (), {'metadata': record_metadata})()
-                        suggested_tier = self.tiering_engine.classify(temp_record)
-                        tiering_metrics = self.tiering_engine.get_tiering_metrics(temp_record)
-
-                    # Override storage tier with 4D suggestion if different
-                    if suggested_tier != storage_tier:
-                        # Map 4D tiers to StorageTier enum values
-                        tier_mapping = {
-                            "HOT": StorageTier.HOT,
-                            "WARM": StorageTier.HOT,  # Map WARM to HOT for storage
-                            "COLD": StorageTier.COLD
-                        }
-                        storage_tier = tier_mapping.get(suggested_tier, StorageTier.AUTO)
-                        self.logger.debug(f"4D-Tiering adjusted tier to {suggested_tier} (was {storage_tier})")
-
-                    # Add tiering metadata
-                    record_metadata.update({
-                        "tiering_4d": {
-                            "enabled": True,
-                            "suggested_tier": suggested_tier,
-                            "score": tiering_metrics.get("total_score", 0.5),
-                            "dimensions": tiering_metrics.get("dimensions", {})
-                        }
-                    })
-
-                # Create memory record
-                record = MemoryRecordV1(
-                    id=record_id or "",
-                    content=content,
-                    metadata=record_metadata,
-                    tags=tags or [],
-                    memory_type=MemoryType(memory_type) if isinstance(memory_type, str) else memory_type,
-                    storage_tier=StorageTier(storage_tier) if isinstance(storage_tier, str) else storage_tier,
-                    embedding=embedding
+                record = self._prepare_record(
+                    content, metadata, tags, memory_type, storage_tier, record_id, embedding
                 )
-
-                # Encrypt content if encryption is enabled
-                if self.crypto.is_encryption_enabled():
-                    encrypted_content, encryption_mode = self.crypto.encrypt_content(content)
-                    record.content = encrypted_content
-                    record.metadata["encryption_mode"] = encryption_mode
                 
-                # Store record with batch commit optimization
+                # Store record; returns once its group-commit batch is durable
+                self._before_store_many([record])
                 success = self._store.store(record)
                 if not success:
                     raise Exception("Failed to store record")
 
-                # Track checksum for durability if enabled
-                if self.durability_enabled:
-                    import hashlib
-                    checksum = hashlib.sha256(content.encode()).hexdigest()
-                    self.durability_checksums[record.id] = checksum
-
-                # Batch commit logic (only if tuning enabled)
-                if self.commit_every > 1 and hasattr(self._store, '_connection'):
-                    self._pending_commits.append(record.id)
-                    if len(self._pending_commits) >= self.commit_every:
-                        # Commit the batch
-                        self._store._connection.commit()
-                        self._pending_commits.clear()
-                        self.logger.debug(f"Committed batch of {self.commit_every} records")
-                else:
-                    # Immediate commit (default behavior)
-                    if hasattr(self._store, '_connection'):
-                        self._store._connection.commit()
-
-                # Update metrics
-                if self.metrics:
-                    self.metrics.update_record_count(len(self.list_all()))
+                self._after_store(record, content)
 
                 self.logger.debug(f"Stored record {record.id}")
                 return record.id
@@ -469,6 +779,41 @@ def store(
                 self.logger.error(f"Failed to store record: {e}")
                 raise
 
+    def store_many(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store many records with a single bulk write and commit.
+
+        Unlike store_batch(), which stores records one by one, the whole
+        list goes to the backend's store_many() in one transaction.
+
+        Args:
+            records: Record dictionaries with 'content' and optionally
+                'metadata', 'tags', 'memory_type', 'storage_tier', 'id'
+                and 'embedding'
+
+        Returns:
+            List of record IDs
+        """
+        with MetricsCollector(self.metrics, "writes") if self.metrics else nullcontext():
+            prepared = [
+                self._prepare_record(
+                    data.get("content", ""),
+                    data.get("metadata"),
+                    data.get("tags"),
+                    data.get("memory_type", MemoryType.CONVERSATION),
+                    data.get("storage_tier", StorageTier.HOT),
+                    data.get("id"),
+                    data.get("embedding")
+                )
+                for data in records
+            ]
+            self._before_store_many(prepared)
+            stored = self._store.store_many(prepared)
+            if stored != len(prepared):
+                raise RuntimeError(f"Bulk write stored {stored} of {len(prepared)} records")
+            self._after_store_many(prepared)
+            return [record.id for record in prepared]
+
     async def store_batch(self, records: List[Dict[str, Any]]) -> List[str]:
         """
         Store multiple records with sharding and batching for high-scale performance.
@@ -486,7 +831,7 @@ async def store_batch(self, records: List[Dict[str, Any]]) -> List[str]:
     
     async def _store_batch_standard(self, records: List[Dict[str, Any]]) -> List[str]:
         """Standard batch storage without sharding."""
-        async def store_single(record_data):
+        def store_single(record_data):
             content = record_data.get("content", "")
             metadata = record_data.get("metadata", {})
             tags = record_data.get("tags")
@@ -501,8 +846,12 @@ async def store_single(record_data):
                 storage_tier=storage_tier
             )
 
-        # Execute all stores concurrently
-        tasks = [store_single(record) for record in records]
+        # Run the blocking stores on a single writer thread so the event
+        # loop keeps serving other tasks while the batch is written.
+        if self._write_executor is None:
+            self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ioa-fabric-write")
+        loop = asyncio.get_running_loop()
+        tasks = [loop.run_in_executor(self._write_executor, store_single, record) for record in records]
         record_ids = await asyncio.gather(*tasks)
 
         self.logger.info(f"Batch stored {len(records)} records")
@@ -516,9 +865,22 @@ async def _store_batch_sharded(self, records: List[Dict[str, Any]]) -> List[str]
         record_ids = []
         total_records = len(records)
         start_time = time.time()
-        last_progress_time = start_time
+        
+        # Progress telemetry for external monitoring, as JSON lines
+        reporter = ProgressReporter(
+            "store",
+            total_records,
+            path=progress_path(self.config) or os.path.join(str(self.config.get("data_dir", self.root_dir)), "progress.log"),
+            interval=self.progress_telemetry,
+            on_update=lambda report: self.logger.info(
+                f"Progress: {report['progress_pct']:.1f}% ({report['done']}/{total_records}) - "
+                f"{report['rate_per_sec']:.0f} records/sec"
+            ),
+            extra={"shards": self.shards, "stage_size": self.stage_size}
+        )
         
         self.logger.info(f"Starting sharded batch storage of {total_records} records across {self.shards} shards")
+        self._start_shard_writers()
         
         # Process records in non-overlapping chunks
         for chunk_start in range(0, total_records, self.stage_size):
@@ -532,13 +894,8 @@ async def _store_batch_sharded(self, records: List[Dict[str, Any]]) -> List[str]
                 # Generate blake3 primary key for uniqueness
                 pk = self._generate_record_pk(record_data)
                 
-                # Use xxhash64 for better distribution (fallback to zlib if xxhash not available)
-                try:
-                    import xxhash
-                    shard_index = xxhash.xxh64(pk.encode(), seed=42).intdigest() % self.shards
-                except ImportError:
-                    # Fallback to zlib if xxhash not available
-                    shard_index = zlib.crc32(pk.encode()) % self.shards
+                # Placement from the persisted shard map (jump consistent hashing)
+                shard_index = self._shard_map.shard_for(pk)
                 
                 # Prepare record for shard storage
                 record_id = f"shard_{shard_index}_{chunk_start}_{i}"
@@ -562,6 +919,8 @@ async def _store_batch_sharded(self, records: List[Dict[str, Any]]) -> List[str]
                 
                 shard_tasks[shard_index].append(shard_record)
                 record_ids.append(record_id)
+                if self._id_filters is not None:
+                    self._id_filters.add(f"shard:{shard_index}", pk)
             
             # Distribute records to shard queues
             for shard_index, shard_records in shard_tasks.items():
@@ -569,34 +928,10 @@ async def _store_batch_sharded(self, records: List[Dict[str, Any]]) -> List[str]
                     for record in shard_records:
                         await self._shard_queues[shard_index].put(record)
             
-            # Progress telemetry
-            current_time = time.time()
-            if current_time - last_progress_time >= self.progress_telemetry:
-                progress_pct = (chunk_end / total_records) * 100
-                elapsed = current_time - start_time
-                rate = chunk_end / elapsed if elapsed > 0 else 0
-                
-                progress_data = {
-                    "phase": "store",
-                    "done": chunk_end,
-                    "total": total_records,
-                    "progress_pct": round(progress_pct, 2),
-                    "elapsed_sec": round(elapsed, 2),
-                    "rate_per_sec": round(rate, 2),
-                    "shards": self.shards,
-                    "stage_size": self.stage_size
-                }
-                
-                self.logger.info(f"Progress: {progress_pct:.1f}% ({chunk_end}/{total_records}) - {rate:.0f} records/sec")
-                
-                # Write progress to file for external monitoring
-                try:
-                    with open("progress.log", "a") as f:
-                        f.write(json.dumps(progress_data) + "\n")
-                except Exception as e:
-                    self.logger.warning(f"Failed to write progress log: {e}")
-                
-                last_progress_time = current_time
+            try:
+                reporter.update(chunk_end - chunk_start)
+            except OSError as e:
+                self.logger.warning(f"Failed to write progress log: {e}")
         
         # Wait for all shard writers to finish
         await self._flush_shard_writers()
@@ -614,8 +949,10 @@ async def _flush_shard_writers(self):
             for queue in self._shard_queues:
                 await queue.put(None)
             
-            # Wait for all writers to complete
+            # Wait for all writers to complete; the next batch starts new ones
             await asyncio.gather(*self._shard_writers, return_exceptions=True)
+            self._shard_writers.clear()
+            self._shard_queues.clear()
             
             # WAL checkpoint for all shards
             for conn in self._shard_connections:
@@ -650,15 +987,22 @@ def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
         """
         with MetricsCollector(self.metrics, "reads") if self.metrics else nullcontext():
             try:
+                if self._id_filters is not None and not self._id_filters.might_contain(record_id, prefix="tier:"):
+                    return None
+                
+                if self._record_cache is not None:
+                    return self._retrieve_cached(record_id)
+                
                 record = self._store.retrieve(record_id)
                 if not record:
+                    if self._id_filters is not None:
+                        self._id_filters.record_false_positive()
                     return None
                 
                 # Decrypt content if encrypted
-                if self.crypto.is_encryption_enabled() and record.metadata.get("encryption_mode") == "aes-gcm":
-                    decrypted_content = self.crypto.decrypt_content(record.content, "aes-gcm")
-                    record.content = decrypted_content
+                record = self._decrypted_copy(record)
                 
+                self._note_access(record)
                 self.logger.debug(f"Retrieved record {record_id}")
                 return record
                 
@@ -666,12 +1010,66 @@ def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
                 self.logger.error(f"Failed to retrieve record {record_id}: {e}")
                 return None
     
+    def _retrieve_cached(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """retrieve() through the record cache, writing access counts behind."""
+        cache = self._record_cache
+        record = cache.get(record_id)
+        if self.metrics:
+            self.metrics.record_cache_access(record is not None)
+        
+        if record is None:
+            generation = cache.generation()
+            found = self._store.get_many([record_id])
+            if not found:
+                if self._id_filters is not None:
+                    self._id_filters.record_false_positive()
+                return None
+            record = self._decrypt_record(copy_record(found[0]))
+            record.update_access()
+            cache.put(record, generation)
+        
+        self._access_tracker.record(record_id, record.last_accessed)
+        self._note_access(record)
+        self.logger.debug(f"Retrieved record {record_id}")
+        return record
+    
+    def _note_access(self, record: MemoryRecordV1) -> None:
+        """Log a read for change-log consumers (buffered and coalesced per record)."""
+        if self._changes is not None:
+            self._changes.record_access(record.id, record.last_accessed)
+    
+    def _forget_cached(self, record_ids: List[str]) -> None:
+        """Drop deleted records from the cache and the access write-behind buffer."""
+        if self._record_cache is not None:
+            self._record_cache.invalidate(record_ids)
+            self._access_tracker.discard(record_ids)
+    
+    def _log_deletes(self, record_ids: List[str]) -> None:
+        """Append delete events to the change log."""
+        if self._changes is not None and record_ids:
+            self._changes.append(OP_DELETE, ((record_id, {}) for record_id in record_ids))
+    
+    def _after_delete(self, record_ids: List[str]) -> None:
+        """Update caches, indexes, durability checksums and the change log after deletes."""
+        if not record_ids:
+            return
+        self._forget_cached(record_ids)
+        self._log_deletes(record_ids)
+        if self._id_filters is not None:
+            self._id_filters.note_removed(len(record_ids), prefix="tier:")
+        for record_id in record_ids:
+            if self._vector_index is not None:
+                self._vector_index.remove(record_id)
+            if self._durability_ledger is not None:
+                self._durability_ledger.remove(record_id)
+    
     def search(
         self,
         query: str,
         limit: int = 10,
         memory_type: Optional[str] = None,
-        storage_tier: Optional[str] = None
+        storage_tier: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
     ) -> List[MemoryRecordV1]:
         """
         Search for memory records.
@@ -681,32 +1079,99 @@ def search(
             limit: Maximum number of results
             memory_type: Filter by memory type
             storage_tier: Filter by storage tier
+            fields: Record fields to read (id is always included); the
+                others keep their defaults. None reads every field
             
         Returns:
-            List of matching records
+            List of matching records; encrypted content is decrypted on first access
         """
+        store_fields = self._store_projection(fields)
         with MetricsCollector(self.metrics, "queries") if self.metrics else nullcontext():
             try:
-                results = self._store.search(query, limit, memory_type)
-                
-                # Decrypt results if encryption is enabled
-                if self.crypto.is_encryption_enabled():
-                    for record in results:
-                        if record.metadata.get("encryption_mode") == "aes-gcm":
-                            decrypted_content = self.crypto.decrypt_content(record.content, "aes-gcm")
-                            record.content = decrypted_content
-                
-                # Filter by storage tier if specified
                 if storage_tier:
-                    results = [r for r in results if r.storage_tier.value == storage_tier]
+                    results = self._store.query(self._tier_search_query(query, limit, memory_type, storage_tier, store_fields))
+                else:
+                    results = self._store.search(query, limit, memory_type, store_fields)
                 
                 self.logger.debug(f"Search returned {len(results)} results for query: {query}")
-                return results
+                return self._decrypt_lazily(results)
                 
             except Exception as e:
                 self.logger.error(f"Failed to search: {e}")
                 return []
     
+    def _tier_search_query(
+        self,
+        text: str,
+        limit: int,
+        memory_type: Optional[Any],
+        storage_tier: Any,
+        fields: Optional[FrozenSet[str]]
+    ) -> FabricQuery:
+        """A search() restricted to storage tiers, as a query so the tier filter applies before the limit."""
+        filters = {"storage_tier": getattr(storage_tier, "value", storage_tier)}
+        if memory_type:
+            filters["memory_type"] = memory_type
+        return FabricQuery(
+            text=text, filters=filters, order_by=["-access_count", "-timestamp"], limit=limit, fields=fields
+        )
+    
+    def query(
+        self,
+        text: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = 10,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """
+        Query records with filters evaluated by the backend before the limit.
+        
+        Filters map record fields (memory_type, storage_tier, timestamp,
+        access_count, ...), metadata keys or "tags" to a value, a list, or a
+        dict of operators (eq, ne, in, gt, gte, lt, lte, exists). SQLite uses
+        expression indexes on the indexed metadata keys and a tag table;
+        JSONL uses an in-memory secondary index.
+        
+        Args:
+            text: Optional full-text match
+            filters: Field filters, all of which must match
+            order_by: Field or list of fields, "-" prefix for descending;
+                "relevance" orders text matches by rank (default with text,
+                otherwise "-timestamp")
+            limit: Maximum number of results (None for all)
+            fields: Record fields to read (id is always included; None for all)
+            
+        Returns:
+            Matching records; encrypted content is decrypted on first access
+        """
+        query = FabricQuery(
+            text=text, filters=filters or {}, order_by=order_by, limit=limit, fields=self._store_projection(fields)
+        )
+        with MetricsCollector(self.metrics, "queries") if self.metrics else nullcontext():
+            return self._decrypt_lazily([copy_record(record) for record in self._store.query(query)])
+    
+    def explain_query(
+        self,
+        text: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = 10
+    ) -> Dict[str, Any]:
+        """
+        Describe how the backend runs a query() (SQL and plan, or index use).
+        
+        Args:
+            text: Optional full-text match
+            filters: Field filters
+            order_by: Ordering fields
+            limit: Maximum number of results
+            
+        Returns:
+            Backend-specific plan dictionary
+        """
+        return self._store.explain(FabricQuery(text=text, filters=filters or {}, order_by=order_by, limit=limit))
+    
     def delete(self, record_id: str) -> bool:
         """
         Delete a memory record.
@@ -720,8 +1185,13 @@ def delete(self, record_id: str) -> bool:
         with MetricsCollector(self.metrics, "writes") if self.metrics else nullcontext():
             try:
                 success = self._store.delete(record_id)
+                if success:
+                    self._after_delete([record_id])
                 if success and self.metrics:
-                    self.metrics.update_record_count(len(self.list_all()))
+                    count = self.count()
+                    self.metrics.update_record_count(
+                        count if count is not None else len(self.list_all(fields=["id"]))
+                    )
                 
                 self.logger.debug(f"Deleted record {record_id}")
                 return success
@@ -730,46 +1200,550 @@ def delete(self, record_id: str) -> bool:
                 self.logger.error(f"Failed to delete record {record_id}: {e}")
                 return False
     
-    def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
+    def list_all(self, limit: Optional[int] = None, fields: Optional[Iterable[str]] = None) -> List[MemoryRecordV1]:
         """
         List all memory records.
         
         Args:
             limit: Maximum number of records to return
+            fields: Record fields to read, e.g. ["tags", "metadata"] for a
+                listing (id is always included; None for all)
             
         Returns:
-            List of all records
+            List of all records; encrypted content is decrypted on first access
         """
+        store_fields = self._store_projection(fields)
         with MetricsCollector(self.metrics, "reads") if self.metrics else nullcontext():
             try:
-                results = self._store.list_all(limit)
+                return self._decrypt_lazily(self._store.list_all(limit, store_fields))
+                
+            except Exception as e:
+                self.logger.error(f"Failed to list records: {e}")
+                return []
+
+    def search_similar(
+        self,
+        vector: List[float],
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        nprobe: Optional[int] = None,
+        exact: bool = False
+    ) -> List[tuple]:
+        """
+        Find records whose embeddings are most similar to a query vector.
+        
+        Args:
+            vector: Query embedding
+            k: Number of results
+            filters: Optional 'memory_type' and/or 'storage_tier' (value or list)
+            nprobe: Inverted lists to probe; higher improves recall at some latency
+            exact: Bypass the approximate search and scan every vector
+            
+        Returns:
+            List of (record, score) tuples, most similar first; encrypted
+            content is decrypted on first access
+        """
+        with MetricsCollector(self.metrics, "queries") if self.metrics else nullcontext():
+            try:
+                if self._vector_index is None or len(self._vector_index) == 0:
+                    return []
                 
-                # Decrypt results if encryption is enabled
-                if self.crypto.is_encryption_enabled():
-                    for record in results:
-                        if record.metadata.get("encryption_mode") == "aes-gcm":
-                            decrypted_content = self.crypto.decrypt_content(record.content, "aes-gcm")
-                            record.content = decrypted_content
+                hits = self._vector_index.search(vector, k=k, filters=filters, nprobe=nprobe, exact=exact)
+                scores = dict(hits)
+                records = self._decrypt_lazily(self._store.get_many([record_id for record_id, _ in hits]))
                 
+                results = [(record, scores[record.id]) for record in records]
+                self.logger.debug(f"Similarity search returned {len(results)} results")
                 return results
                 
             except Exception as e:
-                self.logger.error(f"Failed to list records: {e}")
+                self.logger.error(f"Failed similarity search: {e}")
                 return []
+    
+    def hybrid_search(
+        self,
+        query: str,
+        vector: Optional[List[float]] = None,
+        k: int = 10,
+        fusion: str = "rrf",
+        weights: Optional[List[float]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        candidates: Optional[int] = None,
+        rrf_k: int = DEFAULT_RRF_K,
+        tier4d_prior: float = 0.0,
+        debug: bool = False
+    ) -> Union[List[tuple], tuple]:
+        """
+        Combined lexical (FTS) and vector retrieval in one call.
+        
+        Both candidate generators run concurrently and their rankings are
+        fused; only the fused top-k vector hits are fetched from the store.
+        
+        Args:
+            query: Keyword query for the store's text search
+            vector: Optional query embedding for the ANN index
+            k: Number of results
+            fusion: 'rrf' (reciprocal-rank fusion) or 'weighted' (normalized scores)
+            weights: Per-generator weights as [lexical, vector]
+            filters: Optional 'memory_type' and/or 'storage_tier' filters
+            candidates: Candidates drawn from each generator (default max(4k, 20))
+            rrf_k: RRF damping constant
+            tier4d_prior: Weight of the Tier4D score (recency/priority prior)
+                used to re-rank fused results; 0 disables re-ranking
+            debug: Also return per-stage timings in milliseconds
+            
+        Returns:
+            List of (record, score) tuples, or (results, timings) when debug is
+            set; encrypted content is decrypted on first access
+        """
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        filters = filters or {}
+        depth = candidates or max(4 * k, 20)
+        
+        with MetricsCollector(self.metrics, "queries") if self.metrics else nullcontext():
+            try:
+                def lexical():
+                    t0 = time.perf_counter()
+                    records = []
+                    if query and filters.get("storage_tier"):
+                        records = self._store.query(self._tier_search_query(
+                            query, depth, filters.get("memory_type"), filters["storage_tier"], None
+                        ))
+                    elif query:
+                        records = self._store.search(query, depth, filters.get("memory_type"))
+                    timings["lexical_ms"] = (time.perf_counter() - t0) * 1000
+                    return records
+                
+                def semantic():
+                    t0 = time.perf_counter()
+                    hits = []
+                    if vector is not None and self._vector_index is not None:
+                        hits = self._vector_index.search(vector, k=depth, filters=filters)
+                    timings["vector_ms"] = (time.perf_counter() - t0) * 1000
+                    return hits
+                
+                if self._search_executor is None:
+                    self._search_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ioa-fabric-search")
+                lexical_future = self._search_executor.submit(lexical)
+                vector_hits = semantic()
+                lexical_records = lexical_future.result()
+                
+                t0 = time.perf_counter()
+                by_id = {record.id: record for record in lexical_records}
+                rankings = [[(record.id, None) for record in lexical_records], vector_hits]
+                fused = fuse(rankings, method=fusion, weights=weights, rrf_k=rrf_k)
+                timings["fusion_ms"] = (time.perf_counter() - t0) * 1000
+                
+                # Re-ranking needs metadata for more than k candidates
+                keep = fused[:depth] if tier4d_prior and self.tiering_engine else fused[:k]
+                
+                t0 = time.perf_counter()
+                missing = [record_id for record_id, _ in keep if record_id not in by_id]
+                if missing:
+                    by_id.update((record.id, record) for record in self._store.get_many(missing))
+                results = [(by_id[record_id], score) for record_id, score in keep if record_id in by_id]
+                timings["fetch_ms"] = (time.perf_counter() - t0) * 1000
+                
+                if tier4d_prior and self.tiering_engine:
+                    t0 = time.perf_counter()
+                    results = [
+                        (record, score * (1.0 + tier4d_prior * self.tiering_engine.get_tiering_metrics(record)["total_score"]))
+                        for record, score in results
+                    ]
+                    results.sort(key=lambda item: item[1], reverse=True)
+                    results = results[:k]
+                    timings["rerank_ms"] = (time.perf_counter() - t0) * 1000
+                
+                decrypted = self._decrypt_lazily([record for record, _ in results])
+                results = [(record, score) for record, (_, score) in zip(decrypted, results)]
+                timings["total_ms"] = (time.perf_counter() - started) * 1000
+                self.logger.debug(f"Hybrid search returned {len(results)} results for query: {query}")
+                return (results, timings) if debug else results
+                
+            except Exception as e:
+                self.logger.error(f"Failed hybrid search: {e}")
+                return ([], timings) if debug else []
+    
+    def export_columnar(
+        self,
+        path: str,
+        fmt: str = "auto",
+        row_group_size: int = 10000,
+        hot_keys: Optional[List[str]] = None,
+        decrypt: bool = False,
+        workers: int = 1,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Stream all records to a columnar file.
+        
+        Writes Parquet or Arrow IPC when pyarrow is installed, otherwise
+        gzip-compressed NDJSON chunks; records are read from the store one
+        row group at a time, never all at once.
+        
+        Args:
+            path: Output file (suffix selects the format when fmt='auto')
+            fmt: 'parquet', 'arrow', 'ndjson' or 'auto'
+            row_group_size: Records per row group / chunk
+            hot_keys: Metadata keys promoted to columns (IOA_COLUMNAR_HOT_KEYS;
+                inferred from the first row group by default)
+            decrypt: Export plaintext content instead of the stored ciphertext
+            workers: Threads decrypting row groups ahead of the writer
+            progress: Called with the number of records in each written row group
+            
+        Returns:
+            Export summary (path, format, records, row_groups, bytes, layout)
+        """
+        started = time.perf_counter()
+        if hot_keys is None and os.getenv("IOA_COLUMNAR_HOT_KEYS"):
+            hot_keys = [key.strip() for key in os.getenv("IOA_COLUMNAR_HOT_KEYS").split(",") if key.strip()]
+        self.flush()
+        
+        def decrypt_batch(batch):
+            # Copies: some backends hand out their own in-memory records
+            decrypted = []
+            for record in batch:
+                if record.metadata.get("encryption_mode") == "aes-gcm":
+                    record = self._decrypt_record(copy_record(record))
+                    record.metadata.pop("encryption_mode", None)
+                decrypted.append(record)
+            return decrypted
+        
+        def batches():
+            batches = self._store.iter_batches(row_group_size)
+            if decrypt:
+                batches = bounded_map(decrypt_batch, batches, workers)
+            for batch in batches:
+                yield batch
+                # Reported once the writer asks for the next row group
+                if progress is not None:
+                    progress(len(batch))
+        
+        summary = write_columnar(batches(), path, fmt=fmt, hot_keys=hot_keys)
+        summary["duration_ms"] = (time.perf_counter() - started) * 1000
+        self.logger.info(f"Exported {summary['records']} records to {path} ({summary['format']})")
+        return summary
+    
+    def import_columnar(
+        self,
+        path: str,
+        batch_size: int = 10000,
+        workers: int = 1,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Load records from a columnar export through the bulk write path.
+        
+        Records keep their ids, timestamps and access counts. Plaintext
+        records are encrypted when this fabric has encryption enabled;
+        ciphertext is stored as-is, so encrypted exports need the same key.
+        
+        Args:
+            path: File written by export_columnar()
+            batch_size: Records per bulk write
+            workers: Threads decoding and encrypting batches ahead of the
+                writes (the writes themselves stay in order on this thread)
+            progress: Called with the number of records in each stored batch
+            
+        Returns:
+            Import summary (records, batches, duration_ms)
+        """
+        started = time.perf_counter()
+        imported = 0
+        batches = 0
+        
+        def encrypt_batch(batch):
+            if self.crypto.is_encryption_enabled():
+                for record in batch:
+                    if record.metadata.get("encryption_mode") != "aes-gcm":
+                        encrypted_content, encryption_mode = self.crypto.encrypt_content(record.content)
+                        record.content = encrypted_content
+                        record.metadata["encryption_mode"] = encryption_mode
+            return batch
+        
+        for batch in bounded_map(encrypt_batch, read_columnar(path, batch_size=batch_size), workers):
+            self._before_store_many(batch)
+            stored = self._store.store_many(batch)
+            if stored != len(batch):
+                raise RuntimeError(f"Bulk write stored {stored} of {len(batch)} records from {path}")
+            self._after_store_many(batch)
+            imported += stored
+            batches += 1
+            if progress is not None:
+                progress(stored)
+        
+        summary = {
+            "path": str(path),
+            "records": imported,
+            "batches": batches,
+            "duration_ms": (time.perf_counter() - started) * 1000
+        }
+        self.logger.info(f"Imported {imported} records from {path}")
+        return summary
+    
+    def rebuild_vector_index(self) -> int:
+        """
+        Rebuild the ANN index from all stored embeddings and persist it.
+        
+        Returns:
+            Number of indexed records
+        """
+        index = self._new_vector_index()
+        for record in self._store.list_all(fields=projection(["embedding", "memory_type", "storage_tier"])):
+            if record.embedding is not None:
+                index.add(
+                    record.id,
+                    record.embedding.vector,
+                    memory_type=record.memory_type.value,
+                    storage_tier=record.storage_tier.value
+                )
+        index.train()
+        self._vector_index = index
+        self.save_vector_index()
+        self.logger.info(f"Rebuilt vector index with {len(index)} embeddings")
+        return len(index)
+    
+    def retier(self, batch_size: int = 1000, progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Demote hot records that Tier4D now scores COLD (tiered backend).
+        
+        Cold records move up on their own when they are read again; this is
+        the other direction, meant to run periodically.
+        
+        Args:
+            batch_size: Hot records scored per batch
+            progress: Called with the number of hot records scored in each batch
+            
+        Returns:
+            Number of demoted records
+        """
+        if not isinstance(self._store, TieredStore):
+            raise RuntimeError("retier() requires the tiered backend")
+        self.flush()
+        demoted = self._store.demote(batch_size, progress)
+        self._forget_cached(demoted)
+        if demoted:
+            self.logger.info(f"Demoted {len(demoted)} records to the cold tier")
+        return len(demoted)
+
+    def count(self) -> Optional[int]:
+        """Number of stored records, or None if the backend cannot count without a scan."""
+        if not hasattr(self._store, "count"):
+            return None
+        return self._store.count()
+
+    def verify(
+        self,
+        workers: Optional[int] = None,
+        batch_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Check that every record can be read back.
+
+        Streams all records, decrypting encrypted content without changing
+        the stored records; content that fails AES-GCM authentication (wrong
+        or missing key, corrupted ciphertext) is reported as unreadable.
+        Runs the backend's own integrity check where it has one (SQLite
+        quick_check, segment checksums) and, with durability enabled, the
+        checksum verification of durability_report().
+
+        Args:
+            workers: Parallel workers for the durability verification
+            batch_size: Records read per batch
+            progress: Called with the number of records in each scanned batch
+
+        Returns:
+            Summary (ok, records, unreadable ids, store_errors, durability report)
+        """
+        started = time.perf_counter()
+        self.flush()
+        records = 0
+        unreadable: List[str] = []
+        for batch in self._store.iter_batches(batch_size):
+            for record in batch:
+                if record.metadata.get("encryption_mode") != "aes-gcm":
+                    continue
+                try:
+                    self.crypto.decrypt_content_strict(record.content)
+                except Exception:
+                    unreadable.append(record.id)
+            records += len(batch)
+            if progress is not None:
+                progress(len(batch))
+
+        store_errors = self._store.verify() if hasattr(self._store, "verify") else []
+        durability = None
+        if self._durability_ledger is not None:
+            durability = self.durability_report(workers=workers).to_dict()
+        ok = not unreadable and not store_errors and (durability is None or durability["ok"])
+        return {
+            "ok": ok,
+            "records": records,
+            "unreadable": unreadable,
+            "store_errors": store_errors,
+            "durability": durability,
+            "duration_ms": (time.perf_counter() - started) * 1000
+        }
+
+    def _data_bytes(self) -> int:
+        data_dir = str(self.config.get("data_dir", self.root_dir))
+        total = 0
+        for root, _, files in os.walk(data_dir):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+        return total
+
+    def compact(self) -> Dict[str, Any]:
+        """
+        Reclaim space in the backend: SQLite rebuilds its file and merges
+        the full-text index, segment stores merge every segment, and the
+        tiered backend compacts each tier.
+
+        Returns:
+            Summary (compacted, bytes_before, bytes_after, duration_ms)
+        """
+        started = time.perf_counter()
+        self.flush()
+        before = self._data_bytes()
+        compacted = hasattr(self._store, "compact")
+        if compacted:
+            self._store.compact()
+        summary = {
+            "backend": self.backend_name,
+            "compacted": compacted,
+            "bytes_before": before,
+            "bytes_after": self._data_bytes(),
+            "duration_ms": (time.perf_counter() - started) * 1000
+        }
+        self.logger.info(f"Compaction: {summary['bytes_before']} -> {summary['bytes_after']} bytes")
+        return summary
 
+    def _shard_pks(self, shards: int):
+        """(filter name, pk) of every row in the shard databases."""
+        data_dir = self.config.get("data_dir", "./artifacts/memory/")
+        for index in range(shards):
+            conn = open_shard(shard_path(data_dir, index))
+            try:
+                for (pk,) in conn.execute("SELECT pk FROM memory_records"):
+                    yield f"shard:{index}", pk
+            finally:
+                conn.close()
+    
+    def rebuild_id_filters(self, shards: bool = True) -> int:
+        """
+        Rebuild the Bloom filters from the stored records (and shard rows).
+        
+        Deleted ids stay in the filters until a rebuild; sweep_expired()
+        rebuilds once the deleted share passes `bloom.rebuild_fraction`.
+        
+        Args:
+            shards: Also rebuild the per-shard filters
+            
+        Returns:
+            Number of ids added
+        """
+        if self._id_filters is None:
+            return 0
+        added = self._id_filters.rebuild(
+            ((f"tier:{record.storage_tier.value}", record.id)
+             for batch in self._store.iter_batches() for record in batch),
+            prefix="tier:"
+        )
+        if shards and self._shard_map is not None:
+            added += self._id_filters.rebuild(self._shard_pks(self._shard_map.open_shards), prefix="shard:")
+        self._id_filters.save()
+        self.logger.info(f"Rebuilt id filters with {added} keys")
+        return added
+    
+    def save_vector_index(self) -> None:
+        """Persist the ANN index beside the store data."""
+        if self._vector_index is None:
+            return
+        try:
+            self._vector_index.save(self._vector_index_path)
+        except Exception as e:
+            self.logger.error(f"Failed to save vector index: {e}")
+    
+    def sweep_expired(
+        self,
+        policy: Optional[RetentionPolicy] = None,
+        max_batches: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Delete records older than their memory type's TTL.
+        
+        Deletion happens in bounded batches through the store's index-driven
+        delete_expired(); each batch is reported to metrics as it completes.
+        
+        Args:
+            policy: Retention policy (defaults to the fabric's policy)
+            max_batches: Optional cap on batches per memory type for this run
+            
+        Returns:
+            Number of deleted records per memory type
+        """
+        policy = policy or self.retention_policy
+        now = datetime.now(timezone.utc)
+        results: Dict[str, int] = {}
+        
+        for memory_type in policy.ttl_seconds:
+            cutoff = policy.cutoff_for(memory_type, now)
+            total = 0
+            batches = 0
+            while True:
+                started = time.perf_counter()
+                deleted = self._store.delete_expired(memory_type, cutoff, policy.batch_size)
+                self._after_delete(deleted)
+                total += len(deleted)
+                batches += 1
+                if self.metrics:
+                    self.metrics.record_retention_sweep(
+                        memory_type, len(deleted), total, (time.perf_counter() - started) * 1000
+                    )
+                if len(deleted) < policy.batch_size or (max_batches and batches >= max_batches):
+                    break
+            results[memory_type] = total
+            if total:
+                self.logger.info(f"TTL sweep removed {total} expired {memory_type} records")
+        
+        # Compact the id filters once enough of their keys have expired
+        if self._id_filters is not None:
+            if self._id_filters.stale_fraction("tier:") > self._id_filters.config.rebuild_fraction:
+                self.rebuild_id_filters(shards=False)
+        
+        return results
+    
+    def start_ttl_sweeper(self, interval_seconds: float = 300.0) -> TTLSweeper:
+        """Start a background thread that runs sweep_expired() periodically."""
+        if self._ttl_sweeper is None:
+            self._ttl_sweeper = TTLSweeper(self, interval_seconds=interval_seconds)
+        self._ttl_sweeper.start()
+        return self._ttl_sweeper
+    
     def enable_durability(self, enabled: bool = True):
         """
         Enable or disable durability mode with checksum verification.
 
+        Checksums live in a ledger beside the store data and survive
+        restarts; disabling only stops tracking, the ledger is kept.
+
         Args:
             enabled: Whether to enable durability checks
         """
         self.durability_enabled = enabled
         if enabled:
-            self.durability_checksums = {}
+            if self._durability_ledger is None:
+                self._durability_ledger = DurabilityLedger(self._sidecar_path(".durability.db"))
             self.logger.info("Durability mode enabled")
         else:
-            self.durability_checksums = {}
+            if self._durability_ledger is not None:
+                self._durability_ledger.close()
+                self._durability_ledger = None
             self.logger.info("Durability mode disabled")
 
     def verify_durability(self) -> bool:
@@ -784,70 +1758,245 @@ def verify_durability(self) -> bool:
             return False
 
         try:
-            all_records = self.list_all()
-            verified_count = 0
-
-            for record in all_records:
-                # Calculate current checksum
-                import hashlib
-                current_checksum = hashlib.sha256(record.content.encode()).hexdigest()
-
-                # Check against stored checksum
-                record_id = record.id
-                if record_id in self.durability_checksums:
-                    stored_checksum = self.durability_checksums[record_id]
-                    if current_checksum == stored_checksum:
-                        verified_count += 1
-                    else:
-                        self.logger.error(f"Durability check failed for record {record_id}")
-                        return False
-                else:
-                    # Store checksum for future verification
-                    self.durability_checksums[record_id] = current_checksum
-                    verified_count += 1
-
-            integrity = (verified_count / len(all_records)) * 100 if all_records else 100
-            self.logger.info(f"Durability verification: {verified_count}/{len(all_records)} records ({integrity:.1f}% integrity)")
-            return True
-
+            return self.durability_report().ok
         except Exception as e:
             self.logger.error(f"Durability verification failed: {e}")
             return False
 
+    def durability_report(
+        self,
+        workers: Optional[int] = None,
+        resume: bool = False,
+        segments: Optional[List[int]] = None,
+        report_path: Optional[str] = None
+    ) -> DurabilityReport:
+        """
+        Verify stored records against the durability ledger, segment by segment.
+
+        Each segment's stored content is re-hashed and its Merkle root compared
+        with the ledger; only segments whose roots differ are diffed record by
+        record. SQLite segments are verified in a process pool, other backends
+        in a thread pool. Progress is checkpointed after every segment.
+
+        Args:
+            workers: Parallel workers (IOA_DURABILITY_WORKERS, default CPU count up to 8)
+            resume: Continue the last unfinished run from its checkpoint
+            segments: Optional subset of segments to verify
+            report_path: Optional path to write the report as JSON
+
+        Returns:
+            Report listing mismatched, missing and untracked record ids
+        """
+        if self._durability_ledger is None:
+            raise RuntimeError("Durability is not enabled")
+        ledger = self._durability_ledger
+        workers = workers or int(os.getenv("IOA_DURABILITY_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+        # Workers read from disk, so everything buffered must be committed first
+        self.flush()
+        ledger.commit()
+
+        if isinstance(self._store, SQLiteStore):
+            from concurrent.futures import ProcessPoolExecutor
+            from functools import partial
+            verify = partial(verify_sqlite_segment, ledger.path, self._store.get_db_path())
+            executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        else:
+            def verify(segment):
+                expected = ledger.expected(segment)
+                records = self._store.get_many(list(expected))
+                return compare_segment(
+                    segment, expected, {record.id: content_checksum(record.content) for record in records}
+                )
+            executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+        try:
+            report = run_verification(ledger, verify, executor=executor, resume=resume, segments=segments)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        if isinstance(self._store, SQLiteStore):
+            report.untracked = ledger.untracked(self._store.get_db_path())
+        else:
+            report.untracked = [r.id for r in self._store.list_all(fields=projection(["id"])) if r.id not in ledger]
+
+        for record_id in report.mismatches:
+            self.logger.error(f"Durability check failed for record {record_id}")
+        for record_id in report.missing:
+            self.logger.error(f"Durability check: record {record_id} is missing")
+        if report.untracked:
+            self.logger.warning(f"Durability check: {len(report.untracked)} stored records have no checksum")
+        self.logger.info(
+            f"Durability verification: {report.checked - len(report.mismatches) - len(report.missing)}"
+            f"/{report.checked} records verified in {report.duration_ms:.0f}ms"
+        )
+
+        if report_path:
+            with open(report_path, "w", encoding="utf-8") as f:
+                json.dump(report.to_dict(), f, indent=2)
+        return report
+
     def get_stats(self) -> Dict[str, Any]:
         """Get memory fabric statistics."""
         stats = self._store.get_stats()
         
+        if self._vector_index is not None:
+            stats["vector_index"] = self._vector_index.get_stats()
+        
+        if self._durability_ledger is not None:
+            stats["durability"] = {
+                "tracked_records": len(self._durability_ledger),
+                "segments": self._durability_ledger.segments
+            }
+        
+        if self._record_cache is not None:
+            stats["record_cache"] = self._record_cache.get_stats()
+            stats["record_cache"]["access_write_behind"] = self._access_tracker.get_stats()
+        
+        if self._shard_map is not None:
+            stats["sharding"] = {
+                "shards": self._shard_map.shards,
+                "scheme": self._shard_map.scheme,
+                "version": self._shard_map.version,
+                "migrating": self._shard_map.migrating
+            }
+            if self._resharder is not None:
+                stats["sharding"]["reshard"] = self._resharder.status()
+        
+        if self._id_filters is not None:
+            stats["bloom"] = self._id_filters.get_stats()
+        if self._changes is not None:
+            stats["changelog"] = self._changes.get_stats()
+        
+        if "tiers" in stats and self.metrics:
+            self.metrics.set_tier_latency(stats["tiers"])
+        
+        if self.dedup:
+            stats["dedup"] = self._store.dedup_stats()
+            if self.metrics:
+                self.metrics.set_dedup_ratio(stats["dedup"]["dedup_ratio"])
+        
         if self.metrics:
             metrics = self.metrics.get_current_metrics()
             stats.update(metrics)
         
         return stats
+
+    def changes(
+        self,
+        since_seq: int = 0,
+        follow: bool = False,
+        timeout: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[ChangeEvent]:
+        """
+        Store, access and delete events after a sequence number.
+
+        A consumer keeps the `seq` of the last event it applied and resumes
+        from there, so it does work proportional to the changes rather than
+        the dataset; checkpoint_changes() lets retention drop what every
+        consumer has seen. A new consumer scans the fabric once, starting
+        from `get_stats()["changelog"]["last_seq"]` read before the scan.
+
+        Args:
+            since_seq: Last sequence number already consumed
+            follow: Keep waiting for new events (tail mode)
+            timeout: In tail mode, stop after this many idle seconds (None waits until close())
+            limit: Maximum events to return (without tail mode)
+
+        Returns:
+            Iterator of change events in sequence order
+
+        Raises:
+            ChangeLogTruncatedError: If retention removed events after since_seq
+        """
+        if self._changes is None:
+            raise RuntimeError("changes() requires the change log (config 'changelog' or IOA_FABRIC_CHANGELOG=1)")
+        if follow:
+            return self._changes.follow(since_seq, timeout)
+        return self._changes.read(since_seq, limit)
+
+    def checkpoint_changes(self, consumer: str, seq: int) -> int:
+        """
+        Save a consumer's position in the change log.
+
+        Args:
+            consumer: Consumer name
+            seq: Sequence number of the last event the consumer applied
+
+        Returns:
+            Number of log files removed by retention
+        """
+        if self._changes is None:
+            raise RuntimeError("checkpoint_changes() requires the change log")
+        return self._changes.checkpoint(consumer, seq)
+
+    def publish_snapshot(self, directory: Optional[str] = None, keep: int = 2) -> Dict[str, Any]:
+        """
+        Publish a read-only snapshot of every record for worker processes.
+        
+        Workers open it with the "snapshot" backend, which memory-maps the
+        file (sharing page cache across processes) and picks up each new
+        generation without a restart. Content is written as stored, so
+        encrypted records stay encrypted.
+        
+        Args:
+            directory: Snapshot directory (default: config `snapshot_dir`,
+                IOA_FABRIC_SNAPSHOT_DIR or <data_dir>/snapshot)
+            keep: Generations kept on disk
+            
+        Returns:
+            The published pointer: generation, file, records, published_at
+        """
+        self.flush()
+        records = (record for batch in self._store.iter_batches() for record in batch)
+        pointer = publish_snapshot(directory or snapshot_dir(self.config), records, keep=keep)
+        self.logger.info(f"Published snapshot generation {pointer['generation']} ({pointer['records']} records)")
+        return pointer
     
     def flush(self):
-        """Flush any pending batch commits."""
-        if self._pending_commits and hasattr(self._store, '_connection'):
+        """Flush any pending batch commits and buffered access counts."""
+        if self._access_tracker is not None:
+            self._access_tracker.flush()
+        if self._vector_index is not None and self._vector_index.dirty:
+            self.save_vector_index()
+        if self._id_filters is not None:
             try:
-                self._store._connection.commit()
-                self.logger.debug(f"Flushed {len(self._pending_commits)} pending commits")
-                self._pending_commits.clear()
+                self._id_filters.save()
+            except OSError as e:
+                self.logger.error(f"Failed to save id filters: {e}")
+        if hasattr(self._store, "flush"):
+            try:
+                self._store.flush()
             except Exception as e:
                 self.logger.error(f"Failed to flush pending commits: {e}")
+        if self._changes is not None:
+            self._changes.flush()
 
     def close(self):
         """Close the memory fabric and cleanup resources."""
+        if self._ttl_sweeper is not None:
+            self._ttl_sweeper.stop()
+
         # Flush any pending commits before closing
         self.flush()
+        if self._durability_ledger is not None:
+            self._durability_ledger.close()
+            self._durability_ledger = None
+        if self._changes is not None:
+            self._changes.close()
+
+        # Interrupt a background reshard; it resumes on the next reshard()
+        if self._resharder is not None:
+            self._resharder.stop()
 
-        # Stop shard writers
+        # Stop shard writers left running by an interrupted batch; they exit on
+        # their own loop once they see the shutdown signal
         if self._shard_writers:
             try:
-                # Send shutdown signals
                 for queue in self._shard_queues:
-                    asyncio.create_task(queue.put(None))
-                
-                # Wait for writers to complete
-                asyncio.gather(*self._shard_writers, return_exceptions=True)
+                    queue.put_nowait(None)
                 
             except Exception as e:
                 self.logger.warning(f"Error stopping shard writers: {e}")
@@ -855,6 +2004,13 @@ def close(self):
                 self._shard_writers.clear()
                 self._shard_queues.clear()
 
+        if self._search_executor is not None:
+            self._search_executor.shutdown(wait=False)
+            self._search_executor = None
+        if self._write_executor is not None:
+            self._write_executor.shutdown(wait=True)
+            self._write_executor = None
+
         # Close shard connections
         for conn in self._shard_connections:
             try:
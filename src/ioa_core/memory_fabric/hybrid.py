@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+from typing import Dict, List, Optional, Sequence, Tuple
+"""Hybrid module."""
+
+# Ranked candidate list: (record_id, raw_score); raw_score may be None when the
+# generator only provides an order (e.g. FTS results sorted by the store).
+Ranking = List[Tuple[str, Optional[float]]]
+
+DEFAULT_RRF_K = 60
+SUPPORTED_FUSION = ("rrf", "weighted")
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Ranking],
+    weights: Optional[Sequence[float]] = None,
+    rrf_k: int = DEFAULT_RRF_K
+) -> Dict[str, float]:
+    """
+    Fuse ranked lists with reciprocal-rank fusion.
+
+    Each list contributes weight / (rrf_k + rank) for every id it contains,
+    so ids ranked highly by several generators rise to the top without any
+    need to calibrate their raw scores against each other.
+    """
+    weights = weights or [1.0] * len(rankings)
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, (record_id, _) in enumerate(ranking, start=1):
+            fused[record_id] = fused.get(record_id, 0.0) + weight / (rrf_k + rank)
+    return fused
+
+
+def weighted_score_fusion(
+    rankings: Sequence[Ranking],
+    weights: Optional[Sequence[float]] = None
+) -> Dict[str, float]:
+    """
+    Fuse ranked lists with a weighted sum of min-max normalized scores.
+
+    Lists without raw scores are scored by position (1.0 for the first hit
+    down to 1/n for the last).
+    """
+    weights = weights or [1.0] * len(rankings)
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        if not ranking:
+            continue
+        n = len(ranking)
+        raw = [score for _, score in ranking]
+        if any(score is None for score in raw):
+            normalized = [(n - i) / n for i in range(n)]
+        else:
+            low, high = min(raw), max(raw)
+            span = high - low
+            normalized = [1.0 if span == 0 else (score - low) / span for score in raw]
+        for (record_id, _), score in zip(ranking, normalized):
+            fused[record_id] = fused.get(record_id, 0.0) + weight * score
+    return fused
+
+
+def fuse(
+    rankings: Sequence[Ranking],
+    method: str = "rrf",
+    weights: Optional[Sequence[float]] = None,
+    rrf_k: int = DEFAULT_RRF_K
+) -> List[Tuple[str, float]]:
+    """Fuse rankings and return (record_id, score) sorted by descending score."""
+    if method == "rrf":
+        fused = reciprocal_rank_fusion(rankings, weights, rrf_k)
+    elif method == "weighted":
+        fused = weighted_score_fusion(rankings, weights)
+    else:
+        raise ValueError(f"Unknown fusion method: {method}")
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
@@ -47,7 +47,11 @@ def __init__(self, output_dir: str = "./artifacts/lens/memory_fabric"):
             "latency_ms": {"p50": 0, "p95": 0},
             "encryption": "none",
             "errors": 0,
-            "total_records": 0
+            "total_records": 0,
+            "retention": {"sweeps": 0, "deleted": 0, "last_sweep": None},
+            "cache": {"hits": 0, "misses": 0},
+            "dedup_ratio": 1.0,
+            "tiers": {}
         }
     
     def set_backend(self, backend: str):
@@ -93,6 +97,38 @@ def record_operation(self, operation: str, success: bool, duration_ms: float, er
             "encryption": self._current_metrics["encryption"]
         })
     
+    def record_retention_sweep(self, memory_type: str, deleted: int, total_deleted: int, duration_ms: float):
+        """Record progress of one TTL sweep batch."""
+        retention = self._current_metrics["retention"]
+        retention["sweeps"] += 1
+        retention["deleted"] += deleted
+        retention["last_sweep"] = datetime.now(timezone.utc).isoformat()
+        
+        self._write_metrics_entry({
+            "timestamp": retention["last_sweep"],
+            "operation": "ttl_sweep",
+            "memory_type": memory_type,
+            "deleted": deleted,
+            "total_deleted": total_deleted,
+            "duration_ms": duration_ms,
+            "backend": self._current_metrics["backend"]
+        })
+    
+    def record_cache_access(self, hit: bool):
+        """Count a record cache hit or miss."""
+        self._current_metrics["cache"]["hits" if hit else "misses"] += 1
+    
+    def set_dedup_ratio(self, ratio: float):
+        """Set the logical/stored content byte ratio of a deduplicating store."""
+        self._current_metrics["dedup_ratio"] = ratio
+    
+    def set_tier_latency(self, tiers: Dict[str, Dict[str, Any]]):
+        """Set per-tier read counts, hits and latency percentiles of a tiered store."""
+        self._current_metrics["tiers"] = {
+            tier: {"reads": stats["reads"], "hits": stats["hits"], "latency_ms": dict(stats["latency_ms"])}
+            for tier, stats in tiers.items()
+        }
+    
     def update_record_count(self, count: int):
         """Update the total record count."""
         self._current_metrics["total_records"] = count
@@ -113,7 +149,11 @@ def reset_metrics(self):
             "latency_ms": {"p50": 0, "p95": 0},
             "encryption": "none",
             "errors": 0,
-            "total_records": 0
+            "total_records": 0,
+            "retention": {"sweeps": 0, "deleted": 0, "last_sweep": None},
+            "cache": {"hits": 0, "misses": 0},
+            "dedup_ratio": 1.0,
+            "tiers": {}
         }
         self._operation_times.clear()
     
@@ -0,0 +1,365 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from .schema import MemoryRecordV1
+"""Query module."""
+
+# Record attributes that are filtered and sorted as columns; any other field
+# name refers to a metadata key ("metadata." prefix optional)
+RECORD_FIELDS = ("id", "memory_type", "storage_tier", "timestamp", "access_count", "last_accessed")
+
+# Fields a read can be projected to with `fields=[...]`; "id" is always included
+PROJECTABLE_FIELDS = (
+    "id", "content", "metadata", "timestamp", "tags", "storage_tier", "memory_type",
+    "access_count", "last_accessed", "embedding"
+)
+
+OPERATORS = ("eq", "ne", "in", "gt", "gte", "lt", "lte", "exists")
+
+DEFAULT_INDEXED_METADATA = ("jurisdiction", "risk_level", "priority")
+
+RELEVANCE = "relevance"
+
+_SIMPLE_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def indexed_metadata_keys(config: Optional[Dict[str, Any]] = None) -> Tuple[str, ...]:
+    """
+    Metadata keys a store keeps secondary indexes for.
+
+    From the store config's `indexed_metadata` list or IOA_FABRIC_INDEXED_METADATA
+    (comma-separated); defaults to jurisdiction, risk_level and priority.
+    """
+    keys = (config or {}).get("indexed_metadata")
+    if keys is None:
+        env = os.getenv("IOA_FABRIC_INDEXED_METADATA")
+        keys = env.split(",") if env is not None else DEFAULT_INDEXED_METADATA
+    return tuple(key.strip() for key in keys if key.strip())
+
+
+def json_path(key: str) -> str:
+    """SQLite JSON path for a top-level metadata key."""
+    if _SIMPLE_KEY.match(key):
+        return f"$.{key}"
+    return '$."' + key.replace('"', '""') + '"'
+
+
+def projection(fields: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """
+    Normalize a `fields=[...]` projection.
+
+    Returns:
+        The selected fields plus "id", or None (every field) when `fields` is None
+
+    Raises:
+        ValueError: If a field is not one of PROJECTABLE_FIELDS
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+    selected = frozenset(fields) | {"id"}
+    unknown = selected.difference(PROJECTABLE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields {sorted(unknown)}; choose from {', '.join(PROJECTABLE_FIELDS)}")
+    return None if len(selected) == len(PROJECTABLE_FIELDS) else selected
+
+
+def project(record: MemoryRecordV1, fields: Optional[FrozenSet[str]]) -> MemoryRecordV1:
+    """
+    Copy of `record` with only `fields` set; the other fields keep their defaults.
+
+    For backends that cannot leave fields out of the read itself.
+    """
+    if fields is None:
+        return record
+    values = {name: getattr(record, name) for name in fields}
+    if "metadata" in values:
+        values["metadata"] = dict(values["metadata"])
+    if "tags" in values:
+        values["tags"] = list(values["tags"])
+    return MemoryRecordV1(**values)
+
+
+@dataclass(frozen=True)
+class Condition:
+    """One normalized filter: `kind` is "field", "metadata" or "tag"."""
+    kind: str
+    name: str
+    op: str
+    value: Any = None
+
+    def describe(self) -> str:
+        """Human-readable form used in query plans."""
+        target = {"field": self.name, "metadata": f"metadata.{self.name}", "tag": "tags"}[self.kind]
+        return f"{target} {self.op} {self.value!r}"
+
+
+@dataclass
+class FabricQuery:
+    """
+    A fabric query: optional text match, filters, ordering and limit.
+
+    Filters map a field to a value (equality), a list (membership) or a dict
+    of operators: {"priority": {"gte": 3}, "risk_level": {"in": ["high"]}}.
+    Fields are record attributes (memory_type, storage_tier, timestamp, ...),
+    metadata keys, or "tags" / "tag": a tag value, or a list of which every
+    tag must be present ({"in": [...]} for any of them).
+    """
+    text: Optional[str] = None
+    filters: Dict[str, Any] = field(default_factory=dict)
+    order_by: Optional[Union[str, List[str]]] = None
+    limit: Optional[int] = 10
+    fields: Optional[Iterable[str]] = None  # Projection (None reads every field)
+
+    def __post_init__(self):
+        """Normalize filters, ordering and projection, rejecting unknown operators and fields."""
+        self.conditions = normalize_filters(self.filters)
+        self.fields = projection(self.fields)
+        if self.order_by is None:
+            order = [RELEVANCE] if self.text else ["-timestamp"]
+        elif isinstance(self.order_by, str):
+            order = [self.order_by]
+        else:
+            order = list(self.order_by)
+        self.ordering: List[Tuple[str, bool]] = []
+        for key in order:
+            descending = key.startswith("-")
+            name = key.lstrip("-+")
+            if name == RELEVANCE and not self.text:
+                continue
+            self.ordering.append((name, descending))
+
+
+def _field(name: str) -> Tuple[str, str]:
+    """Resolve a filter or order field to (kind, name)."""
+    if name in ("tags", "tag"):
+        return "tag", "tags"
+    if name in RECORD_FIELDS:
+        return "field", name
+    if name.startswith("metadata."):
+        name = name[len("metadata."):]
+    return "metadata", name
+
+
+def normalize_filters(filters: Optional[Dict[str, Any]]) -> List[Condition]:
+    """Turn a filter dict into a list of conditions (ANDed)."""
+    conditions = []
+    for name, spec in (filters or {}).items():
+        kind, name = _field(name)
+        if isinstance(spec, dict):
+            items = list(spec.items())
+        elif isinstance(spec, (list, tuple, set)):
+            items = [("all" if kind == "tag" else "in", list(spec))]
+        else:
+            items = [("eq", spec)]
+
+        for op, value in items:
+            if kind == "tag" and op == "all":
+                conditions.extend(Condition(kind, name, "eq", tag) for tag in value)
+                continue
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown filter operator '{op}' for {name}")
+            if op == "in":
+                value = list(value)
+            if kind == "tag" and op not in ("eq", "in", "exists"):
+                raise ValueError(f"Tags support eq, in and exists filters, not '{op}'")
+            conditions.append(Condition(kind, name, op, value))
+    return conditions
+
+
+def record_value(record: MemoryRecordV1, kind: str, name: str) -> Any:
+    """Value a condition or ordering refers to (enums as their string values)."""
+    if kind == "metadata":
+        return record.metadata.get(name)
+    value = getattr(record, name)
+    return getattr(value, "value", value)
+
+
+def _comparable(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def matches(record: MemoryRecordV1, conditions: Iterable[Condition]) -> bool:
+    """Evaluate conditions against a record (for in-memory backends)."""
+    for condition in conditions:
+        if condition.kind == "tag":
+            if condition.op == "exists":
+                ok = bool(record.tags) == bool(condition.value)
+            elif condition.op == "in":
+                ok = any(tag in record.tags for tag in condition.value)
+            else:
+                ok = condition.value in record.tags
+            if not ok:
+                return False
+            continue
+
+        if condition.kind == "metadata" and condition.op == "exists":
+            if (condition.name in record.metadata) != bool(condition.value):
+                return False
+            continue
+
+        value = _comparable(record_value(record, condition.kind, condition.name))
+        target = condition.value
+        if condition.op == "in":
+            ok = value in [_comparable(item) for item in target]
+        elif condition.op == "eq":
+            ok = value == _comparable(target)
+        elif condition.op == "ne":
+            ok = value != _comparable(target)
+        else:
+            target = _comparable(target)
+            try:
+                ok = value is not None and {
+                    "gt": value > target,
+                    "gte": value >= target,
+                    "lt": value < target,
+                    "lte": value <= target,
+                }[condition.op]
+            except TypeError:
+                ok = False
+        if not ok:
+            return False
+    return True
+
+
+def text_matches(record: MemoryRecordV1, text: str) -> bool:
+    """Substring text match over content and tags (in-memory backends)."""
+    text = text.lower()
+    return text in record.content.lower() or any(text in tag.lower() for tag in record.tags)
+
+
+def sort_records(records: List[MemoryRecordV1], ordering: List[Tuple[str, bool]]) -> List[MemoryRecordV1]:
+    """Stable multi-key sort; records missing a key sort last."""
+    for name, descending in reversed(ordering):
+        if name == RELEVANCE:
+            # No scoring in memory; rank like search(): most used, then newest
+            records = sorted(records, key=lambda r: (r.access_count, r.timestamp), reverse=True)
+            continue
+        kind, name = _field(name)
+        present = [r for r in records if record_value(r, kind, name) is not None]
+        missing = [r for r in records if record_value(r, kind, name) is None]
+        try:
+            present.sort(key=lambda r: _comparable(record_value(r, kind, name)), reverse=descending)
+        except TypeError:
+            present.sort(key=lambda r: str(record_value(r, kind, name)), reverse=descending)
+        records = present + missing
+    return records
+
+
+class SecondaryIndex:
+    """
+    In-memory inverted index over tags, memory_type, storage_tier and
+    selected metadata keys, for stores that keep records in memory.
+    """
+
+    def __init__(self, metadata_keys: Iterable[str]):
+        """
+        Initialize the index.
+
+        Args:
+            metadata_keys: Metadata keys to index (scalar values only)
+        """
+        self.metadata_keys = tuple(metadata_keys)
+        self._postings: Dict[Tuple[str, str, Any], Set[str]] = {}
+        self._entries: Dict[str, List[Tuple[str, str, Any]]] = {}
+
+    def _keys(self, record: MemoryRecordV1) -> List[Tuple[str, str, Any]]:
+        keys = [("field", "memory_type", record.memory_type.value), ("field", "storage_tier", record.storage_tier.value)]
+        keys.extend(("tag", "tags", tag) for tag in set(record.tags))
+        for key in self.metadata_keys:
+            value = record.metadata.get(key)
+            if isinstance(value, (str, int, float, bool)):
+                keys.append(("metadata", key, value))
+        return keys
+
+    def add(self, record: MemoryRecordV1) -> None:
+        """Index a record, replacing any previous version."""
+        self.remove(record.id)
+        keys = self._keys(record)
+        self._entries[record.id] = keys
+        for key in keys:
+            self._postings.setdefault(key, set()).add(record.id)
+
+    def remove(self, record_id: str) -> None:
+        """Drop a record from the index."""
+        for key in self._entries.pop(record_id, []):
+            postings = self._postings.get(key)
+            if postings is not None:
+                postings.discard(record_id)
+                if not postings:
+                    del self._postings[key]
+
+    def indexable(self, condition: Condition) -> bool:
+        """True if the index can answer a condition."""
+        if condition.op not in ("eq", "in"):
+            return False
+        if condition.kind == "metadata":
+            return condition.name in self.metadata_keys
+        return condition.kind == "tag" or condition.name in ("memory_type", "storage_tier")
+
+    def candidates(self, conditions: Iterable[Condition]) -> Optional[Set[str]]:
+        """IDs satisfying every indexable condition, or None if none applies."""
+        result: Optional[Set[str]] = None
+        for condition in conditions:
+            if not self.indexable(condition):
+                continue
+            values = condition.value if condition.op == "in" else [condition.value]
+            ids: Set[str] = set()
+            for value in values:
+                ids |= self._postings.get((condition.kind, condition.name, value), set())
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result
+
+
+def run_in_memory(
+    records: Dict[str, MemoryRecordV1],
+    query: FabricQuery,
+    index: Optional[SecondaryIndex] = None
+) -> Tuple[List[MemoryRecordV1], Dict[str, Any]]:
+    """
+    Evaluate a query over in-memory records, using the index when it applies.
+
+    Returns:
+        Matching records and the plan that was followed
+    """
+    candidate_ids = index.candidates(query.conditions) if index is not None else None
+    if candidate_ids is None:
+        candidates = list(records.values())
+        access = "full scan"
+    else:
+        candidates = [records[record_id] for record_id in candidate_ids if record_id in records]
+        access = f"secondary index ({len(candidates)} candidates)"
+
+    results = [
+        record for record in candidates
+        if matches(record, query.conditions) and (not query.text or text_matches(record, query.text))
+    ]
+    results = sort_records(results, query.ordering)
+    if query.limit is not None:
+        results = results[:query.limit]
+    results = [project(record, query.fields) for record in results]
+
+    plan = {
+        "access": access,
+        "indexed": [c.describe() for c in query.conditions if index is not None and index.indexable(c)],
+        "filters": [c.describe() for c in query.conditions],
+        "text": query.text,
+        "order_by": [("-" if desc else "") + name for name, desc in query.ordering],
+        "limit": query.limit,
+        "fields": sorted(query.fields) if query.fields is not None else None
+    }
+    return results, plan
@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+"""Replication module."""
+
+logger = logging.getLogger(__name__)
+
+# SQLite database header fields rewritten in a replica's first page
+_HEADER_FILE_FORMAT = 18       # write and read versions: 1 rollback journal, 2 WAL
+_HEADER_CHANGE_COUNTER = 24    # checked by readers to drop stale page caches
+_HEADER_PAGE_COUNT = 28
+_HEADER_VERSION_VALID_FOR = 92
+
+
+def _page_digests(snapshot: bytes, page_size: int) -> List[bytes]:
+    """BLAKE2b-128 digest of each page of a database image."""
+    view = memoryview(snapshot)
+    return [
+        hashlib.blake2b(view[offset:offset + page_size], digest_size=16).digest()
+        for offset in range(0, len(snapshot), page_size)
+    ]
+
+
+def _replica_header(page: bytes, change_counter: int, page_count: int) -> bytes:
+    """First page of the primary rewritten for a rollback-journal replica."""
+    header = bytearray(page)
+    header[_HEADER_FILE_FORMAT:_HEADER_FILE_FORMAT + 2] = b"\x01\x01"
+    header[_HEADER_CHANGE_COUNTER:_HEADER_CHANGE_COUNTER + 4] = change_counter.to_bytes(4, "big")
+    header[_HEADER_PAGE_COUNT:_HEADER_PAGE_COUNT + 4] = page_count.to_bytes(4, "big")
+    header[_HEADER_VERSION_VALID_FOR:_HEADER_VERSION_VALID_FOR + 4] = change_counter.to_bytes(4, "big")
+    return bytes(header)
+
+
+class ReplicaState:
+    """Shipping state of one replica database file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection: Optional[sqlite3.Connection] = None
+        self.fd: Optional[int] = None
+        self.version: Optional[int] = None
+        # Digests of the pages the replica holds; None rewrites every page
+        self.pages: Optional[List[bytes]] = None
+        self.pages_shipped = 0
+        self.commit_seq = 0
+        self.shipped_at: Optional[float] = None
+        self.ships = 0
+        self.failures = 0
+        self.error: Optional[str] = None
+
+    def to_dict(self, lag: Optional[float]) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "ships": self.ships,
+            "pages_shipped": self.pages_shipped,
+            "failures": self.failures,
+            "shipped_at": self.shipped_at,
+            "lag_seconds": lag,
+            "error": self.error
+        }
+
+
+class SQLiteReplicator:
+    """
+    Ships the changed pages of a WAL-mode SQLite database to replica files.
+
+    Each pass serializes one consistent snapshot of the primary (database
+    file plus committed WAL frames, so writers are never blocked), hashes
+    its pages and writes only the pages whose digest differs from what the
+    replica holds. Reading and hashing the snapshot is still O(database
+    size) per pass, but replica writes are O(changed pages). Replicas use a
+    rollback journal: a ship holds the replica's exclusive lock while it
+    writes, so replica readers wait for it and never see a partial
+    transaction. A replica's first ship, or the next one after a failure,
+    rewrites every page.
+
+    Without Connection.serialize() (Python < 3.11) every pass falls back to
+    copying the whole database with SQLite's online backup API.
+
+    Passes skip replicas while `PRAGMA data_version` shows no new commit. The
+    owner calls notify() after each commit; the background thread ships the
+    commits of each `interval` in one pass, which bounds replica lag to
+    about one interval plus the copy time.
+    """
+
+    def __init__(self, source: str, replicas: List[str], interval: float = 1.0):
+        """
+        Initialize the replicator.
+
+        Args:
+            source: Primary database file
+            replicas: Replica database files, nearest first
+            interval: Minimum seconds between shipping passes
+        """
+        if os.path.abspath(source) in {os.path.abspath(path) for path in replicas}:
+            raise ValueError("A replica cannot be the primary database itself")
+        self.source = source
+        self.interval = max(0.0, interval)
+        self.replicas = [ReplicaState(path) for path in replicas]
+        self._source: Optional[sqlite3.Connection] = None
+        self._ship_lock = threading.Lock()
+        # Commit sequence and the times of commits not yet on every replica
+        self._commit_lock = threading.Lock()
+        self._commit_seq = 0
+        self._commit_times: Deque[Tuple[int, float]] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def notify(self) -> None:
+        """Record that the primary committed; the next pass ships it."""
+        with self._commit_lock:
+            self._commit_seq += 1
+            self._commit_times.append((self._commit_seq, time.time()))
+        self._wake.set()
+
+    def sync(self) -> int:
+        """
+        Ship the primary's committed state to every replica that is behind.
+
+        Returns:
+            Number of replicas updated
+        """
+        with self._ship_lock:
+            with self._commit_lock:
+                commit_seq = self._commit_seq
+            if self._source is None:
+                self._source = sqlite3.connect(self.source, check_same_thread=False)
+            # Read after commit_seq: every commit counted there is in this version
+            version = self._source.execute("PRAGMA data_version").fetchone()[0]
+            snapshot, digests = None, None
+            if hasattr(self._source, "serialize") and any(r.version != version for r in self.replicas):
+                snapshot = self._source.serialize()
+                page_size = int.from_bytes(snapshot[16:18], "big")
+                digests = _page_digests(snapshot, 65536 if page_size == 1 else page_size)
+            shipped = 0
+            for replica in self.replicas:
+                if replica.version != version:
+                    try:
+                        if replica.connection is None:
+                            os.makedirs(os.path.dirname(os.path.abspath(replica.path)), exist_ok=True)
+                            replica.connection = sqlite3.connect(
+                                replica.path, check_same_thread=False, isolation_level=None
+                            )
+                        if snapshot is None:
+                            self._source.backup(replica.connection)
+                        else:
+                            replica.pages_shipped += self._write_pages(replica, snapshot, digests)
+                    except (sqlite3.Error, OSError) as e:
+                        replica.pages = None
+                        replica.failures += 1
+                        replica.error = str(e)
+                        logger.warning(f"Shipping to replica {replica.path} failed: {e}")
+                        continue
+                    replica.version = version
+                    replica.shipped_at = time.time()
+                    replica.ships += 1
+                    replica.error = None
+                    shipped += 1
+                replica.commit_seq = commit_seq
+
+            with self._commit_lock:
+                oldest = min(replica.commit_seq for replica in self.replicas)
+                while self._commit_times and self._commit_times[0][0] <= oldest:
+                    self._commit_times.popleft()
+            return shipped
+
+    def _write_pages(self, replica: ReplicaState, snapshot: bytes, digests: List[bytes]) -> int:
+        """
+        Write the snapshot pages a replica lacks, under its exclusive lock.
+
+        Returns:
+            Number of pages written
+        """
+        page_size = len(snapshot) // len(digests)
+        if replica.fd is None:
+            replica.fd = os.open(replica.path, os.O_RDWR | os.O_CREAT, 0o644)
+        held = replica.pages or []
+        changed = [
+            index for index, digest in enumerate(digests)
+            if index == 0 or index >= len(held) or held[index] != digest
+        ]
+        
+        def write():
+            # A new change counter makes replica readers drop their page caches
+            current = os.pread(replica.fd, 4, _HEADER_CHANGE_COUNTER)
+            change_counter = (int.from_bytes(current, "big") + 1) % 2 ** 32 if len(current) == 4 else 1
+            for index in changed:
+                page = snapshot[index * page_size:(index + 1) * page_size]
+                if index == 0:
+                    page = _replica_header(page, change_counter, len(digests))
+                os.pwrite(replica.fd, page, index * page_size)
+            os.ftruncate(replica.fd, len(snapshot))
+        
+        if os.fstat(replica.fd).st_size == 0:
+            # A new replica has no readers yet, and a transaction on an empty
+            # file would write a fresh header over the shipped one
+            write()
+        else:
+            if replica.pages is None:
+                # Contents unknown: leave WAL mode so raw page writes are what readers see
+                replica.connection.execute("PRAGMA journal_mode=DELETE")
+            replica.connection.execute("BEGIN EXCLUSIVE")
+            try:
+                write()
+            finally:
+                replica.connection.execute("COMMIT")
+        replica.pages = digests
+        return len(changed)
+    
+    def lag(self, replica: ReplicaState) -> Optional[float]:
+        """Age of the oldest commit a replica is missing (None before its first ship)."""
+        if replica.shipped_at is None:
+            return None
+        with self._commit_lock:
+            for seq, committed_at in self._commit_times:
+                if seq > replica.commit_seq:
+                    return max(0.0, time.time() - committed_at)
+        return 0.0
+
+    def caught_up(self, replica: ReplicaState) -> bool:
+        """Whether a replica holds every commit notified so far."""
+        with self._commit_lock:
+            return replica.shipped_at is not None and replica.commit_seq >= self._commit_seq
+
+    def start(self) -> "SQLiteReplicator":
+        """Ship once, then keep replicas current from a background thread."""
+        self.sync()
+
+        def target():
+            while not self._stop.is_set():
+                self._wake.wait()
+                # Commits arriving during the interval ship in the same pass
+                if self._stop.wait(self.interval):
+                    return
+                self._wake.clear()
+                try:
+                    self.sync()
+                except sqlite3.Error as e:
+                    logger.warning(f"Replication pass failed: {e}")
+
+        self._thread = threading.Thread(target=target, name="ioa-sqlite-replicator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread, ship pending commits and close connections."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        try:
+            self.sync()
+        except sqlite3.Error as e:
+            logger.warning(f"Final replication pass failed: {e}")
+        with self._ship_lock:
+            for replica in self.replicas:
+                if replica.connection is not None:
+                    replica.connection.close()
+                    replica.connection = None
+                if replica.fd is not None:
+                    os.close(replica.fd)
+                    replica.fd = None
+            if self._source is not None:
+                self._source.close()
+                self._source = None
+
+    def status(self) -> Dict[str, Any]:
+        """Per-replica ship counters and lag, and the worst lag."""
+        replicas = [replica.to_dict(self.lag(replica)) for replica in self.replicas]
+        lags = [replica["lag_seconds"] for replica in replicas]
+        return {
+            "interval": self.interval,
+            "max_lag_seconds": None if None in lags else max(lags, default=0.0),
+            "replicas": replicas
+        }
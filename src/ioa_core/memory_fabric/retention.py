@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+"""Retention module."""
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionPolicy:
+    """Per-memory-type TTLs applied by the expiry sweeper."""
+    ttl_seconds: Dict[str, int] = field(default_factory=dict)
+    batch_size: int = 1000  # Records deleted per bounded transaction
+
+    def __post_init__(self):
+        """Normalize MemoryType keys to their string values."""
+        self.ttl_seconds = {
+            getattr(memory_type, "value", memory_type): int(ttl)
+            for memory_type, ttl in self.ttl_seconds.items()
+        }
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        """
+        Build a policy from the environment.
+
+        IOA_FABRIC_TTL is a comma-separated list of memory_type=seconds pairs,
+        e.g. "conversation=604800,context=86400"; IOA_FABRIC_TTL_BATCH sets
+        the batch size.
+        """
+        ttl_seconds = {}
+        for item in os.getenv("IOA_FABRIC_TTL", "").split(","):
+            memory_type, sep, seconds = item.partition("=")
+            if sep and seconds.strip().isdigit():
+                ttl_seconds[memory_type.strip()] = int(seconds)
+        return cls(ttl_seconds=ttl_seconds, batch_size=int(os.getenv("IOA_FABRIC_TTL_BATCH", "1000")))
+
+    def cutoff_for(self, memory_type: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Timestamp before which records of memory_type are expired (None = keep forever)."""
+        ttl = self.ttl_seconds.get(memory_type)
+        if ttl is None:
+            return None
+        return (now or datetime.now(timezone.utc)) - timedelta(seconds=ttl)
+
+
+class TTLSweeper:
+    """Background thread that periodically deletes expired fabric records."""
+
+    def __init__(self, fabric: Any, policy: Optional[RetentionPolicy] = None, interval_seconds: float = 300.0):
+        """
+        Initialize the sweeper.
+
+        Args:
+            fabric: MemoryFabric to sweep
+            policy: Retention policy (defaults to the fabric's policy)
+            interval_seconds: Delay between sweeps
+        """
+        self.fabric = fabric
+        self.policy = policy
+        self.interval_seconds = interval_seconds
+        self.last_result: Dict[str, int] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """Run a single sweep and return deleted counts per memory type."""
+        self.last_result = self.fabric.sweep_expired(policy=self.policy, max_batches=max_batches)
+        return self.last_result
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"TTL sweep failed: {e}")
+            self._stop_event.wait(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start sweeping in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ioa-fabric-ttl-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """True while the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
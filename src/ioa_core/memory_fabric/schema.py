@@ -9,7 +9,7 @@
 import json
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field, asdict
 """Schema module."""
 
@@ -52,11 +52,38 @@ def from_dict(cls, data: Dict[str, Any]) -> 'EmbeddingV1':
             __schema_version__=data.get("__schema_version__", "1.0")
         )
 
+class _Content:
+    """
+    Descriptor behind MemoryRecordV1.content.
+
+    Content is a plain attribute until defer_content() installs a decoder;
+    the decoder then runs once, on the first read of `.content`.
+    """
+
+    def __get__(self, record: Optional["MemoryRecordV1"], owner: Any = None) -> str:
+        if record is None:
+            return ""  # The dataclass default
+        state = record.__dict__
+        try:
+            return state["_content"]
+        except KeyError:
+            payload, decoder = state["_content_deferred"]
+        # Concurrent first reads may both decode; they store the same value
+        content = decoder(payload)
+        state["_content"] = content
+        state.pop("_content_deferred", None)
+        return content
+
+    def __set__(self, record: "MemoryRecordV1", value: str) -> None:
+        record.__dict__["_content"] = value
+        record.__dict__.pop("_content_deferred", None)
+
+
 @dataclass
 class MemoryRecordV1:
     """Memory record with schema versioning and redaction support."""
     id: str = ""
-    content: str = ""
+    content: str = _Content()
     metadata: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     tags: List[str] = field(default_factory=list)
@@ -76,6 +103,21 @@ def __post_init__(self):
         if isinstance(self.memory_type, str):
             self.memory_type = MemoryType(self.memory_type)
     
+    def defer_content(self, decoder: Callable[[str], str]) -> None:
+        """Replace the content with `decoder(content)` on its first read (e.g. decryption)."""
+        self.__dict__["_content_deferred"] = (self.content, decoder)
+        del self.__dict__["_content"]
+    
+    @property
+    def content_deferred(self) -> bool:
+        """True until deferred content has been decoded."""
+        return "_content_deferred" in self.__dict__
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle and copy with the content decoded (decoders may not be picklable)."""
+        self.content
+        return dict(self.__dict__)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
         data = asdict(self)
@@ -92,7 +134,9 @@ def to_dict(self) -> Dict[str, Any]:
     def from_dict(cls, data: Dict[str, Any]) -> 'MemoryRecordV1':
         """Create from dictionary representation."""
         # Parse timestamps
-        timestamp = datetime.fromisoformat(data["timestamp"]) if isinstance(data["timestamp"], str) else data["timestamp"]
+        timestamp = data.get("timestamp") or datetime.now(timezone.utc)  # Absent from projected reads
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
         last_accessed = None
         if data.get("last_accessed"):
             last_accessed = datetime.fromisoformat(data["last_accessed"]) if isinstance(data["last_accessed"], str) else data["last_accessed"]
@@ -0,0 +1,268 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import bisect
+import os
+import struct
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..bloom import BloomFilter
+from .schema import MemoryRecordV1
+"""Segment module."""
+
+# File layout (little endian):
+#   header | compressed blocks | block index | bloom filter | footer
+# A block holds consecutive records in id order, each as id length, JSON
+# length, id and record JSON (content as stored), compressed as one zlib
+# stream. The index keeps each block's first id, so a point read finds its
+# block by binary search and decompresses only that block. The footer holds
+# a CRC32 of every byte before it.
+MAGIC = b"IOASEG01"
+FORMAT_VERSION = 1
+CODEC_ZLIB = 1
+
+_HEADER = struct.Struct("<8sII")            # magic, version, codec
+_ENTRY = struct.Struct("<HI")               # id length, record length
+_INDEX_ENTRY = struct.Struct("<QIIIH")      # offset, compressed length, raw length, records, first id length
+_FOOTER = struct.Struct("<QQQQQI8s")        # index offset, index length, bloom offset, bloom length, records, crc32, magic
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+class SegmentCorruptError(ValueError):
+    """A segment file failed its structural or checksum validation."""
+
+
+class _ChecksumWriter:
+    """File writer that tracks offset and CRC32 of everything written."""
+
+    def __init__(self, f):
+        self.f = f
+        self.offset = 0
+        self.crc = 0
+
+    def write(self, data: bytes) -> None:
+        self.f.write(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.offset += len(data)
+
+
+def write_segment(
+    path: str,
+    records: Iterable[MemoryRecordV1],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    fp_rate: float = 0.01,
+    level: int = 6
+) -> int:
+    """
+    Write records (sorted by id, ids unique) to an immutable segment file.
+
+    The file is written under a temporary name, synced and renamed, so a
+    segment either exists complete or not at all.
+
+    Args:
+        path: Destination file
+        records: Records in ascending id order
+        block_size: Uncompressed bytes per block
+        fp_rate: Bloom filter false-positive rate
+        level: zlib compression level
+
+    Returns:
+        Number of records written
+    """
+    tmp_path = f"{path}.tmp"
+    index: List[bytes] = []
+    ids: List[str] = []
+    block: List[bytes] = []
+    block_bytes = 0
+    block_first: Optional[bytes] = None
+    block_count = 0
+    previous: Optional[bytes] = None
+
+    with open(tmp_path, "wb") as f:
+        out = _ChecksumWriter(f)
+        out.write(_HEADER.pack(MAGIC, FORMAT_VERSION, CODEC_ZLIB))
+
+        def flush_block():
+            raw = b"".join(block)
+            compressed = zlib.compress(raw, level)
+            index.append(
+                _INDEX_ENTRY.pack(out.offset, len(compressed), len(raw), block_count, len(block_first)) + block_first
+            )
+            out.write(compressed)
+
+        for record in records:
+            record_id = record.id.encode("utf-8")
+            if previous is not None and record_id <= previous:
+                raise ValueError(f"Segment records must be sorted by unique id: {record.id!r}")
+            previous = record_id
+            body = record.to_json().encode("utf-8")
+            if block_first is None:
+                block_first = record_id
+            block.append(_ENTRY.pack(len(record_id), len(body)) + record_id + body)
+            block_bytes += _ENTRY.size + len(record_id) + len(body)
+            block_count += 1
+            ids.append(record.id)
+            if block_bytes >= block_size:
+                flush_block()
+                block, block_bytes, block_first, block_count = [], 0, None, 0
+        if block:
+            flush_block()
+
+        index_offset = out.offset
+        out.write(b"".join(index))
+        bloom = BloomFilter(max(1, len(ids)), fp_rate)
+        for record_id in ids:
+            bloom.add(record_id)
+        bloom_offset = out.offset
+        out.write(bloom.to_bytes())
+        f.write(_FOOTER.pack(
+            index_offset, bloom_offset - index_offset, bloom_offset, out.offset - bloom_offset,
+            len(ids), out.crc, MAGIC
+        ))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(ids)
+
+
+class SegmentReader:
+    """
+    Read access to one segment file.
+
+    Opening reads only the footer, block index and Bloom filter; a point
+    read checks the filter, binary-searches the index and decompresses one
+    block.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a segment.
+
+        Args:
+            path: Segment file written by write_segment()
+
+        Raises:
+            SegmentCorruptError: If the header, footer or index is malformed
+        """
+        self.path = path
+        self.size = os.path.getsize(path)
+        self._fd: Optional[int] = os.open(path, os.O_RDONLY)
+        try:
+            self._open()
+        except (struct.error, SegmentCorruptError) as e:
+            self.close()
+            raise SegmentCorruptError(f"{path}: {e}") from e
+
+    def _open(self) -> None:
+        if self.size < _HEADER.size + _FOOTER.size:
+            raise SegmentCorruptError("file too short")
+        magic, version, self.codec = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+        if magic != MAGIC or version != FORMAT_VERSION or self.codec != CODEC_ZLIB:
+            raise SegmentCorruptError("not a fabric segment")
+        (index_offset, index_length, bloom_offset, bloom_length, self.count, self.crc, magic) = _FOOTER.unpack(
+            os.pread(self._fd, _FOOTER.size, self.size - _FOOTER.size)
+        )
+        if magic != MAGIC:
+            raise SegmentCorruptError("bad footer")
+
+        data = os.pread(self._fd, index_length, index_offset)
+        self._blocks: List[Tuple[int, int, int, int]] = []
+        self._first_ids: List[bytes] = []
+        position = 0
+        while position < len(data):
+            offset, compressed, raw, count, first_length = _INDEX_ENTRY.unpack_from(data, position)
+            position += _INDEX_ENTRY.size
+            self._first_ids.append(data[position:position + first_length])
+            position += first_length
+            self._blocks.append((offset, compressed, raw, count))
+        self.bloom = BloomFilter.from_bytes(os.pread(self._fd, bloom_length, bloom_offset))
+        self.raw_bytes = sum(block[2] for block in self._blocks)
+
+    def close(self) -> None:
+        """Close the file (readers replaced by compaction close when released)."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except (AttributeError, OSError):
+            pass
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _block(self, index: int) -> bytes:
+        offset, compressed, raw, _ = self._blocks[index]
+        data = zlib.decompress(os.pread(self._fd, compressed, offset))
+        if len(data) != raw:
+            raise SegmentCorruptError(f"{self.path}: block {index} has {len(data)} bytes, expected {raw}")
+        return data
+
+    @staticmethod
+    def _entries(data: bytes) -> Iterator[Tuple[bytes, int, int]]:
+        position = 0
+        while position < len(data):
+            id_length, length = _ENTRY.unpack_from(data, position)
+            position += _ENTRY.size
+            yield data[position:position + id_length], position + id_length, length
+            position += id_length + length
+
+    def get(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """Record by id, or None (without I/O when the Bloom filter rules it out)."""
+        if record_id not in self.bloom:
+            return None
+        key = record_id.encode("utf-8")
+        index = bisect.bisect_right(self._first_ids, key) - 1
+        if index < 0:
+            return None
+        data = self._block(index)
+        for entry_id, start, length in self._entries(data):
+            if entry_id == key:
+                return MemoryRecordV1.from_json(data[start:start + length].decode("utf-8"))
+            if entry_id > key:
+                break
+        return None
+
+    def __iter__(self) -> Iterator[MemoryRecordV1]:
+        """Records in id order."""
+        for index in range(len(self._blocks)):
+            data = self._block(index)
+            for _, start, length in self._entries(data):
+                yield MemoryRecordV1.from_json(data[start:start + length].decode("utf-8"))
+
+    def verify(self) -> bool:
+        """Recompute the footer checksum and decompress every block."""
+        crc = 0
+        offset = 0
+        end = self.size - _FOOTER.size
+        while offset < end:
+            chunk = os.pread(self._fd, min(1 << 20, end - offset), offset)
+            crc = zlib.crc32(chunk, crc)
+            offset += len(chunk)
+        if crc != self.crc:
+            return False
+        try:
+            for index in range(len(self._blocks)):
+                self._block(index)
+        except (zlib.error, SegmentCorruptError):
+            return False
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Size, record and block counts."""
+        return {
+            "records": self.count,
+            "blocks": len(self._blocks),
+            "bytes": self.size,
+            "raw_bytes": self.raw_bytes,
+            "bloom_bytes": self.bloom.memory_bytes
+        }
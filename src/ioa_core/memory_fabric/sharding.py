@@ -0,0 +1,410 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+"""Sharding module."""
+
+logger = logging.getLogger(__name__)
+
+SHARD_MAP_FILE = "shard_map.json"
+
+# Placement schemes: "modulo" is the original hash % shards layout (kept so
+# existing shard databases stay readable); "jump" is jump consistent hashing
+SCHEMES = ("modulo", "jump")
+
+_ROW_COLUMNS = "pk, id, content, metadata, tags, memory_type, storage_tier, created_at"
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Jump consistent hash (Lamping & Veach) of a 64-bit key into `buckets`.
+
+    Growing from n to m buckets moves only the keys that land in the new
+    buckets, a 1 - n/m fraction, and never moves keys between old buckets.
+    """
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+
+def default_hash() -> str:
+    """Key hash for new shard maps: xxh64 when xxhash is installed, else BLAKE2b."""
+    return "xxh64" if XXHASH_AVAILABLE else "blake2b"
+
+
+def shard_key(pk: str, hash_name: str) -> int:
+    """Integer hash of a record primary key."""
+    if hash_name == "xxh64":
+        if not XXHASH_AVAILABLE:
+            raise RuntimeError("Shard map uses xxh64 but xxhash is not installed")
+        return xxhash.xxh64(pk.encode(), seed=42).intdigest()
+    if hash_name == "crc32":
+        return zlib.crc32(pk.encode())
+    if hash_name == "blake2b":
+        return int.from_bytes(hashlib.blake2b(pk.encode(), digest_size=8).digest(), "big")
+    raise ValueError(f"Unknown shard hash: {hash_name}")
+
+
+def place(pk: str, shards: int, scheme: str, hash_name: str) -> int:
+    """Shard index of a primary key under a placement scheme."""
+    key = shard_key(pk, hash_name)
+    if scheme == "jump":
+        return jump_hash(key, shards)
+    if scheme == "modulo":
+        return key % shards
+    raise ValueError(f"Unknown shard scheme: {scheme}")
+
+
+@dataclass
+class ShardMap:
+    """
+    Persisted record placement of a sharded fabric.
+
+    While a reshard is copying data, `previous` holds the old layout
+    ({"shards", "scheme"}): writes already follow the new layout and reads
+    try the new placement first, then the old one. `progress` holds the last
+    copied rowid per source shard so an interrupted reshard resumes.
+    """
+    shards: int
+    scheme: str = "jump"
+    hash: str = field(default_factory=default_hash)
+    version: int = 1
+    previous: Optional[Dict[str, Any]] = None
+    progress: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def migrating(self) -> bool:
+        """True while a reshard has not flipped the map yet."""
+        return self.previous is not None
+
+    @property
+    def open_shards(self) -> int:
+        """Number of shard databases that may hold records."""
+        return max(self.shards, self.previous["shards"] if self.previous else 0)
+
+    def shard_for(self, pk: str) -> int:
+        """Shard new writes of a primary key go to."""
+        return place(pk, self.shards, self.scheme, self.hash)
+
+    def previous_shard_for(self, pk: str) -> Optional[int]:
+        """Shard a primary key lived in before the reshard in progress."""
+        if self.previous is None:
+            return None
+        return place(pk, self.previous["shards"], self.previous["scheme"], self.hash)
+
+    def read_order(self, pk: str) -> List[int]:
+        """Shards to try when reading a primary key (double read while migrating)."""
+        shards = [self.shard_for(pk)]
+        previous = self.previous_shard_for(pk)
+        if previous is not None and previous != shards[0]:
+            shards.append(previous)
+        return shards
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ShardMap"]:
+        """Read a shard map; None if the file does not exist."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, path: str) -> None:
+        """Write the map atomically (temp file, fsync, rename)."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+def shard_path(data_dir: str, index: int) -> str:
+    """Database file of one shard."""
+    return os.path.join(data_dir, f"mf_shard_{index}.db")
+
+
+def existing_shards(data_dir: str) -> int:
+    """Number of consecutive shard databases present in a directory."""
+    count = 0
+    while os.path.exists(shard_path(data_dir, count)):
+        count += 1
+    return count
+
+
+def open_shard(path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open (creating if needed) a shard database with the sharded schema."""
+    conn = sqlite3.connect(path, timeout=30.0, check_same_thread=check_same_thread)
+
+    # Apply performance PRAGMAs
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-8192")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA busy_timeout=5000")
+
+    # Create table if not exists with blake3 primary key for uniqueness
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS memory_records (
+            pk TEXT PRIMARY KEY,
+            id TEXT NOT NULL,
+            content TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            tags TEXT,
+            memory_type TEXT,
+            storage_tier TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Create unique index on primary key for deduplication
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uq_records_pk ON memory_records(pk)")
+
+    # Create indexes for performance
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_memory_type ON memory_records(memory_type)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_storage_tier ON memory_records(storage_tier)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON memory_records(created_at)")
+    conn.commit()
+    return conn
+
+
+class _ReshardStopped(Exception):
+    """Raised inside a reshard when stop() was requested."""
+
+
+class Resharder:
+    """
+    Online move of a sharded fabric to a new shard count.
+
+    begin() persists a migrating map (writes switch to the new layout at
+    once, reads fall back to the old one); the copy phase then scans each
+    old shard in rowid order and copies only the records whose placement
+    changed, repeating until a pass finds nothing new; the map is then
+    flipped atomically and the moved rows are deleted from their old
+    shards. Records are immutable (INSERT OR IGNORE on pk), so a copy can
+    never overwrite a newer write.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        current: ShardMap,
+        shards: int,
+        batch_size: int = 1000,
+        on_map: Optional[Callable[[ShardMap], None]] = None
+    ):
+        """
+        Initialize the resharder.
+
+        Args:
+            data_dir: Directory holding the shard databases and map
+            current: Map in effect (a migrating map resumes its reshard)
+            shards: Target shard count
+            batch_size: Rows read per batch
+            on_map: Called with each map as it is persisted
+        """
+        if shards < 1:
+            raise ValueError("Shard count must be at least 1")
+        self.data_dir = data_dir
+        self.map_path = os.path.join(data_dir, SHARD_MAP_FILE)
+        self.current = current
+        self.shards = shards
+        self.batch_size = max(1, batch_size)
+        self._on_map = on_map
+        self._thread: Optional[threading.Thread] = None
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._begun = False
+        self._stop = threading.Event()
+        self.error: Optional[BaseException] = None
+        self._status = {"phase": "pending", "scanned": 0, "copied": 0, "removed": 0, "passes": 0}
+
+    def _publish(self, shard_map: ShardMap) -> None:
+        shard_map.save(self.map_path)
+        self.current = shard_map
+        if self._on_map is not None:
+            self._on_map(shard_map)
+
+    def begin(self) -> ShardMap:
+        """Persist the migrating map; placement of new writes changes now."""
+        current = self.current
+        if current.migrating:
+            if current.shards != self.shards:
+                raise RuntimeError(
+                    f"A reshard to {current.shards} shards is in progress; resume it before resharding again"
+                )
+            target = current
+        elif current.shards == self.shards and current.scheme == "jump":
+            # Nothing to copy; still sweep rows a crash may have left behind
+            target = current
+        else:
+            target = replace(
+                current,
+                shards=self.shards,
+                scheme="jump",
+                version=current.version + 1,
+                previous={"shards": current.shards, "scheme": current.scheme},
+                progress={}
+            )
+        for index in range(target.open_shards):
+            self._connection(index)
+        self._publish(target)
+        self._begun = True
+        return target
+
+    def _connection(self, index: int) -> sqlite3.Connection:
+        conn = self._connections.get(index)
+        if conn is None:
+            conn = open_shard(shard_path(self.data_dir, index), check_same_thread=False)
+            self._connections[index] = conn
+        return conn
+
+    def _rows(self, source: int, after: int):
+        return self._connection(source).execute(
+            f"SELECT rowid, {_ROW_COLUMNS} FROM memory_records WHERE rowid > ? ORDER BY rowid LIMIT ?",
+            (after, self.batch_size)
+        ).fetchall()
+
+    def _copy_pass(self, shard_map: ShardMap) -> int:
+        """Copy moved records written since the last pass; returns rows copied."""
+        copied = 0
+        for source in range(shard_map.previous["shards"]):
+            after = shard_map.progress.get(str(source), 0)
+            while True:
+                if self._stop.is_set():
+                    raise _ReshardStopped()
+                rows = self._rows(source, after)
+                if not rows:
+                    break
+                moves: Dict[int, List[tuple]] = {}
+                for row in rows:
+                    target = shard_map.shard_for(row[1])
+                    if target != source:
+                        moves.setdefault(target, []).append(row[1:])
+                for target, batch in moves.items():
+                    conn = self._connection(target)
+                    conn.executemany(
+                        f"INSERT OR IGNORE INTO memory_records ({_ROW_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        batch
+                    )
+                    conn.commit()
+                    copied += len(batch)
+                after = rows[-1][0]
+                shard_map.progress[str(source)] = after
+                shard_map.save(self.map_path)
+                self._status["scanned"] += len(rows)
+                self._status["copied"] += sum(len(batch) for batch in moves.values())
+        return copied
+
+    def _cleanup(self, shard_map: ShardMap, sources: int) -> None:
+        """Delete records from shards they no longer belong to."""
+        for source in range(sources):
+            conn = self._connection(source)
+            after = 0
+            while True:
+                if self._stop.is_set():
+                    raise _ReshardStopped()
+                rows = conn.execute(
+                    "SELECT rowid, pk FROM memory_records WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (after, self.batch_size)
+                ).fetchall()
+                if not rows:
+                    break
+                stale = [(pk,) for _, pk in rows if shard_map.shard_for(pk) != source]
+                if stale:
+                    conn.executemany("DELETE FROM memory_records WHERE pk = ?", stale)
+                    conn.commit()
+                    self._status["removed"] += len(stale)
+                after = rows[-1][0]
+
+    def run(self) -> ShardMap:
+        """Copy, flip and clean up; returns the final map."""
+        try:
+            shard_map = self.current if self._begun else self.begin()
+            sources = max(shard_map.open_shards, existing_shards(self.data_dir))
+            if shard_map.migrating:
+                self._status["phase"] = "copying"
+                while True:
+                    self._status["passes"] += 1
+                    if self._copy_pass(shard_map) == 0:
+                        break
+
+                # Catch-up passes found nothing new: flip the map atomically
+                self._status["phase"] = "flipping"
+                stable = replace(shard_map, previous=None, progress={})
+                self._publish(stable)
+                shard_map = stable
+
+            self._status["phase"] = "cleanup"
+            self._cleanup(shard_map, sources)
+            self._status["phase"] = "done"
+            logger.info(f"Reshard to {shard_map.shards} shards complete: {self._status}")
+            return shard_map
+        except _ReshardStopped:
+            # The persisted map and progress let a later reshard() resume
+            self._status["phase"] = "stopped"
+            return self.current
+        except BaseException as e:
+            self.error = e
+            self._status["phase"] = "failed"
+            logger.error(f"Reshard to {self.shards} shards failed: {e}")
+            raise
+        finally:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+
+    def start(self) -> "Resharder":
+        """Run in a background thread (call begin() first to switch writes synchronously)."""
+        def target():
+            try:
+                self.run()
+            except BaseException:
+                pass
+
+        self._thread = threading.Thread(target=target, name="ioa-fabric-reshard", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop a background run at the next batch boundary."""
+        self._stop.set()
+        self.wait(timeout)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background run; True once it has finished."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return self._status["phase"] in ("done", "failed")
+
+    def status(self) -> Dict[str, Any]:
+        """Phase and row counters of the reshard."""
+        status = dict(self._status)
+        status["target_shards"] = self.shards
+        if self.error is not None:
+            status["error"] = str(self.error)
+        return status
@@ -0,0 +1,291 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import json
+import mmap
+import os
+import re
+import struct
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .schema import MemoryRecordV1
+"""Snapshot module."""
+
+# File layout (little endian):
+#   header | record blobs | id index | token index | token data
+# A blob is the record id followed by the record JSON as stored (ciphertext
+# when encrypted). The id index is sorted by id, the token index by token;
+# postings are u32 ordinals into the id index.
+MAGIC = b"IOASNAP1"
+FORMAT_VERSION = 1
+POINTER_FILE = "CURRENT"
+
+_HEADER = struct.Struct("<8sIIQQQQQQ")  # magic, version, flags, generation, count, index, blobs, tokens, token count
+_ID_ENTRY = struct.Struct("<QII")       # blob offset, id length, record length
+_TOKEN_ENTRY = struct.Struct("<QQII")   # token offset, postings offset, token length, postings count
+_POSTING = struct.Struct("<I")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens used by the snapshot token index."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _record_tokens(record: MemoryRecordV1) -> Set[str]:
+    tokens = set()
+    # Ciphertext has no meaningful tokens; encrypted records are found by tag only
+    if record.metadata.get("encryption_mode") != "aes-gcm":
+        tokens.update(tokenize(record.content))
+    for tag in record.tags:
+        tokens.update(tokenize(tag))
+    return tokens
+
+
+def snapshot_dir(config: Optional[Dict[str, object]] = None) -> str:
+    """Snapshot directory: config `snapshot_dir`, IOA_FABRIC_SNAPSHOT_DIR, or <data_dir>/snapshot."""
+    config = config or {}
+    return (
+        config.get("snapshot_dir")
+        or os.getenv("IOA_FABRIC_SNAPSHOT_DIR")
+        or os.path.join(str(config.get("data_dir", "./artifacts/memory")), "snapshot")
+    )
+
+
+def snapshot_file(generation: int) -> str:
+    """File name of a snapshot generation."""
+    return f"fabric-{generation:010d}.snap"
+
+
+def read_pointer(directory: str) -> Optional[Dict[str, object]]:
+    """The published snapshot pointer of a directory, or None."""
+    try:
+        with open(os.path.join(directory, POINTER_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_snapshot(path: str, records: Iterable[MemoryRecordV1], generation: int) -> int:
+    """
+    Write records to a snapshot file.
+
+    Blobs are streamed to disk; only ids, offsets and postings are held in
+    memory while the indexes are built.
+
+    Args:
+        path: Destination file
+        records: Records as stored
+        generation: Generation number recorded in the header
+
+    Returns:
+        Number of records written
+    """
+    entries: Dict[str, Tuple[int, int, int]] = {}
+    record_tokens: Dict[str, Set[str]] = {}
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        offset = _HEADER.size
+        for record in records:
+            record_id = record.id.encode("utf-8")
+            blob = record.to_json().encode("utf-8")
+            f.write(record_id)
+            f.write(blob)
+            # A later version of an id replaces the earlier blob
+            entries[record.id] = (offset, len(record_id), len(blob))
+            record_tokens[record.id] = _record_tokens(record)
+            offset += len(record_id) + len(blob)
+
+        ids = sorted(entries, key=lambda record_id: record_id.encode("utf-8"))
+        postings: Dict[str, List[int]] = {}
+        for ordinal, record_id in enumerate(ids):
+            for token in record_tokens.pop(record_id):
+                postings.setdefault(token, []).append(ordinal)
+        index_offset = offset
+        f.write(b"".join(_ID_ENTRY.pack(*entries[record_id]) for record_id in ids))
+
+        tokens = sorted(postings, key=lambda token: token.encode("utf-8"))
+        tokens_offset = index_offset + len(ids) * _ID_ENTRY.size
+        data_offset = tokens_offset + len(tokens) * _TOKEN_ENTRY.size
+        token_entries, token_data = [], []
+        for token in tokens:
+            encoded = token.encode("utf-8")
+            members = postings[token]
+            token_entries.append(_TOKEN_ENTRY.pack(data_offset, data_offset + len(encoded), len(encoded), len(members)))
+            token_data.append(encoded)
+            token_data.append(struct.pack(f"<{len(members)}I", *members))
+            data_offset += len(encoded) + len(members) * _POSTING.size
+        f.write(b"".join(token_entries))
+        f.write(b"".join(token_data))
+
+        f.seek(0)
+        f.write(_HEADER.pack(
+            MAGIC, FORMAT_VERSION, 0, generation, len(ids), index_offset, _HEADER.size, tokens_offset, len(tokens)
+        ))
+        f.flush()
+        os.fsync(f.fileno())
+    return len(entries)
+
+
+def publish_snapshot(directory: str, records: Iterable[MemoryRecordV1], keep: int = 2) -> Dict[str, object]:
+    """
+    Write the next snapshot generation and atomically point readers at it.
+
+    The file is written under a temporary name and renamed, then the
+    CURRENT pointer is replaced the same way. Older generations beyond
+    `keep` are unlinked; readers that still map them keep working.
+
+    Returns:
+        The new pointer (generation, file, records, published_at)
+    """
+    os.makedirs(directory, exist_ok=True)
+    current = read_pointer(directory)
+    generation = int(current["generation"]) + 1 if current else 1
+    name = snapshot_file(generation)
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    count = write_snapshot(tmp_path, records, generation)
+    os.replace(tmp_path, os.path.join(directory, name))
+
+    pointer = {
+        "generation": generation,
+        "file": name,
+        "records": count,
+        "published_at": datetime.now(timezone.utc).isoformat()
+    }
+    pointer_tmp = os.path.join(directory, f".{POINTER_FILE}.tmp")
+    with open(pointer_tmp, "w", encoding="utf-8") as f:
+        json.dump(pointer, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer_tmp, os.path.join(directory, POINTER_FILE))
+    _fsync_dir(directory)
+
+    for old in range(generation - keep, 0, -1):
+        old_path = os.path.join(directory, snapshot_file(old))
+        if not os.path.exists(old_path):
+            break
+        os.unlink(old_path)
+    return pointer
+
+
+class SnapshotReader:
+    """
+    Memory-mapped, read-only view of one snapshot file.
+
+    Lookups binary-search the id and token indexes in place, so processes
+    mapping the same file share its page cache and nothing is loaded up
+    front; only the records returned are decoded.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file.
+
+        Args:
+            path: Snapshot file written by write_snapshot()
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, self.generation, self.count, self._index_offset,
+         _, self._tokens_offset, self.token_count) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a fabric snapshot (format {FORMAT_VERSION}): {path}")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mm.close()
+
+    def _entry(self, ordinal: int) -> Tuple[int, int, int]:
+        return _ID_ENTRY.unpack_from(self._mm, self._index_offset + ordinal * _ID_ENTRY.size)
+
+    def _id_at(self, ordinal: int) -> bytes:
+        offset, id_length, _ = self._entry(ordinal)
+        return self._mm[offset:offset + id_length]
+
+    def _record_at(self, ordinal: int) -> MemoryRecordV1:
+        offset, id_length, length = self._entry(ordinal)
+        start = offset + id_length
+        return MemoryRecordV1.from_json(self._mm[start:start + length].decode("utf-8"))
+
+    def _find(self, record_id: str) -> Optional[int]:
+        key = record_id.encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            if self._id_at(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self.count and self._id_at(low) == key:
+            return low
+        return None
+
+    def __contains__(self, record_id: str) -> bool:
+        return self._find(record_id) is not None
+
+    def get(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """Record by id, or None."""
+        ordinal = self._find(record_id)
+        return self._record_at(ordinal) if ordinal is not None else None
+
+    def _postings(self, token: str) -> List[int]:
+        key = token.encode("utf-8")
+        low, high = 0, self.token_count
+        while low < high:
+            mid = (low + high) // 2
+            offset, _, length, _ = _TOKEN_ENTRY.unpack_from(self._mm, self._tokens_offset + mid * _TOKEN_ENTRY.size)
+            if self._mm[offset:offset + length] < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low >= self.token_count:
+            return []
+        offset, postings_offset, length, count = _TOKEN_ENTRY.unpack_from(
+            self._mm, self._tokens_offset + low * _TOKEN_ENTRY.size
+        )
+        if self._mm[offset:offset + length] != key:
+            return []
+        return list(struct.unpack_from(f"<{count}I", self._mm, postings_offset))
+
+    def search(self, text: str) -> List[MemoryRecordV1]:
+        """Records containing every token of `text` (content or tags)."""
+        tokens = tokenize(text)
+        if not tokens:
+            return []
+        ordinals: Optional[Set[int]] = None
+        for token in sorted(set(tokens), key=len, reverse=True):
+            postings = set(self._postings(token))
+            ordinals = postings if ordinals is None else ordinals & postings
+            if not ordinals:
+                return []
+        return [self._record_at(ordinal) for ordinal in sorted(ordinals)]
+
+    def iter_records(self) -> Iterator[MemoryRecordV1]:
+        """Decode every record in id order."""
+        for ordinal in range(self.count):
+            yield self._record_at(ordinal)
@@ -10,6 +10,10 @@
 from .local_jsonl import LocalJSONLStore
 from .sqlite import SQLiteStore
 from .s3 import S3Store
+from .snapshot import SnapshotStore
+from .tiered import TieredStore
+from .segments import SegmentStore
+from .async_stores import AsyncStoreAdapter, AsyncSQLiteStore, AsyncLocalJSONLStore, AsyncS3Store
 
 """  Init   module."""
 
@@ -18,5 +22,12 @@
     "AsyncMemoryStore", 
     "LocalJSONLStore",
     "SQLiteStore",
-    "S3Store"
+    "S3Store",
+    "SnapshotStore",
+    "TieredStore",
+    "SegmentStore",
+    "AsyncStoreAdapter",
+    "AsyncSQLiteStore",
+    "AsyncLocalJSONLStore",
+    "AsyncS3Store"
 ]
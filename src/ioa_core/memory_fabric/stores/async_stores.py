@@ -0,0 +1,292 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import asyncio
+import functools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+"""Async Stores module."""
+
+from .base import AsyncMemoryStore, MemoryStore
+from .local_jsonl import LocalJSONLStore
+from .sqlite import SQLiteStore
+from .s3 import S3Store
+from ..query import FabricQuery
+from ..schema import MemoryRecordV1
+
+try:
+    import aioboto3
+    AIOBOTO3_AVAILABLE = True
+except ImportError:
+    aioboto3 = None
+    AIOBOTO3_AVAILABLE = False
+
+
+class AsyncStoreAdapter(AsyncMemoryStore):
+    """
+    Run a synchronous store on a dedicated executor so callers never block
+    the event loop.
+
+    The executor is private to the adapter (it does not compete with the
+    loop's default executor) and a semaphore bounds the number of calls in
+    flight; callers beyond the bound wait on the loop instead of queueing
+    unbounded work on the executor.
+    """
+
+    def __init__(
+        self,
+        store: MemoryStore,
+        max_workers: int = 4,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize the adapter.
+
+        Args:
+            store: Synchronous store to wrap
+            max_workers: Executor threads; 1 serializes all access
+            max_concurrency: Maximum calls in flight (default 4 x max_workers)
+        """
+        self.sync_store = store
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency or int(
+            os.getenv("IOA_ASYNC_STORE_CONCURRENCY", str(4 * max_workers))
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"ioa-{type(store).__name__.lower()}"
+        )
+        # Semaphores bind to the running loop, so create them lazily per loop
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop_id = id(asyncio.get_running_loop())
+        semaphore = self._semaphores.get(loop_id)
+        if semaphore is None:
+            semaphore = self._semaphores[loop_id] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the store executor."""
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def store(self, record: MemoryRecordV1) -> bool:
+        """Store a memory record."""
+        return await self._run(self.sync_store.store, record)
+
+    async def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Store prepared records in one bulk write."""
+        return await self._run(self.sync_store.store_many, records)
+
+    async def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """Retrieve a memory record by ID."""
+        return await self._run(self.sync_store.retrieve, record_id)
+
+    async def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records by ID without access tracking."""
+        return await self._run(self.sync_store.get_many, record_ids)
+
+    async def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Search for memory records, reading only `fields`."""
+        return await self._run(self.sync_store.search, query, limit, memory_type, fields)
+
+    async def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Run a query with filters and projection pushed into the backend."""
+        return await self._run(self.sync_store.query, query)
+
+    async def delete(self, record_id: str) -> bool:
+        """Delete a memory record."""
+        return await self._run(self.sync_store.delete, record_id)
+
+    async def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """Delete up to `limit` records of a type older than `cutoff`."""
+        return await self._run(self.sync_store.delete_expired, memory_type, cutoff, limit)
+
+    async def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List all memory records, reading only `fields`."""
+        return await self._run(self.sync_store.list_all, limit, fields)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get storage statistics."""
+        return self.sync_store.get_stats()
+
+    async def close(self) -> None:
+        """Drain in-flight calls and close the wrapped store."""
+        await self._run(self.sync_store.close)
+        self._executor.shutdown(wait=True)
+
+
+class AsyncSQLiteStore(AsyncStoreAdapter):
+    """Async SQLite store; a single writer thread owns the shared connection."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, max_concurrency: Optional[int] = None):
+        """Initialize the async SQLite store."""
+        # One worker: the store shares one connection and commits per write,
+        # so parallel threads would only contend on SQLite's write lock.
+        super().__init__(SQLiteStore(config), max_workers=1, max_concurrency=max_concurrency)
+
+
+class AsyncLocalJSONLStore(AsyncStoreAdapter):
+    """Async JSONL store; appends are serialized on one worker thread."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, max_concurrency: Optional[int] = None):
+        """Initialize the async JSONL store."""
+        super().__init__(LocalJSONLStore(config), max_workers=1, max_concurrency=max_concurrency)
+
+
+class AsyncS3Store(AsyncStoreAdapter):
+    """
+    Async S3 store.
+
+    Point operations (store, retrieve, get_many, delete) use aioboto3 when it
+    is installed and S3 is reachable; listing operations and the local
+    fallback run on the executor through the synchronous S3Store.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        max_concurrency: Optional[int] = None,
+        store: Optional[S3Store] = None
+    ):
+        """
+        Initialize the async S3 store.
+
+        Args:
+            config: S3Store configuration (ignored when `store` is given)
+            max_workers: Executor threads for listing and fallback calls
+            max_concurrency: Maximum requests in flight
+            store: Existing S3Store to wrap
+        """
+        super().__init__(store or S3Store(config), max_workers=max_workers, max_concurrency=max_concurrency)
+        self._session = aioboto3.Session() if AIOBOTO3_AVAILABLE else None
+        self._client = None
+        self._client_context = None
+
+    @property
+    def native(self) -> bool:
+        """Whether point operations use the async S3 client (not with content dedup)."""
+        return self._session is not None and self.sync_store.is_available() and not self.sync_store.dedup
+
+    async def _get_client(self):
+        if self._client is None:
+            self._client_context = self._session.client("s3", region_name=self.sync_store.region)
+            self._client = await self._client_context.__aenter__()
+        return self._client
+
+    def _key(self, record_id: str) -> str:
+        return f"{self.sync_store.prefix}{record_id}.json"
+
+    async def _get_record(self, client, record_id: str) -> MemoryRecordV1:
+        response = await client.get_object(Bucket=self.sync_store.bucket_name, Key=self._key(record_id))
+        async with response["Body"] as body:
+            data = json.loads((await body.read()).decode("utf-8"))
+        return MemoryRecordV1.from_dict(data)
+
+    async def store(self, record: MemoryRecordV1) -> bool:
+        """Store a memory record."""
+        s3 = self.sync_store
+        if not self.native or s3.partition_seconds:
+            # Partition markers need the same two-step write as the sync store
+            return await super().store(record)
+        if not s3._validate_record(record):
+            s3._update_stats("writes", False)
+            return False
+        try:
+            async with self._semaphore():
+                client = await self._get_client()
+                await client.put_object(
+                    Bucket=s3.bucket_name,
+                    Key=self._key(record.id),
+                    Body=record.to_json(),
+                    ContentType="application/json"
+                )
+            s3._update_stats("writes", True)
+            s3._stats["total_records"] += 1
+            return True
+        except Exception:
+            s3._update_stats("writes", False)
+            return await self._run(s3._fallback_store.store, record)
+
+    async def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """Retrieve a memory record by ID."""
+        if not self.native:
+            return await super().retrieve(record_id)
+        try:
+            async with self._semaphore():
+                record = await self._get_record(await self._get_client(), record_id)
+        except Exception:
+            self.sync_store._update_stats("reads", False)
+            return await self._run(self.sync_store._fallback_store.retrieve, record_id)
+        record.update_access()
+        await self.store(record)
+        self.sync_store._update_stats("reads", True)
+        return record
+
+    async def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records concurrently, preserving input order and skipping misses."""
+        if not self.native:
+            return await super().get_many(record_ids)
+        client = await self._get_client()
+
+        async def fetch(record_id):
+            async with self._semaphore():
+                try:
+                    return await self._get_record(client, record_id)
+                except Exception:
+                    self.sync_store._update_stats("reads", False)
+                    return None
+
+        records = await asyncio.gather(*(fetch(record_id) for record_id in record_ids))
+        self.sync_store._update_stats("reads", True)
+        return [record for record in records if record is not None]
+
+    async def delete(self, record_id: str) -> bool:
+        """Delete a memory record."""
+        if not self.native:
+            return await super().delete(record_id)
+        try:
+            async with self._semaphore():
+                client = await self._get_client()
+                await client.delete_object(Bucket=self.sync_store.bucket_name, Key=self._key(record_id))
+            self.sync_store._stats["total_records"] = max(0, self.sync_store._stats["total_records"] - 1)
+            return True
+        except Exception:
+            self.sync_store._update_stats("errors", False)
+            return await self._run(self.sync_store._fallback_store.delete, record_id)
+
+    async def close(self) -> None:
+        """Close the async client and the wrapped store."""
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client = None
+            self._client_context = None
+        await super().close()
+
+
+def create_async_store(store: MemoryStore, max_concurrency: Optional[int] = None) -> AsyncMemoryStore:
+    """
+    Wrap an existing synchronous store for async use.
+
+    S3 stores use the async client when available; SQLite and JSONL stores
+    get a single worker thread (they share a connection / file handle);
+    other stores get a small pool.
+    """
+    if isinstance(store, S3Store):
+        return AsyncS3Store(store=store, max_concurrency=max_concurrency)
+    if isinstance(store, (SQLiteStore, LocalJSONLStore)):
+        return AsyncStoreAdapter(store, max_workers=1, max_concurrency=max_concurrency)
+    return AsyncStoreAdapter(store, max_workers=4, max_concurrency=max_concurrency)
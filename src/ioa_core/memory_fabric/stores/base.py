@@ -7,8 +7,10 @@
 
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Protocol
+from datetime import datetime
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, Protocol, Tuple
 from ..schema import MemoryRecordV1
+from ..query import FabricQuery
 
 # PATCH: Cursor-2025-09-10 DISPATCH-OSS-20250910-MEMORY-FABRIC-REFACTOR <store protocols>
 """Base module."""
@@ -21,20 +23,54 @@ def store(self, record: MemoryRecordV1) -> bool:
         """Store a memory record."""
         ...
     
+    def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Store prepared records in one bulk write; return the number stored."""
+        ...
+    
     def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
         """Retrieve a memory record by ID."""
         ...
     
-    def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None) -> List[MemoryRecordV1]:
-        """Search for memory records."""
+    def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Retrieve several records by ID without access tracking."""
+        ...
+    
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> int:
+        """Add buffered access counts and last access times; return records updated."""
+        ...
+    
+    def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Search for memory records, reading only `fields` (see query.projection())."""
         ...
     
     def delete(self, record_id: str) -> bool:
         """Delete a memory record."""
         ...
     
-    def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
-        """List all memory records."""
+    def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """Delete a bounded batch of records older than cutoff; return their IDs."""
+        ...
+    
+    def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List all memory records, reading only `fields`."""
+        ...
+    
+    def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Run a query with filters and projection pushed into the backend."""
+        ...
+    
+    def explain(self, query: FabricQuery) -> Dict[str, Any]:
+        """Describe how the backend would run a query."""
+        ...
+    
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[MemoryRecordV1]]:
+        """Stream every record in batches without loading the whole store."""
+        ...
+    
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Content deduplication counters and the logical/stored byte ratio."""
         ...
     
     def get_stats(self) -> Dict[str, Any]:
@@ -52,20 +88,38 @@ async def store(self, record: MemoryRecordV1) -> bool:
         """Store a memory record."""
         ...
     
+    async def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Store prepared records in one bulk write; return the number stored."""
+        ...
+    
     async def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
         """Retrieve a memory record by ID."""
         ...
     
-    async def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None) -> List[MemoryRecordV1]:
-        """Search for memory records."""
+    async def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Retrieve several records by ID without access tracking."""
+        ...
+    
+    async def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Search for memory records, reading only `fields`."""
+        ...
+    
+    async def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Run a query with filters and projection pushed into the backend."""
         ...
     
     async def delete(self, record_id: str) -> bool:
         """Delete a memory record."""
         ...
     
-    async def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
-        """List all memory records."""
+    async def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """Delete a bounded batch of records older than cutoff; return their IDs."""
+        ...
+    
+    async def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List all memory records, reading only `fields`."""
         ...
     
     async def get_stats(self) -> Dict[str, Any]:
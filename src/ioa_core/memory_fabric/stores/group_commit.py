@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+"""Group Commit module."""
+
+
+class _Batch:
+    """One open transaction shared by concurrent writers."""
+    __slots__ = ("size", "opened", "done", "error")
+
+    def __init__(self):
+        self.size = 0
+        self.opened = 0.0
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+
+class GroupCommitter:
+    """
+    Group commit coordinator for a store with a single write connection.
+
+    Writers run their (uncommitted) write under the coordinator's lock and
+    join the open batch. The batch commits when it holds `max_records`
+    writes, when it has been open for `max_delay_ms`, or as soon as no
+    other writer is queued to join it, so a lone writer never waits. Each
+    writer returns only after the commit covering its write succeeded; if
+    the commit fails every writer in the batch gets the error.
+    """
+
+    def __init__(
+        self,
+        commit: Callable[[], None],
+        rollback: Optional[Callable[[], None]] = None,
+        max_records: int = 1,
+        max_delay_ms: float = 2.0
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            commit: Makes all writes since the last commit durable
+            rollback: Discards all writes since the last commit
+            max_records: Writes per batch; 1 commits every write
+            max_delay_ms: Longest time a batch stays open
+        """
+        self._commit = commit
+        self._rollback = rollback
+        self.max_records = max(1, int(max_records))
+        self.max_delay = max(0.0, float(max_delay_ms)) / 1000
+        self.lock = threading.RLock()
+        self._cond = threading.Condition(self.lock)
+        self._batch = _Batch()
+        self._active = 0
+        self._active_lock = threading.Lock()
+        self._stats = {"batches": 0, "records": 0, "failed_batches": 0}
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Dict[str, Any],
+        commit: Callable[[], None],
+        rollback: Optional[Callable[[], None]] = None
+    ) -> "GroupCommitter":
+        """
+        Build a coordinator from store config or the environment.
+
+        `group_commit_records` / IOA_GROUP_COMMIT_RECORDS (falling back to
+        `commit_every` / IOA_COMMIT_EVERY) sets the batch size; `group_commit_ms` /
+        IOA_GROUP_COMMIT_MS the longest wait.
+        """
+        max_records = (
+            config.get("group_commit_records")
+            or os.getenv("IOA_GROUP_COMMIT_RECORDS")
+            or config.get("commit_every")
+            or os.getenv("IOA_COMMIT_EVERY", "1")
+        )
+        max_delay_ms = config.get("group_commit_ms") or os.getenv("IOA_GROUP_COMMIT_MS", "2")
+        return cls(commit, rollback, max_records=int(max_records), max_delay_ms=float(max_delay_ms))
+
+    def submit(self, write: Callable[[], Any]) -> Any:
+        """
+        Run a write in the open batch and wait until the batch is committed.
+
+        Args:
+            write: Performs the uncommitted write; an exception aborts only
+                this write and is re-raised
+
+        Returns:
+            The result of `write`
+        """
+        with self._active_lock:
+            self._active += 1
+        try:
+            with self._cond:
+                result = write()
+                batch = self._batch
+                batch.size += 1
+                if batch.size == 1:
+                    batch.opened = time.monotonic()
+
+                while not batch.done:
+                    if batch is self._batch:
+                        remaining = batch.opened + self.max_delay - time.monotonic()
+                        if batch.size >= self.max_records or remaining <= 0 or self._no_joiners(batch):
+                            self._commit_locked()
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+
+                if batch.error is not None:
+                    raise batch.error
+                return result
+        finally:
+            with self._active_lock:
+                self._active -= 1
+
+    def _no_joiners(self, batch: _Batch) -> bool:
+        # Every writer inside submit() is already part of this batch
+        with self._active_lock:
+            return self._active <= batch.size
+
+    def _commit_locked(self) -> None:
+        batch = self._batch
+        self._batch = _Batch()
+        try:
+            self._commit()
+            self._stats["batches"] += 1
+            self._stats["records"] += batch.size
+        except Exception as e:
+            batch.error = e
+            self._stats["failed_batches"] += 1
+            if self._rollback is not None:
+                try:
+                    self._rollback()
+                except Exception:
+                    pass
+        finally:
+            batch.done = True
+            self._cond.notify_all()
+
+    def commit(self) -> None:
+        """Commit the open batch now (also for writes made outside submit)."""
+        with self._cond:
+            batch = self._batch
+            if batch.size:
+                self._commit_locked()
+                if batch.error is not None:
+                    raise batch.error
+            else:
+                self._commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch counters and the average batch size."""
+        stats = dict(self._stats)
+        stats["avg_batch_size"] = stats["records"] / stats["batches"] if stats["batches"] else 0.0
+        stats["max_records"] = self.max_records
+        stats["max_delay_ms"] = self.max_delay * 1000
+        return stats
@@ -10,13 +10,16 @@
 import os
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, Set, Tuple
 """Local Jsonl module."""
 
 from pathlib import Path
 
 from .base import BaseMemoryStore, MemoryStore
+from .group_commit import GroupCommitter
 from ..schema import MemoryRecordV1
+from ..query import FabricQuery, SecondaryIndex, indexed_metadata_keys, project, run_in_memory
+from ..dedup import dedup_enabled, dedup_key, dedup_summary
 
 # PATCH: Cursor-2025-09-10 DISPATCH-OSS-20250910-MEMORY-FABRIC-REFACTOR <local jsonl store>
 
@@ -33,31 +36,116 @@ def __init__(self, config: Optional[Dict[str, Any]] = None):
         run_id = str(uuid.uuid4())[:8]
         self.file_path = self.data_dir / f"memory_run_{run_id}.jsonl"
         self._records: Dict[str, MemoryRecordV1] = {}
+        # Inverted index over tags, type, tier and selected metadata for query()
+        self._index = SecondaryIndex(indexed_metadata_keys(self.config))
+        
+        # Optional time partitioning: records are appended to one segment file per
+        # (memory_type, time window) so expired windows can be dropped by unlinking
+        self.partition_seconds = int(
+            self.config.get("partition_seconds") or os.getenv("IOA_JSONL_PARTITION_SECONDS", "0")
+        )
+        self._segment_info: Dict[Path, Tuple[str, int]] = {}
+        self._segment_ids: Dict[Path, Set[str]] = {}
+        self._record_segment: Dict[str, Path] = {}
+        
+        # Appends are buffered per file and written (and optionally fsynced)
+        # once per group-commit batch instead of once per record
+        self.fsync = bool(self.config.get("fsync") or os.getenv("IOA_JSONL_FSYNC", "0") == "1")
+        self._pending_lines: Dict[Path, List[str]] = {}
+        self._pending_ids: List[str] = []
+        self._committer = GroupCommitter.from_config(self.config, self._write_pending, self._discard_pending)
+        
+        # Optional content deduplication: record lines reference content by
+        # hash and each distinct content is written once to a sidecar file
+        self.dedup = dedup_enabled(self.config)
+        self.content_path = self.data_dir / f"{self.file_path.stem}.content.jsonl"
+        self._contents: Dict[str, str] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._record_hash: Dict[str, str] = {}
+        self._pending_contents: List[str] = []
+        self._orphaned = 0  # Unreferenced contents still in the sidecar
+        
         self._load_existing_records()
     
     def _load_existing_records(self):
-        """Load existing records from JSONL file."""
-        if not self.file_path.exists():
-            return
-        
+        """Load existing records from the JSONL file and any segment files."""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        record = MemoryRecordV1.from_dict(data)
-                        self._records[record.id] = record
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        self._update_stats("errors", False)
-                        continue
+            # Segments outlive the run that wrote them, so with partitioning the
+            # segments (and content sidecars) of earlier runs are loaded too and
+            # their windows can still expire
+            if self.partition_seconds:
+                sidecars = sorted(self.data_dir.glob("memory_run_*.content.jsonl"))
+            else:
+                sidecars = [self.content_path] if self.content_path.exists() else []
+            for sidecar in sidecars:
+                with open(sidecar, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            self._contents[entry["hash"]] = entry["content"]
+            
+            if self.file_path.exists():
+                self._load_file(self.file_path)
             
+            if self.partition_seconds:
+                segments = []
+                for path in self.data_dir.glob("memory_run_*.*.*.jsonl"):
+                    # <run>.<memory_type>.<window_start>.jsonl
+                    parts = path.name.split(".")
+                    if len(parts) == 4 and parts[2].isdigit():
+                        segments.append((int(parts[2]), path.stat().st_mtime, parts[1], path))
+                for window_start, _, memory_type, path in sorted(segments):
+                    self._segment_info[path] = (memory_type, window_start)
+                    self._segment_ids.setdefault(path, set())
+                    self._load_file(path, segment=path)
+            
+            # Content whose records were all deleted or rewritten
+            self._orphaned = len(self._contents) - len(self._refcounts)
+            self._contents = {digest: self._contents[digest] for digest in self._refcounts}
             self._stats["total_records"] = len(self._records)
         except Exception as e:
             self._update_stats("errors", False)
     
+    def _load_file(self, path: Path, segment: Optional[Path] = None):
+        """Load records from one JSONL file; later lines win."""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                    digest = data.pop("content_hash", None)
+                    if digest is not None:
+                        data["content"] = self._contents[digest]
+                    record = MemoryRecordV1.from_dict(data)
+                    self._set_ref(record.id, digest)
+                    self._records[record.id] = record
+                    self._index.add(record)
+                    if segment is not None:
+                        self._track_segment(record.id, segment)
+                except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    self._update_stats("errors", False)
+                    continue
+    
+    def _segment_for(self, record: MemoryRecordV1) -> Path:
+        """Segment file for a record's memory type and timestamp window."""
+        window_start = int(record.timestamp.timestamp()) // self.partition_seconds * self.partition_seconds
+        memory_type = record.memory_type.value
+        path = self.data_dir / f"{self.file_path.stem}.{memory_type}.{window_start:012d}.jsonl"
+        if path not in self._segment_info:
+            self._segment_info[path] = (memory_type, window_start)
+            self._segment_ids[path] = set()
+        return path
+    
+    def _track_segment(self, record_id: str, segment: Path):
+        """Record that the current version of a record lives in ``segment``."""
+        previous = self._record_segment.get(record_id)
+        if previous is not None and previous != segment:
+            self._segment_ids[previous].discard(record_id)
+        self._record_segment[record_id] = segment
+        self._segment_ids[segment].add(record_id)
+    
     def store(self, record: MemoryRecordV1) -> bool:
         """Store a memory record."""
         try:
@@ -65,11 +153,7 @@ def store(self, record: MemoryRecordV1) -> bool:
                 self._update_stats("writes", False)
                 return False
             
-            self._records[record.id] = record
-            
-            # Append to JSONL file
-            with open(self.file_path, 'a', encoding='utf-8') as f:
-                f.write(record.to_json() + '\n')
+            self._committer.submit(lambda: self._append(record))
             
             self._update_stats("writes", True)
             self._stats["total_records"] = len(self._records)
@@ -79,6 +163,118 @@ def store(self, record: MemoryRecordV1) -> bool:
             self._update_stats("writes", False)
             return False
     
+    def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Append records with a single write per file."""
+        valid = [record for record in records if self._validate_record(record)]
+        with self._committer.lock:
+            try:
+                for record in valid:
+                    self._append(record)
+                self._committer.commit()
+            except Exception as e:
+                self._discard_pending()
+                self._update_stats("writes", False)
+                return 0
+        
+        self._stats["writes"] += len(valid)
+        self._stats["total_records"] = len(self._records)
+        return len(valid)
+    
+    def _set_ref(self, record_id: str, digest: Optional[str]) -> bool:
+        """
+        Point a record at a content hash (None for inline content).
+        
+        Returns:
+            True if the previous content lost its last reference
+        """
+        previous = self._record_hash.pop(record_id, None)
+        if digest is not None:
+            self._record_hash[record_id] = digest
+            self._refcounts[digest] = self._refcounts.get(digest, 0) + 1
+        if previous is None:
+            return False
+        self._refcounts[previous] -= 1
+        if self._refcounts[previous] > 0:
+            return False
+        del self._refcounts[previous]
+        self._contents.pop(previous, None)
+        return True
+    
+    def _line_for(self, record: MemoryRecordV1) -> str:
+        """JSONL line of a record; deduplicated content is replaced by its hash."""
+        digest = self._record_hash.get(record.id)
+        if digest is None:
+            return record.to_json() + '\n'
+        data = record.to_dict()
+        data["content"] = ""
+        data["content_hash"] = digest
+        return json.dumps(data, default=str) + '\n'
+    
+    def _append(self, record: MemoryRecordV1):
+        """Apply a record in memory and queue its line for the next commit."""
+        digest = None
+        if self.dedup:
+            digest = dedup_key(record)
+            if digest not in self._contents:
+                self._contents[digest] = record.content
+                self._pending_contents.append(digest)
+            # Share one copy per content (the first ciphertext when encrypted)
+            record.content = self._contents[digest]
+        if self._set_ref(record.id, digest):
+            self._orphaned += 1
+        line = self._line_for(record)
+        self._records[record.id] = record
+        self._index.add(record)
+        
+        path = self.file_path
+        if self.partition_seconds:
+            path = self._segment_for(record)
+            self._track_segment(record.id, path)
+        
+        self._pending_lines.setdefault(path, []).append(line)
+        self._pending_ids.append(record.id)
+    
+    def _write_pending(self):
+        """Append queued lines, one write (and fsync) per file."""
+        # Content before the records that reference it
+        lines = [
+            json.dumps({"hash": digest, "content": self._contents[digest]}) + '\n'
+            for digest in self._pending_contents if digest in self._contents
+        ]
+        if lines:
+            with open(self.content_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        self._pending_contents = []
+        
+        for path, lines in self._pending_lines.items():
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(''.join(lines))
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        self._pending_lines = {}
+        self._pending_ids = []
+    
+    def _discard_pending(self):
+        """Forget records whose batch failed to reach disk."""
+        for record_id in self._pending_ids:
+            self._records.pop(record_id, None)
+            self._index.remove(record_id)
+            self._set_ref(record_id, None)
+        for digest in self._pending_contents:
+            if digest not in self._refcounts:
+                self._contents.pop(digest, None)
+        self._pending_contents = []
+        self._pending_lines = {}
+        self._pending_ids = []
+    
+    def flush(self) -> None:
+        """Write the open group-commit batch, if any."""
+        self._committer.commit()
+    
     def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
         """Retrieve a memory record by ID."""
         try:
@@ -93,8 +289,27 @@ def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
             self._update_stats("reads", False)
             return None
     
-    def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None) -> List[MemoryRecordV1]:
-        """Search for memory records."""
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> int:
+        """Apply write-behind access counts (kept in memory, like retrieve())."""
+        updated = 0
+        for record_id, (count, accessed_at) in accesses.items():
+            record = self._records.get(record_id)
+            if record is not None:
+                record.access_count += count
+                record.last_accessed = accessed_at
+                updated += 1
+        return updated
+    
+    def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records by ID without access tracking, preserving input order."""
+        records = [self._records[record_id] for record_id in record_ids if record_id in self._records]
+        self._update_stats("reads", True)
+        return records
+    
+    def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Search for memory records; with `fields`, projected copies are returned."""
         try:
             results = []
             query_lower = query.lower()
@@ -115,53 +330,199 @@ def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None)
             results.sort(key=lambda r: (r.access_count, r.timestamp), reverse=True)
             
             self._update_stats("queries", True)
-            return results
+            return [project(record, fields) for record in results]
             
         except Exception as e:
             self._update_stats("queries", False)
             return []
     
+    def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Run a query in memory, narrowing candidates with the secondary index."""
+        results, _ = run_in_memory(self._records, query, self._index)
+        self._update_stats("queries", True)
+        return results
+    
+    def explain(self, query: FabricQuery) -> Dict[str, Any]:
+        """The in-memory plan a query would follow."""
+        _, plan = run_in_memory(self._records, query, self._index)
+        plan["backend"] = "local_jsonl"
+        return plan
+    
     def delete(self, record_id: str) -> bool:
         """Delete a memory record."""
+        # Rewrites must not race queued appends
+        with self._committer.lock:
+            return self._delete_locked(record_id)
+    
+    def _delete_locked(self, record_id: str) -> bool:
         try:
+            self.flush()
             if record_id in self._records:
                 del self._records[record_id]
+                self._index.remove(record_id)
+                if self._set_ref(record_id, None):
+                    self._orphaned += 1
                 self._stats["total_records"] = len(self._records)
                 
-                # Rewrite the entire file (simple approach)
-                self._rewrite_file()
+                segment = self._record_segment.pop(record_id, None)
+                if segment is not None:
+                    # Only the record's own segment needs rewriting
+                    self._segment_ids[segment].discard(record_id)
+                    self._rewrite_segment(segment)
+                else:
+                    # Rewrite the entire file (simple approach)
+                    self._rewrite_file()
+                self._compact_contents()
                 return True
             return False
         except Exception as e:
             self._update_stats("errors", False)
             return False
     
-    def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
-        """List all memory records."""
+    def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """
+        Delete records of a memory type older than ``cutoff``.
+        
+        With partitioning enabled, whole segments whose window ends before the
+        cutoff are dropped by unlinking the file (a segment counts as one unit,
+        so more than ``limit`` records may go at once). Without partitioning,
+        up to ``limit`` records are removed and the file is rewritten once.
+        
+        Returns:
+            IDs of the deleted records
+        """
+        with self._committer.lock:
+            return self._delete_expired_locked(memory_type, cutoff, limit)
+    
+    def _delete_expired_locked(self, memory_type: str, cutoff: datetime, limit: int) -> List[str]:
+        try:
+            self.flush()
+            deleted: List[str] = []
+            if self.partition_seconds:
+                cutoff_ts = cutoff.timestamp()
+                expired_segments = sorted(
+                    (window_start, path)
+                    for path, (segment_type, window_start) in self._segment_info.items()
+                    if segment_type == memory_type and window_start + self.partition_seconds <= cutoff_ts
+                )
+                for _, path in expired_segments:
+                    if len(deleted) >= limit:
+                        break
+                    for record_id in self._segment_ids.pop(path, set()):
+                        if self._record_segment.get(record_id) == path:
+                            del self._record_segment[record_id]
+                            self._records.pop(record_id, None)
+                            self._index.remove(record_id)
+                            if self._set_ref(record_id, None):
+                                self._orphaned += 1
+                            deleted.append(record_id)
+                    del self._segment_info[path]
+                    path.unlink(missing_ok=True)
+            else:
+                for record in list(self._records.values()):
+                    if len(deleted) >= limit:
+                        break
+                    if record.memory_type.value == memory_type and record.timestamp < cutoff:
+                        del self._records[record.id]
+                        self._index.remove(record.id)
+                        if self._set_ref(record.id, None):
+                            self._orphaned += 1
+                        deleted.append(record.id)
+                if deleted:
+                    self._rewrite_file()
+            self._compact_contents()
+            
+            self._stats["total_records"] = len(self._records)
+            return deleted
+        except Exception as e:
+            self._update_stats("errors", False)
+            return []
+    
+    def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List all memory records; with `fields`, projected copies are returned."""
         try:
             records = list(self._records.values())
             if limit:
                 records = records[:limit]
             
             self._update_stats("reads", True)
-            return records
+            return [project(record, fields) for record in records]
         except Exception as e:
             self._update_stats("reads", False)
             return []
     
+    def count(self) -> int:
+        """Number of stored records."""
+        return len(self._records)
+    
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[MemoryRecordV1]]:
+        """Stream records in insertion order."""
+        records = list(self._records.values())
+        for start in range(0, len(records), batch_size):
+            self._update_stats("reads", True)
+            yield records[start:start + batch_size]
+    
     def _rewrite_file(self):
         """Rewrite the entire JSONL file with current records."""
         try:
             with open(self.file_path, 'w', encoding='utf-8') as f:
                 for record in self._records.values():
-                    f.write(record.to_json() + '\n')
+                    if record.id not in self._record_segment:
+                        f.write(self._line_for(record))
+        except Exception as e:
+            self._update_stats("errors", False)
+    
+    def _rewrite_segment(self, segment: Path):
+        """Rewrite one segment file with its current records, dropping it if empty."""
+        try:
+            record_ids = self._segment_ids.get(segment, set())
+            if not record_ids:
+                self._segment_ids.pop(segment, None)
+                self._segment_info.pop(segment, None)
+                segment.unlink(missing_ok=True)
+                return
+            with open(segment, 'w', encoding='utf-8') as f:
+                for record_id in record_ids:
+                    f.write(self._line_for(self._records[record_id]))
         except Exception as e:
             self._update_stats("errors", False)
     
+    def _compact_contents(self):
+        """Rewrite the content sidecar without unreferenced contents."""
+        if not self._orphaned:
+            return
+        try:
+            tmp_path = self.content_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for digest, content in self._contents.items():
+                    f.write(json.dumps({"hash": digest, "content": content}) + '\n')
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.content_path)
+            self._orphaned = 0
+        except Exception as e:
+            self._update_stats("errors", False)
+    
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Unique contents, references and the logical/stored byte ratio."""
+        sizes = {digest: len(content.encode("utf-8")) for digest, content in self._contents.items()}
+        return dedup_summary(
+            len(sizes),
+            sum(self._refcounts.values()),
+            sum(sizes.values()),
+            sum(sizes[digest] * count for digest, count in self._refcounts.items() if digest in sizes)
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get storage statistics, including group-commit batching."""
+        stats = super().get_stats()
+        stats["group_commit"] = self._committer.get_stats()
+        return stats
+    
     def close(self) -> None:
         """Close the store and cleanup resources."""
-        # JSONL store doesn't need explicit cleanup
-        pass
+        self.flush()
     
     def get_file_path(self) -> str:
         """Get the file path for this store."""
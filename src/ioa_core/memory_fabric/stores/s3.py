@@ -9,14 +9,17 @@
 import json
 import os
 import uuid
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, Tuple
 """S3 module."""
 
 from pathlib import Path
 
 from .base import BaseMemoryStore, MemoryStore
 from ..schema import MemoryRecordV1, MemoryType, StorageTier
+from ..query import FabricQuery, project, run_in_memory
+from ..dedup import dedup_enabled, dedup_fingerprint, dedup_key, dedup_summary
 
 # PATCH: Cursor-2025-09-10 DISPATCH-OSS-20250910-MEMORY-FABRIC-REFACTOR <s3 store>
 
@@ -42,6 +45,21 @@ def __init__(self, config: Optional[Dict[str, Any]] = None):
             os.getenv("AWS_DEFAULT_REGION", "us-east-1")
         )
         
+        # Optional time partitioning: a marker object per record under
+        # <prefix>_ttl/<memory_type>/<window>/ lets TTL sweeps list only expired windows
+        self.partition_seconds = int(
+            (config.get("partition_seconds") if config else None) or
+            os.getenv("IOA_FABRIC_S3_PARTITION_SECONDS", "0")
+        )
+        self.ttl_prefix = self.prefix.rstrip("/") + "_ttl/"
+        
+        # Optional content deduplication: each distinct content is one object
+        # under <prefix>_content/<hash>, referenced by empty marker objects
+        # under <prefix>_content_refs/<hash>/<record_id>
+        self.dedup = dedup_enabled(config)
+        self.content_prefix = self.prefix.rstrip("/") + "_content/"
+        self.refs_prefix = self.prefix.rstrip("/") + "_content_refs/"
+        
         # Check for AWS credentials
         self._boto3_available = self._check_boto3_availability()
         self._s3_client = None
@@ -87,7 +105,8 @@ def _init_fallback(self):
         # Use LocalJSONLStore as fallback
         from .local_jsonl import LocalJSONLStore
         self._fallback_store = LocalJSONLStore({
-            "data_dir": str(fallback_dir)
+            "data_dir": str(fallback_dir),
+            "dedup": self.dedup
         })
     
     def store(self, record: MemoryRecordV1) -> bool:
@@ -102,12 +121,33 @@ def store(self, record: MemoryRecordV1) -> bool:
             
             # Upload to S3
             key = f"{self.prefix}{record.id}.json"
-            self._s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=record.to_json(),
-                ContentType='application/json'
-            )
+            if self.dedup:
+                digest = self._store_content(record)
+                data = record.to_dict()
+                data["content"] = ""
+                data["content_hash"] = digest
+                self._s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=json.dumps(data, default=str),
+                    ContentType='application/json',
+                    Metadata={"content-hash": digest}
+                )
+            else:
+                self._s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=record.to_json(),
+                    ContentType='application/json'
+                )
+            
+            if self.partition_seconds:
+                window_start = int(record.timestamp.timestamp()) // self.partition_seconds * self.partition_seconds
+                self._s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=f"{self.ttl_prefix}{record.memory_type.value}/{window_start:012d}/{record.id}",
+                    Body=b""
+                )
             
             self._update_stats("writes", True)
             self._stats["total_records"] += 1
@@ -118,6 +158,69 @@ def store(self, record: MemoryRecordV1) -> bool:
             self._update_stats("writes", False)
             return self._fallback_store.store(record)
     
+    def _content_hash_of(self, record_id: str) -> Optional[str]:
+        """Content hash a stored record references, from its object metadata."""
+        try:
+            response = self._s3_client.head_object(Bucket=self.bucket_name, Key=f"{self.prefix}{record_id}.json")
+        except Exception:
+            return None
+        return response.get('Metadata', {}).get("content-hash")
+    
+    def _store_content(self, record: MemoryRecordV1) -> str:
+        """
+        Reference a record's content by hash, uploading it if it is new.
+        
+        S3 has no atomic counters, so references are marker objects and the
+        content is deleted once a release finds no marker left. A write that
+        races the last release of the same content can still lose it.
+        
+        Returns:
+            The content hash
+        """
+        digest = dedup_key(record)
+        previous = self._content_hash_of(record.id)
+        if previous == digest:
+            return digest
+        
+        self._s3_client.put_object(Bucket=self.bucket_name, Key=f"{self.refs_prefix}{digest}/{record.id}", Body=b"")
+        content_key = f"{self.content_prefix}{digest}"
+        try:
+            if dedup_fingerprint(record):
+                # Equal plaintexts encrypt differently; keep the first ciphertext
+                response = self._s3_client.get_object(Bucket=self.bucket_name, Key=content_key)
+                record.content = response['Body'].read().decode('utf-8')
+            else:
+                self._s3_client.head_object(Bucket=self.bucket_name, Key=content_key)
+        except Exception:
+            self._s3_client.put_object(Bucket=self.bucket_name, Key=content_key, Body=record.content.encode('utf-8'))
+        
+        if previous:
+            self._release_content(previous, record.id)
+        return digest
+    
+    def _release_content(self, digest: str, record_id: str):
+        """Drop a record's reference, deleting the content when none remain."""
+        self._s3_client.delete_object(Bucket=self.bucket_name, Key=f"{self.refs_prefix}{digest}/{record_id}")
+        response = self._s3_client.list_objects_v2(
+            Bucket=self.bucket_name, Prefix=f"{self.refs_prefix}{digest}/", MaxKeys=1
+        )
+        if not response.get('Contents'):
+            self._s3_client.delete_object(Bucket=self.bucket_name, Key=f"{self.content_prefix}{digest}")
+    
+    def _record_from_data(self, data: Dict[str, Any]) -> MemoryRecordV1:
+        """Build a record from its object body, fetching deduplicated content."""
+        digest = data.pop("content_hash", None)
+        if digest is not None:
+            response = self._s3_client.get_object(Bucket=self.bucket_name, Key=f"{self.content_prefix}{digest}")
+            data["content"] = response['Body'].read().decode('utf-8')
+        return MemoryRecordV1.from_dict(data)
+    
+    def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Store records one object at a time (S3 has no multi-object put)."""
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.store_many(records)
+        return sum(1 for record in records if self.store(record))
+    
     def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
         """Retrieve a memory record by ID."""
         if not self._boto3_available or not self._s3_client:
@@ -128,7 +231,7 @@ def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
             response = self._s3_client.get_object(Bucket=self.bucket_name, Key=key)
             data = json.loads(response['Body'].read().decode('utf-8'))
             
-            record = MemoryRecordV1.from_dict(data)
+            record = self._record_from_data(data)
             record.update_access()
             
             # Update access count (store back to S3)
@@ -141,10 +244,44 @@ def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
             self._update_stats("reads", False)
             return self._fallback_store.retrieve(record_id)
     
-    def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None) -> List[MemoryRecordV1]:
-        """Search for memory records."""
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> int:
+        """Apply write-behind access counts with one read-modify-write per object."""
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.record_accesses(accesses)
+        
+        updated = 0
+        for record in self.get_many(list(accesses)):
+            count, accessed_at = accesses[record.id]
+            record.access_count += count
+            record.last_accessed = accessed_at
+            if self.store(record):
+                updated += 1
+        return updated
+    
+    def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records by ID without access tracking, preserving input order."""
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.get_many(record_ids)
+        
+        results = []
+        for record_id in record_ids:
+            try:
+                key = f"{self.prefix}{record_id}.json"
+                response = self._s3_client.get_object(Bucket=self.bucket_name, Key=key)
+                data = json.loads(response['Body'].read().decode('utf-8'))
+                results.append(self._record_from_data(data))
+            except Exception:
+                self._update_stats("reads", False)
+        
+        self._update_stats("reads", True)
+        return results
+    
+    def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Search for memory records (objects are read whole, then projected to `fields`)."""
         if not self._boto3_available or not self._s3_client:
-            return self._fallback_store.search(query, limit, memory_type)
+            return self._fallback_store.search(query, limit, memory_type, fields)
         
         try:
             # List all objects with the prefix
@@ -169,7 +306,7 @@ def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None)
                         Key=obj['Key']
                     )
                     data = json.loads(obj_response['Body'].read().decode('utf-8'))
-                    record = MemoryRecordV1.from_dict(data)
+                    record = self._record_from_data(data)
                 except Exception:
                     skip = True
                 
@@ -189,11 +326,11 @@ def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None)
             results.sort(key=lambda r: (r.access_count, r.timestamp), reverse=True)
             
             self._update_stats("queries", True)
-            return results
+            return [project(record, fields) for record in results]
             
         except Exception:
             self._update_stats("queries", False)
-            return self._fallback_store.search(query, limit, memory_type)
+            return self._fallback_store.search(query, limit, memory_type, fields)
     
     def delete(self, record_id: str) -> bool:
         """Delete a memory record."""
@@ -202,7 +339,10 @@ def delete(self, record_id: str) -> bool:
         
         try:
             key = f"{self.prefix}{record_id}.json"
+            digest = self._content_hash_of(record_id) if self.dedup else None
             self._s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+            if digest:
+                self._release_content(digest, record_id)
             
             self._stats["total_records"] = max(0, self._stats["total_records"] - 1)
             return True
@@ -212,10 +352,126 @@ def delete(self, record_id: str) -> bool:
             # Fallback to local storage
             return self._fallback_store.delete(record_id)
     
-    def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
-        """List all memory records."""
+    def _iter_objects(self, prefix: str):
+        """Yield listed objects under a prefix in key order, following pagination."""
+        kwargs = {"Bucket": self.bucket_name, "Prefix": prefix}
+        while True:
+            response = self._s3_client.list_objects_v2(**kwargs)
+            for obj in response.get('Contents', []):
+                yield obj
+            if not response.get('IsTruncated'):
+                break
+            kwargs["ContinuationToken"] = response['NextContinuationToken']
+    
+    def _delete_keys(self, keys: List[str]):
+        """Delete keys with batched DeleteObjects calls (1000 keys per request)."""
+        for start in range(0, len(keys), 1000):
+            self._s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in keys[start:start + 1000]], "Quiet": True}
+            )
+    
+    def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """
+        Delete up to ``limit`` records of a memory type older than ``cutoff``.
+        
+        With partitioning enabled only the marker prefixes of expired windows
+        are listed (keys sort by window, so listing stops at the first live
+        window). Otherwise objects last modified before the cutoff are fetched
+        to confirm their memory type and timestamp.
+        
+        Returns:
+            IDs of the deleted records
+        """
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.delete_expired(memory_type, cutoff, limit)
+        
+        try:
+            deleted: List[str] = []
+            keys: List[str] = []
+            cutoff_ts = cutoff.timestamp()
+            
+            if self.partition_seconds:
+                type_prefix = f"{self.ttl_prefix}{memory_type}/"
+                for obj in self._iter_objects(type_prefix):
+                    window, _, record_id = obj['Key'][len(type_prefix):].partition("/")
+                    if int(window) + self.partition_seconds > cutoff_ts or len(deleted) >= limit:
+                        break
+                    deleted.append(record_id)
+                    keys.extend([f"{self.prefix}{record_id}.json", obj['Key']])
+            else:
+                for obj in self._iter_objects(self.prefix):
+                    if len(deleted) >= limit:
+                        break
+                    # Records are rewritten on access, so LastModified >= timestamp
+                    if obj['LastModified'].timestamp() >= cutoff_ts:
+                        continue
+                    response = self._s3_client.get_object(Bucket=self.bucket_name, Key=obj['Key'])
+                    record = self._record_from_data(json.loads(response['Body'].read().decode('utf-8')))
+                    if record.memory_type.value == memory_type and record.timestamp < cutoff:
+                        deleted.append(record.id)
+                        keys.append(obj['Key'])
+            
+            hashes = {record_id: self._content_hash_of(record_id) for record_id in deleted} if self.dedup else {}
+            self._delete_keys(keys)
+            for record_id, digest in hashes.items():
+                if digest:
+                    self._release_content(digest, record_id)
+            self._stats["total_records"] = max(0, self._stats["total_records"] - len(deleted))
+            return deleted
+            
+        except Exception:
+            self._update_stats("errors", False)
+            return []
+    
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[MemoryRecordV1]]:
+        """Stream records page by page from the object listing."""
         if not self._boto3_available or not self._s3_client:
-            return self._fallback_store.list_all(limit)
+            yield from self._fallback_store.iter_batches(batch_size)
+            return
+        
+        batch: List[MemoryRecordV1] = []
+        for obj in self._iter_objects(self.prefix):
+            if not obj['Key'].endswith('.json'):
+                continue
+            try:
+                response = self._s3_client.get_object(Bucket=self.bucket_name, Key=obj['Key'])
+                batch.append(self._record_from_data(json.loads(response['Body'].read().decode('utf-8'))))
+            except Exception:
+                self._update_stats("reads", False)
+                continue
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Run a query over the object listing, filtering every page before the limit."""
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.query(query)
+        
+        unlimited = replace(query, limit=None, fields=None)
+        matched: Dict[str, MemoryRecordV1] = {}
+        for batch in self.iter_batches():
+            found, _ = run_in_memory({record.id: record for record in batch}, unlimited)
+            matched.update((record.id, record) for record in found)
+        results, _ = run_in_memory(matched, query)
+        self._update_stats("queries", True)
+        return results
+    
+    def explain(self, query: FabricQuery) -> Dict[str, Any]:
+        """The plan a query would follow (S3 has no server-side filtering)."""
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.explain(query)
+        _, plan = run_in_memory({}, query)
+        plan.update({"backend": "s3", "access": f"object listing scan of s3://{self.bucket_name}/{self.prefix}"})
+        return plan
+    
+    def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List all memory records (objects are read whole, then projected to `fields`)."""
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.list_all(limit, fields)
         
         try:
             response = self._s3_client.list_objects_v2(
@@ -238,7 +494,7 @@ def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
                         Key=obj['Key']
                     )
                     data = json.loads(obj_response['Body'].read().decode('utf-8'))
-                    record = MemoryRecordV1.from_dict(data)
+                    record = self._record_from_data(data)
                 except Exception:
                     retrieval_failed = True
                     record = None
@@ -251,11 +507,31 @@ def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
             results.sort(key=lambda r: (r.access_count, r.timestamp), reverse=True)
             
             self._update_stats("reads", True)
-            return results
+            return [project(record, fields) for record in results]
             
         except Exception:
             self._update_stats("reads", False)
-            return self._fallback_store.list_all(limit)
+            return self._fallback_store.list_all(limit, fields)
+    
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Unique contents, references and the logical/stored byte ratio, from listings."""
+        if not self._boto3_available or not self._s3_client:
+            return self._fallback_store.dedup_stats()
+        
+        sizes = {
+            obj['Key'][len(self.content_prefix):]: obj['Size']
+            for obj in self._iter_objects(self.content_prefix)
+        }
+        references: Dict[str, int] = {}
+        for obj in self._iter_objects(self.refs_prefix):
+            digest = obj['Key'][len(self.refs_prefix):].partition("/")[0]
+            references[digest] = references.get(digest, 0) + 1
+        return dedup_summary(
+            len(sizes),
+            sum(references.values()),
+            sum(sizes.values()),
+            sum(sizes.get(digest, 0) * count for digest, count in references.items())
+        )
     
     def close(self) -> None:
         """Close the store and cleanup resources."""
@@ -0,0 +1,359 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import heapq
+import os
+import re
+import threading
+from datetime import datetime
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, Tuple
+"""Segments store module."""
+
+from pathlib import Path
+
+from .base import BaseMemoryStore
+from ..schema import MemoryRecordV1
+from ..query import FabricQuery, project, run_in_memory
+from ..dedup import dedup_summary
+from ..segment import DEFAULT_BLOCK_SIZE, SegmentReader, write_segment
+
+_SEGMENT_NAME = re.compile(r"^seg-(\d{10})\.sst$")
+TOMBSTONE_FILE = "tombstones.log"
+
+
+class SegmentStore(BaseMemoryStore):
+    """
+    Archive store of immutable, block-compressed segment files.
+
+    Each write batch becomes one segment sorted by id; a record's newest
+    segment wins. Deletes append (sequence, id) tombstones that hide every
+    version written before them. Once there are more than
+    `segment_max_segments` segments, the newest ones are merged into one,
+    dropping shadowed versions and deleted records; compact() merges all of
+    them and clears the tombstones.
+
+    A point read checks each segment's Bloom filter, newest first, and
+    decompresses one block of the first segment that holds the id. Segments
+    never change after they are written, so access counts are not persisted.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the segment store.
+
+        Args:
+            config: `segment_dir` (default <data_dir>/segments),
+                `segment_block_size` (or IOA_FABRIC_SEGMENT_BLOCK_SIZE),
+                `segment_max_segments` (or IOA_FABRIC_SEGMENT_MAX) and
+                `segment_fp_rate` (Bloom filter false-positive rate)
+        """
+        super().__init__(config)
+        self.directory = Path(
+            self.config.get("segment_dir") or Path(self.config.get("data_dir", "./artifacts/memory")) / "segments"
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.block_size = int(
+            self.config.get("segment_block_size") or os.getenv("IOA_FABRIC_SEGMENT_BLOCK_SIZE", str(DEFAULT_BLOCK_SIZE))
+        )
+        self.max_segments = max(2, int(
+            self.config.get("segment_max_segments") or os.getenv("IOA_FABRIC_SEGMENT_MAX", "16")
+        ))
+        self.fp_rate = float(self.config.get("segment_fp_rate", 0.01))
+        self.tombstone_path = self.directory / TOMBSTONE_FILE
+
+        self._lock = threading.RLock()
+        # (sequence, reader), newest first; replaced as a whole so readers
+        # iterate a consistent list without taking the lock
+        self._segments: List[Tuple[int, SegmentReader]] = []
+        # Record id -> sequence of its latest delete
+        self._tombstones: Dict[str, int] = {}
+        self._seq = 0
+        self._stats["compactions"] = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Open existing segments and replay the tombstone log."""
+        segments = []
+        for path in self.directory.iterdir():
+            if path.name.endswith(".tmp"):
+                # Left by an interrupted write or compaction
+                path.unlink(missing_ok=True)
+                continue
+            match = _SEGMENT_NAME.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), SegmentReader(str(path))))
+        self._segments = sorted(segments, key=lambda item: item[0], reverse=True)
+        self._seq = max((seq for seq, _ in segments), default=0)
+
+        if self.tombstone_path.exists():
+            with open(self.tombstone_path, encoding="utf-8") as f:
+                for line in f:
+                    seq, _, record_id = line.rstrip("\n").partition(" ")
+                    if record_id:
+                        self._tombstones[record_id] = max(int(seq), self._tombstones.get(record_id, 0))
+                        self._seq = max(self._seq, int(seq))
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.directory / f"seg-{seq:010d}.sst"
+
+    def _hidden(self, record_id: str, seq: int) -> bool:
+        return self._tombstones.get(record_id, 0) >= seq
+
+    def _get(self, record_id: str) -> Optional[MemoryRecordV1]:
+        for seq, reader in self._segments:
+            record = reader.get(record_id)
+            if record is not None:
+                # Older versions were written before this one, so they are hidden too
+                return None if self._hidden(record_id, seq) else record
+        return None
+
+    def _merge(self, segments: List[Tuple[int, SegmentReader]]) -> Iterator[MemoryRecordV1]:
+        """Live records of the given segments in id order, newest version of each."""
+        streams = [
+            ((record.id, -seq, record) for record in reader)
+            for seq, reader in segments
+        ]
+        last_id = None
+        for record_id, negative_seq, record in heapq.merge(*streams, key=lambda item: (item[0], item[1])):
+            if record_id == last_id:
+                continue
+            last_id = record_id
+            if not self._hidden(record_id, -negative_seq):
+                yield record
+
+    def _write(self, seq: int, records: Iterator[MemoryRecordV1]) -> Optional[SegmentReader]:
+        path = self._segment_path(seq)
+        if not write_segment(str(path), records, self.block_size, self.fp_rate):
+            path.unlink(missing_ok=True)
+            return None
+        return SegmentReader(str(path))
+
+    def store(self, record: MemoryRecordV1) -> bool:
+        """Write a single-record segment (batch writes through store_many())."""
+        return self.store_many([record]) == 1
+
+    def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Write the batch as one new segment; the last copy of a repeated id wins."""
+        batch = {}
+        for record in records:
+            if self._validate_record(record):
+                batch[record.id] = record
+            else:
+                self._update_stats("writes", False)
+        if not batch:
+            return 0
+        try:
+            with self._lock:
+                seq = self._seq + 1
+                reader = self._write(seq, (batch[record_id] for record_id in sorted(batch)))
+                self._seq = seq
+                self._segments = [(seq, reader)] + self._segments
+                if len(self._segments) > self.max_segments:
+                    self._compact_run()
+            self._stats["writes"] += len(batch)
+            return len(batch)
+        except (OSError, ValueError) as e:
+            self._update_stats("errors", False)
+            return 0
+
+    def _compact_run(self) -> None:
+        """
+        Merge the newest segments into one.
+
+        The run grows while the next older segment is at most twice its size,
+        so small recent segments fold together and large old ones are
+        rewritten rarely.
+        """
+        segments = self._segments
+        run = 2
+        run_bytes = sum(reader.size for _, reader in segments[:run])
+        while run < len(segments) and segments[run][1].size <= 2 * run_bytes:
+            run_bytes += segments[run][1].size
+            run += 1
+        self._compact(segments[:run])
+
+    def _compact(self, run: List[Tuple[int, SegmentReader]]) -> None:
+        """Replace a run of the newest segments by one segment with the run's newest sequence."""
+        seq = run[0][0]
+        # Replaces the newest input in place: until the older inputs are
+        # removed, they are shadowed by the merged copy
+        reader = self._write(seq, self._merge(run))
+        for old_seq, _ in run[1:]:
+            self._segment_path(old_seq).unlink(missing_ok=True)
+        self._segments = ([(seq, reader)] if reader is not None else []) + self._segments[len(run):]
+        self._stats["compactions"] += 1
+
+    def compact(self) -> int:
+        """
+        Merge every segment into one and clear the tombstones.
+
+        Returns:
+            Number of live records
+        """
+        with self._lock:
+            if self._segments:
+                self._compact(self._segments)
+            self._tombstones = {}
+            tmp_path = self.tombstone_path.with_suffix(".tmp")
+            tmp_path.write_text("", encoding="utf-8")
+            os.replace(tmp_path, self.tombstone_path)
+            return sum(len(reader) for _, reader in self._segments)
+
+    def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """Retrieve a memory record by ID."""
+        try:
+            record = self._get(record_id)
+            if record is not None:
+                record.update_access()
+            self._update_stats("reads", record is not None)
+            return record
+        except (OSError, ValueError) as e:
+            self._update_stats("reads", False)
+            return None
+
+    def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records by ID without access tracking, preserving input order."""
+        records = [record for record in map(self._get, record_ids) if record is not None]
+        self._update_stats("reads", True)
+        return records
+
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> int:
+        """Segments are immutable; access counts of archived records are not persisted."""
+        return 0
+
+    def _live(self) -> Iterator[MemoryRecordV1]:
+        return self._merge(list(self._segments))
+
+    def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Substring search of content and tags over a scan of the segments, projected to `fields`."""
+        results = []
+        query_lower = query.lower()
+        for record in self._live():
+            if memory_type and record.memory_type.value != memory_type:
+                continue
+            if query_lower in record.content.lower() or any(query_lower in tag.lower() for tag in record.tags):
+                results.append(record)
+                if len(results) >= limit:
+                    break
+        results.sort(key=lambda r: (r.access_count, r.timestamp), reverse=True)
+        self._update_stats("queries", True)
+        return [project(record, fields) for record in results]
+
+    def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Evaluate a query over a scan of the segments."""
+        results, _ = run_in_memory({record.id: record for record in self._live()}, query)
+        self._update_stats("queries", True)
+        return results
+
+    def explain(self, query: FabricQuery) -> Dict[str, Any]:
+        """The plan a query would follow."""
+        _, plan = run_in_memory({}, query)
+        plan.update({"backend": "segments", "access": f"segment scan ({len(self._segments)} segments)"})
+        return plan
+
+    def _append_tombstones(self, record_ids: List[str]) -> None:
+        with self._lock:
+            seq = self._seq + 1
+            with open(self.tombstone_path, "a", encoding="utf-8") as f:
+                f.writelines(f"{seq} {record_id}\n" for record_id in record_ids)
+                f.flush()
+                os.fsync(f.fileno())
+            self._seq = seq
+            for record_id in record_ids:
+                self._tombstones[record_id] = seq
+
+    def delete(self, record_id: str) -> bool:
+        """Hide a record behind a tombstone (removed from disk at compaction)."""
+        try:
+            if self._get(record_id) is None:
+                return False
+            self._append_tombstones([record_id])
+            return True
+        except (OSError, ValueError) as e:
+            self._update_stats("errors", False)
+            return False
+
+    def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """Tombstone up to `limit` records of a memory type older than `cutoff`."""
+        deleted = []
+        try:
+            for record in self._live():
+                if len(deleted) >= limit:
+                    break
+                if record.memory_type.value == memory_type and record.timestamp < cutoff:
+                    deleted.append(record.id)
+            if deleted:
+                self._append_tombstones(deleted)
+            return deleted
+        except (OSError, ValueError) as e:
+            self._update_stats("errors", False)
+            return []
+
+    def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List live records in id order, projected to `fields`."""
+        records = []
+        for record in self._live():
+            if limit and len(records) >= limit:
+                break
+            records.append(project(record, fields))
+        self._update_stats("reads", True)
+        return records
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[MemoryRecordV1]]:
+        """Stream live records in id order."""
+        batch: List[MemoryRecordV1] = []
+        for record in self._live():
+            batch.append(record)
+            if len(batch) >= batch_size:
+                self._update_stats("reads", True)
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def verify(self) -> List[str]:
+        """Paths of segments whose checksum or blocks do not verify."""
+        return [reader.path for _, reader in list(self._segments) if not reader.verify()]
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Segments keep content inline (see get_stats() for compression)."""
+        return dedup_summary(0, 0, 0, 0)
+
+    def flush(self) -> None:
+        """Segments and tombstones are synced as they are written."""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Segment count and sizes, compression ratio and pending tombstones."""
+        stats = super().get_stats()
+        segments = [reader.stats() for _, reader in list(self._segments)]
+        stored = sum(segment["bytes"] for segment in segments)
+        raw = sum(segment["raw_bytes"] for segment in segments)
+        stats["segments"] = {
+            "count": len(segments),
+            "records": sum(segment["records"] for segment in segments),
+            "blocks": sum(segment["blocks"] for segment in segments),
+            "bytes": stored,
+            "raw_bytes": raw,
+            "compression_ratio": raw / stored if stored else 1.0,
+            "bloom_bytes": sum(segment["bloom_bytes"] for segment in segments),
+            "tombstones": len(self._tombstones)
+        }
+        return stats
+
+    def close(self) -> None:
+        """Close the segment files."""
+        with self._lock:
+            for _, reader in self._segments:
+                reader.close()
+            self._segments = []
+
+    def get_file_path(self) -> str:
+        """Segment directory (fabric sidecars are written beside it)."""
+        return str(self.directory)
@@ -0,0 +1,240 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, Set, Tuple
+"""Snapshot store module."""
+
+from .base import BaseMemoryStore, MemoryStore
+from ..schema import MemoryRecordV1
+from ..query import FabricQuery, project, run_in_memory
+from ..snapshot import POINTER_FILE, SnapshotReader, read_pointer, snapshot_dir
+
+
+class SnapshotStore(BaseMemoryStore):
+    """
+    Read-mostly store for pre-forked workers: reads come from a shared,
+    memory-mapped fabric snapshot and writes go to a primary store.
+
+    The published snapshot pointer is re-checked at most every
+    `refresh_seconds`, so workers switch to a new generation without a
+    restart. Records written or deleted through this store are read from
+    the primary store from then on, so a worker always sees its own writes.
+    The primary is meant to be worker-local (a fresh JSONL run file by
+    default); scans of a primary that also holds snapshot records return
+    those records once from each source.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, primary: Optional[MemoryStore] = None):
+        """
+        Initialize the snapshot store.
+
+        Args:
+            config: `snapshot_dir` (or IOA_FABRIC_SNAPSHOT_DIR) and
+                `snapshot_refresh_seconds` (or IOA_FABRIC_SNAPSHOT_REFRESH_S)
+            primary: Store that receives writes
+        """
+        super().__init__(config)
+        self.directory = snapshot_dir(self.config)
+        self.refresh_seconds = float(
+            self.config.get("snapshot_refresh_seconds", os.getenv("IOA_FABRIC_SNAPSHOT_REFRESH_S", "1"))
+        )
+        self.primary = primary
+        self._reader: Optional[SnapshotReader] = None
+        self._pointer_mtime: Optional[int] = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        # Ids whose current state lives in the primary store
+        self._local: Set[str] = set()
+        self._stats["generation"] = 0
+        self._stats["refreshes"] = 0
+        self.refresh(force=True)
+
+    @property
+    def generation(self) -> int:
+        """Generation of the mapped snapshot (0 if none is published)."""
+        return self._reader.generation if self._reader is not None else 0
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Map a newer published snapshot if there is one.
+
+        Returns:
+            True if a new generation was mapped
+        """
+        now = time.monotonic()
+        if not force and now - self._checked < self.refresh_seconds:
+            return False
+        self._checked = now
+        try:
+            mtime = os.stat(os.path.join(self.directory, POINTER_FILE)).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._pointer_mtime:
+            return False
+
+        with self._lock:
+            pointer = read_pointer(self.directory)
+            if pointer is None or int(pointer["generation"]) <= self.generation:
+                self._pointer_mtime = mtime
+                return False
+            reader = SnapshotReader(os.path.join(self.directory, str(pointer["file"])))
+            # The old map is released once no in-flight lookup references it
+            self._reader = reader
+            self._pointer_mtime = mtime
+        self._stats["generation"] = reader.generation
+        self._stats["refreshes"] += 1
+        return True
+
+    def _snapshot_get(self, record_id: str) -> Optional[MemoryRecordV1]:
+        self.refresh()
+        reader = self._reader
+        if record_id in self._local or reader is None:
+            return None
+        return reader.get(record_id)
+
+    def _snapshot_records(self) -> Iterator[MemoryRecordV1]:
+        self.refresh()
+        reader = self._reader
+        if reader is None:
+            return
+        for record in reader.iter_records():
+            if record.id not in self._local:
+                yield record
+
+    def _all_records(self) -> Dict[str, MemoryRecordV1]:
+        records = {record.id: record for record in self._snapshot_records()}
+        for batch in self.primary.iter_batches():
+            records.update((record.id, record) for record in batch)
+        return records
+
+    def store(self, record: MemoryRecordV1) -> bool:
+        """Write through to the primary store."""
+        self._local.add(record.id)
+        return self.primary.store(record)
+
+    def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Write through to the primary store."""
+        self._local.update(record.id for record in records)
+        return self.primary.store_many(records)
+
+    def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """Read from the snapshot, then the primary store."""
+        record = self._snapshot_get(record_id)
+        if record is None:
+            return self.primary.retrieve(record_id)
+        record.update_access()
+        self._update_stats("reads", True)
+        return record
+
+    def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records by ID without access tracking, preserving input order."""
+        found = {}
+        missing = []
+        for record_id in record_ids:
+            record = self._snapshot_get(record_id)
+            if record is None:
+                missing.append(record_id)
+            else:
+                found[record_id] = record
+        if missing:
+            found.update((record.id, record) for record in self.primary.get_many(missing))
+        self._update_stats("reads", True)
+        return [found[record_id] for record_id in record_ids if record_id in found]
+
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> int:
+        """Access counts of snapshot records are not persisted; the primary gets its own."""
+        return self.primary.record_accesses(accesses)
+
+    def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Token search of the snapshot merged with the primary store's search, projected to `fields`."""
+        self.refresh()
+        results = {}
+        reader = self._reader
+        if reader is not None:
+            for record in reader.search(query):
+                if record.id not in self._local and (not memory_type or record.memory_type.value == memory_type):
+                    results[record.id] = record
+        # The primary reads the projection plus the fields the merge ranks by
+        ranking = fields | {"access_count", "timestamp"} if fields is not None else None
+        for record in self.primary.search(query, limit, memory_type, ranking):
+            results[record.id] = record
+        ranked = sorted(results.values(), key=lambda r: (r.access_count, r.timestamp), reverse=True)
+        self._update_stats("queries", True)
+        return [project(record, fields) for record in ranked[:limit]]
+
+    def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Evaluate a query over the snapshot and the primary store's records."""
+        results, _ = run_in_memory(self._all_records(), query)
+        self._update_stats("queries", True)
+        return results
+
+    def explain(self, query: FabricQuery) -> Dict[str, Any]:
+        """The plan a query would follow."""
+        _, plan = run_in_memory({}, query)
+        plan.update({
+            "backend": "snapshot",
+            "access": f"snapshot scan (generation {self.generation}) plus primary store"
+        })
+        return plan
+
+    def delete(self, record_id: str) -> bool:
+        """Delete from the primary store and hide the snapshot copy."""
+        in_snapshot = self._snapshot_get(record_id) is not None
+        self._local.add(record_id)
+        return self.primary.delete(record_id) or in_snapshot
+
+    def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """Expire records of the primary store (the snapshot is read-only)."""
+        return self.primary.delete_expired(memory_type, cutoff, limit)
+
+    def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List snapshot and primary records, projected to `fields`."""
+        records = list(self._all_records().values())
+        self._update_stats("reads", True)
+        return [project(record, fields) for record in (records[:limit] if limit else records)]
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[MemoryRecordV1]]:
+        """Stream snapshot records, then the primary store's."""
+        batch: List[MemoryRecordV1] = []
+        for record in self._snapshot_records():
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        yield from self.primary.iter_batches(batch_size)
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Dedup counters of the primary store."""
+        return self.primary.dedup_stats()
+
+    def flush(self) -> None:
+        """Flush the primary store."""
+        if hasattr(self.primary, "flush"):
+            self.primary.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot generation and size, plus the primary store's statistics."""
+        stats = super().get_stats()
+        stats["snapshot_records"] = len(self._reader) if self._reader is not None else 0
+        stats["primary"] = self.primary.get_stats()
+        return stats
+
+    def close(self) -> None:
+        """Unmap the snapshot and close the primary store."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self.primary.close()
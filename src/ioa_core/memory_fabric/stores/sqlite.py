@@ -8,19 +8,54 @@
 
 import json
 import os
+import re
 import sqlite3
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, Tuple
 """Sqlite module."""
 
 from pathlib import Path
 
 from .base import BaseMemoryStore, MemoryStore
+from .group_commit import GroupCommitter
 from ..schema import MemoryRecordV1
+from ..query import FabricQuery, RELEVANCE, indexed_metadata_keys, json_path
+from ..dedup import dedup_enabled, dedup_key, dedup_summary
+from ..replication import SQLiteReplicator
 
 # PATCH: Cursor-2025-09-10 DISPATCH-OSS-20250910-MEMORY-FABRIC-REFACTOR <sqlite store>
 
+# Column order expected by SQLiteStore._row_to_record
+RECORD_COLUMNS = (
+    "id, content, metadata, timestamp, tags, storage_tier, memory_type, "
+    "access_count, last_accessed, embedding, schema_version"
+)
+
+
+def resolved_content(alias: str = "") -> str:
+    """SQL expression for a record's content, read from memory_content when deduplicated."""
+    return (
+        f"COALESCE((SELECT c.content FROM memory_content c WHERE c.hash = {alias}content_hash), "
+        f"{alias}content)"
+    )
+
+
+def record_columns(alias: str = "", fields: Optional[FrozenSet[str]] = None) -> str:
+    """
+    RECORD_COLUMNS with an optional table alias and content resolved.
+
+    Columns outside a `fields` projection are selected as NULL, so rows keep
+    their layout while SQLite skips reading (and resolving) their values.
+    """
+    def column_sql(column: str) -> str:
+        if fields is not None and column not in fields and column != "schema_version":
+            return "NULL"
+        return resolved_content(alias) if column == "content" else alias + column
+
+    return ", ".join(column_sql(column) for column in RECORD_COLUMNS.split(", "))
+
 class SQLiteStore(BaseMemoryStore):
     """SQLite storage implementation for Memory Fabric with WAL mode."""
     
@@ -34,7 +69,10 @@ def __init__(self, config: Optional[Dict[str, Any]] = None):
         # This enables production use cases where a single database is preferred
         db_name = (config or {}).get("db_name") or os.environ.get("IOA_MEMORY_DB_NAME")
         
-        if db_name:
+        if db_name == ":memory:":
+            # In-process database (e.g. the hot tier of a tiered fabric); nothing persists
+            self.db_path = Path(":memory:")
+        elif db_name:
             # Fixed database name (recommended for production)
             self.db_path = self.data_dir / db_name
         else:
@@ -42,8 +80,95 @@ def __init__(self, config: Optional[Dict[str, Any]] = None):
             run_id = str(uuid.uuid4())[:8]
             self.db_path = self.data_dir / f"memory_run_{run_id}.db"
         
+        # Metadata keys with expression indexes for query() pushdown
+        self.indexed_metadata = indexed_metadata_keys(self.config)
+        
+        # Content-addressed storage of new writes; reads resolve either layout
+        self.dedup = dedup_enabled(self.config)
+        
         self._connection = None
         self._init_database()
+        
+        # Concurrent writers share transactions; see GroupCommitter
+        self._committer = GroupCommitter.from_config(
+            self.config, self._commit, lambda: self._connection.rollback()
+        )
+        
+        # Read replicas: committed pages are shipped to each replica file and
+        # read-only queries go to the nearest one within the lag bound
+        replicas = self.config.get("replicas")
+        if replicas is None:
+            replicas = [path for path in os.getenv("IOA_SQLITE_REPLICAS", "").split(",") if path.strip()]
+        self.replica_max_lag = float(
+            self.config.get("replica_max_lag", os.getenv("IOA_SQLITE_REPLICA_MAX_LAG_S", "5"))
+        )
+        self._replica_connections: Dict[str, sqlite3.Connection] = {}
+        self._replicator: Optional[SQLiteReplicator] = None
+        if replicas:
+            self._replicator = SQLiteReplicator(
+                str(self.db_path),
+                [str(self.data_dir / path.strip()) for path in replicas],
+                interval=float(self.config.get("replica_interval", os.getenv("IOA_SQLITE_REPLICA_INTERVAL_S", "1")))
+            ).start()
+    
+    def _commit(self):
+        """Commit the open transaction and schedule it for shipping to replicas."""
+        self._connection.commit()
+        if self._replicator is not None:
+            self._replicator.notify()
+    
+    def _reader(self, read_your_writes: bool = False) -> sqlite3.Connection:
+        """
+        Connection for a read-only query: the nearest replica within the lag bound, else the primary.
+        
+        With `read_your_writes`, only a replica holding every commit of this
+        store qualifies, so lookups by id see the store's own writes (lag
+        only measures the age of missing commits, which is ~0 right after one).
+        """
+        if self._replicator is None:
+            return self._connection
+        for replica in self._replicator.replicas:
+            if read_your_writes:
+                if not self._replicator.caught_up(replica):
+                    continue
+            else:
+                lag = self._replicator.lag(replica)
+                if lag is None or lag > self.replica_max_lag:
+                    continue
+            connection = self._replica_connections.get(replica.path)
+            if connection is None:
+                connection = sqlite3.connect(f"file:{replica.path}?mode=ro", uri=True, check_same_thread=False)
+                self._replica_connections[replica.path] = connection
+            self._stats["replica_reads"] = self._stats.get("replica_reads", 0) + 1
+            return connection
+        self._stats["primary_reads"] = self._stats.get("primary_reads", 0) + 1
+        return self._connection
+    
+    def sync_replicas(self) -> int:
+        """
+        Ship committed writes to the replicas now instead of on the next pass.
+        
+        Returns:
+            Number of replicas updated
+        """
+        if self._replicator is None:
+            return 0
+        self.flush()
+        return self._replicator.sync()
+    
+    @contextmanager
+    def _savepoint(self):
+        """Scope a write inside the open group transaction; failures undo only this write."""
+        if not self._connection.in_transaction:
+            self._connection.execute("BEGIN")
+        self._connection.execute("SAVEPOINT record_write")
+        try:
+            yield
+        except Exception:
+            self._connection.execute("ROLLBACK TO record_write")
+            self._connection.execute("RELEASE record_write")
+            raise
+        self._connection.execute("RELEASE record_write")
     
     def _init_database(self):
         """Initialize the SQLite database with WAL mode and optional performance tuning."""
@@ -84,6 +209,19 @@ def _init_database(self):
                 )
             """)
             
+            # Deduplicated records keep their content in memory_content by hash
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(memory_records)")}
+            if "content_hash" not in columns:
+                self._connection.execute("ALTER TABLE memory_records ADD COLUMN content_hash TEXT")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS memory_content (
+                    hash TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    refcount INTEGER NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            
             # Create indexes for performance
             self._connection.execute("""
                 CREATE INDEX IF NOT EXISTS idx_memory_type ON memory_records(memory_type)
@@ -97,6 +235,38 @@ def _init_database(self):
             self._connection.execute("""
                 CREATE INDEX IF NOT EXISTS idx_access_count ON memory_records(access_count)
             """)
+            # Lets TTL sweeps seek straight to the oldest rows of one memory type
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memory_type_timestamp ON memory_records(memory_type, timestamp)
+            """)
+            
+            # Expression indexes over frequently filtered metadata keys
+            for key in self.indexed_metadata:
+                index_name = "idx_meta_" + re.sub(r"[^A-Za-z0-9_]", "_", key)
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON memory_records({self._metadata_expr(key, alias='')})"
+                )
+            
+            # Tag junction table; filled from existing rows when first created
+            has_tag_table = self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_tags'"
+            ).fetchone()
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS memory_tags (
+                    tag TEXT NOT NULL,
+                    record_id TEXT NOT NULL,
+                    PRIMARY KEY (tag, record_id)
+                ) WITHOUT ROWID
+            """)
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memory_tags_record ON memory_tags(record_id)
+            """)
+            if not has_tag_table:
+                self._connection.execute("""
+                    INSERT OR IGNORE INTO memory_tags (tag, record_id)
+                    SELECT j.value, m.id FROM memory_records m, json_each(m.tags) j
+                    WHERE m.tags IS NOT NULL
+                """)
             
             # Full-text search index
             self._connection.execute("""
@@ -122,87 +292,142 @@ def store(self, record: MemoryRecordV1) -> bool:
                 self._update_stats("writes", False)
                 return False
             
-            # Convert to database format
-            data = record.to_dict()
-            
-            cursor = self._connection.execute("""
-                INSERT OR REPLACE INTO memory_records 
-                (id, content, metadata, timestamp, tags, storage_tier, memory_type, 
-                 access_count, last_accessed, embedding, schema_version)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                record.id,
-                record.content,
-                json.dumps(record.metadata),
-                record.timestamp.isoformat(),
-                json.dumps(record.tags),
-                record.storage_tier.value,
-                record.memory_type.value,
-                record.access_count,
-                record.last_accessed.isoformat() if record.last_accessed else None,
-                json.dumps(record.embedding.to_dict()) if record.embedding else None,
-                record.__schema_version__
-            ))
-            
-            # Update FTS index
-            self._connection.execute("""
-                INSERT OR REPLACE INTO memory_fts (rowid, content, tags)
-                VALUES (?, ?, ?)
-            """, (
-                cursor.lastrowid,
-                record.content,
-                " ".join(record.tags)
-            ))
-            
-            self._connection.commit()
+            self._committer.submit(lambda: self._write_record(record))
             self._update_stats("writes", True)
             self._stats["total_records"] += 1
             return True
             
         except Exception as e:
-            self._connection.rollback()
             self._update_stats("writes", False)
             return False
     
+    def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Store records in a single transaction with one commit."""
+        valid = [record for record in records if self._validate_record(record)]
+        try:
+            with self._committer.lock:
+                with self._savepoint():
+                    for record in valid:
+                        self._insert_record(record)
+                self._committer.commit()
+        except Exception as e:
+            self._update_stats("writes", False)
+            return 0
+        
+        self._stats["writes"] += len(valid)
+        self._stats["total_records"] += len(valid)
+        return len(valid)
+    
+    def _write_record(self, record: MemoryRecordV1):
+        """Write one record in its own savepoint of the open transaction."""
+        with self._savepoint():
+            self._insert_record(record)
+    
+    def _insert_record(self, record: MemoryRecordV1):
+        """Insert or replace a record and its FTS row without committing."""
+        previous = self._connection.execute(
+            "SELECT content_hash FROM memory_records WHERE id = ?", (record.id,)
+        ).fetchone()
+        
+        stored_content, digest = record.content, None
+        if self.dedup:
+            digest = dedup_key(record)
+            self._connection.execute("""
+                INSERT INTO memory_content (hash, content, refcount, size) VALUES (?, ?, 1, ?)
+                ON CONFLICT(hash) DO UPDATE SET refcount = refcount + 1
+            """, (digest, record.content, len(record.content.encode("utf-8"))))
+            # Equal plaintexts encrypt differently; keep the first ciphertext
+            record.content = self._connection.execute(
+                "SELECT content FROM memory_content WHERE hash = ?", (digest,)
+            ).fetchone()[0]
+            stored_content = ""
+        
+        cursor = self._connection.execute("""
+            INSERT OR REPLACE INTO memory_records 
+            (id, content, metadata, timestamp, tags, storage_tier, memory_type, 
+             access_count, last_accessed, embedding, schema_version, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            record.id,
+            stored_content,
+            json.dumps(record.metadata),
+            record.timestamp.isoformat(),
+            json.dumps(record.tags),
+            record.storage_tier.value,
+            record.memory_type.value,
+            record.access_count,
+            record.last_accessed.isoformat() if record.last_accessed else None,
+            json.dumps(record.embedding.to_dict()) if record.embedding else None,
+            record.__schema_version__,
+            digest
+        ))
+        if previous and previous[0]:
+            self._release_content([previous[0]])
+
+        # Update FTS index
+        self._connection.execute("""
+            INSERT OR REPLACE INTO memory_fts (rowid, content, tags)
+            VALUES (?, ?, ?)
+        """, (
+            cursor.lastrowid,
+            record.content,
+            " ".join(record.tags)
+        ))
+        
+        # Update tag junction rows
+        self._connection.execute("DELETE FROM memory_tags WHERE record_id = ?", (record.id,))
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO memory_tags (tag, record_id) VALUES (?, ?)",
+            [(tag, record.id) for tag in set(record.tags)]
+        )
+    
+    def _release_content(self, hashes: List[str]):
+        """Drop one reference per hash, deleting content nobody references."""
+        rows = [(digest,) for digest in hashes if digest]
+        self._connection.executemany("UPDATE memory_content SET refcount = refcount - 1 WHERE hash = ?", rows)
+        self._connection.executemany("DELETE FROM memory_content WHERE hash = ? AND refcount <= 0", rows)
+    
+    def _row_to_record(self, row: tuple) -> MemoryRecordV1:
+        """Convert a row selected with RECORD_COLUMNS to a record."""
+        # Columns left out of a projection are NULL and keep the record defaults
+        return MemoryRecordV1.from_dict({
+            "id": row[0],
+            "content": row[1] if row[1] is not None else "",
+            "metadata": json.loads(row[2]) if row[2] else {},
+            "timestamp": row[3],
+            "tags": json.loads(row[4]) if row[4] else [],
+            "storage_tier": row[5] or "hot",
+            "memory_type": row[6] or "conversation",
+            "access_count": row[7] or 0,
+            "last_accessed": row[8],
+            "embedding": json.loads(row[9]) if row[9] else None,
+            "__schema_version__": row[10]
+        })
+    
     def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
         """Retrieve a memory record by ID."""
         try:
-            cursor = self._connection.execute("""
-                SELECT id, content, metadata, timestamp, tags, storage_tier, memory_type,
-                       access_count, last_accessed, embedding, schema_version
-                FROM memory_records WHERE id = ?
-            """, (record_id,))
+            cursor = self._reader(read_your_writes=True).execute(
+                f"SELECT {record_columns()} FROM memory_records WHERE id = ?", (record_id,)
+            )
             
             row = cursor.fetchone()
             if not row:
                 self._update_stats("reads", False)
                 return None
             
-            # Convert from database format
-            data = {
-                "id": row[0],
-                "content": row[1],
-                "metadata": json.loads(row[2]) if row[2] else {},
-                "timestamp": row[3],
-                "tags": json.loads(row[4]) if row[4] else [],
-                "storage_tier": row[5],
-                "memory_type": row[6],
-                "access_count": row[7],
-                "last_accessed": row[8],
-                "embedding": json.loads(row[9]) if row[9] else None,
-                "__schema_version__": row[10]
-            }
-            
-            record = MemoryRecordV1.from_dict(data)
+            record = self._row_to_record(row)
             record.update_access()
             
             # Update access count in database
-            self._connection.execute("""
-                UPDATE memory_records 
-                SET access_count = ?, last_accessed = ?
-                WHERE id = ?
-            """, (record.access_count, record.last_accessed.isoformat(), record_id))
-            self._connection.commit()
+            with self._committer.lock:
+                with self._savepoint():
+                    self._connection.execute("""
+                        UPDATE memory_records 
+                        SET access_count = access_count + 1, last_accessed = ?
+                        WHERE id = ?
+                    """, (record.last_accessed.isoformat(), record_id))
+                self._committer.commit()
             
             self._update_stats("reads", True)
             return record
@@ -211,13 +436,53 @@ def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
             self._update_stats("reads", False)
             return None
     
-    def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None) -> List[MemoryRecordV1]:
-        """Search for memory records using FTS."""
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> int:
+        """Apply write-behind access counts in one transaction."""
+        rows = [
+            (count, accessed_at.isoformat(), record_id)
+            for record_id, (count, accessed_at) in accesses.items()
+        ]
+        with self._committer.lock:
+            with self._savepoint():
+                self._connection.executemany("""
+                    UPDATE memory_records
+                    SET access_count = access_count + ?, last_accessed = ?
+                    WHERE id = ?
+                """, rows)
+            self._committer.commit()
+        return len(rows)
+    
+    def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records by ID without access tracking, preserving input order."""
+        try:
+            found: Dict[str, MemoryRecordV1] = {}
+            reader = self._reader(read_your_writes=True)
+            # Stay well below SQLITE_MAX_VARIABLE_NUMBER
+            for start in range(0, len(record_ids), 500):
+                chunk = record_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = reader.execute(
+                    f"SELECT {record_columns()} FROM memory_records WHERE id IN ({placeholders})",
+                    chunk
+                )
+                for row in cursor.fetchall():
+                    found[row[0]] = self._row_to_record(row)
+            
+            self._update_stats("reads", True)
+            return [found[record_id] for record_id in record_ids if record_id in found]
+            
+        except Exception as e:
+            self._update_stats("reads", False)
+            return []
+    
+    def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Search for memory records using FTS, selecting only `fields`."""
         try:
             # Build query with optional memory_type filter
-            sql = """
-                SELECT m.id, m.content, m.metadata, m.timestamp, m.tags, m.storage_tier, 
-                       m.memory_type, m.access_count, m.last_accessed, m.embedding, m.schema_version
+            sql = f"""
+                SELECT {record_columns('m.', fields)}
                 FROM memory_records m
                 JOIN memory_fts f ON m.rowid = f.rowid
                 WHERE memory_fts MATCH ?
@@ -231,24 +496,11 @@ def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None)
             sql += " ORDER BY m.access_count DESC, m.timestamp DESC LIMIT ?"
             params.append(limit)
             
-            cursor = self._connection.execute(sql, params)
+            cursor = self._reader().execute(sql, params)
             results = []
             
             for row in cursor.fetchall():
-                data = {
-                    "id": row[0],
-                    "content": row[1],
-                    "metadata": json.loads(row[2]) if row[2] else {},
-                    "timestamp": row[3],
-                    "tags": json.loads(row[4]) if row[4] else [],
-                    "storage_tier": row[5],
-                    "memory_type": row[6],
-                    "access_count": row[7],
-                    "last_accessed": row[8],
-                    "embedding": json.loads(row[9]) if row[9] else None,
-                    "__schema_version__": row[10]
-                }
-                results.append(MemoryRecordV1.from_dict(data))
+                results.append(self._row_to_record(row))
             
             self._update_stats("queries", True)
             return results
@@ -257,62 +509,216 @@ def search(self, query: str, limit: int = 10, memory_type: Optional[str] = None)
             self._update_stats("queries", False)
             return []
     
+    @staticmethod
+    def _metadata_expr(key: str, alias: str = "m.") -> str:
+        """SQL expression for a metadata key; matches the expression indexes."""
+        path = json_path(key).replace("'", "''")
+        return f"json_extract({alias}metadata, '{path}')"
+    
+    def _compile_query(self, query: FabricQuery):
+        """Translate a FabricQuery into SQL with every filter pushed down."""
+        sql = f"SELECT {record_columns('m.', query.fields)} FROM memory_records m"
+        where: List[str] = []
+        params: List[Any] = []
+        if query.text:
+            sql += " JOIN memory_fts f ON m.rowid = f.rowid"
+            where.append("memory_fts MATCH ?")
+            params.append(query.text)
+        
+        for condition in query.conditions:
+            value = condition.value.isoformat() if isinstance(condition.value, datetime) else condition.value
+            if condition.kind == "tag":
+                if condition.op == "exists":
+                    clause = "m.id IN (SELECT record_id FROM memory_tags)"
+                    where.append(clause if value else f"NOT {clause}")
+                elif condition.op == "in":
+                    where.append(
+                        f"m.id IN (SELECT record_id FROM memory_tags WHERE tag IN ({','.join('?' * len(value))}))"
+                    )
+                    params.extend(value)
+                else:
+                    where.append("m.id IN (SELECT record_id FROM memory_tags WHERE tag = ?)")
+                    params.append(value)
+                continue
+            
+            if condition.kind == "metadata":
+                expr = self._metadata_expr(condition.name)
+            else:
+                expr = f"m.{condition.name}"
+            
+            if condition.op == "exists":
+                path = json_path(condition.name).replace("'", "''")
+                clause = f"json_type(m.metadata, '{path}') IS NOT NULL"
+                where.append(clause if value else f"NOT ({clause})")
+            elif condition.op == "in":
+                values = [v.isoformat() if isinstance(v, datetime) else v for v in value]
+                where.append(f"{expr} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+            elif condition.op == "eq" and value is None:
+                where.append(f"{expr} IS NULL")
+            elif condition.op == "eq":
+                where.append(f"{expr} = ?")
+                params.append(value)
+            elif condition.op == "ne":
+                where.append(f"({expr} IS NULL OR {expr} != ?)")
+                params.append(value)
+            else:
+                operator = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}[condition.op]
+                where.append(f"{expr} {operator} ?")
+                params.append(value)
+        
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        
+        order = []
+        for name, descending in query.ordering:
+            if name == RELEVANCE:
+                order.append("f.rank")
+                continue
+            if name in ("tags", "tag"):
+                raise ValueError("Cannot order by tags")
+            if name in ("id", "memory_type", "storage_tier", "timestamp", "access_count", "last_accessed"):
+                expr = f"m.{name}"
+            else:
+                expr = self._metadata_expr(name[len("metadata."):] if name.startswith("metadata.") else name)
+            order.append(f"{expr} {'DESC' if descending else 'ASC'}")
+        if order:
+            sql += " ORDER BY " + ", ".join(order)
+        if query.limit is not None:
+            sql += " LIMIT ?"
+            params.append(query.limit)
+        return sql, params
+    
+    def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Run a query with filters, ordering and limit evaluated by SQLite."""
+        sql, params = self._compile_query(query)
+        try:
+            rows = self._reader().execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            self._update_stats("queries", False)
+            raise
+        self._update_stats("queries", True)
+        return [self._row_to_record(row) for row in rows]
+    
+    def explain(self, query: FabricQuery) -> Dict[str, Any]:
+        """The SQL a query compiles to and SQLite's query plan for it."""
+        sql, params = self._compile_query(query)
+        plan = self._connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        details = [row[-1] for row in plan]
+        return {
+            "backend": "sqlite",
+            "sql": sql,
+            "params": params,
+            "plan": details,
+            "indexes": sorted({
+                match.group(1) for detail in details
+                for match in [re.search(r"USING (?:COVERING )?INDEX (\w+)", detail)] if match
+            }),
+            "filters": [condition.describe() for condition in query.conditions],
+            "residual": []
+        }
+    
     def delete(self, record_id: str) -> bool:
         """Delete a memory record."""
         try:
-            cursor = self._connection.execute("SELECT rowid FROM memory_records WHERE id = ?", (record_id,))
-            row = cursor.fetchone()
-            
-            if not row:
-                return False
-            
-            # Delete from main table
-            self._connection.execute("DELETE FROM memory_records WHERE id = ?", (record_id,))
-            
-            # Delete from FTS index
-            self._connection.execute("DELETE FROM memory_fts WHERE rowid = ?", (row[0],))
-            
-            self._connection.commit()
+            with self._committer.lock:
+                cursor = self._connection.execute(
+                    "SELECT rowid, content_hash FROM memory_records WHERE id = ?", (record_id,)
+                )
+                row = cursor.fetchone()
+                
+                if not row:
+                    return False
+                
+                with self._savepoint():
+                    # Delete from main table
+                    self._connection.execute("DELETE FROM memory_records WHERE id = ?", (record_id,))
+                    
+                    # Delete from FTS index
+                    self._connection.execute("DELETE FROM memory_fts WHERE rowid = ?", (row[0],))
+                    self._connection.execute("DELETE FROM memory_tags WHERE record_id = ?", (record_id,))
+                    self._release_content([row[1]])
+                
+                self._committer.commit()
             self._stats["total_records"] = max(0, self._stats["total_records"] - 1)
             return True
             
         except Exception as e:
-            self._connection.rollback()
             self._update_stats("errors", False)
             return False
     
-    def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
-        """List all memory records."""
+    def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """
+        Delete up to ``limit`` records of a memory type older than ``cutoff``.
+        
+        Runs as one bounded transaction driven by the timestamp index, so a
+        sweep never holds the write lock for an unbounded amount of work.
+        
+        Returns:
+            IDs of the deleted records
+        """
         try:
-            sql = """
-                SELECT id, content, metadata, timestamp, tags, storage_tier, memory_type,
-                       access_count, last_accessed, embedding, schema_version
+            with self._committer.lock:
+                cursor = self._connection.execute("""
+                    SELECT rowid, id, content_hash FROM memory_records
+                    WHERE memory_type = ? AND timestamp < ?
+                    ORDER BY timestamp
+                    LIMIT ?
+                """, (memory_type, cutoff.isoformat(), limit))
+                rows = cursor.fetchall()
+                if not rows:
+                    return []
+                
+                rowids = [(row[0],) for row in rows]
+                with self._savepoint():
+                    self._connection.executemany("DELETE FROM memory_records WHERE rowid = ?", rowids)
+                    self._connection.executemany("DELETE FROM memory_fts WHERE rowid = ?", rowids)
+                    self._connection.executemany(
+                        "DELETE FROM memory_tags WHERE record_id = ?", [(row[1],) for row in rows]
+                    )
+                    self._release_content([row[2] for row in rows])
+                self._committer.commit()
+            
+            self._stats["total_records"] = max(0, self._stats["total_records"] - len(rows))
+            return [row[1] for row in rows]
+            
+        except Exception as e:
+            self._update_stats("errors", False)
+            return []
+    
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[MemoryRecordV1]]:
+        """Stream records in rowid order using keyset pagination."""
+        last_rowid = 0
+        while True:
+            rows = self._connection.execute(
+                f"SELECT rowid, {record_columns()} FROM memory_records WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            self._update_stats("reads", True)
+            yield [self._row_to_record(row[1:]) for row in rows]
+    
+    def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List all memory records, selecting only `fields`."""
+        try:
+            sql = f"""
+                SELECT {record_columns(fields=fields)}
                 FROM memory_records
                 ORDER BY access_count DESC, timestamp DESC
             """
             
+            reader = self._reader()
             if limit:
                 sql += " LIMIT ?"
-                cursor = self._connection.execute(sql, (limit,))
+                cursor = reader.execute(sql, (limit,))
             else:
-                cursor = self._connection.execute(sql)
+                cursor = reader.execute(sql)
             
             results = []
             for row in cursor.fetchall():
-                data = {
-                    "id": row[0],
-                    "content": row[1],
-                    "metadata": json.loads(row[2]) if row[2] else {},
-                    "timestamp": row[3],
-                    "tags": json.loads(row[4]) if row[4] else [],
-                    "storage_tier": row[5],
-                    "memory_type": row[6],
-                    "access_count": row[7],
-                    "last_accessed": row[8],
-                    "embedding": json.loads(row[9]) if row[9] else None,
-                    "__schema_version__": row[10]
-                }
-                results.append(MemoryRecordV1.from_dict(data))
+                results.append(self._row_to_record(row))
             
             self._update_stats("reads", True)
             return results
@@ -321,9 +727,60 @@ def list_all(self, limit: Optional[int] = None) -> List[MemoryRecordV1]:
             self._update_stats("reads", False)
             return []
     
+    def flush(self) -> None:
+        """Commit the open group-commit batch, if any."""
+        if self._connection:
+            self._committer.commit()
+    
+    def count(self) -> int:
+        """Number of stored records."""
+        self.flush()
+        return self._reader(read_your_writes=True).execute("SELECT COUNT(*) FROM memory_records").fetchone()[0]
+    
+    def verify(self) -> List[str]:
+        """Problems reported by SQLite's quick_check (empty when the file is sound)."""
+        self.flush()
+        rows = [row[0] for row in self._connection.execute("PRAGMA quick_check")]
+        return [] if rows == ["ok"] else rows
+    
+    def compact(self) -> None:
+        """Merge the full-text index, rebuild the database file and truncate the WAL."""
+        with self._committer.lock:
+            self._committer.commit()
+            self._connection.execute("INSERT INTO memory_fts(memory_fts) VALUES('optimize')")
+            self._connection.commit()
+            self._connection.execute("VACUUM")
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        if self._replicator is not None:
+            self._replicator.notify()
+    
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Unique contents, references and the logical/stored byte ratio."""
+        row = self._connection.execute("""
+            SELECT COUNT(*), COALESCE(SUM(refcount), 0), COALESCE(SUM(size), 0), COALESCE(SUM(size * refcount), 0)
+            FROM memory_content
+        """).fetchone()
+        return dedup_summary(*row)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get storage statistics, including group-commit batching and replica lag."""
+        stats = super().get_stats()
+        stats["group_commit"] = self._committer.get_stats()
+        if self._replicator is not None:
+            stats["replication"] = self._replicator.status()
+            stats["replication"]["max_lag_allowed"] = self.replica_max_lag
+        return stats
+    
     def close(self) -> None:
         """Close the store and cleanup resources."""
         if self._connection:
+            self.flush()
+            if self._replicator is not None:
+                self._replicator.stop()
+                self._replicator = None
+            for connection in self._replica_connections.values():
+                connection.close()
+            self._replica_connections.clear()
             self._connection.close()
             self._connection = None
     
@@ -0,0 +1,403 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2025 OrchIntel Systems Ltd.
+# https://orchintel.com | https://ioa.systems
+#
+# Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from typing import Callable, List, Optional, Dict, Any, FrozenSet, Iterator, Tuple
+"""Tiered store module."""
+
+from .base import BaseMemoryStore, MemoryStore
+from ..schema import MemoryRecordV1, StorageTier
+from ..query import FabricQuery, project, run_in_memory
+from ..dedup import dedup_summary
+from ..tiering_4d import Tier4D
+
+logger = logging.getLogger(__name__)
+
+TIERS = ("hot", "cold")
+
+
+class TieredStore(BaseMemoryStore):
+    """
+    Hot/cold store: COLD records live in a cheap cold store and everything
+    else in a fast hot store.
+
+    Reads check the hot tier first and fall back to the cold tier. A cold hit
+    is re-scored with Tier4D, with the record's previous access time as the
+    temporal dimension, and promoted to the hot tier unless it still scores
+    COLD. A record read again within the policy's hot window therefore moves
+    up; a one-off scan of old data does not. demote() moves hot records that
+    score COLD the other way.
+
+    With `prefetch` > 0, each cold hit also loads related cold records
+    (shared tags, and ids listed in metadata `related_ids`) in the
+    background, so follow-up reads skip the cold round trip.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        hot: Optional[MemoryStore] = None,
+        cold: Optional[MemoryStore] = None,
+        scorer: Optional[Tier4D] = None,
+        on_tier_change: Optional[Callable[[List[str], str], None]] = None
+    ):
+        """
+        Initialize the tiered store.
+
+        Args:
+            config: Fabric config; its `tiering` dict sets `promote` (default
+                True), `prefetch` (related records per cold hit, default 0 or
+                IOA_FABRIC_TIER_PREFETCH) and `prefetch_buffer` (default 1024)
+            hot: Store of HOT and AUTO records
+            cold: Store of COLD records
+            scorer: Tier4D engine used to promote and demote
+            on_tier_change: Called with the moved ids and their new tier
+                ("hot" or "cold") after promotions and demotions
+        """
+        super().__init__(config)
+        tiering = self.config.get("tiering") or {}
+        self.hot = hot
+        self.cold = cold
+        self.scorer = scorer or Tier4D()
+        self.on_tier_change = on_tier_change
+        self.promote = bool(tiering.get("promote", True))
+        self.prefetch_limit = int(tiering.get("prefetch", os.getenv("IOA_FABRIC_TIER_PREFETCH", "0")))
+        self.prefetch_buffer = int(tiering.get("prefetch_buffer", 1024))
+        self._stores = {"hot": hot, "cold": cold}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Prefetched cold records, and writes that must not be overwritten by
+        # a prefetch that started before them
+        self._prefetched: "OrderedDict[str, MemoryRecordV1]" = OrderedDict()
+        self._write_seq = 0
+        self._written: Dict[str, int] = {}
+        self._prefetches_running = 0
+        self._latency = {tier: deque(maxlen=1024) for tier in TIERS}
+        self._tier_stats = {tier: {"reads": 0, "hits": 0} for tier in TIERS}
+        self._stats.update({"promotions": 0, "demotions": 0, "prefetched": 0, "prefetch_hits": 0})
+
+    @staticmethod
+    def tier_of(record: MemoryRecordV1) -> str:
+        """Tier a record is stored in."""
+        return "cold" if record.storage_tier == StorageTier.COLD else "hot"
+
+    def _timed(self, tier: str, fn, *args):
+        started = time.perf_counter()
+        result = fn(*args)
+        self._latency[tier].append((time.perf_counter() - started) * 1000)
+        self._tier_stats[tier]["reads"] += 1
+        if result:
+            self._tier_stats[tier]["hits"] += 1
+        return result
+
+    def _note_writes(self, record_ids) -> None:
+        with self._lock:
+            self._write_seq += 1
+            for record_id in record_ids:
+                self._prefetched.pop(record_id, None)
+                if self._prefetches_running:
+                    self._written[record_id] = self._write_seq
+
+    def score(self, record: MemoryRecordV1) -> str:
+        """
+        Tier4D class of a record, aged from its last access (or creation).
+
+        Returns:
+            'HOT', 'WARM' or 'COLD'
+        """
+        last_seen = record.last_accessed or record.timestamp
+        view = type("TierView", (), {"metadata": dict(record.metadata, timestamp=last_seen.isoformat())})()
+        return self.scorer.classify(view)
+
+    def store(self, record: MemoryRecordV1) -> bool:
+        """Store a record in the tier its storage_tier selects."""
+        self._note_writes([record.id])
+        tier = self.tier_of(record)
+        if not self._stores[tier].store(record):
+            return False
+        if tier == "cold":
+            # A stale hot copy would shadow the cold write
+            self.hot.delete(record.id)
+        self._update_stats("writes", True)
+        return True
+
+    def store_many(self, records: List[MemoryRecordV1]) -> int:
+        """Store records in bulk, one bulk write per tier."""
+        self._note_writes(record.id for record in records)
+        by_tier = {tier: [record for record in records if self.tier_of(record) == tier] for tier in TIERS}
+        stored = 0
+        for tier in TIERS:
+            if by_tier[tier]:
+                stored += self._stores[tier].store_many(by_tier[tier])
+        for record in by_tier["cold"]:
+            self.hot.delete(record.id)
+        self._stats["writes"] += stored
+        return stored
+
+    def retrieve(self, record_id: str) -> Optional[MemoryRecordV1]:
+        """Read from the hot tier, then the prefetch buffer, then the cold tier."""
+        record = self._timed("hot", self.hot.retrieve, record_id)
+        if record is not None:
+            self._update_stats("reads", True)
+            return record
+
+        with self._lock:
+            record = self._prefetched.pop(record_id, None)
+        if record is not None:
+            self._stats["prefetch_hits"] += 1
+        else:
+            found = self._timed("cold", self.cold.get_many, [record_id])
+            if not found:
+                self._update_stats("reads", False)
+                return None
+            record = found[0]
+
+        promote = self.promote and self.score(record) != "COLD"
+        record.update_access()
+        if promote:
+            self._promote(record)
+        else:
+            self.cold.record_accesses({record_id: (1, record.last_accessed)})
+        if self.prefetch_limit > 0:
+            self._schedule_prefetch(record)
+        self._update_stats("reads", True)
+        return record
+
+    def _promote(self, record: MemoryRecordV1) -> None:
+        """Move a cold record to the hot tier (written hot first, so a crash leaves a shadowed copy, not a loss)."""
+        record.storage_tier = StorageTier.HOT
+        if self.hot.store(record):
+            self.cold.delete(record.id)
+            self._stats["promotions"] += 1
+            if self.on_tier_change is not None:
+                self.on_tier_change([record.id], "hot")
+        else:
+            record.storage_tier = StorageTier.COLD
+
+    def _schedule_prefetch(self, record: MemoryRecordV1) -> None:
+        if not record.tags and not record.metadata.get("related_ids"):
+            return
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ioa-fabric-prefetch")
+            self._prefetches_running += 1
+            started = self._write_seq
+        self._executor.submit(self._prefetch, record, started)
+
+    def _prefetch(self, record: MemoryRecordV1, started: int) -> None:
+        """Load cold records related to `record` into the prefetch buffer."""
+        try:
+            related: Dict[str, MemoryRecordV1] = {}
+            related_ids = [str(record_id) for record_id in record.metadata.get("related_ids", [])]
+            if related_ids:
+                related.update((r.id, r) for r in self.cold.get_many(related_ids[:self.prefetch_limit]))
+            if record.tags and len(related) < self.prefetch_limit:
+                query = FabricQuery(filters={"tags": {"in": list(record.tags)}}, limit=self.prefetch_limit + 1)
+                related.update((r.id, r) for r in self.cold.query(query))
+            related.pop(record.id, None)
+            with self._lock:
+                for record_id, found in list(related.items())[:self.prefetch_limit]:
+                    if self._written.get(record_id, 0) > started:
+                        continue
+                    self._prefetched[record_id] = found
+                    self._prefetched.move_to_end(record_id)
+                    self._stats["prefetched"] += 1
+                while len(self._prefetched) > self.prefetch_buffer:
+                    self._prefetched.popitem(last=False)
+        except Exception as e:
+            logger.warning(f"Prefetch of records related to {record.id} failed: {e}")
+        finally:
+            with self._lock:
+                self._prefetches_running -= 1
+                if not self._prefetches_running:
+                    self._written.clear()
+
+    def get_many(self, record_ids: List[str]) -> List[MemoryRecordV1]:
+        """Fetch records by ID without access tracking, preserving input order."""
+        found = {record.id: record for record in self._timed("hot", self.hot.get_many, record_ids)}
+        missing = [record_id for record_id in record_ids if record_id not in found]
+        if missing:
+            found.update((record.id, record) for record in self._timed("cold", self.cold.get_many, missing))
+        self._update_stats("reads", True)
+        return [found[record_id] for record_id in record_ids if record_id in found]
+
+    def record_accesses(self, accesses: Dict[str, Tuple[int, datetime]]) -> int:
+        """Apply write-behind access counts in whichever tier holds each record."""
+        hot_ids = {record.id for record in self.hot.get_many(list(accesses))}
+        hot = {record_id: access for record_id, access in accesses.items() if record_id in hot_ids}
+        cold = {record_id: access for record_id, access in accesses.items() if record_id not in hot_ids}
+        return (self.hot.record_accesses(hot) if hot else 0) + (self.cold.record_accesses(cold) if cold else 0)
+
+    def _merged(self, hot: List[MemoryRecordV1], cold: List[MemoryRecordV1]) -> Dict[str, MemoryRecordV1]:
+        """Records of both tiers by id; a hot copy shadows a cold one."""
+        records = {record.id: record for record in cold}
+        records.update((record.id, record) for record in hot)
+        return records
+
+    def search(
+        self, query: str, limit: int = 10, memory_type: Optional[str] = None, fields: Optional[FrozenSet[str]] = None
+    ) -> List[MemoryRecordV1]:
+        """Search both tiers and merge by access count and recency, projected to `fields`."""
+        # Each tier reads the projection plus the fields the merge ranks by
+        ranking = fields | {"access_count", "timestamp"} if fields is not None else None
+        records = self._merged(
+            self.hot.search(query, limit, memory_type, ranking), self.cold.search(query, limit, memory_type, ranking)
+        )
+        ranked = sorted(records.values(), key=lambda r: (r.access_count, r.timestamp), reverse=True)
+        self._update_stats("queries", True)
+        return [project(record, fields) for record in ranked[:limit]]
+
+    def query(self, query: FabricQuery) -> List[MemoryRecordV1]:
+        """Run a query in each tier (each pushes it down) and merge the results."""
+        # The merge re-applies filters and ordering, so the tiers read whole records
+        whole = replace(query, fields=None)
+        results, _ = run_in_memory(self._merged(self.hot.query(whole), self.cold.query(whole)), query)
+        self._update_stats("queries", True)
+        return results
+
+    def explain(self, query: FabricQuery) -> Dict[str, Any]:
+        """Plans of both tiers."""
+        _, plan = run_in_memory({}, query)
+        plan.update({
+            "backend": "tiered",
+            "access": "both tiers, merged",
+            "hot": self.hot.explain(query),
+            "cold": self.cold.explain(query)
+        })
+        return plan
+
+    def delete(self, record_id: str) -> bool:
+        """Delete a record from both tiers."""
+        self._note_writes([record_id])
+        hot = self.hot.delete(record_id)
+        cold = self.cold.delete(record_id)
+        return hot or cold
+
+    def delete_expired(self, memory_type: str, cutoff: datetime, limit: int = 1000) -> List[str]:
+        """Expire records of the hot tier, then the cold tier, up to `limit` in total."""
+        deleted = self.hot.delete_expired(memory_type, cutoff, limit)
+        if len(deleted) < limit:
+            deleted += self.cold.delete_expired(memory_type, cutoff, limit - len(deleted))
+        self._note_writes(deleted)
+        return deleted
+
+    def demote(self, batch_size: int = 1000, progress: Optional[Callable[[int], None]] = None) -> List[str]:
+        """
+        Move hot records that score COLD to the cold tier.
+
+        Each batch is written to the cold tier before it is removed from the
+        hot tier, so an interrupted run leaves copies, never gaps.
+
+        Args:
+            batch_size: Hot records scored per batch
+            progress: Called with the number of hot records scored in each batch
+
+        Returns:
+            IDs of the demoted records
+        """
+        demoted: List[str] = []
+        for batch in self.hot.iter_batches(batch_size):
+            moving = [record for record in batch if self.score(record) == "COLD"]
+            if progress is not None:
+                progress(len(batch))
+            if not moving:
+                continue
+            for record in moving:
+                record.storage_tier = StorageTier.COLD
+            self._note_writes(record.id for record in moving)
+            if self.cold.store_many(moving) != len(moving):
+                raise RuntimeError("Cold tier rejected demoted records")
+            for record in moving:
+                self.hot.delete(record.id)
+            demoted.extend(record.id for record in moving)
+            if self.on_tier_change is not None:
+                self.on_tier_change([record.id for record in moving], "cold")
+        self._stats["demotions"] += len(demoted)
+        return demoted
+
+    def list_all(self, limit: Optional[int] = None, fields: Optional[FrozenSet[str]] = None) -> List[MemoryRecordV1]:
+        """List records of both tiers, reading only `fields`."""
+        records = list(self._merged(self.hot.list_all(fields=fields), self.cold.list_all(fields=fields)).values())
+        self._update_stats("reads", True)
+        return records[:limit] if limit else records
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[MemoryRecordV1]]:
+        """Stream hot records, then cold records not shadowed by a hot copy."""
+        yield from self.hot.iter_batches(batch_size)
+        for batch in self.cold.iter_batches(batch_size):
+            shadowed = {record.id for record in self.hot.get_many([record.id for record in batch])}
+            batch = [record for record in batch if record.id not in shadowed]
+            if batch:
+                yield batch
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Dedup counters of both tiers combined."""
+        hot, cold = self.hot.dedup_stats(), self.cold.dedup_stats()
+        return dedup_summary(*(
+            hot.get(key, 0) + cold.get(key, 0)
+            for key in ("unique_contents", "references", "stored_bytes", "logical_bytes")
+        ))
+
+    def flush(self) -> None:
+        """Flush both tiers."""
+        for store in self._stores.values():
+            if hasattr(store, "flush"):
+                store.flush()
+
+    def count(self) -> Optional[int]:
+        """Records in both tiers (None unless both tiers can count; shadowed copies count twice)."""
+        if not all(hasattr(store, "count") for store in self._stores.values()):
+            return None
+        return self.hot.count() + self.cold.count()
+
+    def verify(self) -> List[str]:
+        """Integrity problems of each tier that can check itself, prefixed with the tier."""
+        return [
+            f"{tier}: {problem}"
+            for tier, store in self._stores.items() if hasattr(store, "verify")
+            for problem in store.verify()
+        ]
+
+    def compact(self) -> None:
+        """Compact each tier that supports it."""
+        for store in self._stores.values():
+            if hasattr(store, "compact"):
+                store.compact()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-tier read counts, hit rates and latency percentiles, plus each store's statistics."""
+        stats = super().get_stats()
+        stats["tiers"] = {}
+        for tier in TIERS:
+            store_stats = self._stores[tier].get_stats()
+            latencies = sorted(self._latency[tier])
+            tier_stats = dict(self._tier_stats[tier])
+            tier_stats["latency_ms"] = {
+                "p50": latencies[len(latencies) // 2] if latencies else 0.0,
+                "p95": latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+            }
+            tier_stats["store"] = store_stats
+            stats["tiers"][tier] = tier_stats
+        stats["total_records"] = sum(stats["tiers"][tier]["store"].get("total_records", 0) for tier in TIERS)
+        stats["prefetch_buffer"] = len(self._prefetched)
+        return stats
+
+    def close(self) -> None:
+        """Stop prefetching and close both tiers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.hot.close()
+        self.cold.close()
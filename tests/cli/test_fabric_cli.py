@@ -0,0 +1,143 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from click.testing import CliRunner
+
+from ioa_core.cli import app
+from ioa_core.memory_fabric.fabric import MemoryFabric
+from ioa_core.memory_fabric.schema import MemoryRecordV1
+
+
+@pytest.fixture
+def fabric_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("USE_4D_TIERING", "false")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _seed(data_dir, count=3, age_seconds=0):
+    mf = MemoryFabric(backend="sqlite", config={"data_dir": str(data_dir), "db_name": "fabric.db"}, enable_metrics=False)
+    for i in range(count):
+        mf._store.store(MemoryRecordV1(
+            id=f"r{i}",
+            content=f"record {i}",
+            timestamp=datetime.now(timezone.utc) - timedelta(seconds=age_seconds)
+        ))
+    mf.close()
+
+
+class TestFabricSweep:
+    """Test `ioa fabric sweep`."""
+
+    def test_sweep_deletes_expired(self, fabric_dir):
+        _seed(fabric_dir, count=3, age_seconds=7200)
+        result = CliRunner().invoke(app, [
+            "fabric", "sweep", "--backend", "sqlite", "--data-dir", str(fabric_dir),
+            "--db-name", "fabric.db", "--ttl", "conversation=3600", "--json"
+        ])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["deleted"] == {"conversation": 3}
+
+    def test_sweep_requires_ttl(self, fabric_dir, monkeypatch):
+        monkeypatch.delenv("IOA_FABRIC_TTL", raising=False)
+        result = CliRunner().invoke(app, ["fabric", "sweep", "--backend", "sqlite", "--data-dir", str(fabric_dir)])
+        assert result.exit_code == 1
+        assert "No TTLs configured" in result.output
+
+
+def _fabric_args(data_dir):
+    return ["--backend", "sqlite", "--data-dir", str(data_dir), "--db-name", "fabric.db"]
+
+
+class TestFabricBulk:
+    """Test the bulk `ioa fabric` subcommands."""
+
+    def test_export_import_round_trip_with_progress_file(self, fabric_dir):
+        _seed(fabric_dir, count=25)
+        export_path = fabric_dir / "dump.ndjson.gz"
+        progress_path = fabric_dir / "progress.jsonl"
+        result = CliRunner().invoke(app, [
+            "fabric", "export", str(export_path), *_fabric_args(fabric_dir), "--format", "ndjson",
+            "--row-group-size", "10", "--progress-file", str(progress_path), "--quiet", "--json"
+        ])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["records"] == 25
+        final = json.loads(progress_path.read_text().splitlines()[-1])
+        assert final["phase"] == "export" and final["final"] and final["done"] == 25 and final["total"] == 25
+
+        target = fabric_dir / "copy"
+        result = CliRunner().invoke(app, [
+            "fabric", "import", str(export_path), "--backend", "sqlite", "--data-dir", str(target),
+            "--db-name", "fabric.db", "--batch-size", "10", "--workers", "2", "--json"
+        ])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output.splitlines()[-1])["records"] == 25
+
+        result = CliRunner().invoke(app, [
+            "fabric", "verify", "--backend", "sqlite", "--data-dir", str(target), "--db-name", "fabric.db",
+            "--quiet", "--json"
+        ])
+        assert result.exit_code == 0, result.output
+        summary = json.loads(result.output)
+        assert summary["ok"] and summary["records"] == 25 and summary["store_errors"] == []
+
+    def test_verify_reports_records_the_key_cannot_decrypt(self, fabric_dir, monkeypatch):
+        mf = MemoryFabric(
+            backend="sqlite", config={"data_dir": str(fabric_dir), "db_name": "fabric.db"},
+            encryption_key="right-key", enable_metrics=False
+        )
+        ids = sorted(mf.store(f"secret {i}") for i in range(3))
+        mf.close()
+        args = ["fabric", "verify", *_fabric_args(fabric_dir), "--quiet", "--json"]
+
+        monkeypatch.setenv("IOA_FABRIC_KEY", "wrong-key")
+        result = CliRunner().invoke(app, args)
+        assert result.exit_code == 2, result.output
+        assert sorted(json.loads(result.output)["unreadable"]) == ids
+
+        monkeypatch.setenv("IOA_FABRIC_KEY", "right-key")
+        result = CliRunner().invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["unreadable"] == []
+
+    def test_stats_compact_and_retier(self, fabric_dir):
+        _seed(fabric_dir, count=5)
+        result = CliRunner().invoke(app, ["fabric", "stats", *_fabric_args(fabric_dir)])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["records"] == 5
+
+        result = CliRunner().invoke(app, ["fabric", "compact", *_fabric_args(fabric_dir), "--json"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["compacted"]
+
+        result = CliRunner().invoke(app, ["fabric", "retier", *_fabric_args(fabric_dir), "--quiet"])
+        assert result.exit_code == 1
+        assert "requires the tiered backend" in result.output
+
+
+class TestBenchFabric:
+    """Test `ioa bench fabric`."""
+
+    def test_report_and_baseline_regression(self, fabric_dir):
+        report_path = fabric_dir / "bench.json"
+        args = ["bench", "fabric", "--workload", "read-heavy", "--records", "40", "--iterations", "1", "--warmup", "0"]
+        result = CliRunner().invoke(app, [*args, "--output", str(report_path), "--json"])
+        assert result.exit_code == 0, result.output
+        report = json.loads(report_path.read_text())
+        assert json.loads(result.output)["report"]["workloads"].keys() == report["workloads"].keys() == {"read-heavy"}
+
+        report["workloads"]["read-heavy"]["ops_per_sec"] *= 100
+        report_path.write_text(json.dumps(report))
+        result = CliRunner().invoke(app, [*args, "--baseline", str(report_path)])
+        assert result.exit_code == 2
+        assert "❌ read-heavy: ops_per_sec" in result.output
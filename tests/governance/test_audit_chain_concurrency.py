@@ -0,0 +1,114 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import gc
+import json
+import threading
+
+import pytest
+
+from ioa_core.audit.canonical import compute_hash
+from ioa_core.governance import audit_chain
+from ioa_core.governance.audit_chain import AuditChain
+
+
+def _entries(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestConcurrentProducers:
+    """Test the queue and writer thread of the audit chain."""
+
+    def test_chain_integrity_under_32_producers(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        chain = AuditChain(str(log_path), fsync="none")
+        start = threading.Barrier(32)
+        futures, errors = [], []
+
+        def produce(worker):
+            start.wait()
+            try:
+                for i in range(100):
+                    data = {"worker": worker, "i": i}
+                    if i % 3 == 0:
+                        futures.append(chain.submit("evt", data))
+                    else:
+                        chain.log("evt", data, durable=i % 10 == 1)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == [] and all(f.result()["hash"] for f in futures)
+        chain.close()
+
+        entries = _entries(log_path)
+        assert len(entries) == 3200
+        assert [e["seq"] for e in entries] == list(range(1, 3201))
+        prev = "0" * 64
+        for entry in entries:
+            assert entry["prev_hash"] == prev
+            assert entry["hash"] == compute_hash({k: v for k, v in entry.items() if k != "hash"})
+            prev = entry["hash"]
+        # Each producer's own events keep their order
+        for worker in range(32):
+            assert [e["data"]["i"] for e in entries if e["data"]["worker"] == worker] == list(range(100))
+        assert log_path.with_suffix(".nonce").read_text().split() == [e["nonce"] for e in entries]
+
+    def test_durable_waits_for_fsync_and_fire_and_forget_reports_errors(self, tmp_path, monkeypatch):
+        synced = []
+        fsync = audit_chain.os.fsync
+        monkeypatch.setattr(audit_chain.os, "fsync", lambda fd: synced.append(fd) or fsync(fd))
+        log_path = tmp_path / "audit.jsonl"
+        chain = AuditChain(str(log_path), fsync="none", flush_interval=0)
+
+        entry = chain.log("evt", {"nonce": "once"}, durable=True)
+        assert synced and _entries(log_path)[-1]["hash"] == entry["hash"]
+
+        replay = chain.submit("evt", {"nonce": "once"})
+        with pytest.raises(RuntimeError, match="Replay"):
+            replay.result(timeout=5)
+        chain.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            chain.submit("evt", {})
+
+    def test_full_queue_applies_backpressure(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(audit_chain, "AUDIT_BACKPRESSURE_THRESHOLD", 3)
+        monkeypatch.setattr(audit_chain, "AUDIT_BACKPRESSURE_TIMEOUT", 0.05)
+        chain = AuditChain(str(tmp_path / "audit.jsonl"), fsync="none")
+        release = threading.Event()
+        sequence = chain._sequence
+
+        def slow_sequence(event, data):
+            release.wait(5)
+            return sequence(event, data)
+
+        chain._sequence = slow_sequence
+        futures = [chain.submit("evt", {"i": i}) for i in range(4)]  # one in the writer, three queued
+        with pytest.raises(RuntimeError, match="backpressure"):
+            chain.submit("evt", {"i": 4})
+        release.set()
+        assert [f.result(timeout=5)["seq"] for f in futures] == [1, 2, 3, 4]
+        chain.close()
+
+    def test_dropped_chain_is_collected_and_flushed(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        chain = AuditChain(str(log_path), fsync="none", flush_interval=0)
+        for i in range(3):
+            chain.log("evt", {"i": i})
+        thread = chain._thread
+        del chain
+        gc.collect()
+
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert [e["data"]["i"] for e in _entries(log_path)] == [0, 1, 2]
@@ -0,0 +1,192 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import json
+
+import pytest
+
+from ioa_core.audit.canonical import compute_hash
+from ioa_core.governance import audit_chain
+from ioa_core.governance.audit_chain import AuditChain, AuditLogWriter
+
+
+def _entries(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestAuditLogWriter:
+    """Test the persistent audit log writer."""
+
+    def test_nonces_and_entries_flush_together_through_open_files(self, tmp_path, monkeypatch):
+        log_path = tmp_path / "audit.jsonl"
+        opened = []
+        open_file = type(log_path).open
+        monkeypatch.setattr(type(log_path), "open", lambda self, *a, **k: opened.append(self.name) or open_file(self, *a, **k))
+
+        chain = AuditChain(str(log_path), fsync="none", flush_interval=0)
+        for i in range(25):
+            chain.log("evt", {"i": i, "note": "café"})
+        assert opened == ["audit.nonce", "audit.jsonl"]
+
+        # Two full batches are on disk, nonce index and log in step
+        entries = _entries(log_path)
+        nonces = log_path.with_suffix(".nonce").read_text().split()
+        assert len(entries) == 20 and nonces == [e["nonce"] for e in entries]
+
+        chain.close()
+        entries = _entries(log_path)
+        assert [e["seq"] for e in entries] == list(range(1, 26))
+        prev = "0" * 64
+        for entry in entries:
+            body = {k: v for k, v in entry.items() if k != "hash"}
+            assert entry["prev_hash"] == prev and entry["hash"] == compute_hash(body)
+            prev = entry["hash"]
+        assert entries[0]["data"]["note"] == "café"
+
+        # Reopening resumes the chain and still rejects known nonces
+        with AuditChain(str(log_path), fsync="none") as reopened:
+            assert reopened.prev_hash == prev
+            with pytest.raises(RuntimeError, match="Replay"):
+                reopened.log("evt", {"nonce": entries[3]["nonce"]})
+            reopened.log("evt", {"i": 25})
+        assert _entries(log_path)[-1]["prev_hash"] == prev
+
+    def test_fsync_policies(self, tmp_path, monkeypatch):
+        synced = []
+        monkeypatch.setattr(audit_chain.os, "fsync", synced.append)
+        clock = [100.0]
+        monkeypatch.setattr(audit_chain.time, "monotonic", lambda: clock[0])
+
+        writer = AuditLogWriter(tmp_path / "b.jsonl", tmp_path / "b.nonce", fsync="batch")
+        writer.write(["{}"], ["n1"])
+        writer.write(["{}"], ["n2"])
+        assert len(synced) == 4
+        writer.close()
+        assert len(synced) == 4 and writer.closed
+
+        synced.clear()
+        writer = AuditLogWriter(tmp_path / "i.jsonl", tmp_path / "i.nonce", fsync="interval", fsync_interval=1.0)
+        writer.write(["{}"], ["n1"])
+        clock[0] += 0.5
+        writer.write(["{}"], ["n2"])
+        assert synced == []
+        clock[0] += 0.6
+        writer.write(["{}"], ["n3"])
+        assert len(synced) == 2
+        writer.write(["{}"], ["n4"])
+        writer.close()
+        assert len(synced) == 4
+
+        synced.clear()
+        writer = AuditLogWriter(tmp_path / "n.jsonl", tmp_path / "n.nonce", fsync="none")
+        writer.write(["{}"], ["n1"])
+        assert synced == [] and writer.size() == 3
+        writer.close()
+        assert len(synced) == 2
+        with pytest.raises(ValueError):
+            AuditLogWriter(tmp_path / "x.jsonl", tmp_path / "x.nonce", fsync="always")
+
+    def test_rotation_reopens_the_log(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        chain = AuditChain(str(log_path), rotate_bytes=2000, fsync="none")
+        for i in range(40):
+            chain.log("evt", {"i": i})
+        chain.close()
+
+        rotated = sorted(p for p in tmp_path.glob("audit-*.jsonl"))
+        assert rotated and log_path.exists()
+        total = sum(len(_entries(p)) for p in rotated) + len(_entries(log_path))
+        assert total == 40
+
+        # Each rotation starts a new nonce generation and journal
+        journal = log_path.with_suffix(".nonce").read_text().split()
+        assert journal == [e["nonce"] for e in _entries(log_path)]
+        with AuditChain(str(log_path), fsync="none") as reopened:
+            assert reopened._nonces.generation == len(rotated)
+            assert all(e["nonce"] in reopened._nonces for p in rotated for e in _entries(p))
+
+
+class TestAuditCheckpoint:
+    """Test checkpoint-based startup recovery."""
+
+    def _spy_scans(self, monkeypatch):
+        scans = []
+        scan = audit_chain._scan_lines
+        monkeypatch.setattr(audit_chain, "_scan_lines", lambda f, offset: scans.append(offset) or scan(f, offset))
+        return scans
+
+    def test_startup_trusts_a_matching_checkpoint(self, tmp_path, monkeypatch):
+        log_path = tmp_path / "audit.jsonl"
+        with AuditChain(str(log_path), fsync="none") as chain:
+            for i in range(30):
+                chain.log("evt", {"i": i})
+        checkpoint = audit_chain.read_checkpoint(log_path.with_suffix(".ckpt"))
+        assert checkpoint["offset"] == log_path.stat().st_size and checkpoint["next_seq"] == 31
+        assert log_path.with_suffix(".ckpt").stat().st_size == audit_chain.AUDIT_CHECKPOINT_SIZE
+
+        scans = self._spy_scans(monkeypatch)
+        reopened = AuditChain(str(log_path), fsync="none")
+        assert scans == [] and reopened.prev_hash == _entries(log_path)[-1]["hash"]
+        assert reopened.log("evt", {})["seq"] == 31
+        reopened.close()
+
+    def test_entries_after_the_checkpoint_are_replayed_from_its_offset(self, tmp_path, monkeypatch):
+        log_path = tmp_path / "audit.jsonl"
+        checkpoint_path = log_path.with_suffix(".ckpt")
+        with AuditChain(str(log_path), fsync="none") as chain:
+            for i in range(10):
+                chain.log("evt", {"i": i})
+        stale = checkpoint_path.read_bytes()
+        offset = log_path.stat().st_size
+        with AuditChain(str(log_path), fsync="none") as chain:
+            for i in range(5):
+                chain.log("evt", {"i": i})
+        checkpoint_path.write_bytes(stale)
+        with log_path.open("ab") as f:
+            f.write(b'{"torn": ')
+
+        scans = self._spy_scans(monkeypatch)
+        reopened = AuditChain(str(log_path), fsync="none")
+        assert scans == [offset]
+        last = json.loads(log_path.read_bytes().splitlines()[-2])
+        assert reopened.prev_hash == last["hash"] and reopened._seq_counter == 16 == last["seq"] + 1
+        reopened.close()
+
+    def test_inconsistent_checkpoint_falls_back_to_a_full_scan(self, tmp_path, monkeypatch):
+        log_path = tmp_path / "audit.jsonl"
+        checkpoint_path = log_path.with_suffix(".ckpt")
+        with AuditChain(str(log_path), fsync="none") as chain:
+            for i in range(12):
+                chain.log("evt", {"i": i})
+        lines = log_path.read_bytes().splitlines(keepends=True)
+        scans = self._spy_scans(monkeypatch)
+
+        # Log truncated behind the checkpoint's back
+        log_path.write_bytes(b"".join(lines[:7]))
+        chain = AuditChain(str(log_path), fsync="none")
+        assert scans == [0] and chain.prev_hash == json.loads(lines[6])["hash"] and chain._seq_counter == 8
+        chain.close()
+        assert audit_chain.read_checkpoint(checkpoint_path)["offset"] == log_path.stat().st_size
+
+        # Torn checkpoint record
+        scans.clear()
+        checkpoint_path.write_bytes(checkpoint_path.read_bytes()[:40])
+        assert audit_chain.read_checkpoint(checkpoint_path) is None
+        AuditChain(str(log_path), fsync="none").close()
+        assert scans == [0]
+
+    def test_tail_line_reads_backwards_across_chunks(self, tmp_path):
+        path = tmp_path / "lines"
+        path.write_bytes(b"first\n" + b"x" * 50 + b"\n\n  \nlast\npartial")
+        with path.open("rb") as f:
+            size = path.stat().st_size
+            assert audit_chain._tail_line(f, size, chunk=7) == (size - 7, b"last")
+            assert audit_chain._tail_line(f, size - 12, chunk=7) == (57, b"x" * 50)
+            assert audit_chain._tail_line(f, 56, chunk=7) == (6, b"first")
+            assert audit_chain._tail_line(f, 5, chunk=7) is None
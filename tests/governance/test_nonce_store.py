@@ -0,0 +1,152 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ioa_core.governance import audit_chain, nonce_store
+from ioa_core.governance.audit_chain import AuditChain
+from ioa_core.governance.nonce_store import NonceStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(nonce_store.time, "time", lambda: now[0])
+    return now
+
+
+class TestNonceStore:
+    """Test the generational nonce index."""
+
+    def test_filters_answer_fresh_nonces_and_survive_restarts(self, tmp_path):
+        store = NonceStore(tmp_path / "n.db", capacity=1000)
+        for i in range(200):
+            store.add(f"n{i}")
+        assert "n7" in store
+        assert store.commit() == 200 and store.commit() == 0
+        assert "n7" in store and "n199" in store
+        assert not any(f"fresh{i}" in store for i in range(500))
+        stats = store.stats()
+        assert stats["nonces"] == 200 and stats["filter_negatives"] + stats["false_positives"] == 500
+        assert stats["filter_negatives"] > 490
+        store.close()
+
+        # Saved filters are reused; a filter that missed commits is rebuilt
+        reopened = NonceStore(tmp_path / "n.db", capacity=1000)
+        reopened.add("late")
+        reopened.commit()
+        reopened._conn.close()
+        reopened._conn = None
+        crashed = NonceStore(tmp_path / "n.db", capacity=1000)
+        assert "late" in crashed and "n42" in crashed and "nope" not in crashed
+        crashed.close()
+
+    def test_rotation_expires_generations_outside_the_window(self, tmp_path, clock):
+        store = NonceStore(tmp_path / "n.db", retention_seconds=3600, capacity=100)
+        for generation in range(4):
+            for i in range(50):
+                store.add(f"g{generation}-{i}")
+            store.commit()
+            clock[0] += 2000
+            assert store.rotate() == generation + 1
+
+        # Generations 0 and 1 closed more than an hour ago
+        assert "g0-1" not in store and "g1-1" not in store
+        assert "g2-1" in store and "g3-49" in store
+        stats = store.stats()
+        assert sorted(stats["filters"]) == [2, 3, 4] and stats["nonces"] == 100
+        store.close()
+
+    def test_keep_expired_checks_old_generations_on_disk(self, tmp_path, clock):
+        store = NonceStore(tmp_path / "n.db", retention_seconds=60, keep_expired=True, capacity=100)
+        store.add("old")
+        store.commit()
+        clock[0] += 10
+        store.rotate()
+        clock[0] += 120
+        store.rotate()
+        assert sorted(store.stats()["filters"]) == [1, 2]
+        assert "old" in store and "never" not in store
+        store.close()
+
+    def test_audit_chain_does_not_load_the_memory_fabric(self, tmp_path):
+        code = (
+            "import sys; from ioa_core.governance.audit_chain import AuditChain; "
+            f"AuditChain({str(tmp_path / 'audit.jsonl')!r}, fsync='none').close(); "
+            "print(sorted(m for m in sys.modules if 'memory_fabric' in m))"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_index_journal_reads_only_the_unindexed_tail(self, tmp_path):
+        journal = tmp_path / "audit.nonce"
+        journal.write_bytes(b"a\nb\n\nc\n")
+        store = NonceStore(tmp_path / "n.db")
+        assert store.index_journal(journal) == 3 and store.journal_offset() == 7
+        with journal.open("ab") as f:
+            f.write(b"d\ne\npart")
+        assert store.index_journal(journal) == 2 and store.journal_offset() == 11
+        assert store.index_journal(journal) == 0
+        assert all(n in store for n in "abcde") and "part" not in store
+        store.close()
+
+
+class TestAuditChainReplay:
+    """Test replay protection of the audit chain through the nonce store."""
+
+    def test_strict_mode_uses_the_index_instead_of_scanning_the_log(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("IOA_AUDIT_REPLAY_STRICT", "1")
+        log_path = tmp_path / "audit.jsonl"
+        with AuditChain(str(log_path), fsync="none") as chain:
+            for i in range(15):
+                chain.log("evt", {"i": i, "nonce": f"req-{i}"})
+
+        reads = []
+        open_file = type(log_path).open
+
+        def tracking_open(path, mode="r", *args, **kwargs):
+            if "r" in mode:
+                reads.append(path.name)
+            return open_file(path, mode, *args, **kwargs)
+
+        monkeypatch.setattr(type(log_path), "open", tracking_open)
+        with AuditChain(str(log_path), fsync="none") as chain:
+            with pytest.raises(RuntimeError, match="Replay"):
+                chain.log("evt", {"nonce": "req-3"})
+            chain.log("evt", {"nonce": "req-15"})
+            with pytest.raises(RuntimeError, match="Replay"):
+                chain.log("evt", {"nonce": "req-15"})
+        # Only the startup tail check reads the log; replay checks never scan it
+        assert reads.count("audit.jsonl") == 1
+
+    def test_journaled_nonces_missing_from_the_index_are_recovered(self, tmp_path):
+        log_path = tmp_path / "audit.jsonl"
+        chain = AuditChain(str(log_path), fsync="none")
+        for i in range(25):
+            chain.log("evt", {"nonce": f"req-{i}"})
+        chain.flush()
+        # Crash: the journal holds the flushed nonces, the index never committed them
+        assert chain._nonces.stats()["nonces"] == 0
+        chain._requests.put(audit_chain._STOP)
+        chain._thread.join()
+        chain._writer.close()
+        chain._nonces._conn.close()
+        chain._closed = True
+
+        with AuditChain(str(log_path), fsync="none") as reopened:
+            assert reopened._nonces.stats()["nonces"] == 25
+            with pytest.raises(RuntimeError, match="Replay"):
+                reopened.log("evt", {"nonce": "req-24"})
+        with pytest.raises(RuntimeError, match="closed"):
+            reopened.log("evt", {})
@@ -0,0 +1,45 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+Shared fixtures for the Memory Fabric tests.
+"""
+
+import pytest
+
+from ioa_core.memory_fabric.fabric import MemoryFabric
+
+
+@pytest.fixture(autouse=True)
+def _no_tiering(monkeypatch):
+    monkeypatch.setenv("USE_4D_TIERING", "false")
+
+
+@pytest.fixture
+def fabric_config():
+    """Config shared by every fabric of a test module; modules override this fixture."""
+    return {}
+
+
+@pytest.fixture
+def make_fabric(tmp_path, fabric_config):
+    """
+    Factory for fabrics under tmp_path.
+
+    make_fabric(backend="sqlite", encryption_key=None, data_dir=None, **config)
+    layers config over fabric_config; dict values (cache, bloom, tiering, ...)
+    are merged key by key.
+    """
+
+    def make(backend="sqlite", encryption_key=None, data_dir=None, **config):
+        merged = {"data_dir": str(data_dir or tmp_path), "db_name": "fabric.db", **fabric_config}
+        for key, value in config.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                value = {**merged[key], **value}
+            merged[key] = value
+        return MemoryFabric(backend=backend, config=merged, encryption_key=encryption_key, enable_metrics=False)
+
+    return make
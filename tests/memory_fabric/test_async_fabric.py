@@ -0,0 +1,147 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ioa_core.memory_fabric import AsyncMemoryFabric, MemoryFabric
+from ioa_core.memory_fabric.schema import EmbeddingV1
+from ioa_core.memory_fabric.stores.async_stores import AsyncStoreAdapter, AsyncS3Store, create_async_store
+
+
+@pytest.fixture(params=["sqlite", "local_jsonl"])
+def fabric(request, tmp_path, monkeypatch):
+    monkeypatch.setenv("USE_4D_TIERING", "false")
+    return AsyncMemoryFabric(backend=request.param, config={"data_dir": str(tmp_path)}, enable_metrics=False)
+
+
+class SlowStore:
+    """Sync store stub that blocks like a slow disk write."""
+
+    def __init__(self):
+        self.threads = set()
+
+    def store(self, record):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return True
+
+    def close(self):
+        pass
+
+
+class TestAsyncMemoryFabric:
+    """Test the async facade against the local backends."""
+
+    @pytest.mark.asyncio
+    async def test_store_retrieve_search_delete(self, fabric):
+        record_id = await fabric.store("async hello", memory_type="knowledge", tags=["a"])
+        record = await fabric.retrieve(record_id)
+        assert record.content == "async hello"
+        assert [r.id for r in await fabric.search("hello")] == [record_id]
+        assert await fabric.delete(record_id) is True
+        assert await fabric.retrieve(record_id) is None
+        await fabric.close()
+
+    @pytest.mark.asyncio
+    async def test_store_batch_preserves_order(self, fabric):
+        ids = await fabric.store_batch([{"content": f"batch {i}", "id": f"r{i}"} for i in range(20)])
+        assert ids == [f"r{i}" for i in range(20)]
+        assert len(await fabric.list_all()) == 20
+        await fabric.close()
+
+    @pytest.mark.asyncio
+    async def test_search_by_tier_filters_before_the_limit(self, fabric):
+        cold = [await fabric.store(f"cold note {i}", storage_tier="cold") for i in range(3)]
+        for i in range(10):
+            await fabric.store(f"hot note {i}", storage_tier="hot")
+        results = await fabric.search("note", limit=5, storage_tier="cold")
+        assert sorted(r.id for r in results) == sorted(cold)
+        assert len(await fabric.search("note", limit=5, storage_tier="hot")) == 5
+        await fabric.close()
+
+    @pytest.mark.asyncio
+    async def test_search_similar_shares_index(self, fabric):
+        near = await fabric.store("near", embedding=EmbeddingV1(vector=[1.0, 0.0], model="m", dimension=2))
+        results = await fabric.search_similar([1.0, 0.1], k=1)
+        assert results[0][0].id == near
+        # The wrapped sync fabric sees the same data and index
+        assert fabric.fabric.search_similar([1.0, 0.1], k=1)[0][0].id == near
+        await fabric.close()
+
+    @pytest.mark.asyncio
+    async def test_encryption_round_trip(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        async with AsyncMemoryFabric(
+            backend="sqlite", config={"data_dir": str(tmp_path)}, encryption_key="k", enable_metrics=False
+        ) as mf:
+            record_id = await mf.store("secret")
+            assert (await mf.retrieve(record_id)).content == "secret"
+            assert mf.fabric._store.retrieve(record_id).content != "secret"
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_durability_checksum(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        async with AsyncMemoryFabric(
+            backend="sqlite", config={"data_dir": str(tmp_path), "durability": True}, enable_metrics=False
+        ) as mf:
+            kept = await mf.store("kept")
+            dropped = await mf.store("dropped", embedding=EmbeddingV1(vector=[1.0, 0.0], model="m", dimension=2))
+            assert await mf.delete(dropped) is True
+            report = mf.fabric.durability_report()
+            assert report.ok and report.missing == [] and report.checked == 1
+            assert mf.fabric._durability_ledger.get(kept) is not None
+            assert await mf.search_similar([1.0, 0.0], k=1) == []
+
+
+class TestAsyncStores:
+    """Test executor offloading and store selection."""
+
+    @pytest.mark.asyncio
+    async def test_slow_store_does_not_block_loop(self):
+        adapter = AsyncStoreAdapter(SlowStore(), max_workers=1)
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        beat = asyncio.create_task(heartbeat())
+        assert await adapter.store(object()) is True
+        beat.cancel()
+        assert ticks > 3
+        assert all(name.startswith("ioa-slowstore") for name in adapter.sync_store.threads)
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        adapter = AsyncStoreAdapter(SlowStore(), max_workers=2, max_concurrency=2)
+        await asyncio.gather(*(adapter.store(object()) for _ in range(4)))
+        assert adapter._semaphore()._value == 2
+        await adapter.close()
+
+    def test_create_async_store_selects_s3_adapter(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mf = MemoryFabric(backend="s3", config={"bucket_name": "b"}, enable_metrics=False)
+        adapter = create_async_store(mf._store)
+        assert isinstance(adapter, AsyncS3Store)
+        assert adapter.native is False  # no credentials here: falls back to the executor
+        mf.close()
+
+    def test_store_batch_standard_runs_off_loop(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)}, enable_metrics=False)
+        ids = asyncio.run(mf.store_batch([{"content": f"c{i}"} for i in range(5)]))
+        assert len(ids) == 5 and mf._write_executor is not None
+        mf.close()
@@ -0,0 +1,71 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import os
+
+import pytest
+
+from ioa_core.memory_fabric.bench import BenchmarkRunner, compare, generate_records, percentile
+
+
+class TestBenchmarkRunner:
+    """Test workload runs and their reports."""
+
+    def test_seeded_data_and_percentiles(self):
+        assert generate_records(50, seed=7) == generate_records(50, seed=7)
+        assert generate_records(50, seed=7) != generate_records(50, seed=8)
+        assert percentile(list(range(1, 101)), 50) == 50
+        assert percentile(list(range(1, 101)), 99) == 99
+        assert percentile([3.0], 99) == 3.0 and percentile([], 50) is None
+
+    def test_runs_workloads_and_restores_environment(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("IOA_SHARDS", raising=False)
+        monkeypatch.setenv("USE_4D_TIERING", "true")
+        seen = []
+        runner = BenchmarkRunner(
+            records=60, iterations=2, warmup=1, work_dir=str(tmp_path),
+            on_iteration=lambda name, iteration, result: seen.append((name, iteration))
+        )
+        report = runner.run(["search-mixed", "encrypted", "sharded"])
+
+        assert seen == [(name, i) for name in ("search-mixed", "encrypted", "sharded") for i in range(2)]
+        mixed = report["workloads"]["search-mixed"]
+        assert set(mixed["operations"]) == {"write", "read", "search"}
+        assert sum(op["count"] for op in mixed["operations"].values()) == 2 * 60
+        assert mixed["ops_per_sec"] > 0 and mixed["p50_ms"] <= mixed["p99_ms"]
+        assert report["workloads"]["sharded"]["operations"]["write_batch"]["count"] == 2
+        assert report["settings"]["seed"] == 42 and os.listdir(tmp_path) == []
+        assert "IOA_SHARDS" not in os.environ and os.environ["USE_4D_TIERING"] == "true"
+        with pytest.raises(ValueError):
+            runner.run(["no-such-workload"])
+
+
+class TestCompare:
+    """Test baseline comparison."""
+
+    def test_throughput_drop_and_p99_growth_beyond_threshold_regress(self):
+        baseline = {"workloads": {
+            "write-heavy": {"ops_per_sec": 1000.0, "p50_ms": 1.0, "p99_ms": 5.0},
+            "read-heavy": {"ops_per_sec": 4000.0, "p50_ms": 0.2, "p99_ms": 1.0},
+            "retired": {"ops_per_sec": 1.0, "p50_ms": 1.0, "p99_ms": 1.0}
+        }}
+        report = {"workloads": {
+            "write-heavy": {"ops_per_sec": 850.0, "p50_ms": 1.5, "p99_ms": 5.2},
+            "read-heavy": {"ops_per_sec": 3900.0, "p50_ms": 0.2, "p99_ms": 1.5},
+            "sharded": {"ops_per_sec": 9000.0, "p50_ms": 0.1, "p99_ms": 9.0}
+        }}
+
+        result = compare(report, baseline, threshold=0.10)
+        assert [(r["workload"], r["metric"]) for r in result["regressions"]] == [
+            ("write-heavy", "ops_per_sec"), ("read-heavy", "p99_ms")
+        ]
+        assert result["workloads"]["write-heavy"]["ops_per_sec"]["change_pct"] == -15.0
+        assert result["missing_from_baseline"] == ["sharded"] and result["missing_from_report"] == ["retired"]
+        assert not result["ok"]
+        assert compare(report, baseline, threshold=0.60)["ok"]
@@ -0,0 +1,114 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ioa_core.bloom import ScalableBloomFilter
+from ioa_core.memory_fabric.bloom import BloomConfig, IdFilterSet
+from ioa_core.memory_fabric.retention import RetentionPolicy
+
+
+@pytest.fixture
+def fabric_config():
+    return {"bloom": {"capacity": 100}}
+
+
+
+class TestScalableBloomFilter:
+    """Test filter accuracy and growth."""
+
+    def test_no_false_negatives_and_bounded_fp_rate(self):
+        bloom = ScalableBloomFilter(capacity=500, fp_rate=0.01)
+        keys = [f"rec-{i}" for i in range(5000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+        assert len(bloom.stages) > 1
+        false_positives = sum(f"absent-{i}" in bloom for i in range(20000))
+        assert false_positives / 20000 < 0.02
+        assert bloom.stats()["estimated_fp_rate"] < 0.02
+
+    def test_rebuild_keeps_concurrent_adds(self, tmp_path):
+        filters = IdFilterSet(BloomConfig(enabled=True, capacity=10), str(tmp_path / "ids.bloom"))
+        filters.add("tier:hot", "old")
+
+        def items():
+            yield "tier:hot", "a"
+            filters.add("tier:hot", "written-during-rebuild")
+            yield "tier:cold", "b"
+
+        assert filters.rebuild(items(), prefix="tier:") == 2
+        assert not filters.might_contain("old")
+        assert all(filters.might_contain(key) for key in ("a", "b", "written-during-rebuild"))
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "local_jsonl"])
+class TestFabricIdFilters:
+    """Test negative lookups through the fabric."""
+
+    def test_misses_skip_the_store(self, tmp_path, backend, monkeypatch, make_fabric):
+        mf = make_fabric(backend)
+        ids = [mf.store(f"record {i}", storage_tier="cold" if i % 2 else "hot") for i in range(50)]
+        calls = []
+        original = mf._store.retrieve
+        monkeypatch.setattr(mf._store, "retrieve", lambda record_id: calls.append(record_id) or original(record_id))
+
+        assert all(mf.retrieve(record_id) is not None for record_id in ids)
+        assert all(mf.retrieve(f"missing-{i}") is None for i in range(200))
+        assert len(calls) - len(ids) < 10
+
+        stats = mf.get_stats()["bloom"]
+        assert set(stats["filters"]) == {"tier:hot", "tier:cold"}
+        assert stats["negatives"] >= 190 and stats["memory_bytes"] > 0
+        assert stats["false_positives"] == len(calls) - len(ids)
+        mf.close()
+
+
+class TestIdFilterPersistence:
+    """Test the persisted filter sidecar."""
+
+    def test_saved_filters_are_reused_and_invalidated_by_writes(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        first = mf.store("first")
+        mf.close()
+        path = str(tmp_path / "fabric.db.bloom")
+        assert os.path.exists(path)
+
+        reopened = make_fabric()
+        assert reopened.get_stats()["bloom"]["rebuilds"] == 0
+        assert reopened.retrieve(first).content == "first"
+        second = reopened.store("second")
+        # A write after the save makes the file untrustworthy until the next save
+        assert not os.path.exists(path)
+        reopened._store.close()
+
+        recovered = make_fabric()
+        assert recovered.get_stats()["bloom"]["rebuilds"] == 1
+        assert recovered.retrieve(second).content == "second"
+        recovered.close()
+
+    def test_sweep_rebuilds_stale_filters(self, tmp_path, make_fabric):
+        mf = make_fabric(bloom={"rebuild_fraction": 0.5})
+        old = datetime.now(timezone.utc) - timedelta(days=2)
+        for i in range(10):
+            mf.store(f"expired {i}", record_id=f"old-{i}")
+            record = mf._store.retrieve(f"old-{i}")
+            record.timestamp = old
+            mf._store.store(record)
+        mf.store("fresh", record_id="new")
+        mf.sweep_expired(RetentionPolicy(ttl_seconds={"conversation": 3600}))
+
+        stats = mf.get_stats()["bloom"]
+        assert stats["rebuilds"] == 2 and stats["filters"]["tier:hot"]["keys"] == 1
+        assert not mf._id_filters.might_contain("old-0")
+        assert mf.retrieve("new").content == "fresh"
+        mf.close()
@@ -0,0 +1,106 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ioa_core.memory_fabric.changelog import ChangeLog, ChangeLogConfig, ChangeLogTruncatedError
+from ioa_core.memory_fabric.retention import RetentionPolicy
+
+
+@pytest.fixture
+def fabric_config():
+    return {"changelog": {"enabled": True}}
+
+
+
+class TestFabricChanges:
+    """Test the events the fabric appends."""
+
+    @pytest.mark.parametrize("backend", ["sqlite", "local_jsonl"])
+    def test_store_access_delete_events_in_order(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        first = mf.store("alpha", record_id="a")
+        mf.store_many([{"content": "beta", "id": "b"}, {"content": "gamma", "id": "c"}])
+        mf.retrieve(first)
+        mf.retrieve(first)
+        assert mf.delete("b")
+
+        events = list(mf.changes())
+        assert [(e.seq, e.op, e.record_id) for e in events] == [
+            (1, "store", "a"), (2, "store", "b"), (3, "store", "c"), (4, "access", "a"), (5, "delete", "b")
+        ]
+        assert events[3].data["count"] == 2 and events[0].data["memory_type"] == "conversation"
+        assert [e.seq for e in mf.changes(since_seq=3)] == [4, 5]
+
+        old = datetime.now(timezone.utc) - timedelta(days=3)
+        mf.store("stale", record_id="old", memory_type="conversation")
+        record = mf._store.get_many(["old"])[0]
+        record.timestamp = old
+        record.metadata["timestamp"] = old.isoformat()
+        mf._store.store(record)
+        mf.sweep_expired(RetentionPolicy(ttl_seconds={"conversation": 86400}))
+        assert [(e.op, e.record_id) for e in mf.changes(since_seq=5)] == [("store", "old"), ("delete", "old")]
+        mf.close()
+
+        reopened = make_fabric(backend)
+        reopened.store("delta", record_id="d")
+        assert reopened.get_stats()["changelog"]["last_seq"] == 8
+        reopened.close()
+
+    def test_tail_mode_delivers_new_events(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        mf.store("one", record_id="r1")
+        seen = []
+
+        def consume():
+            for event in mf.changes(since_seq=0, follow=True, timeout=2):
+                seen.append(event.record_id)
+                if len(seen) == 3:
+                    return
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        time.sleep(0.05)
+        mf.store("two", record_id="r2")
+        mf.store("three", record_id="r3")
+        consumer.join(5)
+        assert seen == ["r1", "r2", "r3"]
+        with pytest.raises(RuntimeError):
+            list(make_fabric(data_dir=tmp_path / "off", changelog={"enabled": False}).changes())
+        mf.close()
+
+
+class TestRetention:
+    """Test checkpoint-bounded retention."""
+
+    def test_files_are_removed_once_every_consumer_is_past_them(self, tmp_path):
+        log = ChangeLog(str(tmp_path / "log"), ChangeLogConfig(enabled=True, segment_events=10))
+        for i in range(35):
+            log.append("store", [(f"r{i}", {})])
+        assert log.get_stats()["segments"] == 4
+
+        assert log.checkpoint("indexer", 25) == 2
+        assert log.checkpoint("replica", 5) == 0  # the slower consumer holds files back
+        assert [e.seq for e in log.read(30)] == [31, 32, 33, 34, 35]
+        with pytest.raises(ChangeLogTruncatedError):
+            list(log.read(3))
+
+        assert log.remove_consumer("replica") == 0
+        assert log.checkpoint("indexer", 35) == 1
+        assert log.get_stats()["first_seq"] == 31
+        log.close()
+
+        reopened = ChangeLog(str(tmp_path / "log"), ChangeLogConfig(enabled=True, segment_events=10))
+        assert reopened.last_seq == 35 and reopened.checkpoints() == {"indexer": 35}
+        assert reopened.append("delete", [("r0", {})]) == 36
+        reopened.close()
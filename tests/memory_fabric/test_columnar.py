@@ -0,0 +1,144 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import gzip
+import json
+
+import pytest
+
+from ioa_core.memory_fabric.columnar import ColumnarLayout, read_columnar, write_columnar
+from ioa_core.memory_fabric.schema import EmbeddingV1, MemoryRecordV1
+
+
+def _seed(mf, n=25):
+    ids = []
+    for i in range(n):
+        embedding = EmbeddingV1(vector=[float(i), 1.0, 0.5], model="m", dimension=3) if i % 2 else None
+        ids.append(mf.store(
+            f"record {i}",
+            metadata={"jurisdiction": "eu", "priority": i, "note": None if i % 3 else "x"},
+            tags=["t", f"n{i}"],
+            memory_type="knowledge",
+            embedding=embedding
+        ))
+    return ids
+
+
+class TestColumnarLayout:
+    """Test layout inference and row round trips."""
+
+    def test_promotes_consistent_scalar_keys(self):
+        records = [
+            MemoryRecordV1(content="a", metadata={"region": "eu", "score": 1, "mixed": 1}),
+            MemoryRecordV1(content="b", metadata={"region": "us", "score": 2, "mixed": "x"}),
+        ]
+        layout = ColumnarLayout.from_sample(records)
+        assert layout.hot_keys == {"region": "string", "score": "int64"}
+
+    def test_round_trip_keeps_unfit_values_in_residual(self):
+        layout = ColumnarLayout({"score": "int64"}, dimension=2)
+        record = MemoryRecordV1(
+            content="c",
+            metadata={"score": "not-an-int", "other": [1, 2]},
+            embedding=EmbeddingV1(vector=[1.0, 2.0, 3.0], model="wide", dimension=3)
+        )
+        row = layout.to_row(record, iso_timestamps=True)
+        assert "meta.score" not in row
+        assert row["embedding"] is None and row["embedding_json"]
+        restored = layout.from_row(json.loads(json.dumps(row)))
+        assert restored.metadata == record.metadata
+        assert restored.embedding.vector == [1.0, 2.0, 3.0]
+        assert restored.timestamp == record.timestamp
+
+
+class TestNDJSONExport:
+    """Test the stdlib fallback format end to end."""
+
+    def test_export_is_chunked_gzip(self, tmp_path):
+        records = [MemoryRecordV1(content=f"r{i}") for i in range(7)]
+        path = tmp_path / "out.ndjson.gz"
+        summary = write_columnar([records[:3], records[3:6], records[6:]], str(path))
+        assert summary["format"] == "ndjson" and summary["row_groups"] == 3
+        with gzip.open(path, "rt") as f:
+            assert json.loads(f.readline())["format"] == "ioa-fabric-ndjson"
+        batches = list(read_columnar(str(path), batch_size=4))
+        assert [len(b) for b in batches] == [4, 3]
+        assert [r.id for b in batches for r in b] == [r.id for r in records]
+
+    @pytest.mark.parametrize("backend", ["sqlite", "local_jsonl"])
+    def test_fabric_clone(self, tmp_path, backend, make_fabric):
+        source = make_fabric(backend, data_dir=tmp_path / "src")
+        ids = _seed(source)
+        path = tmp_path / "clone.ndjson.gz"
+        summary = source.export_columnar(str(path), row_group_size=10)
+        assert summary["records"] == 25 and summary["row_groups"] == 3
+        # The fabric's own metadata keys are promoted alongside the caller's
+        assert set(summary["layout"]["hot_keys"]) == {"jurisdiction", "priority", "timestamp", "memory_type"}
+        originals = {r.id: r for r in source.list_all()}
+        source.close()
+
+        target = make_fabric(data_dir=tmp_path / "dst")
+        assert target.import_columnar(str(path), batch_size=8)["records"] == 25
+        for record in target._store.get_many(ids):
+            original = originals[record.id]
+            assert record.content == original.content
+            assert record.metadata == original.metadata
+            assert record.tags == original.tags
+            assert record.timestamp == original.timestamp
+            assert (record.embedding is None) == (original.embedding is None)
+        assert target.search_similar([3.0, 1.0, 0.5], k=1)[0][0].id == ids[3]
+        target.close()
+
+    def test_decrypted_export_leaves_stored_records_encrypted(self, tmp_path, make_fabric):
+        source = make_fabric("local_jsonl", encryption_key="k", data_dir=tmp_path / "src")
+        kept = source.store("secret alpha")
+        dropped = source.store("secret beta")
+        path = tmp_path / "plain.ndjson.gz"
+        source.export_columnar(str(path), decrypt=True, workers=2)
+        exported = {r.id: r for batch in read_columnar(str(path)) for r in batch}
+        assert exported[kept].content == "secret alpha" and "encryption_mode" not in exported[kept].metadata
+
+        # The export decrypted copies, so a rewrite keeps ciphertext on disk
+        source.delete(dropped)
+        data = (tmp_path / "src" / source._store.file_path.name).read_text()
+        assert kept in data and "secret alpha" not in data and '"encryption_mode": "aes-gcm"' in data
+        assert source.retrieve(kept).content == "secret alpha"
+        source.close()
+
+    def test_plaintext_import_is_encrypted(self, tmp_path, make_fabric):
+        source = make_fabric(data_dir=tmp_path / "src")
+        record_id = source.store("sensitive")
+        path = tmp_path / "out.ndjson.gz"
+        source.export_columnar(str(path))
+        source.close()
+
+        target = make_fabric(encryption_key="k", data_dir=tmp_path / "dst")
+        target.import_columnar(str(path))
+        assert target._store.retrieve(record_id).content != "sensitive"
+        assert target.retrieve(record_id).content == "sensitive"
+        target.close()
+
+
+class TestArrowExport:
+    """Test Parquet and Arrow IPC output when pyarrow is installed."""
+
+    @pytest.mark.parametrize("suffix", ["parquet", "arrow"])
+    def test_round_trip(self, tmp_path, suffix, make_fabric):
+        pytest.importorskip("pyarrow")
+        source = make_fabric(data_dir=tmp_path / "src")
+        ids = _seed(source, 12)
+        path = tmp_path / f"out.{suffix}"
+        summary = source.export_columnar(str(path), row_group_size=5)
+        assert summary["format"] == suffix and summary["row_groups"] == 3
+        source.close()
+
+        target = make_fabric(data_dir=tmp_path / "dst")
+        target.import_columnar(str(path))
+        assert [r.id for r in target._store.get_many(ids)] == ids
+        target.close()
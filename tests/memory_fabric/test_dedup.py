@@ -0,0 +1,125 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import sqlite3
+
+import pytest
+
+from ioa_core.memory_fabric.dedup import DEDUP_HASH_KEY
+from ioa_core.memory_fabric.schema import MemoryRecordV1
+from ioa_core.memory_fabric.stores.local_jsonl import LocalJSONLStore
+
+
+@pytest.fixture
+def fabric_config():
+    return {"dedup": True}
+
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "local_jsonl"])
+class TestDedup:
+    """Test content deduplication on each backend."""
+
+    def test_identical_content_is_stored_once(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        ids = [mf.store("policy text " * 50) for _ in range(4)]
+        mf.store("something else")
+        assert all(mf.retrieve(record_id).content == "policy text " * 50 for record_id in ids)
+        assert [r.id for r in mf.query(text="else")] and len(mf.query(filters={}, limit=None)) == 5
+
+        stats = mf.get_stats()["dedup"]
+        assert stats["unique_contents"] == 2 and stats["references"] == 5
+        assert stats["dedup_ratio"] > 3.5
+        mf.close()
+
+    def test_deletes_release_references(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        first = mf.store("shared")
+        second = mf.store("shared")
+        mf.delete(first)
+        assert mf.retrieve(second).content == "shared"
+        assert mf.get_stats()["dedup"]["references"] == 1
+        mf.delete(second)
+        assert mf.get_stats()["dedup"]["unique_contents"] == 0
+        mf.close()
+
+    def test_rewrite_moves_reference(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        record_id = mf.store("v1")
+        mf.store("v2", record_id=record_id)
+        assert mf.retrieve(record_id).content == "v2"
+        stats = mf.get_stats()["dedup"]
+        assert stats["unique_contents"] == 1 and stats["references"] == 1
+        mf.close()
+
+    def test_encrypted_duplicates_share_one_ciphertext(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend, encryption_key="k")
+        ids = [mf.store("secret") for _ in range(3)]
+        assert {mf.retrieve(record_id).content for record_id in ids} == {"secret"}
+        assert mf.get_stats()["dedup"]["unique_contents"] == 1
+        mf.close()
+
+    def test_caller_metadata_never_keys_content(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        first = mf.store("alpha document", metadata={"content_hash": "v1", DEDUP_HASH_KEY: "v1"})
+        second = mf.store("beta document", metadata={"content_hash": "v1", DEDUP_HASH_KEY: "v1"})
+        assert mf.retrieve(first).content == "alpha document"
+        assert mf.retrieve(second).content == "beta document"
+        assert mf.retrieve(second).metadata["content_hash"] == "v1"
+        assert DEDUP_HASH_KEY not in mf.retrieve(second).metadata
+        assert mf.get_stats()["dedup"]["unique_contents"] == 2
+        mf.close()
+
+        # Plaintext records written straight to a store are keyed by content too
+        store = mf._store.__class__({"data_dir": str(tmp_path / "direct"), "dedup": True})
+        for record_id, content in (("a", "alpha"), ("b", "beta")):
+            store.store(MemoryRecordV1(id=record_id, content=content, metadata={DEDUP_HASH_KEY: "v1"}))
+        assert [r.content for r in store.get_many(["a", "b"])] == ["alpha", "beta"]
+        store.close()
+
+
+class TestDedupPersistence:
+    """Test the on-disk layout of deduplicated content."""
+
+    def test_sqlite_keeps_content_out_of_record_rows(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        mf.store("x" * 1000)
+        mf.store("x" * 1000)
+        mf.close()
+        conn = sqlite3.connect(str(tmp_path / "fabric.db"))
+        assert conn.execute("SELECT COUNT(*) FROM memory_records WHERE content = ''").fetchone()[0] == 2
+        assert conn.execute("SELECT refcount FROM memory_content").fetchall() == [(2,)]
+        conn.close()
+
+        reopened = make_fabric(dedup=False)
+        assert [r.content for r in reopened.query(limit=None)] == ["x" * 1000] * 2
+        reopened.close()
+
+    def test_durability_verifies_deduplicated_content(self, tmp_path, make_fabric):
+        mf = make_fabric(encryption_key="k")
+        mf.enable_durability(True)
+        for _ in range(3):
+            mf.store("same")
+        report = mf.durability_report()
+        assert report.ok and report.checked == 3
+        mf.close()
+
+    def test_jsonl_reload_resolves_and_compacts_content(self, tmp_path):
+        store = LocalJSONLStore({"data_dir": str(tmp_path), "dedup": True})
+        store.store_many([MemoryRecordV1(id="a", content="shared"), MemoryRecordV1(id="b", content="shared")])
+        store.store(MemoryRecordV1(id="a", content="other"))
+        store.delete("b")
+        store.close()
+        assert len(store.content_path.read_text().splitlines()) == 1
+
+        reloaded = LocalJSONLStore({"data_dir": str(tmp_path), "dedup": True})
+        reloaded.file_path, reloaded.content_path = store.file_path, store.content_path
+        reloaded._load_existing_records()
+        assert [r.content for r in reloaded.list_all()] == ["other"]
+        assert reloaded.dedup_stats()["references"] == 1
@@ -0,0 +1,127 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ioa_core.memory_fabric.fabric import MemoryFabric
+from ioa_core.memory_fabric.schema import MemoryRecordV1
+from ioa_core.memory_fabric.stores.group_commit import GroupCommitter
+from ioa_core.memory_fabric.stores.local_jsonl import LocalJSONLStore
+from ioa_core.memory_fabric.stores.sqlite import SQLiteStore
+
+
+def _record(i):
+    return MemoryRecordV1(id=f"r{i}", content=f"content {i}")
+
+
+class TestGroupCommitter:
+    """Test batching rules in isolation."""
+
+    def test_lone_writer_commits_immediately(self):
+        commits = []
+        committer = GroupCommitter(lambda: commits.append(time.monotonic()), max_records=100, max_delay_ms=1000)
+        started = time.monotonic()
+        for _ in range(3):
+            committer.submit(lambda: None)
+        assert len(commits) == 3
+        assert time.monotonic() - started < 0.5
+
+    def test_concurrent_writers_share_commits(self):
+        commits = []
+
+        def slow_commit():
+            time.sleep(0.01)  # an fsync
+            commits.append(1)
+
+        committer = GroupCommitter(slow_commit, max_records=64, max_delay_ms=50)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: committer.submit(lambda: None), range(64)))
+
+        stats = committer.get_stats()
+        assert stats["records"] == 64
+        assert stats["batches"] < 64
+        assert stats["avg_batch_size"] > 1
+
+    def test_failed_commit_fails_every_writer_in_batch(self):
+        rollbacks = []
+
+        def failing_commit():
+            raise IOError("disk full")
+
+        committer = GroupCommitter(failing_commit, lambda: rollbacks.append(1), max_records=1)
+        with pytest.raises(IOError):
+            committer.submit(lambda: None)
+        assert rollbacks == [1]
+        assert committer.get_stats()["failed_batches"] == 1
+
+
+class TestStoreGroupCommit:
+    """Test group commit in the SQLite and JSONL stores."""
+
+    def test_sqlite_writes_are_durable_on_return(self, tmp_path):
+        store = SQLiteStore({"data_dir": str(tmp_path), "db_name": "g.db", "group_commit_records": 32})
+        errors = []
+
+        def write(i):
+            if not store.store(_record(i)):
+                errors.append(i)
+            # Visible to an independent connection once acknowledged
+            other = sqlite3.connect(str(tmp_path / "g.db"))
+            try:
+                assert other.execute("SELECT 1 FROM memory_records WHERE id = ?", (f"r{i}",)).fetchone()
+            finally:
+                other.close()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(200)))
+        assert errors == []
+        assert store.get_stats()["group_commit"]["records"] == 200
+        assert len(store.search("content", limit=500)) == 200
+        store.close()
+
+    def test_sqlite_failed_write_does_not_abort_batch(self, tmp_path):
+        store = SQLiteStore({"data_dir": str(tmp_path), "db_name": "g.db", "group_commit_records": 8})
+        assert store.store(_record(1))
+        store._connection.execute("CREATE TRIGGER reject BEFORE INSERT ON memory_records "
+                                  "WHEN NEW.id = 'r2' BEGIN SELECT RAISE(ABORT, 'no'); END")
+        assert store.store(_record(2)) is False
+        assert store.store(_record(3))
+        assert [r.id for r in store.get_many(["r1", "r2", "r3"])] == ["r1", "r3"]
+        store.close()
+
+    def test_jsonl_batches_appends(self, tmp_path):
+        store = LocalJSONLStore({"data_dir": str(tmp_path), "group_commit_records": 16, "fsync": True})
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(lambda i: store.store(_record(i)), range(100)))
+        lines = store.file_path.read_text().splitlines()
+        assert len(lines) == 100
+        assert store.delete("r5")
+        assert len(store.file_path.read_text().splitlines()) == 99
+        store.close()
+
+    def test_fabric_commit_every_uses_group_commit(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        monkeypatch.setenv("IOA_COMMIT_EVERY", "10")
+        mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)}, enable_metrics=False)
+        ids = [mf.store(f"record {i}") for i in range(5)]
+        assert mf._store.get_stats()["group_commit"]["max_records"] == 10
+        assert [r.id for r in mf._store.get_many(ids)] == ids
+        mf.close()
+
+    def test_fabric_store_many_commits_once(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)}, enable_metrics=False)
+        ids = mf.store_many([{"id": f"m{i}", "content": f"bulk {i}", "tags": ["b"]} for i in range(50)])
+        assert ids == [f"m{i}" for i in range(50)]
+        assert mf.retrieve("m7").tags == ["b"]
+        mf.close()
@@ -0,0 +1,111 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import pytest
+
+from ioa_core.memory_fabric.fabric import MemoryFabric
+from ioa_core.memory_fabric.hybrid import fuse, reciprocal_rank_fusion, weighted_score_fusion
+from ioa_core.memory_fabric.schema import EmbeddingV1
+
+
+def _embedding(vector):
+    return EmbeddingV1(vector=vector, model="test-embedding", dimension=len(vector))
+
+
+@pytest.fixture
+def fabric(tmp_path, monkeypatch):
+    monkeypatch.setenv("USE_4D_TIERING", "false")
+    mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)}, enable_metrics=False)
+    yield mf
+    mf.close()
+
+
+class TestFusion:
+    """Test rank fusion functions."""
+
+    def test_rrf_rewards_agreement(self):
+        lexical = [("a", None), ("b", None), ("c", None)]
+        semantic = [("c", 0.9), ("a", 0.8), ("d", 0.1)]
+        fused = reciprocal_rank_fusion([lexical, semantic])
+        assert fused["a"] > fused["b"]
+        assert fused["c"] > fused["d"]
+        assert fuse([lexical, semantic])[0][0] == "a"
+
+    def test_weighted_fusion_respects_weights(self):
+        lexical = [("a", None), ("b", None)]
+        semantic = [("b", 0.9), ("a", 0.1)]
+        assert fuse([lexical, semantic], method="weighted", weights=[1.0, 0.0])[0][0] == "a"
+        assert fuse([lexical, semantic], method="weighted", weights=[0.0, 1.0])[0][0] == "b"
+
+    def test_weighted_fusion_handles_constant_scores(self):
+        fused = weighted_score_fusion([[("a", 0.5), ("b", 0.5)]])
+        assert fused == {"a": 1.0, "b": 1.0}
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError):
+            fuse([], method="borda")
+
+
+class TestHybridSearch:
+    """Test MemoryFabric.hybrid_search integration."""
+
+    def test_combines_lexical_and_vector_hits(self, fabric):
+        keyword = fabric.store("quarterly revenue report", embedding=_embedding([0.0, 1.0]))
+        semantic = fabric.store("earnings summary", embedding=_embedding([1.0, 0.0]))
+        fabric.store("unrelated note", embedding=_embedding([-1.0, 0.0]))
+
+        results = fabric.hybrid_search("revenue", vector=[1.0, 0.0], k=2)
+        ids = [record.id for record, _ in results]
+        assert set(ids) == {keyword, semantic}
+
+    def test_lexical_only_without_vector(self, fabric):
+        keyword = fabric.store("governance checklist")
+        fabric.store("something else")
+        results = fabric.hybrid_search("governance", k=5)
+        assert [record.id for record, _ in results] == [keyword]
+
+    def test_lexical_tier_filter_applies_before_the_candidate_limit(self, fabric):
+        cold = [fabric.store(f"cold note {i}", storage_tier="cold") for i in range(3)]
+        for i in range(30):
+            fabric.store(f"hot note {i}", storage_tier="hot")
+        results = fabric.hybrid_search("note", k=5, candidates=5, filters={"storage_tier": "cold"})
+        assert sorted(record.id for record, _ in results) == sorted(cold)
+
+    def test_debug_returns_stage_timings(self, fabric):
+        fabric.store("debug timing record", embedding=_embedding([1.0, 0.0]))
+        results, timings = fabric.hybrid_search("timing", vector=[1.0, 0.0], k=1, debug=True)
+        assert len(results) == 1
+        for stage in ("lexical_ms", "vector_ms", "fusion_ms", "fetch_ms", "total_ms"):
+            assert stage in timings
+
+    def test_tier4d_prior_reranks(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "true")
+        mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)}, enable_metrics=False)
+        low = mf.store("policy note alpha", metadata={"priority": 0})
+        high = mf.store("policy note beta", metadata={"priority": 10, "risk_level": "high"})
+
+        results, timings = mf.hybrid_search("policy", k=2, tier4d_prior=1.0, debug=True)
+        assert [record.id for record, _ in results][0] == high
+        assert "rerank_ms" in timings
+        assert low in [record.id for record, _ in results]
+        mf.close()
+
+    def test_encrypted_results_leave_stored_records_encrypted(self, make_fabric, tmp_path):
+        mf = make_fabric("local_jsonl", encryption_key="hybrid-test-key")
+        alpha = mf.store("secret alpha", tags=["alpha"], embedding=_embedding([1.0, 0.0]))
+        beta = mf.store("secret beta", embedding=_embedding([0.0, 1.0]))
+
+        # Vector-only hits are fetched by id, lexical hits come from the store's search
+        assert [(r.id, r.content) for r, _ in mf.hybrid_search("zzz", vector=[1.0, 0.0], k=1)] == [(alpha, "secret alpha")]
+        assert [r.content for r, _ in mf.hybrid_search("alpha", k=1)] == ["secret alpha"]
+
+        mf.delete(beta)
+        data = (tmp_path / mf._store.file_path.name).read_text()
+        assert "secret alpha" not in data and '"encryption_mode": "aes-gcm"' in data
+        mf.close()
@@ -0,0 +1,149 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ioa_core.memory_fabric import MemoryFabric
+from tools.migrate_memory_engine_to_fabric import MemoryMigrationTool, parse_chunk, plan_chunks
+
+CHUNK_BYTES = 64
+
+
+def _write_source(path, count=40):
+    lines = []
+    for i in range(count):
+        # Uneven line lengths so ranges end mid-line; every fifth record has no id
+        entry = {"content": f"memory {i} " + "x" * (i % 7) * 5, "tags": [f"t{i % 3}"]}
+        if i % 5:
+            entry["id"] = f"rec-{i}"
+        lines.append(json.dumps(entry))
+        if i % 9 == 0:
+            lines.append("")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _parse_all(path, chunk_bytes):
+    ranges = plan_chunks(str(path), path.stat().st_size, chunk_bytes)
+    return ranges, [parse_chunk(str(path), start, end) for start, end in ranges]
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    # Receipts and the target fabric live under the working directory
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "legacy" / "memories.jsonl"
+    path.parent.mkdir()
+    _write_source(path)
+    return path
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    """IDs passed to MemoryFabric.store_many, batch by batch."""
+    batches = []
+    store_many = MemoryFabric.store_many
+
+    def tracking_store_many(self, records):
+        batches.append([record["id"] for record in records])
+        return store_many(self, records)
+
+    monkeypatch.setattr(MemoryFabric, "store_many", tracking_store_many)
+    return batches
+
+
+def _migrate(source, resume_receipt=None):
+    tool = MemoryMigrationTool()
+    stats = tool.migrate_streaming(
+        [{"path": str(source.parent)}], workers=1, chunk_bytes=CHUNK_BYTES, resume_receipt=resume_receipt
+    )
+    return tool, stats
+
+
+def _receipt(tool):
+    return tool.receipts_dir / f"{tool.migration_id}-receipt.json"
+
+
+class TestChunkParsing:
+    """Test byte-range planning and parsing."""
+
+    def test_every_line_is_parsed_exactly_once(self, source):
+        ranges, results = _parse_all(source, CHUNK_BYTES)
+        assert len(ranges) > 10
+        assert [end for _, end in ranges[:-1]] == [start for start, _ in ranges[1:]]
+        assert ranges[-1][1] == source.stat().st_size
+
+        contents = [record["content"] for result in results for record in result["records"]]
+        assert sorted(contents) == sorted(json.loads(line)["content"] for line in source.read_text().splitlines() if line)
+        assert len(set(contents)) == 40
+        assert sum(result["bytes"] for result in results) == source.stat().st_size
+        assert all(result["skipped"] == 0 and result["errors"] == [] for result in results)
+
+    def test_position_derived_ids_are_stable(self, source):
+        def ids(chunk_bytes):
+            return [record["id"] for result in _parse_all(source, chunk_bytes)[1] for record in result["records"]]
+
+        first = ids(CHUNK_BYTES)
+        assert first == ids(CHUNK_BYTES) == ids(1024 * 1024)
+        derived = [record_id for record_id in first if not record_id.startswith("rec-")]
+        assert len(derived) == len(set(derived)) == 8
+
+
+class TestStreamingResume:
+    """Test resuming a streaming migration from its receipt."""
+
+    def test_resume_skips_completed_ranges(self, source, stored):
+        tool, stats = _migrate(source)
+        assert stats["complete"] and stats["records_migrated"] == 40
+        state = stats["files"][str(source)]
+        assert state["complete"] and len(state["done"]) == state["chunks"]
+
+        # Turn the receipt into one interrupted after the first half of the ranges
+        receipt = json.loads(_receipt(tool).read_text())
+        state = receipt["files"][str(source)]
+        ranges, results = _parse_all(source, CHUNK_BYTES)
+        completed = {str(start) for start, _ in ranges[:len(ranges) // 2]}
+        state["done"] = {key: digest for key, digest in state["done"].items() if key in completed}
+        state["complete"] = False
+        state["offset"] = ranges[len(ranges) // 2][0]
+        _receipt(tool).write_text(json.dumps(receipt))
+
+        stored.clear()
+        resumed_tool, resumed = _migrate(source, resume_receipt=str(_receipt(tool)))
+        assert resumed_tool.migration_id == tool.migration_id and resumed["complete"]
+        expected = [record["id"] for result in results[len(ranges) // 2:] for record in result["records"]]
+        assert sorted(record_id for batch in stored for record_id in batch) == sorted(expected)
+
+        fabric = MemoryFabric(backend="sqlite", config=dict(resumed["target_config"]), enable_metrics=False)
+        assert fabric.count() == 40
+        fabric.close()
+
+    def test_completed_receipt_rewrites_nothing(self, source, stored):
+        tool, _ = _migrate(source)
+        stored.clear()
+        _, resumed = _migrate(source, resume_receipt=str(_receipt(tool)))
+        assert resumed["complete"] and stored == []
+
+    def test_changed_file_is_migrated_again(self, source, stored):
+        tool, _ = _migrate(source)
+        with source.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"id": "late", "content": "appended later"}) + "\n")
+        stored.clear()
+
+        _, resumed = _migrate(source, resume_receipt=str(_receipt(tool)))
+        ids = [record_id for batch in stored for record_id in batch]
+        assert len(ids) == 41 and "late" in ids
+        state = resumed["files"][str(source)]
+        assert state["complete"] and state["size"] == os.stat(source).st_size
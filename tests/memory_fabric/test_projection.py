@@ -0,0 +1,104 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import copy
+
+import pytest
+
+from ioa_core.memory_fabric.query import FabricQuery, projection
+from ioa_core.memory_fabric.schema import MemoryRecordV1
+
+
+def _seed(mf, count=5):
+    mf.store_many([
+        {"content": f"alpha note {i}", "id": f"r{i}", "tags": ["alpha", f"n{i}"], "metadata": {"priority": i}}
+        for i in range(count)
+    ])
+
+
+class TestProjection:
+    """Test `fields=[...]` on fabric reads."""
+
+    @pytest.mark.parametrize("backend", ["sqlite", "local_jsonl", "tiered"])
+    def test_reads_only_selected_fields(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        _seed(mf)
+
+        listed = sorted(mf.list_all(fields=["tags"]), key=lambda r: r.id)
+        assert [r.id for r in listed] == ["r0", "r1", "r2", "r3", "r4"]
+        assert listed[2].tags == ["alpha", "n2"]
+        assert listed[2].content == "" and listed[2].metadata == {}
+
+        found = mf.search("alpha", limit=3, fields=["metadata"])
+        assert len(found) == 3 and all(r.content == "" and r.metadata["priority"] >= 0 for r in found)
+        queried = mf.query(filters={"priority": {"gte": 3}}, order_by="priority", fields=["content"])
+        assert [(r.id, r.content, r.metadata) for r in queried] == [("r3", "alpha note 3", {}), ("r4", "alpha note 4", {})]
+
+        # The store's own records are untouched by projection
+        assert mf.retrieve("r2").content == "alpha note 2"
+        with pytest.raises(ValueError):
+            mf.list_all(fields=["secret"])
+        mf.close()
+
+    def test_sqlite_leaves_unselected_columns_out_of_the_select(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        _seed(mf, 2)
+        plan = mf._store.explain(FabricQuery(fields=["tags"]))
+        assert "NULL" in plan["sql"] and "memory_content" not in plan["sql"]
+        assert projection(["id", "content", "metadata", "timestamp", "tags", "storage_tier", "memory_type",
+                           "access_count", "last_accessed", "embedding"]) is None
+        mf.close()
+
+
+class TestLazyContent:
+    """Test decryption on first access to `.content`."""
+
+    @pytest.mark.parametrize("backend", ["sqlite", "local_jsonl"])
+    def test_listing_encrypted_records_decrypts_nothing_until_read(self, tmp_path, backend, monkeypatch, make_fabric):
+        mf = make_fabric(backend, encryption_key="projection-test-key")
+        _seed(mf)
+        calls = []
+        decrypt = mf.crypto.decrypt_content
+        monkeypatch.setattr(mf.crypto, "decrypt_content", lambda *a, **k: calls.append(1) or decrypt(*a, **k))
+
+        listed = sorted(mf.list_all(), key=lambda r: r.id)
+        assert len(listed) == 5 and calls == [] and all(r.content_deferred for r in listed)
+        assert listed[1].content == "alpha note 1" and len(calls) == 1
+        assert listed[1].content == "alpha note 1" and len(calls) == 1
+        assert sorted(r.id for r in mf.list_all(fields=["tags", "metadata"])) == [r.id for r in listed]
+        assert len(calls) == 1
+
+        # Projected content is still decrypted lazily (its metadata marks the encryption)
+        found = mf.search("n3", fields=["content"])
+        assert [r.content for r in found] == ["alpha note 3"] and len(calls) == 2
+
+        # Copies resolve the content; the backend keeps ciphertext
+        assert copy.deepcopy(listed[4]).content == "alpha note 4"
+        assert sorted(r.content for r in mf.list_all())[0] == "alpha note 0"
+        stored = mf._store.get_many(["r0"])[0]
+        assert stored.content != "alpha note 0" and not stored.content_deferred
+        mf.close()
+
+    def test_retrieve_leaves_the_stored_record_encrypted(self, tmp_path, make_fabric):
+        mf = make_fabric("local_jsonl", encryption_key="projection-test-key")
+        _seed(mf, 2)
+        assert mf.retrieve("r0").content == "alpha note 0"
+        mf.delete("r1")
+        data = (tmp_path / mf._store.file_path.name).read_text()
+        assert '"id": "r0"' in data and "alpha note 0" not in data
+        mf.close()
+
+    def test_deferred_content_record(self):
+        record = MemoryRecordV1(id="a", content="payload")
+        record.defer_content(str.upper)
+        assert record.content_deferred and record.to_dict()["content"] == "PAYLOAD"
+        assert not record.content_deferred
+        record.defer_content(str.lower)
+        record.content = "replaced"
+        assert record.content == "replaced" and not record.content_deferred
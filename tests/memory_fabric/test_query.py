@@ -0,0 +1,111 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import sqlite3
+
+import pytest
+
+from ioa_core.memory_fabric.query import FabricQuery, normalize_filters
+
+
+def _seed(mf):
+    ids = {}
+    for i in range(40):
+        ids[i] = mf.store(
+            f"incident report {i}",
+            metadata={"jurisdiction": "eu" if i % 2 else "us", "priority": i % 5, "risk_level": "high" if i % 7 == 0 else "low"},
+            tags=["audit", f"team{i % 3}"],
+            storage_tier="cold" if i % 4 == 0 else "hot"
+        )
+    return ids
+
+
+class TestFilterNormalization:
+    """Test filter parsing."""
+
+    def test_shorthands(self):
+        conditions = normalize_filters({"tags": ["a", "b"], "priority": {"gte": 2}, "risk_level": ["high", "medium"]})
+        assert [(c.kind, c.op) for c in conditions] == [
+            ("tag", "eq"), ("tag", "eq"), ("metadata", "gte"), ("metadata", "in")
+        ]
+
+    def test_unknown_operator(self):
+        with pytest.raises(ValueError):
+            FabricQuery(filters={"priority": {"between": [1, 2]}})
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "local_jsonl"])
+class TestFabricQuery:
+    """Test query() pushdown on each backend."""
+
+    def test_filters_apply_before_limit(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        _seed(mf)
+        results = mf.query(filters={"jurisdiction": "eu", "priority": {"gte": 3}}, order_by="-priority", limit=None)
+        assert len(results) == 8
+        assert all(r.metadata["jurisdiction"] == "eu" and r.metadata["priority"] >= 3 for r in results)
+        assert [r.metadata["priority"] for r in results] == sorted((r.metadata["priority"] for r in results), reverse=True)
+        mf.close()
+
+    def test_tags_and_text(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        ids = _seed(mf)
+        results = mf.query(text="incident", filters={"tags": ["audit", "team1"], "risk_level": "high"}, limit=None)
+        assert {r.id for r in results} == {ids[i] for i in range(40) if i % 3 == 1 and i % 7 == 0}
+        assert len(mf.query(filters={"tags": {"in": ["team0", "team2"]}}, limit=None)) == 27
+        mf.close()
+
+    def test_search_by_tier_is_not_short(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        _seed(mf)
+        results = mf.search("incident", limit=5, storage_tier="cold")
+        assert len(results) == 5
+        assert all(r.storage_tier.value == "cold" for r in results)
+        mf.close()
+
+    def test_explain(self, tmp_path, backend, make_fabric):
+        mf = make_fabric(backend)
+        _seed(mf)
+        plan = mf.explain_query(filters={"jurisdiction": "eu", "tags": "audit"})
+        assert plan["backend"] == backend
+        assert "metadata.jurisdiction eq 'eu'" in plan["filters"]
+        if backend == "sqlite":
+            assert "idx_meta_jurisdiction" in plan["indexes"]
+        else:
+            assert plan["access"].startswith("secondary index")
+        mf.close()
+
+
+class TestSQLiteTagTable:
+    """Test tag junction maintenance."""
+
+    def test_rewrites_and_deletes_keep_tags_in_sync(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        record_id = mf.store("x", tags=["old"])
+        mf.store("x", tags=["new"], record_id=record_id)
+        assert mf.query(filters={"tags": "old"}) == []
+        assert [r.id for r in mf.query(filters={"tags": "new"})] == [record_id]
+        mf.delete(record_id)
+        mf.close()
+        conn = sqlite3.connect(str(tmp_path / "fabric.db"))
+        assert conn.execute("SELECT COUNT(*) FROM memory_tags").fetchone()[0] == 0
+        conn.close()
+
+    def test_backfills_existing_database(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        record_id = mf.store("legacy", tags=["keep"])
+        mf.close()
+        conn = sqlite3.connect(str(tmp_path / "fabric.db"))
+        conn.execute("DROP TABLE memory_tags")
+        conn.commit()
+        conn.close()
+
+        reopened = make_fabric()
+        assert [r.id for r in reopened.query(filters={"tags": "keep"})] == [record_id]
+        reopened.close()
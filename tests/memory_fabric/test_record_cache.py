@@ -0,0 +1,144 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import sqlite3
+
+import pytest
+
+from ioa_core.memory_fabric.cache import AccessTracker, CacheConfig, RecordCache
+from ioa_core.memory_fabric.fabric import MemoryFabric
+from ioa_core.memory_fabric.schema import MemoryRecordV1
+
+
+@pytest.fixture
+def fabric_config():
+    return {"cache": {"max_entries": 8}}
+
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRecordCache:
+    """Test eviction, admission and expiry in isolation."""
+
+    def test_lru_eviction_and_ttl(self):
+        clock = FakeClock()
+        cache = RecordCache(CacheConfig(max_entries=2, ttl_seconds=10), clock=clock)
+        for i in range(3):
+            cache.put(MemoryRecordV1(id=f"r{i}", content=str(i)))
+        assert cache.get("r0") is None
+        assert cache.get("r2").content == "2"
+        clock.now = 11
+        assert cache.get("r2") is None
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1 and stats["expirations"] == 1 and stats["hits"] == 1
+
+    def test_only_admitted_tiers_are_cached(self):
+        cache = RecordCache(CacheConfig(max_entries=4))
+        assert not cache.put(MemoryRecordV1(id="c", content="x", storage_tier="cold"))
+        assert cache.put(MemoryRecordV1(id="h", content="x", storage_tier="hot"))
+
+    def test_tinylfu_keeps_popular_records(self):
+        cache = RecordCache(CacheConfig(max_entries=1, policy="tinylfu"))
+        for _ in range(5):
+            cache.get("popular")
+        cache.put(MemoryRecordV1(id="popular", content="p"))
+        cache.get("one-off")
+        assert not cache.put(MemoryRecordV1(id="one-off", content="o"))
+        assert cache.get("popular").content == "p"
+
+    def test_stale_put_after_invalidation_is_dropped(self):
+        cache = RecordCache(CacheConfig(max_entries=4))
+        generation = cache.generation()
+        cache.invalidate(["r"])
+        assert not cache.put(MemoryRecordV1(id="r", content="old"), generation)
+
+    def test_hits_return_copies(self):
+        cache = RecordCache(CacheConfig(max_entries=4))
+        cache.put(MemoryRecordV1(id="r", content="x", metadata={"a": 1}))
+        cache.get("r").metadata["a"] = 2
+        assert cache.get("r").metadata == {"a": 1}
+
+
+class TestAccessTracker:
+    """Test the write-behind buffer."""
+
+    def test_sums_accesses_and_flushes_on_threshold(self):
+        writes = []
+        tracker = AccessTracker(writes.append, flush_records=2, flush_seconds=60)
+        record = MemoryRecordV1(id="a")
+        record.update_access()
+        tracker.record("a", record.last_accessed)
+        tracker.record("a", record.last_accessed)
+        assert writes == []
+        tracker.record("b", record.last_accessed)
+        assert writes[0]["a"][0] == 2 and writes[0]["b"][0] == 1
+
+    def test_failed_flush_keeps_pending(self):
+        def failing(_):
+            raise IOError("down")
+
+        tracker = AccessTracker(failing, flush_records=100)
+        record = MemoryRecordV1(id="a")
+        record.update_access()
+        tracker.record("a", record.last_accessed)
+        assert tracker.flush() == 0
+        assert len(tracker) == 1
+
+
+class TestFabricCache:
+    """Test the cache through MemoryFabric.retrieve()."""
+
+    def test_hits_skip_backend_and_counts_are_written_behind(self, tmp_path, make_fabric):
+        mf = make_fabric(cache={"access_flush_records": 100})
+        record_id = mf.store("context")
+        for _ in range(5):
+            assert mf.retrieve(record_id).content == "context"
+        stats = mf.get_stats()["record_cache"]
+        assert stats["hits"] == 4 and stats["misses"] == 1
+        assert stats["access_write_behind"]["pending"] == 1
+        assert mf.retrieve(record_id).access_count == 6
+
+        mf.flush()
+        conn = sqlite3.connect(str(tmp_path / "fabric.db"))
+        assert conn.execute("SELECT access_count FROM memory_records WHERE id = ?", (record_id,)).fetchone()[0] == 6
+        conn.close()
+        mf.close()
+
+    def test_store_and_delete_invalidate(self, tmp_path, make_fabric):
+        mf = make_fabric("local_jsonl")
+        record_id = mf.store("v1")
+        assert mf.retrieve(record_id).content == "v1"
+        mf.store("v2", record_id=record_id)
+        assert mf.retrieve(record_id).content == "v2"
+        assert mf.delete(record_id)
+        assert mf.retrieve(record_id) is None
+        mf.close()
+
+    def test_caches_decrypted_content_without_touching_store(self, tmp_path, make_fabric):
+        mf = make_fabric("local_jsonl", encryption_key="k")
+        record_id = mf.store("secret")
+        assert mf.retrieve(record_id).content == "secret"
+        assert mf.retrieve(record_id).content == "secret"
+        assert mf._store.get_many([record_id])[0].content != "secret"
+        mf.close()
+
+    def test_cold_records_are_not_cached(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        record_id = mf.store("archive", storage_tier="cold")
+        mf.retrieve(record_id)
+        mf.retrieve(record_id)
+        assert mf.get_stats()["record_cache"]["size"] == 0
+        mf.close()
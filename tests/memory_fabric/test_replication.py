@@ -0,0 +1,148 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from ioa_core.memory_fabric.replication import SQLiteReplicator
+
+
+@pytest.fixture
+def fabric_config():
+    return {"replicas": ["replica-a.db", "replica-b.db"]}
+
+
+
+class TestSQLiteReplicator:
+    """Test page shipping between local database files."""
+
+    def test_ships_committed_state_and_tracks_lag(self, tmp_path):
+        primary = sqlite3.connect(str(tmp_path / "p.db"))
+        primary.execute("PRAGMA journal_mode=WAL")
+        primary.execute("CREATE TABLE t (x)")
+        primary.commit()
+        replicator = SQLiteReplicator(str(tmp_path / "p.db"), [str(tmp_path / "r.db")], interval=60)
+        assert replicator.sync() == 1 and replicator.sync() == 0
+
+        primary.execute("INSERT INTO t VALUES (1)")
+        primary.commit()
+        replicator.notify()
+        assert replicator.status()["max_lag_seconds"] >= 0
+        assert replicator._commit_times
+        assert replicator.sync() == 1
+        assert replicator.status()["max_lag_seconds"] == 0.0
+
+        replica = sqlite3.connect(f"file:{tmp_path / 'r.db'}?mode=ro", uri=True)
+        assert replica.execute("SELECT x FROM t").fetchall() == [(1,)]
+        replica.close()
+        replicator.stop()
+        primary.close()
+
+    def test_ships_only_changed_pages(self, tmp_path):
+        primary = sqlite3.connect(str(tmp_path / "p.db"))
+        primary.execute("PRAGMA journal_mode=WAL")
+        primary.execute("CREATE TABLE t (x)")
+        primary.executemany("INSERT INTO t VALUES (?)", [("row %d " % i * 10,) for i in range(2000)])
+        primary.commit()
+        replicator = SQLiteReplicator(str(tmp_path / "p.db"), [str(tmp_path / "r.db")], interval=60)
+        replicator.sync()
+        replica_state = replicator.replicas[0]
+        total = replica_state.pages_shipped
+        assert total == (tmp_path / "r.db").stat().st_size // 4096 > 40
+
+        # A reader opened before the next ship sees it without reconnecting
+        replica = sqlite3.connect(f"file:{tmp_path / 'r.db'}?mode=ro", uri=True)
+        assert replica.execute("SELECT COUNT(*) FROM t").fetchone() == (2000,)
+        primary.execute("INSERT INTO t VALUES ('late')")
+        primary.commit()
+        replicator.notify()
+        assert replicator.sync() == 1
+        assert replica_state.pages_shipped - total <= 4
+        assert replica.execute("SELECT COUNT(*) FROM t").fetchone() == (2001,)
+        assert replica.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+        assert replica.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+
+        # Unknown replica contents (after a failed ship) are rewritten in full
+        replica_state.pages = None
+        primary.execute("DELETE FROM t WHERE x = 'late'")
+        primary.commit()
+        replicator.sync()
+        assert replica_state.pages_shipped - total > total - 4
+        assert replica.execute("SELECT COUNT(*) FROM t").fetchone() == (2000,)
+        replica.close()
+        replicator.stop()
+        primary.close()
+
+    def test_replica_cannot_be_primary(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteReplicator(str(tmp_path / "p.db"), [str(tmp_path / "p.db")])
+
+
+class TestReplicaReads:
+    """Test SQLiteStore routing reads to replicas."""
+
+    def test_reads_are_served_by_replica(self, tmp_path, make_fabric):
+        mf = make_fabric(replica_interval=60)
+        ids = [mf.store(f"replicated record {i}", tags=["r"]) for i in range(5)]
+        assert mf._store.sync_replicas() == 2
+
+        before = mf.get_stats()
+        assert [r["lag_seconds"] for r in before["replication"]["replicas"]] == [0.0, 0.0]
+        assert len(mf.query(filters={"tags": "r"}, limit=None)) == 5
+        assert mf.retrieve(ids[0]).content == "replicated record 0"
+        assert len(mf.search("replicated")) == 5
+        stats = mf.get_stats()
+        assert stats["replica_reads"] - before.get("replica_reads", 0) == 3
+        mf.close()
+
+        replica = sqlite3.connect(str(tmp_path / "replica-b.db"))
+        assert replica.execute("SELECT access_count FROM memory_records WHERE id = ?", (ids[0],)).fetchone() == (1,)
+        replica.close()
+
+    def test_lookups_by_id_read_your_writes(self, tmp_path, make_fabric):
+        mf = make_fabric(replicas=["r1.db"], replica_interval=60)
+        mf.store("first")
+        mf._store.sync_replicas()
+        # Within the default lag bound, but the replica lacks the new write
+        record_id = mf.store("hello")
+        assert mf.retrieve(record_id).content == "hello"
+        assert [r.id for r in mf._store.get_many([record_id])] == [record_id]
+        assert mf.count() == 2
+        assert mf.get_stats().get("replica_reads", 0) == 0
+
+        mf._store.sync_replicas()
+        assert mf.retrieve(record_id).content == "hello"
+        assert mf.get_stats()["replica_reads"] == 1
+        mf.close()
+
+    def test_lagging_replicas_fall_back_to_primary(self, tmp_path, make_fabric):
+        mf = make_fabric(replica_interval=60, replica_max_lag=0)
+        mf.store("first")
+        mf._store.sync_replicas()
+        record_id = mf.store("second")
+        mf._store.flush()
+        assert mf.retrieve(record_id).content == "second"
+        stats = mf.get_stats()
+        assert stats["primary_reads"] >= 1
+        assert stats["replication"]["max_lag_seconds"] > 0
+        mf.close()
+
+    def test_background_shipping_bounds_lag(self, tmp_path, make_fabric):
+        mf = make_fabric(replica_interval=0.05)
+        record_id = mf.store("shipped in the background")
+        mf._store.flush()
+        deadline = time.monotonic() + 5
+        while mf.get_stats()["replication"]["max_lag_seconds"] != 0.0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        replica = sqlite3.connect(f"file:{tmp_path / 'replica-a.db'}?mode=ro", uri=True)
+        assert replica.execute("SELECT id FROM memory_records").fetchall() == [(record_id,)]
+        replica.close()
+        mf.close()
@@ -0,0 +1,158 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import random
+
+import pytest
+
+from ioa_core.memory_fabric.ann_index import IVFFlatIndex, np
+from ioa_core.memory_fabric.fabric import MemoryFabric
+from ioa_core.memory_fabric.schema import EmbeddingV1
+
+
+def _embedding(vector):
+    return EmbeddingV1(vector=vector, model="test-embedding", dimension=len(vector))
+
+
+@pytest.fixture
+def fabric(tmp_path, monkeypatch):
+    monkeypatch.setenv("USE_4D_TIERING", "false")
+    mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)}, enable_metrics=False)
+    yield mf
+    mf.close()
+
+
+class TestIVFFlatIndex:
+    """Test the ANN index in isolation."""
+
+    def test_exact_search_orders_by_cosine(self):
+        index = IVFFlatIndex(metric="cosine")
+        index.add("a", [1.0, 0.0])
+        index.add("b", [0.7, 0.7])
+        index.add("c", [0.0, 1.0])
+
+        hits = index.search([1.0, 0.1], k=2)
+        assert [record_id for record_id, _ in hits] == ["a", "b"]
+        assert hits[0][1] > hits[1][1]
+
+    def test_dot_metric_uses_magnitude(self):
+        index = IVFFlatIndex(metric="dot")
+        index.add("small", [1.0, 0.0])
+        index.add("large", [5.0, 0.0])
+        assert index.search([1.0, 0.0], k=1)[0][0] == "large"
+
+    def test_filters_and_remove(self):
+        index = IVFFlatIndex()
+        index.add("k1", [1.0, 0.0], memory_type="knowledge", storage_tier="hot")
+        index.add("c1", [1.0, 0.0], memory_type="conversation", storage_tier="cold")
+
+        hits = index.search([1.0, 0.0], k=5, filters={"memory_type": "knowledge"})
+        assert [record_id for record_id, _ in hits] == ["k1"]
+        hits = index.search([1.0, 0.0], k=5, filters={"storage_tier": ["cold"]})
+        assert [record_id for record_id, _ in hits] == ["c1"]
+
+        assert index.remove("k1") is True
+        assert [record_id for record_id, _ in index.search([1.0, 0.0], k=5)] == ["c1"]
+
+    def test_dimension_mismatch_rejected(self):
+        index = IVFFlatIndex()
+        index.add("a", [1.0, 0.0])
+        with pytest.raises(ValueError):
+            index.add("b", [1.0, 0.0, 0.0])
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        index = IVFFlatIndex(metric="cosine")
+        index.add("a", [1.0, 0.0], memory_type="knowledge")
+        index.add("b", [0.0, 1.0], memory_type="context")
+        index.remove("a")
+
+        path = tmp_path / "index.ann.json"
+        index.save(path)
+        loaded = IVFFlatIndex.load(path)
+
+        assert len(loaded) == 1
+        assert "a" not in loaded
+        assert loaded.search([0.0, 1.0], k=1)[0][0] == "b"
+
+    @pytest.mark.skipif(np is None, reason="numpy not installed")
+    def test_trained_index_recall(self):
+        rng = random.Random(7)
+        index = IVFFlatIndex(nlist=8, nprobe=8, train_threshold=400)
+        vectors = {}
+        for i in range(600):
+            vector = [rng.gauss(0, 1) for _ in range(16)]
+            vectors[f"r{i}"] = vector
+            index.add(f"r{i}", vector)
+
+        assert index.is_trained
+        query = vectors["r42"]
+        # Probing every list must match the exact scan
+        assert index.search(query, k=10) == index.search(query, k=10, exact=True)
+        assert index.search(query, k=1, nprobe=1)[0][0] == "r42"
+
+
+class TestSearchSimilar:
+    """Test MemoryFabric.search_similar integration."""
+
+    def test_search_similar_returns_records_with_scores(self, fabric):
+        near = fabric.store("near", memory_type="knowledge", embedding=_embedding([1.0, 0.0, 0.0]))
+        fabric.store("far", memory_type="knowledge", embedding=_embedding([0.0, 0.0, 1.0]))
+        fabric.store("no embedding")
+
+        results = fabric.search_similar([0.9, 0.1, 0.0], k=1)
+        assert len(results) == 1
+        record, score = results[0]
+        assert record.id == near
+        assert record.content == "near"
+        assert score > 0.9
+
+    def test_search_similar_filters_memory_type(self, fabric):
+        fabric.store("conversation", memory_type="conversation", embedding=_embedding([1.0, 0.0]))
+        knowledge = fabric.store("knowledge", memory_type="knowledge", embedding=_embedding([0.5, 0.5]))
+
+        results = fabric.search_similar([1.0, 0.0], k=5, filters={"memory_type": "knowledge"})
+        assert [record.id for record, _ in results] == [knowledge]
+
+    def test_deleted_records_leave_index(self, fabric):
+        record_id = fabric.store("gone", embedding=_embedding([1.0, 0.0]))
+        fabric.delete(record_id)
+        assert fabric.search_similar([1.0, 0.0], k=5) == []
+
+    def test_index_persists_and_rebuilds(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        config = {"data_dir": str(tmp_path), "db_name": "fabric.db"}
+        mf = MemoryFabric(backend="sqlite", config=dict(config), enable_metrics=False)
+        record_id = mf.store("persisted", embedding=_embedding([0.0, 1.0]))
+        mf.close()
+
+        reopened = MemoryFabric(backend="sqlite", config=dict(config), enable_metrics=False)
+        assert reopened.search_similar([0.0, 1.0], k=1)[0][0].id == record_id
+
+        assert reopened.rebuild_vector_index() == 1
+        assert reopened.search_similar([0.0, 1.0], k=1)[0][0].id == record_id
+        reopened.close()
+
+    def test_encrypted_content_is_decrypted(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        mf = MemoryFabric(
+            backend="local_jsonl",
+            config={"data_dir": str(tmp_path)},
+            encryption_key="test-key",
+            enable_metrics=False
+        )
+        mf.store("secret text", embedding=_embedding([1.0, 0.0]))
+        other = mf.store("other secret", embedding=_embedding([0.0, 1.0]))
+        record, _ = mf.search_similar([1.0, 0.0], k=1)[0]
+        assert record.content == "secret text"
+
+        # The store's own record stays encrypted, so a rewrite keeps ciphertext on disk
+        mf.delete(other)
+        data = (tmp_path / mf._store.file_path.name).read_text()
+        assert "secret text" not in data and '"encryption_mode": "aes-gcm"' in data
+        mf.close()
@@ -0,0 +1,109 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+
+from ioa_core.memory_fabric.query import FabricQuery
+from ioa_core.memory_fabric.schema import MemoryRecordV1
+from ioa_core.memory_fabric.segment import SegmentCorruptError, SegmentReader, write_segment
+from ioa_core.memory_fabric.stores.segments import SegmentStore
+
+
+def _records(start, stop, batch=0):
+    return [
+        MemoryRecordV1(id=f"r{i:05d}", content=f"archived note {i} from batch {batch} " * 4, tags=[f"t{i % 3}"])
+        for i in range(start, stop)
+    ]
+
+
+class TestSegmentFormat:
+    """Test the on-disk segment file."""
+
+    def test_point_read_decompresses_one_block(self, tmp_path):
+        path = str(tmp_path / "seg.sst")
+        assert write_segment(path, _records(0, 500), block_size=2048) == 500
+        reader = SegmentReader(path)
+        stats = reader.stats()
+        assert stats["blocks"] > 10 and stats["raw_bytes"] > 3 * stats["bytes"]
+
+        with mock.patch("ioa_core.memory_fabric.segment.zlib.decompress", wraps=__import__("zlib").decompress) as spy:
+            assert reader.get("r00321").content.startswith("archived note 321 ")
+            assert spy.call_count == 1
+            assert reader.get("r99999") is None and reader.get("a") is None
+            assert spy.call_count <= 2  # at most one Bloom false positive
+        assert [r.id for r in reader] == [f"r{i:05d}" for i in range(500)]
+        assert reader.verify()
+        reader.close()
+
+    def test_checksum_detects_corruption(self, tmp_path):
+        path = tmp_path / "seg.sst"
+        write_segment(str(path), _records(0, 200))
+        data = bytearray(path.read_bytes())
+        data[40] ^= 0xFF
+        path.write_bytes(bytes(data))
+        assert not SegmentReader(str(path)).verify()
+
+        path.write_bytes(b"not a segment" * 10)
+        with pytest.raises(SegmentCorruptError):
+            SegmentReader(str(path))
+        with pytest.raises(ValueError):
+            write_segment(str(tmp_path / "unsorted.sst"), list(reversed(_records(0, 3))))
+
+
+class TestSegmentStore:
+    """Test the segment-backed MemoryStore."""
+
+    def test_newest_segment_wins_and_compaction_merges(self, tmp_path):
+        store = SegmentStore({"data_dir": str(tmp_path), "segment_max_segments": 4})
+        for batch in range(6):
+            assert store.store_many(_records(batch * 50, batch * 50 + 100, batch)) == 100
+        stats = store.get_stats()
+        assert stats["segments"]["count"] <= 4 and stats["compactions"] >= 1
+        assert store.retrieve("r00120").content.startswith("archived note 120 from batch 2 ")
+        assert len(store.list_all()) == 350
+
+        assert store.delete("r00120") and not store.delete("r00120")
+        assert store.retrieve("r00120") is None and store.get_stats()["segments"]["tombstones"] == 1
+        old = datetime.now(timezone.utc) - timedelta(days=30)
+        expired = [MemoryRecordV1(id=f"old{i}", content="old", timestamp=old) for i in range(3)]
+        store.store_many(expired)
+        assert sorted(store.delete_expired("conversation", datetime.now(timezone.utc) - timedelta(days=1))) == [
+            "old0", "old1", "old2"
+        ]
+
+        assert store.compact() == 349
+        assert store.get_stats()["segments"]["count"] == 1 and store.verify() == []
+        store.close()
+
+        reopened = SegmentStore({"data_dir": str(tmp_path)})
+        assert reopened.retrieve("r00120") is None
+        assert reopened.retrieve("r00121").content.startswith("archived note 121 from batch 2 ")
+        assert len(reopened.query(FabricQuery(filters={"tags": "t1"}, limit=None))) == 117
+        assert len(reopened.search("t1", limit=1000)) == 117
+        reopened.close()
+
+    def test_segments_as_cold_tier(self, tmp_path, make_fabric):
+        mf = make_fabric("tiered", tiering={"cold": "segments", "promote": False})
+        assert isinstance(mf._store.cold, SegmentStore)
+        stale = mf.store("stale note")
+        fresh = mf.store("fresh note")
+        record = mf._store.hot.get_many([stale])[0]
+        record.timestamp = datetime.now(timezone.utc) - timedelta(days=10)
+        record.metadata["timestamp"] = record.timestamp.isoformat()
+        mf._store.hot.store(record)
+
+        assert mf.retier() == 1
+        assert [r.id for r in mf._store.cold.list_all()] == [stale]
+        assert mf.retrieve(stale).content == "stale note"
+        assert {r.id for r in mf.query(limit=None)} == {stale, fresh}
+        assert mf.delete(stale) and mf.retrieve(stale) is None
+        mf.close()
@@ -0,0 +1,132 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from ioa_core.memory_fabric.sharding import Resharder, ShardMap, jump_hash, shard_path
+
+
+@pytest.fixture(autouse=True)
+def _sharded(monkeypatch):
+    monkeypatch.setenv("IOA_SHARDS", "4")
+    monkeypatch.setenv("IOA_PROGRESS_T", "3600")
+
+
+def _populate(make_fabric, count=400):
+    async def run():
+        mf = make_fabric()
+        await mf.store_batch([{"content": f"doc {i}", "metadata": {"i": i}} for i in range(count)])
+        pks = [mf._generate_record_pk({"content": f"doc {i}", "metadata": {"i": i}}) for i in range(count)]
+        mf.close()
+        return pks
+    return asyncio.run(run())
+
+
+def _counts(tmp_path, shards):
+    counts = []
+    for i in range(shards):
+        conn = sqlite3.connect(shard_path(str(tmp_path), i))
+        counts.append(conn.execute("SELECT COUNT(*) FROM memory_records").fetchone()[0])
+        conn.close()
+    return counts
+
+
+class TestJumpHash:
+    """Test placement stability."""
+
+    def test_growth_only_moves_keys_to_new_shards(self):
+        moved = 0
+        for key in range(0, 2 ** 40, 2 ** 40 // 2000):
+            before, after = jump_hash(key, 4), jump_hash(key, 16)
+            assert after == before or after >= 4
+            moved += after != before
+        assert 0.65 < moved / 2000 < 0.85
+
+
+class TestReshard:
+    """Test online resharding of the sharded fabric."""
+
+    def test_grow_copies_moved_records_and_flips_map(self, tmp_path, make_fabric):
+        pks = _populate(make_fabric)
+        assert sum(_counts(tmp_path, 4)) == 400
+
+        mf = make_fabric()
+        resharder = mf.reshard(16, background=False)
+        assert resharder.status()["phase"] == "done"
+        assert 0.6 < resharder.status()["copied"] / 400 < 0.9
+
+        counts = _counts(tmp_path, 16)
+        assert sum(counts) == 400 and all(counts)
+        for pk in pks:
+            record = mf.get_sharded_record(pk)
+            assert record is not None and record["shard"] == mf._shard_map.shard_for(pk)
+
+        with open(tmp_path / "shard_map.json") as f:
+            persisted = json.load(f)
+        assert persisted["shards"] == 16 and persisted["previous"] is None and persisted["version"] == 2
+        mf.close()
+
+    def test_reads_fall_back_to_old_shard_while_migrating(self, tmp_path, make_fabric):
+        pks = _populate(make_fabric, count=50)
+        mf = make_fabric()
+        resharder = Resharder(str(tmp_path), mf._shard_map, 8, on_map=mf._set_shard_map)
+        shard_map = resharder.begin()
+        for i in range(len(mf._shard_connections), 8):
+            mf._shard_connections.append(sqlite3.connect(shard_path(str(tmp_path), i)))
+
+        moved = [pk for pk in pks if shard_map.shard_for(pk) != shard_map.previous_shard_for(pk)]
+        assert moved and mf._shard_map.migrating
+        record = mf.get_sharded_record(moved[0])
+        assert record["shard"] == shard_map.previous_shard_for(moved[0])
+        mf.close()
+
+        # A fabric reopened mid-reshard keeps both layouts and resumes
+        reopened = make_fabric()
+        assert reopened._shard_map.migrating and len(reopened._shard_connections) == 8
+        reopened.reshard(8, background=False)
+        assert reopened.get_sharded_record(moved[0])["shard"] == reopened._shard_map.shard_for(moved[0])
+        assert sum(_counts(tmp_path, 8)) == 50
+        reopened.close()
+
+    def test_legacy_layout_keeps_modulo_placement(self, tmp_path, make_fabric):
+        sqlite3.connect(shard_path(str(tmp_path), 0)).close()
+        mf = make_fabric()
+        assert mf._shard_map.scheme == "modulo"
+        mf.close()
+        assert ShardMap.load(str(tmp_path / "shard_map.json")).scheme == "modulo"
+
+    def test_shard_filters_cover_copied_rows(self, tmp_path, make_fabric):
+        pks = _populate(make_fabric, count=100)
+        mf = make_fabric(bloom=True)
+        mf.reshard(8, background=False)
+        assert all(mf.get_sharded_record(pk) is not None for pk in pks)
+        before = mf.get_stats()["bloom"]["negatives"]
+        assert mf.get_sharded_record("0" * 64) is None
+        assert mf.get_stats()["bloom"]["negatives"] == before + 1
+        mf.close()
+
+    def test_batches_after_a_reshard_start_writers_on_their_loop(self, tmp_path, make_fabric):
+        mf = make_fabric()
+        assert mf._shard_writers == []
+        mf.reshard(8, background=False)
+
+        async def run(batch):
+            return await mf.store_batch([{"content": f"doc {batch}-{i}"} for i in range(100)])
+
+        assert len(asyncio.run(run(0))) == 100
+        # Writers of the first batch are gone; the second batch starts its own
+        assert mf._shard_writers == []
+        assert len(asyncio.run(run(1))) == 100
+        counts = _counts(tmp_path, 8)
+        assert sum(counts) == 200 and all(counts)
+        mf.close()
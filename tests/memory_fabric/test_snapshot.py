@@ -0,0 +1,81 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import os
+
+from ioa_core.memory_fabric.schema import MemoryRecordV1
+from ioa_core.memory_fabric.snapshot import SnapshotReader, publish_snapshot, write_snapshot
+
+
+def _worker(make_fabric, tmp_path, encryption_key=None):
+    return make_fabric(
+        "snapshot",
+        encryption_key=encryption_key,
+        data_dir=tmp_path / "worker",
+        snapshot_dir=str(tmp_path / "snap"),
+        snapshot_refresh_seconds=0
+    )
+
+
+class TestSnapshotFormat:
+    """Test the mmap snapshot file."""
+
+    def test_lookup_and_token_search(self, tmp_path):
+        path = str(tmp_path / "s.snap")
+        records = [MemoryRecordV1(id=f"r{i:03d}", content=f"report {i} about audit", tags=[f"t{i % 2}"]) for i in range(50)]
+        records.append(MemoryRecordV1(id="r007", content="rewritten later"))
+        assert write_snapshot(path, records, generation=3) == 50
+
+        reader = SnapshotReader(path)
+        assert reader.generation == 3 and len(reader) == 50
+        assert reader.get("r007").content == "rewritten later"
+        assert reader.get("missing") is None
+        assert len(reader.search("audit report")) == 49
+        assert {r.id for r in reader.search("t1")} == {f"r{i:03d}" for i in range(1, 50, 2) if i != 7}
+        reader.close()
+
+    def test_publish_rotates_generations(self, tmp_path):
+        directory = str(tmp_path)
+        for _ in range(3):
+            pointer = publish_snapshot(directory, [MemoryRecordV1(id="a", content="x")], keep=2)
+        assert pointer["generation"] == 3
+        assert sorted(name for name in os.listdir(directory) if name.endswith(".snap")) == [
+            "fabric-0000000002.snap", "fabric-0000000003.snap"
+        ]
+
+
+class TestSnapshotBackend:
+    """Test workers reading a published snapshot."""
+
+    def test_worker_reads_snapshot_and_picks_up_new_generation(self, tmp_path, make_fabric):
+        primary = make_fabric(encryption_key="k", data_dir=tmp_path / "primary", snapshot_dir=str(tmp_path / "snap"))
+        first = primary.store("first policy", tags=["gov"])
+        primary.publish_snapshot()
+
+        worker = _worker(make_fabric, tmp_path, encryption_key="k")
+        assert worker.retrieve(first).content == "first policy"
+        assert [r.id for r in worker.search("gov")] == [first]
+
+        second = primary.store("second policy")
+        assert worker.retrieve(second) is None
+        primary.publish_snapshot()
+        assert worker.retrieve(second).content == "second policy"
+        assert worker.get_stats()["generation"] == 2
+        primary.close()
+        worker.close()
+
+    def test_worker_writes_go_to_primary_and_shadow_snapshot(self, tmp_path, make_fabric):
+        publish_snapshot(str(tmp_path / "snap"), [MemoryRecordV1(id="a", content="from snapshot")])
+        worker = _worker(make_fabric, tmp_path)
+        worker.store("local edit", record_id="a")
+        assert worker.retrieve("a").content == "local edit"
+        assert worker.delete("a")
+        assert worker.retrieve("a") is None
+        assert len(worker.query(limit=None)) == 0
+        worker.close()
@@ -0,0 +1,112 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from ioa_core.memory_fabric.schema import EmbeddingV1
+
+
+def _age(mf, record_id, days):
+    """Backdate a cold record's creation and last access."""
+    record = mf._store.cold.get_many([record_id])[0]
+    record.timestamp = datetime.now(timezone.utc) - timedelta(days=days)
+    record.metadata["timestamp"] = record.timestamp.isoformat()
+    record.last_accessed = None
+    mf._store.cold.store(record)
+
+
+class TestTieredReads:
+    """Test the hot-then-cold read path."""
+
+    def test_writes_follow_storage_tier_and_reads_fall_back(self, tmp_path, make_fabric):
+        mf = make_fabric("tiered", encryption_key="k")
+        hot = mf.store("recent note")
+        cold = mf.store("archived note", storage_tier="cold")
+        assert [r.id for r in mf._store.hot.list_all()] == [hot]
+        assert [r.id for r in mf._store.cold.list_all()] == [cold]
+
+        assert mf.retrieve(hot).content == "recent note"
+        assert mf.retrieve(cold).content == "archived note"
+        assert mf.retrieve("missing") is None
+        assert {r.id for r in mf.query(limit=None)} == {hot, cold}
+
+        tiers = mf.get_stats()["tiers"]
+        assert tiers["hot"]["reads"] == 3 and tiers["cold"]["reads"] == 2
+        assert tiers["cold"]["hits"] == 1 and tiers["cold"]["latency_ms"]["p95"] > 0
+        mf.close()
+
+    def test_cold_hit_is_promoted_only_when_it_rescores_warm(self, tmp_path, make_fabric):
+        mf = make_fabric("tiered")
+        record_id = mf.store("old audit trail", storage_tier="cold")
+        _age(mf, record_id, days=30)
+
+        # First read in a month: still COLD, stays in the cold tier
+        assert mf.retrieve(record_id).content == "old audit trail"
+        assert mf._store.cold.get_many([record_id])
+        # Read again right away: the recent access re-scores it as hot
+        record = mf.retrieve(record_id)
+        assert record.access_count == 2
+        assert not mf._store.cold.get_many([record_id])
+        assert mf._store.hot.get_many([record_id])[0].storage_tier.value == "hot"
+        assert mf.get_stats()["promotions"] == 1
+        mf.close()
+
+    def test_retier_demotes_cold_scoring_records(self, tmp_path, make_fabric):
+        mf = make_fabric("tiered", tiering={"promote": False})
+        stale = mf.store("stale")
+        fresh = mf.store("fresh")
+        record = mf._store.hot.get_many([stale])[0]
+        record.timestamp = datetime.now(timezone.utc) - timedelta(days=10)
+        record.metadata["timestamp"] = record.timestamp.isoformat()
+        mf._store.hot.store(record)
+
+        assert mf.retier() == 1
+        assert [r.id for r in mf._store.cold.list_all()] == [stale]
+        assert mf.retrieve(stale).storage_tier.value == "cold"
+        assert mf.retrieve(fresh) is not None
+        mf.close()
+
+    def test_similarity_tier_filters_follow_promotion_and_retier(self, tmp_path, make_fabric):
+        mf = make_fabric("tiered")
+        embedding = EmbeddingV1(vector=[1.0, 0.0], model="m", dimension=2)
+        record_id = mf.store("old audit trail", storage_tier="cold", embedding=embedding)
+
+        def tier_hits(tier):
+            return [r.id for r, _ in mf.search_similar([1.0, 0.0], k=5, filters={"storage_tier": tier})]
+
+        assert tier_hits("cold") == [record_id] and tier_hits("hot") == []
+        _age(mf, record_id, days=30)
+        mf.retrieve(record_id)
+        mf.retrieve(record_id)
+        assert mf.get_stats()["promotions"] == 1
+        assert tier_hits("hot") == [record_id] and tier_hits("cold") == []
+
+        record = mf._store.hot.get_many([record_id])[0]
+        record.timestamp = datetime.now(timezone.utc) - timedelta(days=10)
+        record.metadata["timestamp"] = record.timestamp.isoformat()
+        record.last_accessed = None
+        mf._store.hot.store(record)
+        assert mf.retier() == 1
+        assert tier_hits("cold") == [record_id] and tier_hits("hot") == []
+        mf.close()
+
+    def test_prefetch_loads_related_cold_records(self, tmp_path, make_fabric):
+        mf = make_fabric("tiered", tiering={"hot": "memory", "prefetch": 5, "promote": False})
+        ids = [mf.store(f"case file {i}", tags=["case-42"], storage_tier="cold") for i in range(4)]
+        assert mf.retrieve(ids[0]) is not None
+        deadline = time.monotonic() + 5
+        while mf.get_stats()["prefetched"] < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        cold_reads = mf.get_stats()["tiers"]["cold"]["reads"]
+        assert all(mf.retrieve(record_id) is not None for record_id in ids[1:])
+        stats = mf.get_stats()
+        assert stats["prefetch_hits"] == 3 and stats["tiers"]["cold"]["reads"] == cold_reads
+        mf.close()
@@ -0,0 +1,190 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright (c) 2025 OrchIntel Systems Ltd.
+https://orchintel.com | https://ioa.systems
+
+Part of IOA Core (Open Source Edition). See LICENSE at repo root.
+
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from ioa_core.memory_fabric.fabric import MemoryFabric
+from ioa_core.memory_fabric.retention import RetentionPolicy, TTLSweeper
+from ioa_core.memory_fabric.schema import MemoryRecordV1, MemoryType
+from ioa_core.memory_fabric.stores.local_jsonl import LocalJSONLStore
+from ioa_core.memory_fabric.stores.s3 import S3Store
+
+NOW = datetime.now(timezone.utc)
+
+
+def _record(record_id, age_seconds, memory_type=MemoryType.CONVERSATION):
+    return MemoryRecordV1(
+        id=record_id,
+        content=f"content {record_id}",
+        timestamp=NOW - timedelta(seconds=age_seconds),
+        memory_type=memory_type
+    )
+
+
+@pytest.fixture
+def sqlite_fabric(tmp_path, monkeypatch):
+    monkeypatch.setenv("USE_4D_TIERING", "false")
+    mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)}, enable_metrics=False)
+    yield mf
+    mf.close()
+
+
+class TestRetentionPolicy:
+    """Test policy parsing."""
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("IOA_FABRIC_TTL", "conversation=60, context=3600,bogus")
+        policy = RetentionPolicy.from_env()
+        assert policy.ttl_seconds == {"conversation": 60, "context": 3600}
+
+    def test_enum_keys_and_cutoff(self):
+        policy = RetentionPolicy(ttl_seconds={MemoryType.CONTEXT: 10})
+        assert policy.cutoff_for("context", NOW) == NOW - timedelta(seconds=10)
+        assert policy.cutoff_for("knowledge", NOW) is None
+
+
+class TestSQLiteSweep:
+    """Test index-driven deletion in SQLite."""
+
+    def test_deletes_only_expired_type_in_batches(self, sqlite_fabric):
+        store = sqlite_fabric._store
+        for i in range(5):
+            store.store(_record(f"old{i}", 7200))
+        store.store(_record("fresh", 10))
+        store.store(_record("old-knowledge", 7200, MemoryType.KNOWLEDGE))
+
+        policy = RetentionPolicy(ttl_seconds={"conversation": 3600}, batch_size=2)
+        assert sqlite_fabric.sweep_expired(policy) == {"conversation": 5}
+
+        remaining = {record.id for record in store.list_all()}
+        assert remaining == {"fresh", "old-knowledge"}
+        assert store.search("content") != []
+
+    def test_max_batches_bounds_work(self, sqlite_fabric):
+        for i in range(5):
+            sqlite_fabric._store.store(_record(f"old{i}", 7200))
+        policy = RetentionPolicy(ttl_seconds={"conversation": 3600}, batch_size=2)
+        assert sqlite_fabric.sweep_expired(policy, max_batches=1) == {"conversation": 2}
+
+    def test_sweep_emits_metrics(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("USE_4D_TIERING", "false")
+        mf = MemoryFabric(backend="sqlite", config={"data_dir": str(tmp_path)})
+        mf.metrics.metrics_file = tmp_path / "metrics.jsonl"
+        mf._store.store(_record("old", 7200))
+        mf.sweep_expired(RetentionPolicy(ttl_seconds={"conversation": 60}))
+
+        assert mf.metrics.get_current_metrics()["retention"]["deleted"] == 1
+        entries = [json.loads(line) for line in mf.metrics.metrics_file.read_text().splitlines()]
+        assert any(entry["operation"] == "ttl_sweep" and entry["deleted"] == 1 for entry in entries)
+        mf.close()
+
+
+class TestJSONLPartitionedSweep:
+    """Test segment dropping in the JSONL store."""
+
+    def test_expired_segments_are_unlinked(self, tmp_path):
+        store = LocalJSONLStore({"data_dir": str(tmp_path), "partition_seconds": 60})
+        store.store(_record("old", 7200))
+        store.store(_record("fresh", 0))
+        store.store(_record("old-context", 7200, MemoryType.CONTEXT))
+        segments_before = set(tmp_path.glob("*.jsonl"))
+        assert len(segments_before) == 3
+
+        deleted = store.delete_expired("conversation", NOW - timedelta(seconds=3600))
+        assert deleted == ["old"]
+        assert store.retrieve("old") is None
+        assert store.retrieve("fresh") is not None
+        assert len(set(tmp_path.glob("*.jsonl"))) == 2
+
+    def test_segments_reload(self, tmp_path):
+        store = LocalJSONLStore({"data_dir": str(tmp_path), "partition_seconds": 60})
+        store.store(_record("a", 7200))
+        store.store(_record("b", 0))
+        store.delete("b")
+
+        # A later run has its own run file but picks up the earlier run's segments
+        reopened = LocalJSONLStore({"data_dir": str(tmp_path), "partition_seconds": 60})
+        assert reopened.file_path != store.file_path
+        assert set(reopened._records) == {"a"}
+        assert reopened.delete_expired("conversation", NOW - timedelta(seconds=3600)) == ["a"]
+        assert list(tmp_path.glob("*.conversation.*.jsonl")) == []
+
+    def test_segments_of_earlier_runs_reload_deduplicated_content(self, tmp_path):
+        config = {"data_dir": str(tmp_path), "partition_seconds": 60, "dedup": True}
+        store = LocalJSONLStore(config)
+        store.store(_record("a", 7200))
+        store.store(_record("b", 0))
+        store.flush()
+
+        reopened = LocalJSONLStore(config)
+        assert reopened.retrieve("a").content == "content a"
+        assert reopened.retrieve("b").content == "content b"
+
+    def test_unpartitioned_fallback(self, tmp_path):
+        store = LocalJSONLStore({"data_dir": str(tmp_path)})
+        store.store(_record("old", 7200))
+        store.store(_record("fresh", 0))
+        assert store.delete_expired("conversation", NOW - timedelta(seconds=3600)) == ["old"]
+        assert "old" not in store.file_path.read_text()
+
+
+class TestS3PartitionedSweep:
+    """Test marker-driven deletion in the S3 store."""
+
+    def _store(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        store = S3Store({"bucket_name": "bucket", "prefix": "mem/", "partition_seconds": 60})
+        store._boto3_available = True
+        store._s3_client = Mock()
+        return store
+
+    def test_store_writes_marker(self, tmp_path, monkeypatch):
+        store = self._store(tmp_path, monkeypatch)
+        store.store(_record("r1", 0))
+        keys = [call.kwargs["Key"] for call in store._s3_client.put_object.call_args_list]
+        assert keys[0] == "mem/r1.json"
+        assert keys[1].startswith("mem_ttl/conversation/") and keys[1].endswith("/r1")
+
+    def test_sweep_lists_markers_and_batch_deletes(self, tmp_path, monkeypatch):
+        store = self._store(tmp_path, monkeypatch)
+        old_window = int((NOW - timedelta(hours=2)).timestamp()) // 60 * 60
+        new_window = int(NOW.timestamp()) // 60 * 60
+        store._s3_client.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": f"mem_ttl/conversation/{old_window:012d}/r-old"},
+                {"Key": f"mem_ttl/conversation/{new_window:012d}/r-new"},
+            ],
+            "IsTruncated": False
+        }
+
+        deleted = store.delete_expired("conversation", NOW - timedelta(hours=1))
+        assert deleted == ["r-old"]
+        request = store._s3_client.delete_objects.call_args.kwargs["Delete"]["Objects"]
+        assert [obj["Key"] for obj in request] == [
+            "mem/r-old.json",
+            f"mem_ttl/conversation/{old_window:012d}/r-old"
+        ]
+
+
+class TestTTLSweeper:
+    """Test the background sweeper."""
+
+    def test_run_once_and_background_thread(self, sqlite_fabric):
+        sqlite_fabric._store.store(_record("old", 7200))
+        sweeper = TTLSweeper(sqlite_fabric, RetentionPolicy(ttl_seconds={"conversation": 60}), interval_seconds=0.01)
+        assert sweeper.run_once() == {"conversation": 1}
+
+        sweeper.start()
+        assert sweeper.running
+        sweeper.stop(timeout=2)
+        assert not sweeper.running
@@ -8,22 +8,164 @@
 """
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
 import sys
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from memory_fabric import MemoryFabric, MemoryRecordV1
+from ioa_core.memory_fabric import MemoryFabric, MemoryRecordV1
 
 # PATCH: Cursor-2025-09-10 DISPATCH-OSS-20250910-MEMORY-FABRIC-REFACTOR <migration tool>
 
+# Namespace for ids derived from a record's source position, so re-running a
+# chunk after a crash overwrites the records it already wrote
+LEGACY_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://ioa.systems/memory-engine")
+
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+MAX_CHUNK_ERRORS = 100
+
+
+def convert_legacy_record(data: Dict[str, Any], default_id: str = "") -> Optional[MemoryRecordV1]:
+    """Convert legacy data to MemoryRecordV1."""
+    try:
+        # Handle different legacy formats
+        if "content" in data:
+            content = data["content"]
+        elif "text" in data:
+            content = data["text"]
+        elif "message" in data:
+            content = data["message"]
+        else:
+            return None
+
+        # Extract metadata
+        metadata = data.get("metadata", {})
+        if "timestamp" in data:
+            metadata["legacy_timestamp"] = data["timestamp"]
+
+        # Extract tags
+        tags = data.get("tags", [])
+        if "category" in data:
+            tags.append(data["category"])
+
+        # Create record
+        record = MemoryRecordV1(
+            id=data.get("id") or default_id,
+            content=content,
+            metadata=metadata,
+            tags=tags,
+            memory_type=data.get("memory_type", "conversation"),
+            storage_tier=data.get("storage_tier", "hot")
+        )
+
+        return record
+
+    except Exception as e:
+        print(f"Error converting record: {e}")
+        return None
+
+
+def plan_chunks(file_path: str, size: int, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split a source file into byte ranges parsed independently.
+
+    JSONL files are split every `chunk_bytes`; the parser aligns each range to
+    line boundaries. JSON documents cannot be split and form a single range.
+    """
+    if not file_path.endswith(".jsonl") or size <= chunk_bytes:
+        return [(0, size)]
+    return [(start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)]
+
+
+def parse_chunk(file_path: str, start: int, end: int) -> Dict[str, Any]:
+    """
+    Parse and convert the records of one byte range (process pool worker).
+
+    A JSONL range owns every line that starts inside [start, end). Records
+    without an id get one derived from file path and line offset.
+
+    Returns:
+        Chunk result with converted record dictionaries, skipped and error
+        counts, the bytes read and a sha256 of the range
+    """
+    records: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    skipped = 0
+    hasher = hashlib.sha256()
+    source = os.path.abspath(file_path)
+
+    def add(data: Any, position: int) -> None:
+        nonlocal skipped
+        record = None
+        if isinstance(data, dict):
+            record = convert_legacy_record(data, str(uuid.uuid5(LEGACY_ID_NAMESPACE, f"{source}:{position}")))
+        if record is None:
+            skipped += 1
+            return
+        records.append({
+            "id": record.id,
+            "content": record.content,
+            "metadata": record.metadata,
+            "tags": record.tags,
+            "memory_type": record.memory_type.value,
+            "storage_tier": record.storage_tier.value
+        })
+
+    with open(file_path, "rb") as f:
+        if file_path.endswith(".jsonl"):
+            if start > 0:
+                # Skip the tail of a line owned by the previous range
+                f.seek(start - 1)
+                if f.read(1) != b"\n":
+                    f.readline()
+            position = first = f.tell()
+            while position < end:
+                line = f.readline()
+                if not line:
+                    break
+                hasher.update(line)
+                if line.strip():
+                    try:
+                        add(json.loads(line), position)
+                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                        skipped += 1
+                        if len(errors) < MAX_CHUNK_ERRORS:
+                            errors.append(f"{file_path}@{position}: {e}")
+                position = f.tell()
+            read = position - first
+        else:
+            raw = f.read()
+            hasher.update(raw)
+            read = len(raw)
+            try:
+                data = json.loads(raw)
+                for index, item in enumerate(data if isinstance(data, list) else [data]):
+                    add(item, index)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                errors.append(f"{file_path}: {e}")
+
+    return {
+        "path": file_path,
+        "start": start,
+        "end": end,
+        "records": records,
+        "skipped": skipped,
+        "errors": errors,
+        "bytes": read,
+        "sha256": hasher.hexdigest()
+    }
+
+
 class MemoryMigrationTool:
     """Tool for migrating from memory_engine to memory_fabric."""
     
@@ -216,42 +358,7 @@ def _migrate_file(self, file_path: str, fabric: Optional[MemoryFabric]) -> List[
     
     def _convert_to_memory_record(self, data: Dict[str, Any]) -> Optional[MemoryRecordV1]:
         """Convert legacy data to MemoryRecordV1."""
-        try:
-            # Handle different legacy formats
-            if "content" in data:
-                content = data["content"]
-            elif "text" in data:
-                content = data["text"]
-            elif "message" in data:
-                content = data["message"]
-            else:
-                return None
-            
-            # Extract metadata
-            metadata = data.get("metadata", {})
-            if "timestamp" in data:
-                metadata["legacy_timestamp"] = data["timestamp"]
-            
-            # Extract tags
-            tags = data.get("tags", [])
-            if "category" in data:
-                tags.append(data["category"])
-            
-            # Create record
-            record = MemoryRecordV1(
-                id=data.get("id", ""),
-                content=content,
-                metadata=metadata,
-                tags=tags,
-                memory_type=data.get("memory_type", "conversation"),
-                storage_tier=data.get("storage_tier", "hot")
-            )
-            
-            return record
-            
-        except Exception as e:
-            print(f"Error converting record: {e}")
-            return None
+        return convert_legacy_record(data)
     
     def _calculate_checksum(self, path: str) -> str:
         """Calculate checksum for a file or directory."""
@@ -270,6 +377,204 @@ def _calculate_checksum(self, path: str) -> str:
                         hasher.update(f.read())
             return hasher.hexdigest()
     
+    def iter_source_files(self, source_locations: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield source files lazily, in a stable order, each once."""
+        seen = set()
+        for location in source_locations:
+            path = location["path"]
+            if os.path.isfile(path):
+                candidates = [path]
+            else:
+                candidates = []
+                for root, dirs, files in os.walk(path):
+                    dirs.sort()
+                    candidates.extend(
+                        os.path.join(root, file) for file in sorted(files)
+                        if file.endswith((".json", ".jsonl"))
+                    )
+            for file_path in candidates:
+                key = os.path.realpath(file_path)
+                if key not in seen:
+                    seen.add(key)
+                    yield file_path
+    
+    def migrate_streaming(
+        self,
+        source_locations: List[Dict[str, Any]],
+        target_backend: str = "sqlite",
+        workers: int = 4,
+        batch_size: int = 5000,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        resume_receipt: Optional[str] = None,
+        progress_interval: float = 5.0
+    ) -> Dict[str, Any]:
+        """
+        Migrate with a parallel, resumable streaming pipeline.
+        
+        Files are discovered lazily and split into byte ranges, a process
+        pool parses and converts the ranges, and this process writes the
+        converted records to the fabric in bulk batches. Completed ranges
+        are checkpointed per file in the receipt, so a restarted migration
+        with `resume_receipt` skips them. Source data is only read, so no
+        backups are made.
+        
+        Args:
+            source_locations: Locations from discover_memory_data()
+            target_backend: Target fabric backend
+            workers: Parser processes
+            batch_size: Records per bulk write
+            chunk_bytes: Size of the byte ranges JSONL files are split into
+            resume_receipt: Receipt of an interrupted streaming migration
+            progress_interval: Seconds between throughput reports
+            
+        Returns:
+            Migration stats, also saved as the receipt
+        """
+        if resume_receipt:
+            with open(resume_receipt, 'r', encoding='utf-8') as f:
+                migration_stats = json.load(f)
+            self.migration_id = migration_stats["migration_id"]
+            chunk_bytes = migration_stats["chunk_bytes"]
+            print(f"Resuming migration {self.migration_id}")
+        else:
+            migration_stats = {
+                "migration_id": self.migration_id,
+                "mode": "stream",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "source_locations": source_locations,
+                "target_backend": target_backend,
+                "target_config": {
+                    "data_dir": "./artifacts/memory_fabric",
+                    "db_name": f"{self.migration_id}.db"
+                },
+                "chunk_bytes": chunk_bytes,
+                "records_migrated": 0,
+                "records_skipped": 0,
+                "errors": [],
+                "checksums": {},
+                "backup_paths": [],
+                "files": {}
+            }
+        files = migration_stats["files"]
+        migration_stats["complete"] = False
+        
+        fabric = None
+        if not self.dry_run:
+            fabric = MemoryFabric(
+                backend=migration_stats["target_backend"],
+                config=dict(migration_stats["target_config"])
+            )
+        
+        def work_units() -> Iterator[Tuple[str, int, int]]:
+            # Producer: discovery and chunk planning, skipping checkpointed ranges
+            for file_path in self.iter_source_files(migration_stats["source_locations"]):
+                stat = os.stat(file_path)
+                state = files.get(file_path)
+                if state and (state["size"], state["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                    print(f"Warning: {file_path} changed since the last run, migrating it again")
+                    state = None
+                if state is None:
+                    ranges = plan_chunks(file_path, stat.st_size, chunk_bytes)
+                    state = files[file_path] = {
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "chunks": len(ranges),
+                        "offset": 0,
+                        "done": {},
+                        "records": 0,
+                        "complete": False
+                    }
+                if state["complete"]:
+                    continue
+                for start, end in plan_chunks(file_path, state["size"], chunk_bytes):
+                    if str(start) not in state["done"]:
+                        yield file_path, start, end
+        
+        def complete_chunk(result: Dict[str, Any]) -> None:
+            state = files[result["path"]]
+            state["done"][str(result["start"])] = result["sha256"]
+            state["records"] += len(result["records"])
+            # Every byte below `offset` has been migrated
+            while state["offset"] < state["size"] and str(state["offset"]) in state["done"]:
+                state["offset"] = min(state["offset"] + chunk_bytes, state["size"])
+            if len(state["done"]) == state["chunks"]:
+                state["complete"] = True
+                state["offset"] = state["size"]
+                digests = [state["done"][key] for key in sorted(state["done"], key=int)]
+                migration_stats["checksums"][result["path"]] = (
+                    digests[0] if len(digests) == 1 else hashlib.sha256("".join(digests).encode()).hexdigest()
+                )
+            migration_stats["records_migrated"] += len(result["records"])
+            migration_stats["records_skipped"] += result["skipped"]
+            migration_stats["errors"].extend(result["errors"])
+        
+        started = time.monotonic()
+        last_report = last_checkpoint = started
+        records_done = 0
+        bytes_done = 0
+        units = work_units()
+        pending = set()
+        
+        try:
+            with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+                while True:
+                    # Keep a bounded number of ranges in flight
+                    while len(pending) < max(1, workers) * 2:
+                        unit = next(units, None)
+                        if unit is None:
+                            break
+                        pending.add(pool.submit(parse_chunk, *unit))
+                    if not pending:
+                        break
+                    
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        result = future.result()
+                        records = result["records"]
+                        if fabric:
+                            for i in range(0, len(records), batch_size):
+                                fabric.store_many(records[i:i + batch_size])
+                        complete_chunk(result)
+                        records_done += len(records)
+                        bytes_done += result["bytes"]
+                    
+                    now = time.monotonic()
+                    if now - last_checkpoint >= 1.0:
+                        self._save_checkpoint(migration_stats)
+                        last_checkpoint = now
+                    if now - last_report >= progress_interval:
+                        elapsed = now - started
+                        completed = sum(1 for state in files.values() if state["complete"])
+                        print(f"  {records_done} records ({records_done / elapsed:.0f} records/s, "
+                              f"{bytes_done / elapsed / (1024 * 1024):.1f} MB/s), "
+                              f"{completed}/{len(files)} files")
+                        last_report = now
+            migration_stats["complete"] = True
+        except Exception as e:
+            error_msg = f"Streaming migration interrupted: {e}"
+            migration_stats["errors"].append(error_msg)
+            print(f"ERROR: {error_msg}")
+        finally:
+            if fabric:
+                fabric.close()
+            self._save_checkpoint(migration_stats)
+        
+        elapsed = max(time.monotonic() - started, 1e-9)
+        print(f"  Throughput: {records_done / elapsed:.0f} records/s over {elapsed:.1f}s")
+        return migration_stats
+    
+    def _save_checkpoint(self, migration_stats: Dict[str, Any]) -> None:
+        """Atomically rewrite the receipt of a streaming migration."""
+        if self.dry_run:
+            return
+        receipt_file = self.receipts_dir / f"{self.migration_id}-receipt.json"
+        tmp_file = receipt_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(migration_stats, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, receipt_file)
+    
     def save_receipt(self, migration_stats: Dict[str, Any]) -> str:
         """Save migration receipt."""
         receipt_file = self.receipts_dir / f"{self.migration_id}-receipt.json"
@@ -319,6 +624,14 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Perform dry run without actual migration")
     parser.add_argument("--backend", choices=["local_jsonl", "sqlite", "s3"], default="sqlite", help="Target backend")
     parser.add_argument("--rollback", help="Rollback migration using receipt file")
+    parser.add_argument("--stream", action="store_true", help="Use the parallel, resumable streaming pipeline")
+    parser.add_argument("--resume", help="Resume an interrupted streaming migration from its receipt file")
+    parser.add_argument("--source", action="append", help="Migrate this file or directory instead of discovering")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Parser processes (streaming)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Records per bulk write (streaming)")
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_BYTES // (1024 * 1024),
+                        help="JSONL range size per parse task in MB (streaming)")
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="Seconds between throughput reports")
     
     args = parser.parse_args()
     
@@ -337,8 +650,38 @@ def main():
         print()
     
     # Discover existing data
-    print("Discovering existing memory data...")
-    locations = tool.discover_memory_data()
+    if args.resume:
+        locations = []
+    elif args.source:
+        locations = [
+            {"path": path, "type": "file" if os.path.isfile(path) else "directory",
+             "size": os.path.getsize(path) if os.path.isfile(path) else tool._get_directory_size(path)}
+            for path in args.source
+        ]
+    else:
+        print("Discovering existing memory data...")
+        locations = tool.discover_memory_data()
+    
+    if args.stream or args.resume:
+        print(f"Streaming to {args.backend} backend with {args.workers} workers...")
+        migration_stats = tool.migrate_streaming(
+            locations,
+            args.backend,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            chunk_bytes=max(1, int(args.chunk_mb * 1024 * 1024)),
+            resume_receipt=args.resume,
+            progress_interval=args.progress_interval
+        )
+        receipt_file = str(tool.receipts_dir / f"{tool.migration_id}-receipt.json")
+        print(f"  Records migrated: {migration_stats['records_migrated']}")
+        print(f"  Records skipped: {migration_stats['records_skipped']}")
+        print(f"  Errors: {len(migration_stats['errors'])}")
+        print(f"  Receipt: {receipt_file}")
+        if not migration_stats["complete"]:
+            print(f"\nMigration interrupted; to resume: python {__file__} --resume {receipt_file}")
+            sys.exit(1)
+        sys.exit(0)
     
     if not locations:
         print("No memory data found to migrate")